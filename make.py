@@ -216,9 +216,20 @@ def translateall():
     if not os.path.exists(PYGETTEXT):
         raise RuntimeError("pygettext.py could not be found at %s" % PYGETTEXT)
 
+    # The API definitions are stored as JSON, so emit them as Python for
+    # pygettext to find.
+    os.makedirs("build", exist_ok=True)
+    api_messages = os.path.join("build", "api_messages.py")
+    stores = [os.path.join("mu", "modes", "api", name) for name in
+              sorted(os.listdir(os.path.join("mu", "modes", "api")))
+              if name.endswith(".json")]
+    with open(api_messages, "w", encoding="utf-8") as f:
+        subprocess.run(["python", os.path.join("utils", "mkapi.py"),
+                        "--messages"] + stores, stdout=f, check=True)
     result = subprocess.run([
         "python", PYGETTEXT,
-        "mu/*", "mu/debugger/*", "mu/modes/*", "mu/resources/*"
+        "mu/*", "mu/debugger/*", "mu/modes/*", "mu/resources/*",
+        api_messages
     ]).returncode
     print("\nNew messages.pot file created.")
     print("Remember to update the translation strings"
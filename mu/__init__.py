@@ -1,6 +1,12 @@
 import gettext
 import locale
 import os
+import sys
+from mu.startup import profile, PROFILE_OPTION
+
+# Time the imports of Mu's modules if asked to profile start-up.
+if PROFILE_OPTION in sys.argv:
+    profile.start()
 
 # Configure locale and language
 # Define where the translation assets are to be found.
@@ -23,19 +23,17 @@ import logging
 from logging.handlers import TimedRotatingFileHandler
 import os
 import platform
-import pkgutil
 import sys
 
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QApplication, QSplashScreen
 
 from mu import __version__
+from mu.startup import profile, PROFILE_OPTION, StartupScheduler
 from mu.logic import Editor, LOG_FILE, LOG_DIR, DEBUGGER_PORT, ENCODING
 from mu.interface import Window
 from mu.resources import load_pixmap, load_icon
-from mu.modes import (PythonMode, AdafruitMode, MicrobitMode, DebugMode,
-                      PyGameZeroMode)
-from mu.debugger.runner import run as run_debugger
+from mu.modes import ModeRegistry, available_modes
 from mu.interface.themes import NIGHT_STYLE, DAY_STYLE, CONTRAST_STYLE
 
 
@@ -68,24 +66,10 @@ def setup_logging():
 
 def setup_modes(editor, view):
     """
-    Create a simple dictionary to hold instances of the available modes.
-
-    *PREMATURE OPTIMIZATION ALERT* This may become more complex in future so
-    splitting things out here to contain the mess. ;-)
+    Create the registry of the available modes (such as Pygame Zero, if pgzero
+    is installed). Each mode is only instantiated when it is first used.
     """
-    modes = {
-        'python': PythonMode(editor, view),
-        'adafruit': AdafruitMode(editor, view),
-        'microbit': MicrobitMode(editor, view),
-        'debugger': DebugMode(editor, view),
-    }
-
-    # Check if pgzero is available (without importing it)
-    if any([m for m in pkgutil.iter_modules() if 'pgzero' in m]):
-        modes['pygamezero'] = PyGameZeroMode(editor, view)
-
-    # return available modes
-    return modes
+    return ModeRegistry(editor, view, available_modes())
 
 
 def excepthook(*exc_args):
@@ -106,12 +90,15 @@ def run():
     - create an application object
     - create an editor window and status bar
     - display a splash screen while starting
-    - close the splash screen after startup timer ends
+    - close the splash screen once the window is ready (first painted)
+    - finish starting (e.g. create the workspace) once the window is ready
     """
     setup_logging()
+    profile.mark('imports')
     logging.info('\n\n-----------------\n\nStarting Mu {}'.format(__version__))
     logging.info(platform.uname())
     logging.info('Python path: {}'.format(sys.path))
+    paths = [arg for arg in sys.argv[1:] if arg != PROFILE_OPTION]
 
     # The app object is the application running on your computer.
     app = QApplication(sys.argv)
@@ -124,6 +111,11 @@ def run():
     # Images (such as toolbar icons) aren't scaled nicely on retina/4k displays
     # unless this flag is set
     app.setAttribute(Qt.AA_UseHighDpiPixmaps)
+    # Display a friendly "splash" icon until the window is ready.
+    splash = QSplashScreen(load_pixmap('splash-screen'))
+    splash.show()
+    app.processEvents()
+    profile.mark('application')
 
     # Create the "window" we'll be looking at.
     editor_window = Window()
@@ -141,12 +133,31 @@ def run():
     app.setWindowIcon(load_icon(editor_window.icon))
     # Create the "editor" that'll control the "window".
     editor = Editor(view=editor_window)
+    profile.mark('window')
     editor.setup(setup_modes(editor, editor_window))
+    profile.mark('modes')
+    # Work not needed to show the window is done once the window is ready.
+    # This is connected before the window is shown since it may be first
+    # painted while a dialog (such as the mode selector) is open.
+    scheduler = StartupScheduler(profile)
+    scheduler.defer('workspace', editor.setup_workspace)
+    scheduler.defer('usb checker', editor.start_usb_checker)
+
+    @editor_window.first_paint.connect
+    def ready():
+        # Hide the splash icon.
+        splash.finish(editor_window)
+        scheduler.start()
+
+    # The splash icon would otherwise stay on top of the mode selector.
+    editor_window.selecting_mode.connect(splash.close)
     # Setup the window.
     editor_window.closeEvent = editor.quit
     editor_window.setup(editor.debug_toggle_breakpoint, editor.theme)
+    profile.mark('window setup')
     # Restore the previous session along with files passed by the os
-    editor.restore_session(sys.argv[1:])
+    editor.restore_session(paths)
+    profile.mark('session')
     # Connect the various UI elements in the window to the editor.
     editor_window.connect_tab_rename(editor.rename_tab, 'Ctrl+Shift+S')
     editor_window.connect_find_replace(editor.find_replace, 'Ctrl+F')
@@ -154,16 +165,6 @@ def run():
     status_bar = editor_window.status_bar
     status_bar.connect_logs(editor.show_admin, 'Ctrl+Shift+D')
 
-    # Display a friendly "splash" icon.
-    splash = QSplashScreen(load_pixmap('splash-screen'))
-    splash.show()
-
-    # Hide the splash icon.
-    splash_be_gone = QTimer()
-    splash_be_gone.timeout.connect(lambda: splash.finish(editor_window))
-    splash_be_gone.setSingleShot(True)
-    splash_be_gone.start(2000)
-
     # Stop the program after the application finishes executing.
     sys.exit(app.exec_())
 
@@ -178,6 +179,7 @@ def debug():
     if len(sys.argv) > 1:
         filename = os.path.normcase(os.path.abspath(sys.argv[1]))
         args = sys.argv[2:]
+        from mu.debugger.runner import run as run_debugger
         run_debugger('localhost', DEBUGGER_PORT, filename, args)
     else:
         print(_("Debugger requires a Python script filename to run."))
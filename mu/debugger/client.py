@@ -22,6 +22,8 @@ import time
 import logging
 import os.path
 from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from mu.debugger.utils import (encode_message, MessageBuffer, RECV_SIZE,
+                               LATENCY_STAGES)
 
 
 logger = logging.getLogger(__name__)
@@ -46,16 +48,24 @@ class Breakpoint:
     Represents a breakpoint, identified by a breakpoint number (bpnum). Users
     set breakpoints to stop the debugger at a certain line (potentially in a
     named function) in a file.
+
+    The debug runner only stops at a breakpoint when its (optional)
+    condition is true and on its hit_count'th hit. A breakpoint with a log
+    message (a logpoint) prints the message instead of stopping.
     """
 
     def __init__(self, bpnum, filename, line, enabled=True, temporary=False,
-                 funcname=None):
+                 funcname=None, condition=None, hit_count=None,
+                 log_message=None):
         self.bpnum = bpnum
         self.filename = filename
         self.line = line
         self.enabled = enabled
         self.temporary = temporary
         self.funcname = funcname
+        self.condition = condition
+        self.hit_count = hit_count
+        self.log_message = log_message
 
     def __str__(self):
         return '{}:{}'.format(self.filename, self.line)
@@ -70,7 +80,8 @@ class CommandBufferHandler(QObject):
     fails at appropriate moments during the lifetime of a debug session.
     """
 
-    on_command = pyqtSignal(str)  #: Signal emitted when a command is received.
+    #: Signal emitted with a command, and the time it was received.
+    on_command = pyqtSignal(str, float)
     on_fail = pyqtSignal(str)  #: Emitted when there was a connection failure.
 
     def __init__(self, debugger):
@@ -86,66 +97,41 @@ class CommandBufferHandler(QObject):
         """
         Buffer input from a socket, emit complete debugger commands as signals.
         """
-        connected = False
-        tries = 0
-        connection_attempts = 50  # Translates to 10 seconds.
-        pause_between_attempts = 0.2
-        while not connected:
-            try:
-                self.debugger.socket = socket.socket(socket.AF_INET,
-                                                     socket.SOCK_STREAM)
-                self.debugger.socket.connect((self.debugger.host,
-                                              self.debugger.port))
-                connected = True
-            except ConnectionRefusedError:
-                # Allow up to connection_attempts attempts to connect.
-                # The Raspberry Pi is quite slow, so Mu needs to give the
-                # debug runner enough time to start up and start listening.
-                tries += 1
-                if tries >= connection_attempts:
-                    self.on_fail.emit(_('Connection timed out. Is your '
-                                        'machine slow or busy? Free up some '
-                                        "of the machine's resources and try "
-                                        "again."))
-                    return
-                time.sleep(pause_between_attempts)
-            except OSError:
-                # This will catch address related errors. Especially on OSX
-                # this is usually solved by adding "127.0.0.1 localhost" to
-                # /etc/hosts.
-                self.on_fail.emit(_('Could not find localhost.\n'
-                                    "Ensure you have '127.0.0.1 localhost' in "
-                                    "your /etc/hosts file."))
-                return
+        # The runner only announces its port once it's listening, so there's
+        # no need to wait for it to start up.
+        try:
+            self.debugger.socket = socket.socket(socket.AF_INET,
+                                                 socket.SOCK_STREAM)
+            self.debugger.socket.connect((self.debugger.host,
+                                          self.debugger.port))
+        except ConnectionRefusedError:
+            self.on_fail.emit(_('The debug runner refused the connection. '
+                                'Please try again.'))
+            return
+        except OSError:
+            # This will catch address related errors. Especially on OSX
+            # this is usually solved by adding "127.0.0.1 localhost" to
+            # /etc/hosts.
+            self.on_fail.emit(_('Could not find localhost.\n'
+                                "Ensure you have '127.0.0.1 localhost' in "
+                                "your /etc/hosts file."))
+            return
         # Getting here means the connection has been established, so handle all
         # incoming data from the debug runner process.
-        remainder = b''
+        message_buffer = MessageBuffer()
         while not self.stopped:
             new_buffer = None
             try:
-                new_buffer = self.debugger.socket.recv(1024)
+                new_buffer = self.debugger.socket.recv(RECV_SIZE)
             except Exception:
                 # Stop if there's any failure in receiving data from the
                 # runner.
                 self.stopped = True
             if new_buffer:
-                if new_buffer.endswith(self.debugger.ETX):
-                    terminator = self.debugger.ETX
-                    pos = new_buffer.rfind(self.debugger.ETX)
-                    full_buffer = remainder + new_buffer[:pos]
-                else:
-                    terminator = None
-                    full_buffer = remainder + new_buffer
-
-                commands = full_buffer.split(self.debugger.ETX)
-                if terminator is None:
-                    remainder = commands.pop()
-                else:
-                    remainder = b''
-                for command in commands:
-                    command = command.decode('utf-8')
+                received = time.time()
+                for command in message_buffer.feed(new_buffer):
                     logger.debug(command)
-                    self.on_command.emit(command)
+                    self.on_command.emit(command, received)
             else:
                 # If recv() returns None, the socket is closed.
                 logger.debug('Debug client closed.')
@@ -157,8 +143,6 @@ class Debugger(QObject):
     Represents the networked debugger client.
     """
 
-    ETX = b'\x03'  # End transmission token.
-
     def __init__(self, host, port, proc=None):
         """
         Instantiate given a host, port and process for the debug runner.
@@ -167,6 +151,10 @@ class Debugger(QObject):
         self.port = port
         self.proc = proc
         self.view = None  # Set after instantiation.
+        self.stack = []
+        # When each message of the current step was received and how long it
+        # took to handle (see on_timings).
+        self.step_timings = {}
         super().__init__()
 
     def start(self):
@@ -181,13 +169,28 @@ class Debugger(QObject):
         self.listener_thread.started.connect(self.command_handler.worker)
         self.listener_thread.start()
 
-    def on_command(self, command):
+    def on_command(self, command, received=None):
         """
-        Handle a command emitted by the client thread.
+        Handle a command emitted by the client thread (at the time it was
+        received).
+
+        The times taken to handle the messages that show where the program
+        stopped and its stack are kept for on_timings.
         """
+        started = time.time()
+        start = time.perf_counter()
         event, data = json.loads(command)
+        decoded = time.perf_counter()
         if hasattr(self, 'on_{}'.format(event)):
             getattr(self, 'on_{}'.format(event))(**data)
+        if event in ('line', 'stack') and received is not None:
+            self.step_timings[event] = {
+                'received': received,
+                'started': started,
+                'decode': decoded - start,
+                'handle': time.perf_counter() - decoded,
+                'finished': time.time(),
+            }
 
     def on_fail(self, message):
         """
@@ -215,8 +218,7 @@ class Debugger(QObject):
         Send a command to the debug runner.
         """
         try:
-            dumped = json.dumps((event, data)).encode('utf-8')
-            self.socket.sendall(dumped + Debugger.ETX)
+            self.socket.sendall(encode_message(event, data))
         except OSError as e:
             logger.debug('Debugger client error.')
             logger.debug(e)
@@ -248,12 +250,24 @@ class Debugger(QObject):
 
     # Commands that can be passed to the debug runner.
 
-    def create_breakpoint(self, filename, line, temporary=False):
+    def create_breakpoint(self, filename, line, temporary=False,
+                          condition=None, hit_count=None, log_message=None):
         """
         Create a new, enabled breakpoint at the specified line of the given
-        file.
+        file, with an optional condition, hit count and log message.
         """
-        self.output('break', filename=filename, line=line, temporary=temporary)
+        self.output('break', filename=filename, line=line, temporary=temporary,
+                    condition=condition, hit_count=hit_count,
+                    log_message=log_message)
+
+    def set_breakpoint_options(self, breakpoint, condition=None,
+                               hit_count=None, log_message=None):
+        """
+        Set the condition, hit count and log message of an existing
+        breakpoint.
+        """
+        self.output('options', bpnum=breakpoint.bpnum, condition=condition,
+                    hit_count=hit_count, log_message=log_message)
 
     def enable_breakpoint(self, breakpoint):
         """
@@ -287,6 +301,12 @@ class Debugger(QObject):
         """
         self.output('continue')
 
+    def do_pause(self):
+        """
+        Pause the running script at the next line of code it executes.
+        """
+        self.output('pause')
+
     def do_step(self):
         """
         Step through one stack frame.
@@ -305,6 +325,33 @@ class Debugger(QObject):
         """
         self.output('return')
 
+    def do_back(self):
+        """
+        Step backwards through the history recorded by the runner.
+        """
+        self.output('back')
+
+    def record(self, enabled):
+        """
+        Start (or stop) recording the history needed to step backwards.
+        """
+        self.output('record', enabled=enabled)
+
+    def watch(self, expressions):
+        """
+        Set the expressions to evaluate whenever the runner stops.
+        """
+        self.output('watch', expressions=expressions)
+
+    def expand(self, frame, path, start, count):
+        """
+        Ask for (count of) the children, from the given position, of the
+        variable at the given path (its name followed by the position of each
+        child) in the referenced stack frame.
+        """
+        self.output('expand', frame=frame, path=path, start=start,
+                    count=count)
+
     # Handlers for events raised by the debug runner. These generally follow
     # the pattern of updating state in the client object to reflect that of
     # the debug runner, then calling a method in the UI layer to update the
@@ -357,6 +404,17 @@ class Debugger(QObject):
         bp.ignore = count
         self.view.debug_on_breakpoint_ignore(bp, count)
 
+    def on_breakpoint_options(self, bpnum, condition, hit_count,
+                              log_message):
+        """
+        The runner has set the options of the referenced breakpoint.
+        """
+        bp = self.bp_list[bpnum]
+        bp.condition = condition
+        bp.hit_count = hit_count
+        bp.log_message = log_message
+        self.view.debug_on_breakpoint_options(bp)
+
     def on_breakpoint_clear(self, bpnum):
         """
         The runner has cleared the referenced breakpoint.
@@ -364,12 +422,65 @@ class Debugger(QObject):
         bp = self.bp_list[bpnum]
         self.view.debug_on_breakpoint_clear(bp)
 
-    def on_stack(self, stack):
+    def on_stack(self, stack, watches=None):
         """
-        The runner has sent an update to the stack.
+        The runner has sent an update to the stack (and the values of the
+        watch expressions in the current frame).
+
+        Frames whose locals haven't changed since the previous update are
+        filled in from the previous stack.
         """
+        for index, (line, frame) in enumerate(stack):
+            if frame.pop('unchanged', False):
+                if index < len(self.stack):
+                    frame['locals'] = self.stack[index][1]['locals']
+                else:
+                    frame['locals'] = {}
         self.stack = stack
-        self.view.debug_on_stack(stack)
+        self.view.debug_on_stack(stack, watches or [])
+
+    def on_timings(self, stopped, stack, encode, send, sent):
+        """
+        The runner has sent when the program stopped, how long it took to
+        describe, encode and send the stack, and when it was sent. Along with
+        the times measured here, these are the latency of each stage (see
+        LATENCY_STAGES) of the step, in seconds.
+        """
+        stack_times = self.step_timings.get('stack')
+        line_times = self.step_timings.get('line')
+        self.step_timings = {}
+        if stack_times is None:
+            return
+        latency = {
+            'stack': stack,
+            'encode': encode,
+            'send': send,
+            'transfer': max(stack_times['received'] - sent, 0),
+            'queue': max(stack_times['started'] - stack_times['received'], 0),
+            'decode': stack_times['decode'],
+            'editor': line_times['handle'] if line_times else 0,
+            'inspector': stack_times['handle'],
+            'total': max(stack_times['finished'] - stopped, 0),
+        }
+        logger.debug('Debugger step latency (ms): {}'.format(', '.join(
+            '{} {:.1f}'.format(stage, latency[stage] * 1000)
+            for stage in LATENCY_STAGES)))
+        self.view.debug_on_timings(latency)
+
+    def on_expansion(self, frame, path, children, more, start):
+        """
+        The runner has sent the children, from the start position, of the
+        variable at the referenced path in a stack frame (and how many more
+        there are that weren't sent).
+        """
+        self.view.debug_on_expansion(frame, path, children, more, start)
+
+    def on_history(self, filename, line, locals, steps):
+        """
+        The runner has sent the line (and the locals) at a position in its
+        recorded history, the referenced number of steps before the present.
+        """
+        self.view.debug_on_history(filename, line, locals, steps)
 
     def on_restart(self):
         """
@@ -21,18 +21,66 @@ import os
 import socket
 import json
 import bdb
+import dis
 import linecache
 import logging
+import reprlib
+import signal
+import time
 import traceback
+import types
+import _thread
+from collections import deque, namedtuple
 from enum import Enum
+from itertools import islice
 from queue import Queue
-from threading import Thread
-from mu.debugger.utils import is_breakpoint_line
+from threading import Thread, Timer, main_thread
+from mu.debugger.utils import (is_breakpoint_line, encode_message,
+                               MessageBuffer, RECV_SIZE, PORT_HANDSHAKE,
+                               WATCH_FRAME)
 
 
 logger = logging.getLogger(__name__)
 
 
+#: The maximum number of characters in the repr of a value sent to the client.
+MAX_REPR_LENGTH = 120
+#: The number of children of a value sent at once when it's expanded.
+MAX_CHILDREN = 100
+#: The (approximate) number of bytes of recorded history kept for stepping
+#: backwards through the program.
+MAX_HISTORY_SIZE = 16 * 1024 * 1024
+#: Names that are never recorded: the runner's own (see _runscript) and the
+#: builtins (the client doesn't show them).
+NOT_RECORDED = {'__builtins__', '__debug_code__', '__debug_script__'}
+#: The types of value whose summary can't change unless the variable is
+#: assigned another value, so needn't be described again for every line.
+IMMUTABLE_TYPES = {int, float, complex, bool, str, bytes, type(None), type,
+                   types.FunctionType, types.BuiltinFunctionType,
+                   types.ModuleType, types.CodeType}
+#: The number of seconds after which the evaluation of a watch expression is
+#: interrupted. This isn't a guarantee: a single call into C code (such as
+#: sum(range(10 ** 9))) can't be interrupted until it returns.
+WATCH_TIME_LIMIT = 0.5
+
+
+# Produces reprs that are both truncated and cheap to make for large values.
+short_repr = reprlib.Repr()
+short_repr.maxstring = MAX_REPR_LENGTH
+short_repr.maxother = MAX_REPR_LENGTH
+short_repr.maxlong = MAX_REPR_LENGTH
+
+
+#: A line run in the user's code: the frame it was run in (and if it was
+#: the first line recorded in that frame), the depth of the frame in the
+#: stack, where the line is, the summaries of the locals that changed since
+#: the previous line in the frame (None for those deleted) and the
+#: approximate number of bytes it takes up.
+HistoryEntry = namedtuple('HistoryEntry', ['frame', 'start', 'depth',
+                                           'filename', 'line', 'changes',
+                                           'size'])
+
+
 class Restart(Exception):
     """
     Cause the debugger to restart for the target Python program.
@@ -47,6 +95,14 @@ class ClientClose(Exception):
     pass
 
 
+class WatchTimeout(BaseException):
+    """
+    Interrupts a watch expression that takes too long to evaluate. Like
+    KeyboardInterrupt, it isn't caught by the usual "except Exception".
+    """
+    pass
+
+
 class DebugState(Enum):
     """
     Enumerates the three possible states of a debugging session.
@@ -56,32 +112,81 @@ class DebugState(Enum):
     STARTED = 2
 
 
+def interrupt_main():
+    """
+    Interrupt the main thread, which runs the program being debugged, with
+    SIGINT (see Debugger.on_pause_signal). Where possible the signal is sent
+    to the thread so that blocking calls, such as time.sleep, are interrupted
+    too.
+    """
+    if hasattr(signal, 'pthread_kill'):
+        signal.pthread_kill(main_thread().ident, signal.SIGINT)
+    else:
+        _thread.interrupt_main()
+
+
+def get_children(value):
+    """
+    Return an iterator of (label, value) pairs for the children of the given
+    value that may be inspected: the items in a container or the attributes of
+    an object.
+    """
+    if isinstance(value, dict):
+        return ((short_repr.repr(k), v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ((str(i), v) for i, v in enumerate(value))
+    attributes = getattr(value, '__dict__', None)
+    if isinstance(attributes, dict):
+        return ((k, attributes[k]) for k in sorted(attributes))
+    return iter(())
+
+
+def describe(name, value):
+    """
+    Return a summary of the named value for the client: its type, a truncated
+    repr, its length (if it's a container) and if it has children the client
+    may ask to inspect (see Debugger.do_expand).
+    """
+    try:
+        text = short_repr.repr(value)
+    except Exception:
+        text = '<unprintable {} object>'.format(type(value).__name__)
+    length = None
+    if isinstance(value, (dict, list, tuple, set, frozenset)):
+        try:
+            length = len(value)
+        except Exception:
+            pass
+        expandable = bool(length)
+    else:
+        attributes = getattr(value, '__dict__', None)
+        expandable = isinstance(attributes, dict) and bool(attributes)
+    return {
+        'name': name,
+        'type': type(value).__name__,
+        'repr': text,
+        'length': length,
+        'expandable': expandable,
+    }
+
+
 def command_buffer(debugger):
     """
     Buffer input from a socket, yield complete debugger commands.
     """
-    remainder = b''
+    message_buffer = MessageBuffer()
     while True:
-        new_buffer = debugger.client.recv(1024)
+        new_buffer = debugger.client.recv(RECV_SIZE)
         if new_buffer:
-            if new_buffer.endswith(debugger.ETX):
-                terminator = debugger.ETX
-                pos = new_buffer.rfind(debugger.ETX)
-                full_buffer = remainder + new_buffer[:pos]
-            else:
-                terminator = None
-                full_buffer = remainder + new_buffer
-
-            commands = full_buffer.split(debugger.ETX)
-            if terminator is None:
-                remainder = commands.pop()
-            else:
-                remainder = b''
-            for command in commands:
-                command = command.decode('utf-8')
+            for command in message_buffer.feed(new_buffer):
                 command_data = json.loads(command)
                 logging.debug(command_data)
-                debugger.commands.put(command_data)
+                if command_data[0] == 'pause':
+                    # The program is probably running, so nothing is reading
+                    # the commands. Deal with it straight away, from here.
+                    debugger.do_pause()
+                else:
+                    debugger.commands.put(command_data)
         else:
             # If recv() returns None, the socket is closed.
             break
@@ -93,8 +198,6 @@ class Debugger(bdb.Bdb):
     Instances of this class represent and drive the debugging process.
     """
 
-    ETX = b'\x03'  # End transmission token.
-
     def __init__(self, socket, host, port, skip=None):
         super().__init__(skip=skip)
         self._run_state = DebugState.NOT_STARTED
@@ -112,15 +215,58 @@ class Debugger(bdb.Bdb):
         # set_continue, in the absence of breakpoints at script start. The
         # flag indicates that continue means set_continue from now on.
         self.continue_flag = False
+        # The frames described in the last stack sent to the client (so it can
+        # ask for more detail) and what was sent about them (so unchanged
+        # frames needn't be sent again).
+        self.inspected_frames = []
+        self.sent_frames = []
+        # Caches if each code object has a breakpoint while continuing (see
+        # run_to_breakpoint) and which code is being monitored for them.
+        self.breakpoint_code = {}
+        self.monitored_code = set()
+        self.monitoring = False
+        # The condition, hit count and log message of each breakpoint (by
+        # number) as given by the client and compiled, once, for use.
+        self.breakpoint_options = {}
+        self.compiled_options = {}
+        # When recording, each line run in the user's code is kept in the
+        # history (see record) so the client can step backwards through it.
+        # The history_position is the entry being looked at (None means the
+        # present).
+        self.recording = False
+        self.history = deque()
+        self.history_size = 0
+        self.history_position = None
+        self.recorded_frames = {}
+        self.recorded_code = {}
+        # Set while the user is interacting with the paused program, and when
+        # the client has asked for the running program to pause.
+        self.interacting = False
+        self.pause_requested = False
+        # The client's watch expressions, each with its compiled code (or the
+        # error compiling it), and their values the last time the program
+        # stopped (so the client can expand them).
+        self.watches = []
+        self.watch_values = {}
+        self.evaluating_watch = False
+        # When the program last stopped (so the time until the client has the
+        # stack can be measured) and how long the last output took to encode
+        # and send.
+        self.stopped_at = None
+        self.output_times = (0, 0)
 
     def output(self, event, **data):
         """
         Dumps data related to a referenced event to the socket.
         """
         try:
-            dumped = json.dumps((event, data)).encode('utf-8')
-            logging.debug(dumped)
-            self.client.sendall(dumped + Debugger.ETX)
+            started = time.perf_counter()
+            message = encode_message(event, data)
+            encoded = time.perf_counter()
+            logging.debug(message)
+            self.client.sendall(message)
+            self.output_times = (encoded - started,
+                                 time.perf_counter() - encoded)
         except OSError as e:
             logger.debug('Debugger client error.')
             logger.debug(e)
@@ -135,7 +281,17 @@ class Debugger(bdb.Bdb):
         If this is a normal situation, the top two frames are BDB and the
         runner executing the program. If there is an exception, there are two
         further extra frames. All these frames can be ignored.
+
+        Only a summary of each local variable is sent (see describe) and a
+        frame whose locals are the same as when the stack was last sent is
+        marked as unchanged instead. The client asks for the children of
+        a variable when the user wants to see them (see do_expand).
+
+        The first time the stack is sent after the program stops, it's
+        followed by the time taken by each stage of sending it, so the
+        client can work out where the time goes with each step.
         """
+        started = time.perf_counter()
         str_index = 0
         sl = len(self.stack)  # Bound check for stack length.
         if sl > 1 and self.stack[1][0].f_code.co_filename == '<string>':
@@ -143,29 +299,93 @@ class Debugger(bdb.Bdb):
         elif sl > 3 and self.stack[3][0].f_code.co_filename == '<string>':
                 str_index = 4
         stack_data = []
+        inspected_frames = []
+        sent_frames = []
         if str_index > 0:
-            for frame, line_no in self.stack[str_index:]:
-                frame_data = (
-                    line_no,
-                    {
-                        'filename': frame.f_code.co_filename,
-                        'locals': {k: repr(v) for k, v in
-                                   frame.f_locals.items()},
-                        'globals': {k: repr(v) for k, v in
-                                    frame.f_globals.items()},
-                        'builtins': {k: repr(v) for k, v in
-                                     frame.f_builtins.items()},
-                        'restricted': getattr(frame, 'f_restricted', ''),
-                        'lasti': repr(frame.f_lasti),
-                        'exc_type': repr(getattr(frame, 'f_exc_type', '')),
-                        'exc_value': repr(getattr(frame, 'f_exc_value', '')),
-                        'exc_traceback': repr(getattr(frame,
-                                                      'f_exc_traceback', '')),
-                        'current': frame is self.curframe,
-                    }
+            for index, (frame, line_no) in enumerate(self.stack[str_index:]):
+                frame_info = (
+                    frame.f_code.co_filename,
+                    frame.f_code.co_name,
+                    {k: describe(k, v) for k, v in frame.f_locals.items()},
                 )
-                stack_data.append(frame_data)
-        self.output('stack', stack=stack_data)
+                frame_data = {
+                    'filename': frame_info[0],
+                    'function': frame_info[1],
+                    'current': frame is self.curframe,
+                }
+                if (index < len(self.sent_frames) and
+                        self.sent_frames[index] == frame_info):
+                    # The client already has these locals.
+                    frame_data['unchanged'] = True
+                else:
+                    frame_data['locals'] = frame_info[2]
+                stack_data.append((line_no, frame_data))
+                inspected_frames.append(frame)
+                sent_frames.append(frame_info)
+        self.inspected_frames = inspected_frames
+        self.sent_frames = sent_frames
+        watches = self.evaluate_watches() if stack_data else []
+        described = time.perf_counter()
+        self.output('stack', stack=stack_data, watches=watches)
+        if self.stopped_at is not None:
+            encode, send = self.output_times
+            self.output('timings', stopped=self.stopped_at,
+                        stack=described - started, encode=encode, send=send,
+                        sent=time.time())
+            self.stopped_at = None
+
+    def evaluate_watches(self):
+        """
+        Return a summary of the value of each watch expression in the current
+        frame (or of the error evaluating it), in the order the client gave
+        them.
+        """
+        self.watch_values = {}
+        summaries = []
+        for expression, code, error in self.watches:
+            if code is not None:
+                try:
+                    summaries.append(self.evaluate_watch(expression, code,
+                                                         self.curframe))
+                    continue
+                except WatchTimeout:
+                    error = 'Took longer than {} seconds.'.format(
+                        WATCH_TIME_LIMIT)
+                except (Exception, SystemExit) as ex:
+                    error = '{}: {}'.format(type(ex).__name__, ex)
+            summaries.append({'name': expression, 'type': 'error',
+                              'repr': error, 'length': None,
+                              'expandable': False})
+        return summaries
+
+    def evaluate_watch(self, expression, code, frame):
+        """
+        Return a summary of the value of the compiled watch expression in the
+        referenced frame. If it takes longer than WATCH_TIME_LIMIT the
+        evaluation is interrupted with a signal (see on_pause_signal) and
+        WatchTimeout is raised. The size of the summary is limited, as for
+        every value (see describe).
+
+        Python only handles the signal between bytecodes (or when a blocking
+        call such as time.sleep is interrupted). So an expression stuck in a
+        call into C code keeps the debugger waiting until the call returns.
+        It can't be abandoned, since it must run in the paused program's own
+        thread and frame. The user can still stop the script as usual.
+        """
+        timer = Timer(WATCH_TIME_LIMIT, interrupt_main)
+        self.evaluating_watch = True
+        timer.start()
+        try:
+            value = eval(code, frame.f_globals, frame.f_locals)
+            summary = describe(expression, value)
+        finally:
+            self.evaluating_watch = False
+            timer.cancel()
+            # Make sure a late signal arrives while the program is paused, so
+            # it's ignored.
+            timer.join()
+        self.watch_values[expression] = value
+        return summary
 
     def reset(self):
         """
@@ -175,6 +395,7 @@ class Debugger(bdb.Bdb):
         self.stack = []
         self.curindex = 0
         self.curframe = None
+        self.inspected_frames = []
 
     def setup(self, frame, traceback):
         """
@@ -188,7 +409,11 @@ class Debugger(bdb.Bdb):
         """
         Contains the loop processing interactions with the debugger.
         """
+        self.interacting = True
+        self.pause_requested = False  # Paused anyway.
+        self.stopped_at = time.time()
         self.setup(frame, traceback)
+        self.trace_all(frame)
         self.output_stack()
         while True:
             try:
@@ -211,12 +436,17 @@ class Debugger(bdb.Bdb):
             except (OSError, AttributeError, ClientClose):
                 # Connection problem; try listening for new connection.
                 client, addr = self.socket.accept()
+                # Send each message straight away, rather than waiting for
+                # the previous one to be acknowledged (which can add tens of
+                # milliseconds to every step).
+                client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 self.client = client
                 self.commands = Queue()
                 self.command_thread = Thread(target=command_buffer,
                                              args=(self, ))
                 self.command_thread.daemon = True
                 self.command_thread.start()
+                self.sent_frames = []  # A new client knows nothing.
                 self.output(
                     'bootstrap',
                     breakpoints=[
@@ -226,7 +456,8 @@ class Debugger(bdb.Bdb):
                             'line': bp.line,
                             'temporary': bp.temporary,
                             'enabled': bp.enabled,
-                            'funcname': bp.funcname
+                            'funcname': bp.funcname,
+                            **self.breakpoint_options.get(bp.number, {})
                         }
                         for bp in bdb.Breakpoint.bpbynumber[1:]
                     ]
@@ -234,10 +465,390 @@ class Debugger(bdb.Bdb):
                 self.output_stack()
         # End
         self.reset()
+        self.interacting = False
+
+    # Tracing only code with breakpoints, while continuing.
+
+    def has_breakpoint(self, code):
+        """
+        Return True if a line of the referenced code object (not counting any
+        code nested within it) has a breakpoint. The answer is cached until
+        the program is next continued.
+        """
+        result = self.breakpoint_code.get(code)
+        if result is None:
+            lines = self.breaks.get(self.canonic(code.co_filename))
+            result = bool(lines) and any(
+                line in lines for offset, line in dis.findlinestarts(code))
+            self.breakpoint_code[code] = result
+        return result
+
+    def run_to_breakpoint(self):
+        """
+        Continue running the program without the overhead of tracing every
+        call and line in every module (including the standard library) until
+        a breakpoint is reached: only code containing a breakpoint is traced.
+
+        Python 3.12+ uses sys.monitoring, so code without breakpoints is only
+        looked at the first time it starts. Otherwise, the system trace
+        function only selects the frames that need tracing (see
+        trace_breakpoints).
+        """
+        self.breakpoint_code = {}
+        if self.start_monitoring():
+            sys.settrace(None)
+            events = sys.monitoring.events
+            frame = self.curframe
+            while frame and frame is not self.botframe:
+                frame.f_trace = None
+                if self.has_breakpoint(frame.f_code):
+                    self.monitor_code(frame.f_code)
+                frame = frame.f_back
+            sys.monitoring.set_events(sys.monitoring.DEBUGGER_ID,
+                                      events.PY_START)
+        else:
+            frame = self.curframe
+            while frame and frame is not self.botframe:
+                if self.has_breakpoint(frame.f_code):
+                    frame.f_trace = self.trace_dispatch
+                else:
+                    frame.f_trace = None
+                frame = frame.f_back
+            sys.settrace(self.trace_breakpoints)
+
+    def trace_all(self, frame):
+        """
+        Go back to tracing every call and line from the referenced frame (for
+        stepping through code).
+        """
+        self.stop_monitoring()
+        while frame and frame is not self.botframe:
+            frame.f_trace = self.trace_dispatch
+            frame = frame.f_back
+        sys.settrace(self.trace_dispatch)
+
+    def trace_breakpoints(self, frame, event, arg):
+        """
+        The system trace function (called as each frame starts) while
+        continuing in Python < 3.12: only frames running code that contains a
+        breakpoint are traced.
+        """
+        if self.has_breakpoint(frame.f_code):
+            return self.trace_dispatch(frame, event, arg)
+        return None
+
+    def start_monitoring(self):
+        """
+        Start using sys.monitoring (if available) to watch for breakpoints.
+        Returns a boolean indication of success.
+        """
+        if not hasattr(sys, 'monitoring'):
+            return False
+        tool = sys.monitoring.DEBUGGER_ID
+        try:
+            sys.monitoring.use_tool_id(tool, 'mu-debugger')
+        except ValueError:
+            return False  # Something else is already using it.
+        events = sys.monitoring.events
+        sys.monitoring.register_callback(tool, events.PY_START,
+                                         self.monitor_start)
+        sys.monitoring.register_callback(tool, events.LINE,
+                                         self.monitor_line)
+        self.monitoring = True
+        return True
+
+    def stop_monitoring(self):
+        """
+        Stop watching for breakpoints with sys.monitoring (if started).
+        """
+        if not self.monitoring:
+            return
+        tool = sys.monitoring.DEBUGGER_ID
+        sys.monitoring.set_events(tool, 0)
+        for code in self.monitored_code:
+            sys.monitoring.set_local_events(tool, code, 0)
+        self.monitored_code = set()
+        sys.monitoring.free_tool_id(tool)
+        # Lines disabled while monitoring must report again next time.
+        sys.monitoring.restart_events()
+        self.monitoring = False
+
+    def monitor_code(self, code):
+        """
+        Watch each line run in the referenced code object.
+        """
+        sys.monitoring.set_local_events(sys.monitoring.DEBUGGER_ID, code,
+                                        sys.monitoring.events.LINE)
+        self.monitored_code.add(code)
+
+    def monitor_start(self, code, offset):
+        """
+        Called by sys.monitoring when code starts running. Watch the lines of
+        code containing a breakpoint. Either way, the code needn't be looked
+        at again.
+        """
+        if self.has_breakpoint(code):
+            self.monitor_code(code)
+        return sys.monitoring.DISABLE
+
+    def monitor_line(self, code, line):
+        """
+        Called by sys.monitoring when a line in code containing a breakpoint
+        is about to run. Stop (and trace everything again) if the line's
+        breakpoint says so.
+        """
+        if line not in self.breaks.get(self.canonic(code.co_filename), ()):
+            return sys.monitoring.DISABLE  # No need to look at it again.
+        frame = sys._getframe(1)
+        if self.break_here(frame):
+            self.trace_all(frame)
+            self.user_line(frame)
+            if self.quitting:
+                raise bdb.BdbQuit
+
+    # Conditional breakpoints, hit counts and logpoints.
+
+    def set_breakpoint_options(self, bp, condition=None, hit_count=None,
+                               log_message=None):
+        """
+        Set the options of the referenced breakpoint: it only stops when the
+        condition (an expression) is true and on the hit_count'th time it's
+        hit (counting only the hits when the condition was true). If there's
+        a log message, it's printed instead of stopping, with any
+        {expressions} in it evaluated (like an f-string).
+
+        The condition and log message are compiled once, here, rather than
+        every time the breakpoint is hit. Returns an error message if the
+        options are invalid.
+        """
+        try:
+            if hit_count:
+                hit_count = int(hit_count)
+                if hit_count < 1:
+                    raise ValueError('hit count must be at least 1')
+            condition_code = None
+            if condition:
+                condition_code = compile(condition, '<condition>', 'eval')
+            log_code = None
+            if log_message:
+                log_code = compile('f' + repr(log_message), '<log message>',
+                                   'eval')
+        except (SyntaxError, ValueError) as ex:
+            return 'Invalid breakpoint option: {}'.format(ex)
+        bp.cond = condition or None
+        bp.hits = 0
+        self.breakpoint_options[bp.number] = {
+            'condition': condition or None,
+            'hit_count': hit_count or None,
+            'log_message': log_message or None,
+        }
+        self.compiled_options[bp.number] = (condition_code, hit_count or None,
+                                            log_code)
+
+    def should_break(self, bp, frame):
+        """
+        Return True if the referenced (enabled) breakpoint's options say the
+        program should stop in the given frame. Logpoints print their
+        message here, in the runner, and never stop.
+        """
+        condition, hit_count, log_message = self.compiled_options.get(
+            bp.number, (None, None, None))
+        if condition:
+            try:
+                if not eval(condition, frame.f_globals, frame.f_locals):
+                    return False
+            except Exception as ex:
+                # Stop, so the user can see what went wrong.
+                self.output('error', message='Error in condition of '
+                            'breakpoint {}: {}'.format(bp.number, ex))
+                return True
+        bp.hits += 1
+        if hit_count and bp.hits != hit_count:
+            return False
+        if bp.ignore > 0:
+            bp.ignore -= 1
+            return False
+        if log_message:
+            try:
+                print(eval(log_message, frame.f_globals, frame.f_locals))
+            except Exception as ex:
+                self.output('error', message='Error in log message of '
+                            'breakpoint {}: {}'.format(bp.number, ex))
+            return False
+        return True
+
+    # Recording execution, for stepping backwards.
+
+    def is_recorded(self, code):
+        """
+        Return True if the referenced code object is part of the user's code
+        (anything in the same directory as their script) so should be
+        recorded. The answer is cached.
+        """
+        result = self.recorded_code.get(code)
+        if result is None:
+            directory = os.path.dirname(self.mainpyfile) + os.sep
+            result = self.canonic(code.co_filename).startswith(directory)
+            self.recorded_code[code] = result
+        return result
+
+    def record(self, frame):
+        """
+        Add the line about to run in the referenced frame to the history,
+        with the summaries of the locals that have changed since the previous
+        line in the frame. The oldest history is forgotten to keep it within
+        MAX_HISTORY_SIZE.
+        """
+        code = frame.f_code
+        if not self.is_recorded(code):
+            return
+        key = id(frame)
+        known = self.recorded_frames.get(key)
+        previous, previous_values = known[1:] if known else ({}, {})
+        summaries = {}
+        values = {}
+        for name, value in frame.f_locals.items():
+            if name in NOT_RECORDED:
+                continue
+            if type(value) in IMMUTABLE_TYPES:
+                # Describing values is the slow part of recording.
+                values[name] = value
+                if previous_values.get(name, values) is value:
+                    summaries[name] = previous[name]
+                    continue
+            summaries[name] = describe(name, value)
+        if known is None:
+            depth = 0
+            caller = frame.f_back
+            while caller is not None:
+                depth += 1
+                caller = caller.f_back
+            changes = summaries
+        else:
+            depth = known[0]
+            changes = {k: v for k, v in summaries.items()
+                       if previous.get(k) != v}
+            changes.update((k, None) for k in previous if k not in summaries)
+        self.recorded_frames[key] = (depth, summaries, values)
+        size = 200 + sum(len(k) + (len(v['repr']) + 100 if v else 0)
+                         for k, v in changes.items())
+        self.history.append(HistoryEntry(key, known is None, depth,
+                                         self.canonic(code.co_filename),
+                                         frame.f_lineno, changes, size))
+        self.history_size += size
+        while self.history_size > MAX_HISTORY_SIZE and len(self.history) > 1:
+            self.history_size -= self.history.popleft().size
+
+    def recorded_locals(self, position):
+        """
+        Return the summaries of the locals when the line at the referenced
+        position in the history was run (rebuilt from the changes recorded
+        in its frame, as far back as the history goes).
+        """
+        entry = self.history[position]
+        summaries = {}
+        earlier_entries = islice(reversed(self.history),
+                                 len(self.history) - 1 - position, None)
+        for earlier in earlier_entries:
+            if earlier.frame == entry.frame:
+                for name, summary in earlier.changes.items():
+                    summaries.setdefault(name, summary)
+                if earlier.start:
+                    break
+        # The values are long gone, so their children can't be shown.
+        return {name: dict(summary, expandable=False)
+                for name, summary in summaries.items() if summary}
+
+    def show_history(self):
+        """
+        Send the client the line (and locals) at the current position in the
+        history.
+        """
+        position = self.history_position
+        entry = self.history[position]
+        self.output('history', filename=entry.filename, line=entry.line,
+                    locals=self.recorded_locals(position),
+                    steps=len(self.history) - 1 - position)
+
+    def step_forward(self, stop):
+        """
+        Step forwards through the history to the next line for which the stop
+        function (given the depth of that line's frame and that of the line
+        being looked at) returns True, or to the present.
+        """
+        depth = self.history[self.history_position].depth
+        start = self.history_position + 1
+        for position, entry in enumerate(islice(self.history, start,
+                                                len(self.history) - 1),
+                                         start):
+            if stop(entry.depth, depth):
+                self.history_position = position
+                self.show_history()
+                return
+        # Back to the present, where the program is actually paused.
+        self.history_position = None
+        self.output('line', filename=self.canonic(
+            self.curframe.f_code.co_filename), line=self.curframe.f_lineno)
+        self.sent_frames = []
+        self.output_stack()
 
     # Overridden Bdb methods
     # See https://docs.python.org/3.6/library/bdb.html#bdb.Bdb.user_call
 
+    def dispatch_line(self, frame):
+        """
+        Record the line about to run (when recording) before deciding whether
+        to stop at it.
+        """
+        if self.recording:
+            self.record(frame)
+        return super().dispatch_line(frame)
+
+    def dispatch_call(self, frame, arg):
+        """
+        When recording, trace every line of the user's code (even when Bdb
+        wouldn't need to) so it's all recorded.
+        """
+        result = super().dispatch_call(frame, arg)
+        if result is None and self.recording and \
+                self.is_recorded(frame.f_code):
+            return self.trace_dispatch
+        return result
+
+    def dispatch_return(self, frame, arg):
+        """
+        Forget the locals recorded for a frame that's returning.
+        """
+        if self.recording:
+            self.recorded_frames.pop(id(frame), None)
+        return super().dispatch_return(frame, arg)
+
+    def break_here(self, frame):
+        """
+        Return True if there's an enabled breakpoint on the frame's current
+        line (or, for a function breakpoint, the line the function starts
+        on) whose options say to stop (see should_break).
+
+        Unlike Bdb, conditions are evaluated from code compiled in advance,
+        hit counts only include the hits that met the condition and
+        logpoints never stop.
+        """
+        filename = self.canonic(frame.f_code.co_filename)
+        lines = self.breaks.get(filename, ())
+        line = frame.f_lineno
+        if line not in lines:
+            line = frame.f_code.co_firstlineno
+            if line not in lines:
+                return False
+        for bp in bdb.Breakpoint.bplist[filename, line]:
+            if bp.enabled and bdb.checkfuncname(bp, frame) and \
+                    self.should_break(bp, frame):
+                self.currentbp = bp.number
+                if bp.temporary:
+                    self.do_clear(bp.number)
+                return True
+        return False
+
     def user_call(self, frame, argument_list):
         """
         This method is called from dispatch_call() when there is the
@@ -297,9 +908,11 @@ class Debugger(bdb.Bdb):
 
     # Debug command handlers.
 
-    def do_break(self, filename, line, temporary=False):
+    def do_break(self, filename, line, temporary=False, condition=None,
+                 hit_count=None, log_message=None):
         """
-        Set a breakpoint.
+        Set a breakpoint, with optional condition, hit count and log message
+        (see set_breakpoint_options).
         """
         globs = self.curframe.f_globals if hasattr(self, 'curframe') else None
         code = linecache.getline(filename, line, globs)
@@ -309,13 +922,21 @@ class Debugger(bdb.Bdb):
                 self.output('error', message=err)
             else:
                 bp = self.get_breaks(filename, line)[-1]
+                err = self.set_breakpoint_options(bp, condition, hit_count,
+                                                  log_message)
+                if err:
+                    # Don't leave a breakpoint that always stops instead.
+                    self.clear_bpbynumber(bp.number)
+                    self.output('error', message=err)
+                    return
                 self.output(
                     'breakpoint_create',
                     bpnum=bp.number,
                     filename=bp.file,
                     line=bp.line,
                     temporary=bp.temporary,
-                    funcname=bp.funcname
+                    funcname=bp.funcname,
+                    **self.breakpoint_options.get(bp.number, {})
                 )
         else:
             self.output('error', message='{}:{} is not executable'.format(
@@ -367,6 +988,27 @@ class Debugger(bdb.Bdb):
             else:
                 self.output('breakpoint_enable', bpnum=bpnum)
 
+    def do_options(self, bpnum, condition=None, hit_count=None,
+                   log_message=None):
+        """
+        Set the condition, hit count and log message of the breakpoint
+        referenced by its breakpoint number (bpnum).
+        """
+        bpnum = int(bpnum)
+        if not (0 < bpnum < len(bdb.Breakpoint.bpbynumber)) or \
+                not bdb.Breakpoint.bpbynumber[bpnum]:
+            self.output('error',
+                        message='No breakpoint numbered {}'.format(bpnum))
+            return
+        bp = bdb.Breakpoint.bpbynumber[bpnum]
+        err = self.set_breakpoint_options(bp, condition, hit_count,
+                                          log_message)
+        if err:
+            self.output('error', message=err)
+        else:
+            self.output('breakpoint_options', bpnum=bpnum,
+                        **self.breakpoint_options[bpnum])
+
     def do_clear(self, bpnum):
         """
         Handle how a breakpoint must be removed when it is a temporary one.
@@ -379,12 +1021,17 @@ class Debugger(bdb.Bdb):
             if err:
                 self.output('error', message=err)
             else:
+                self.breakpoint_options.pop(bpnum, None)
+                self.compiled_options.pop(bpnum, None)
                 self.output('breakpoint_clear', bpnum=bpnum)
 
     def do_step(self):
         """
         Stop after one line of code.
         """
+        if self.history_position is not None:
+            self.step_forward(lambda depth, current: True)
+            return
         self.set_step()
         return True
 
@@ -392,9 +1039,70 @@ class Debugger(bdb.Bdb):
         """
         Stop on the next line in or below the given frame.
         """
+        if self.history_position is not None:
+            self.step_forward(lambda depth, current: depth <= current)
+            return
         self.set_next(self.curframe)
         return True
 
+    def do_back(self):
+        """
+        Step backwards to the previous line in the recorded history (without
+        running anything). Stepping forwards (see do_step, do_next and
+        do_return) goes back through the history to the present.
+        """
+        if self.history_position is None:
+            position = len(self.history) - 1  # The present.
+        else:
+            position = self.history_position
+        if position < 1:
+            self.output('info', message='There is no earlier history.')
+            return
+        self.history_position = position - 1
+        self.show_history()
+
+    def do_record(self, enabled):
+        """
+        Start (or stop) recording each line run in the user's code so the
+        client can step backwards through it. Either way, any previously
+        recorded history is forgotten.
+        """
+        self.recording = bool(enabled)
+        self.history.clear()
+        self.history_size = 0
+        self.history_position = None
+        self.recorded_frames = {}
+        if self.recording and self.curframe:
+            self.record(self.curframe)
+
+    def do_expand(self, frame, path, start=0, count=MAX_CHILDREN):
+        """
+        Send a summary of (up to count of) the children of a variable in the
+        referenced frame (an index into the stack last sent), starting from
+        the child at the given position. The path is the name of the variable
+        followed by the position of each child to descend into. The values of
+        the watch expressions are in the WATCH_FRAME.
+        """
+        try:
+            if frame == WATCH_FRAME:
+                value = self.watch_values[path[0]]
+            else:
+                value = self.inspected_frames[frame].f_locals[path[0]]
+            for position in path[1:]:
+                value = next(islice(get_children(value), position, None))[1]
+        except (IndexError, KeyError, StopIteration):
+            # The stack has changed since the client asked.
+            self.output('expansion', frame=frame, path=path, children=[],
+                        more=0, start=start)
+            return
+        children = [describe(label, child) for label, child in
+                    islice(get_children(value), start, start + count)]
+        more = 0
+        if isinstance(value, (dict, list, tuple, set, frozenset)):
+            more = max(len(value) - start - len(children), 0)
+        self.output('expansion', frame=frame, path=path, children=children,
+                    more=more, start=start)
+
     def do_restart(self):
         """
         Restart the program by raising an exception to be caught by the
@@ -406,6 +1114,9 @@ class Debugger(bdb.Bdb):
         """
         Stop when returning from the current frame.
         """
+        if self.history_position is not None:
+            self.step_forward(lambda depth, current: depth < current)
+            return
         self.set_return(self.curframe)
         return True
 
@@ -416,13 +1127,68 @@ class Debugger(bdb.Bdb):
         However, use the continue_flag to ensure set_continue is always called
         thereafter.
         """
+        self.history_position = None
         if self.continue_flag or self.get_all_breaks():
-            self.set_continue()
+            if self.recording:
+                # Keep tracing every line, so it's recorded.
+                self._set_stopinfo(self.botframe, None, -1)
+            else:
+                self.set_continue()
+                if self.breaks:
+                    self.run_to_breakpoint()
         else:
             self.set_step()
             self.continue_flag = True
         return True
 
+    def do_watch(self, expressions):
+        """
+        Compile, once, the expressions the client wants to watch: they're
+        evaluated in the current frame whenever the program stops (see
+        evaluate_watches). If it's stopped now, send the stack (with the
+        values of the expressions) again.
+        """
+        self.watches = []
+        for expression in expressions:
+            try:
+                code = compile(expression, '<watch>', 'eval')
+                self.watches.append((expression, code, None))
+            except (SyntaxError, ValueError) as ex:
+                error = '{}: {}'.format(type(ex).__name__, ex)
+                self.watches.append((expression, None, error))
+        if self.curframe and self.history_position is None:
+            self.output_stack()
+
+    def do_pause(self):
+        """
+        Pause the running program at the next line. This is called by the
+        command_buffer thread as soon as the command arrives, so the program
+        is interrupted with a signal (see on_pause_signal) to stop it
+        whatever it's doing and however it's being traced.
+        """
+        if not (self.interacting or self.pause_requested):
+            self.pause_requested = True
+            interrupt_main()
+
+    def on_pause_signal(self, signum, frame):
+        """
+        Handle the signal sent to pause the program (in the main thread,
+        between the lines of the program) by tracing everything again and
+        stopping at the next line of the interrupted frame (or wherever the
+        program goes next, if it returns). Any other interruption (e.g.
+        Ctrl-C) is handled as usual. The same signal interrupts a watch
+        expression that takes too long (see evaluate_watch).
+        """
+        if self.evaluating_watch:
+            raise WatchTimeout()
+        if self.pause_requested:
+            self.pause_requested = False
+            # Not set_step, which would stop in this handler.
+            self.set_next(frame)
+            self.trace_all(frame)
+        elif not self.interacting:
+            signal.default_int_handler(signum, frame)
+
     def do_quit(self):
         """
         Set the quitting attribute to True. This raises BdbQuit in the next
@@ -466,13 +1232,22 @@ class Debugger(bdb.Bdb):
              ' r"{filename}", "exec");'
              'exec(__debug_code__);'
              '__debug_script__.close();'.format(filename=filename))
-        self.run(e)
+        handler = signal.signal(signal.SIGINT, self.on_pause_signal)
+        try:
+            self.run(e)
+        finally:
+            self.stop_monitoring()
+            signal.signal(signal.SIGINT, handler)
 
 
 def run(hostname, port, filename, *args):
     """
     Run a Python script identified by "filename" with the specified arguments
     in a debugger session that's listening at hostname/port.
+
+    If the port is 0, any free port is used. Either way, the port is
+    announced as the first line of output (see PORT_HANDSHAKE) so the client
+    can connect straight away.
     """
     # Create the correct context for the target Python script.
     sys.argv[0] = filename
@@ -485,6 +1260,8 @@ def run(hostname, port, filename, *args):
     s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
     s.bind((hostname, port))
     s.listen(1)
+    port = s.getsockname()[1]
+    print(PORT_HANDSHAKE.format(port), flush=True)
 
     debugger = Debugger(s, hostname, port)
     debugger.reset()
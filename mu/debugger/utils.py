@@ -16,6 +16,32 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
+import json
+import struct
+import zlib
+
+
+#: Each message starts with a header of its flags and the payload's length.
+HEADER = struct.Struct('!BI')
+#: Flag set in the header if the payload is compressed.
+COMPRESSED = 1
+#: Payloads larger than this (in bytes) are compressed before sending. Off by
+#: default, since it doesn't pay over localhost (see the debugger benchmark in
+#: the utils directory).
+COMPRESS_THRESHOLD = None
+#: The number of bytes to ask for in each read from the socket.
+RECV_SIZE = 256 * 1024
+#: The first line of output from the debug runner, telling Mu the port on
+#: which it's listening for the client to connect.
+PORT_HANDSHAKE = 'mu-debugger-port: {}'
+#: The frame index given to the values of watch expressions, so they can be
+#: expanded in the same way as the locals in each frame of the stack.
+WATCH_FRAME = -1
+#: The stages of each step in the debugger, from the program stopping to the
+#: client showing the stack, whose durations are measured (see the client's
+#: Debugger.on_timings).
+LATENCY_STAGES = ['stack', 'encode', 'send', 'transfer', 'queue', 'decode',
+                  'editor', 'inspector', 'total']
 
 
 def is_breakpoint_line(code):
@@ -39,3 +65,66 @@ def is_breakpoint_line(code):
     if len(code) == 1 and code in (')', '}', ']'):
         return False
     return True
+
+
+def read_port_handshake(line):
+    """
+    Return the port number announced in the referenced line of output from
+    the debug runner (see PORT_HANDSHAKE), or None if it isn't the
+    handshake.
+    """
+    prefix = PORT_HANDSHAKE.format('')
+    line = line.strip()
+    if line.startswith(prefix) and line[len(prefix):].isdigit():
+        return int(line[len(prefix):])
+    return None
+
+
+def encode_message(event, data, compress_threshold=COMPRESS_THRESHOLD):
+    """
+    Return the bytes of a message, for the named event with the given data, to
+    be sent to the other end of the debugger's connection.
+
+    The message is compact JSON preceded by a header of flags and the length
+    of the payload, so the payload may contain any bytes at all. Payloads
+    larger than the compress_threshold (None to never compress) are
+    compressed with zlib.
+    """
+    payload = json.dumps((event, data), separators=(',', ':')).encode('utf-8')
+    flags = 0
+    if compress_threshold is not None and len(payload) > compress_threshold:
+        payload = zlib.compress(payload, 1)
+        flags |= COMPRESSED
+    return HEADER.pack(flags, len(payload)) + payload
+
+
+class MessageBuffer:
+    """
+    Buffers the bytes received from the other end of the debugger's
+    connection and extracts the complete messages within them.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """
+        Add the newly received bytes to the buffer and return a list of the
+        JSON of each message that is now complete, in the order they arrived.
+        """
+        self.buffer += data
+        messages = []
+        start = 0
+        available = len(self.buffer)
+        while available - start >= HEADER.size:
+            flags, length = HEADER.unpack_from(self.buffer, start)
+            end = start + HEADER.size + length
+            if end > available:
+                break  # Wait for the rest of the message.
+            payload = bytes(self.buffer[start + HEADER.size:end])
+            if flags & COMPRESSED:
+                payload = zlib.decompress(payload)
+            messages.append(payload.decode('utf-8'))
+            start = end
+        del self.buffer[:start]
+        return messages
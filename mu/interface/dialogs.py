@@ -17,16 +17,22 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import QSize, QTimer, Qt
 from PyQt5.QtWidgets import (QVBoxLayout, QListWidget, QLabel, QListWidgetItem,
                              QDialog, QDialogButtonBox, QPlainTextEdit,
-                             QTabWidget, QWidget, QCheckBox, QLineEdit)
+                             QTabWidget, QWidget, QCheckBox, QLineEdit,
+                             QSpinBox, QTableWidget, QTableWidgetItem)
 from mu.resources import load_icon
+from mu.debugger.utils import LATENCY_STAGES
 
 
 logger = logging.getLogger(__name__)
 
 
+# The most pre-warmed interpreters which may be kept ready to run scripts.
+MAX_WARM_POOL = 4
+
+
 class ModeItem(QListWidgetItem):
     """
     Represents an available mode listed for selection.
@@ -118,10 +124,10 @@ class LogWidget(QWidget):
 class EnvironmentVariablesWidget(QWidget):
     """
     Used for editing and displaying environment variables used with Python 3
-    mode.
+    mode, and the number of interpreters kept ready to run scripts.
     """
 
-    def setup(self, envars):
+    def setup(self, envars, warm_pool=0):
         widget_layout = QVBoxLayout()
         self.setLayout(widget_layout)
         label = QLabel(_('The environment variables shown below will be '
@@ -134,6 +140,35 @@ class EnvironmentVariablesWidget(QWidget):
         self.text_area.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.text_area.setPlainText(envars)
         widget_layout.addWidget(self.text_area)
+        label = QLabel(_('Number of Python interpreters to keep ready, so '
+                         'scripts start running sooner (0 means none):'))
+        label.setWordWrap(True)
+        widget_layout.addWidget(label)
+        self.warm_pool = QSpinBox()
+        self.warm_pool.setRange(0, MAX_WARM_POOL)
+        self.warm_pool.setValue(warm_pool)
+        widget_layout.addWidget(self.warm_pool)
+
+
+class EditorSettingsWidget(QWidget):
+    """
+    Used for configuring the editor:
+
+    * Checking code as you type.
+    """
+
+    def setup(self, live_check):
+        widget_layout = QVBoxLayout()
+        self.setLayout(widget_layout)
+        self.live_check = QCheckBox(_('Check the code for problems as you '
+                                      'type?'))
+        self.live_check.setChecked(live_check)
+        widget_layout.addWidget(self.live_check)
+        label = QLabel(_('Problems are shown soon after you stop typing. '
+                         'Press Check to show or hide them.'))
+        label.setWordWrap(True)
+        widget_layout.addWidget(label)
+        widget_layout.addStretch()
 
 
 class MicrobitSettingsWidget(QWidget):
@@ -161,6 +196,88 @@ class MicrobitSettingsWidget(QWidget):
         widget_layout.addStretch()
 
 
+class DebuggerSettingsWidget(QWidget):
+    """
+    Used for configuring the graphical debugger:
+
+    * Recording history (so it's possible to step backwards).
+    """
+
+    def setup(self, debug_recording):
+        widget_layout = QVBoxLayout()
+        self.setLayout(widget_layout)
+        self.recording = QCheckBox(_('Record the history of the program while '
+                                     'debugging (so you can step '
+                                     'backwards)?'))
+        self.recording.setChecked(debug_recording)
+        widget_layout.addWidget(self.recording)
+        label = QLabel(_('Recording makes the program run more slowly in the '
+                         'debugger.'))
+        label.setWordWrap(True)
+        widget_layout.addWidget(label)
+        widget_layout.addStretch()
+
+
+class DebuggerLatencyWidget(QWidget):
+    """
+    Used to display how long each stage of the recent steps in the graphical
+    debugger took, updated as more steps are taken.
+    """
+
+    stage_names = {
+        'stack': _('Describing the stack'),
+        'encode': _('Encoding the stack'),
+        'send': _('Sending the stack'),
+        'transfer': _('Receiving the stack'),
+        'queue': _('Waiting for Mu'),
+        'decode': _('Decoding the stack'),
+        'editor': _('Highlighting the line'),
+        'inspector': _('Updating the debug inspector'),
+        'total': _('Total'),
+    }
+
+    def setup(self, latency):
+        self.latency = latency
+        widget_layout = QVBoxLayout()
+        self.setLayout(widget_layout)
+        self.label = QLabel()
+        self.label.setWordWrap(True)
+        widget_layout.addWidget(self.label)
+        self.table = QTableWidget(len(LATENCY_STAGES), 3)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setHorizontalHeaderLabels([_('Last step (ms)'),
+                                              _('Mean (ms)'),
+                                              _('Slowest (ms)')])
+        self.table.setVerticalHeaderLabels([self.stage_names[stage]
+                                            for stage in LATENCY_STAGES])
+        widget_layout.addWidget(self.table)
+        self.refresh()
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(500)
+
+    def refresh(self):
+        """
+        Show the latency of the steps taken so far.
+        """
+        steps = list(self.latency)
+        self.label.setText(_('The time taken by each stage of the last {} '
+                             'steps in the debugger, from the program '
+                             'stopping until Mu shows where it is.')
+                           .format(len(steps)))
+        for row, stage in enumerate(LATENCY_STAGES):
+            values = [step[stage] * 1000 for step in steps]
+            if values:
+                cells = ['{:.1f}'.format(value) for value in
+                         (values[-1], sum(values) / len(values), max(values))]
+            else:
+                cells = ['-', '-', '-']
+            for column, text in enumerate(cells):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+
+
 class AdminDialog(QDialog):
     """
     Displays administrative related information and settings (logs, environment
@@ -185,13 +302,23 @@ class AdminDialog(QDialog):
         self.log_widget.setup(log)
         self.tabs.addTab(self.log_widget, _("Current Log"))
         self.envar_widget = EnvironmentVariablesWidget()
-        self.envar_widget.setup(settings.get('envars', ''))
+        self.envar_widget.setup(settings.get('envars', ''),
+                                settings.get('warm_pool', 0))
         self.tabs.addTab(self.envar_widget, _('Python3 Environment'))
         self.log_widget.log_text_area.setFocus()
+        self.editor_widget = EditorSettingsWidget()
+        self.editor_widget.setup(settings.get('live_check', True))
+        self.tabs.addTab(self.editor_widget, _('Editor Settings'))
         self.microbit_widget = MicrobitSettingsWidget()
         self.microbit_widget.setup(settings.get('minify', False),
                                    settings.get('microbit_runtime', ''))
         self.tabs.addTab(self.microbit_widget, _('BBC micro:bit Settings'))
+        self.debugger_widget = DebuggerSettingsWidget()
+        self.debugger_widget.setup(settings.get('debug_recording', False))
+        self.tabs.addTab(self.debugger_widget, _('Debugger Settings'))
+        self.latency_widget = DebuggerLatencyWidget()
+        self.latency_widget.setup(settings.get('debug_latency', []))
+        self.tabs.addTab(self.latency_widget, _('Debugger Latency'))
 
     def settings(self):
         """
@@ -201,8 +328,11 @@ class AdminDialog(QDialog):
         """
         return {
             'envars': self.envar_widget.text_area.toPlainText(),
+            'warm_pool': self.envar_widget.warm_pool.value(),
             'minify': self.microbit_widget.minify.isChecked(),
             'microbit_runtime': self.microbit_widget.runtime_path.text(),
+            'debug_recording': self.debugger_widget.recording.isChecked(),
+            'live_check': self.editor_widget.live_check.isChecked(),
         }
 
 
@@ -262,3 +392,69 @@ class FindReplaceDialog(QDialog):
         Return the value of the global replace flag.
         """
         return self.replace_all_flag.isChecked()
+
+
+class BreakpointOptionsDialog(QDialog):
+    """
+    Display a dialog for getting the options of a breakpoint:
+
+    * A condition that must be true for the debugger to stop,
+    * The hit (counting only those meeting the condition) to stop on,
+    * A message to log instead of stopping.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+    def setup(self, condition=None, hit_count=None, log_message=None):
+        self.setMinimumSize(600, 200)
+        self.setWindowTitle(_('Breakpoint Options'))
+        widget_layout = QVBoxLayout()
+        self.setLayout(widget_layout)
+        # Condition.
+        condition_label = QLabel(_('Only stop when this expression is true '
+                                   '(optional):'))
+        self.condition_term = QLineEdit()
+        self.condition_term.setText(condition)
+        widget_layout.addWidget(condition_label)
+        widget_layout.addWidget(self.condition_term)
+        # Hit count.
+        hit_count_label = QLabel(_('Only stop on this hit of the breakpoint '
+                                   '(optional):'))
+        self.hit_count_term = QSpinBox()
+        self.hit_count_term.setRange(0, 1000000000)
+        self.hit_count_term.setSpecialValueText(_('Every hit'))
+        self.hit_count_term.setValue(hit_count or 0)
+        widget_layout.addWidget(hit_count_label)
+        widget_layout.addWidget(self.hit_count_term)
+        # Log message.
+        log_message_label = QLabel(_('Log this message instead of stopping, '
+                                     'with any {expressions} filled in '
+                                     '(optional):'))
+        self.log_message_term = QLineEdit()
+        self.log_message_term.setText(log_message)
+        widget_layout.addWidget(log_message_label)
+        widget_layout.addWidget(self.log_message_term)
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok |
+                                      QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        widget_layout.addWidget(button_box)
+
+    def condition(self):
+        """
+        Return the condition the user entered, or None.
+        """
+        return self.condition_term.text().strip() or None
+
+    def hit_count(self):
+        """
+        Return the hit count the user entered, or None.
+        """
+        return self.hit_count_term.value() or None
+
+    def log_message(self):
+        """
+        Return the log message the user entered, or None.
+        """
+        return self.log_message_term.text() or None
@@ -19,13 +19,16 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import keyword
 import os
 import re
+import hashlib
 import logging
 import os.path
 from collections import defaultdict
 from PyQt5.Qsci import QsciScintilla, QsciLexerPython, QsciAPIs
 from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QWidget
 from mu.interface.themes import Font, DayTheme
-from mu.logic import NEWLINE
+from mu.logic import NEWLINE, DATA_DIR
+from mu import __version__
 
 
 # Regular Expression for valid individual code 'words'
@@ -58,6 +61,132 @@ class PythonLexer(QsciLexerPython):
         return ' '.join(kws)
 
 
+class TranslatedAPIs(QsciAPIs):
+    """
+    API entries for tooltips, calltips and the like, added untranslated and
+    only translated when a call tip is actually shown.
+    """
+
+    def __init__(self, lexer, api_definitions):
+        super().__init__(lexer)
+        self.api_definitions = api_definitions
+        self.entries = None  # Entries by the call tips shown for them.
+
+    def callTips(self, context, commas, style, shifts):
+        """
+        Return the translated call tips for the context (see QsciAPIs).
+        """
+        tips = super().callTips(context, commas, style, shifts)
+        return [self.translate(tip) for tip in tips]
+
+    def translate(self, tip):
+        """
+        Return the translation of the call tip, which is either an entry or
+        an entry without its leading "module." qualifiers.
+        """
+        if self.entries is None:
+            self.entries = {}
+            for entry in self.api_definitions:
+                self.entries[entry] = entry
+                name = entry.split('(', 1)[0]
+                if '.' in name:
+                    qualifiers = name.rsplit('.', 1)[0] + '.'
+                    self.entries.setdefault(entry[len(qualifiers):], entry)
+        entry = self.entries.get(tip, tip)
+        translation = _(entry)
+        qualifiers = entry[:len(entry) - len(tip)]
+        if translation.startswith(qualifiers):
+            return translation[len(qualifiers):]
+        return translation
+
+
+class PreparedAPIs:
+    """
+    The API entries for tooltips, calltips and the like, prepared once and
+    shared by all the tabs using the same entries (i.e. in the same mode),
+    rather than prepared again for each tab.
+
+    The entries are prepared in the background (by QsciAPIs) and the result
+    saved in Mu's data directory, so the same entries for the same version of
+    Mu are loaded rather than prepared again.
+    """
+
+    def __init__(self):
+        self.lexer = None  # Created on first use (needs a QApplication).
+        self.apis = {}  # QsciAPIs by key (see get).
+
+    def path(self, key):
+        """
+        Return the path of the file containing the prepared API entries with
+        the referenced key.
+        """
+        return os.path.join(DATA_DIR, 'api-{}-{}.prepared'.format(__version__,
+                                                                  key))
+
+    def get(self, api_definitions):
+        """
+        Return the QsciAPIs for the referenced API entries, which may still
+        be being prepared.
+
+        The entries are keyed by a hash of their content.
+        """
+        key = hashlib.sha1('\n'.join(api_definitions).encode('utf-8')).\
+            hexdigest()[:16]
+        if key not in self.apis:
+            if self.lexer is None:
+                self.lexer = PythonLexer()
+            api = TranslatedAPIs(self.lexer, api_definitions)
+            path = self.path(key)
+            if os.path.isfile(path) and api.loadPrepared(path):
+                logger.info('Loaded prepared API from {}'.format(path))
+            else:
+                for entry in api_definitions:
+                    api.add(entry)
+                api.apiPreparationFinished.connect(
+                    lambda: self.save(api, path))
+                api.prepare()
+            self.apis[key] = api
+        return self.apis[key]
+
+    def save(self, api, path):
+        """
+        Save the prepared API entries to the referenced path.
+        """
+        if api.savePrepared(path):
+            logger.info('Saved prepared API to {}'.format(path))
+        else:
+            logger.warning('Could not save prepared API to {}'.format(path))
+
+
+# The prepared API entries shared by all the tabs.
+prepared_apis = PreparedAPIs()
+
+
+class EditorPlaceholder(QWidget):
+    """
+    Stands in for the editor of a file restored from the last session until
+    its tab is first focused, so the file is only read, lexed and styled when
+    it is needed.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    @property
+    def label(self):
+        """
+        The label associated with the placeholder (the filename of the script).
+        """
+        return os.path.basename(self.path)
+
+    def isModified(self):
+        """
+        The file hasn't been read yet, so there are never unsaved changes.
+        """
+        return False
+
+
 class EditorPane(QsciScintilla):
     """
     Represents the text editor.
@@ -74,7 +203,8 @@ class EditorPane(QsciScintilla):
         self.newline = newline
         self.check_indicators = {  # IDs are arbitrary
             'error': {'id': 19, 'markers': {}},
-            'style': {'id': 20, 'markers': {}}
+            'style': {'id': 20, 'markers': {}},
+            'profile': {'id': 24, 'markers': {}},
         }
         self.search_indicators = {
             'selection': {'id': 21, 'positions': []}
@@ -86,9 +216,17 @@ class EditorPane(QsciScintilla):
         }
         self.lexer = PythonLexer()
         self.api = None
+        # Flag to show the annotations are the results of checking the code
+        # on request (see Editor.check_code).
         self.has_annotations = False
+        # Flag to show lines may have moved since the check annotations were
+        # made (see update_annotations).
+        self.lines_changed = False
+        self.linesChanged.connect(self.on_lines_changed)
         self.setModified(False)
         self.breakpoint_handles = set()
+        # Condition, hit count and log message of breakpoints, by handle.
+        self.breakpoint_options = {}
         self.configure()
 
     def dropEvent(self, event):
@@ -181,6 +319,8 @@ class EditorPane(QsciScintilla):
                                          self.check_indicators['error']['id'])
         self.setIndicatorForegroundColor(theme.IndicatorStyle,
                                          self.check_indicators['style']['id'])
+        self.setIndicatorForegroundColor(
+            theme.IndicatorProfile, self.check_indicators['profile']['id'])
         self.setIndicatorForegroundColor(theme.DebugStyle,
                                          self.DEBUG_INDICATOR)
         for type_ in self.search_indicators:
@@ -202,10 +342,8 @@ class EditorPane(QsciScintilla):
         """
         Sets the API entries for tooltips, calltips and the like.
         """
-        self.api = QsciAPIs(self.lexer)
-        for entry in api_definitions:
-            self.api.add(entry)
-        self.api.prepare()
+        self.api = prepared_apis.get(api_definitions)
+        self.lexer.setAPIs(self.api)
 
     @property
     def label(self):
@@ -280,6 +418,67 @@ class EditorPane(QsciScintilla):
             first_problem_line = sorted(feedback.keys())[0]
             self.ensureLineVisible(first_problem_line)
 
+    def on_lines_changed(self):
+        """
+        The number of lines has changed, so the annotations (which move with
+        the text) may no longer be on the lines recorded for them.
+        """
+        self.lines_changed = True
+
+    def update_annotations(self, feedback):
+        """
+        Given a dictionary of lists of annotations by type (see annotate_code)
+        replace the annotations of those types, only re-applying those on the
+        lines whose annotations have changed.
+
+        If the number of lines has changed since the last update, so the
+        annotations may have moved, all the annotations are re-applied.
+        """
+        changed = set()
+        if self.lines_changed:
+            self.lines_changed = False
+            last_line = self.lines() - 1
+            for annotation_type in feedback:
+                self.clearIndicatorRange(
+                    0, 0, last_line, len(self.text(last_line)),
+                    self.check_indicators[annotation_type]['id'])
+                self.check_indicators[annotation_type]['markers'] = {}
+            self.clearAnnotations()
+            for indicator in self.check_indicators.values():
+                changed.update(indicator['markers'])
+        for annotation_type, markers in feedback.items():
+            indicator = self.check_indicators[annotation_type]
+            old_markers = indicator['markers']
+            for line_no in set(old_markers) | set(markers):
+                if old_markers.get(line_no) == markers.get(line_no):
+                    continue
+                changed.add(line_no)
+                self.clearIndicatorRange(line_no, 0, line_no, 999999,
+                                         indicator['id'])
+                for message in markers.get(line_no, []):
+                    col = message.get('column', 0)
+                    if col:
+                        self.fillIndicatorRange(line_no, col - 1, line_no,
+                                                col + 1, indicator['id'])
+            indicator['markers'] = dict(markers)
+        for line_no in changed:
+            self.clearAnnotations(line_no)
+        self.annotate_lines(changed)
+
+    def annotate_lines(self, lines):
+        """
+        Display the messages to be annotated to the referenced lines of code.
+        """
+        for line in lines:
+            messages = []
+            for indicator in self.check_indicators:
+                for m in self.check_indicators[indicator]['markers'].get(
+                        line, []):
+                    messages.append('\u2191 ' + m['message'])
+            text = '\n'.join(messages).strip()
+            if text:
+                self.annotate(line, text, self.annotationDisplay())
+
     def debugger_at_line(self, line):
         """
         Set the line to be highlighted with the DEBUG_INDICATOR.
@@ -291,6 +490,16 @@ class EditorPane(QsciScintilla):
                                 self.DEBUG_INDICATOR)
         self.ensureLineVisible(line)
 
+    def breakpoint_handle(self, line):
+        """
+        Return the handle of the breakpoint marker on the referenced line, or
+        None if there isn't one.
+        """
+        for handle in self.breakpoint_handles:
+            if self.markerLine(handle) == line:
+                return handle
+        return None
+
     def reset_debugger_highlight(self):
         """
         Reset all the lines so the DEBUG_INDICATOR is no longer displayed.
@@ -18,30 +18,37 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import sys
 import logging
-import serial
 import os.path
 from PyQt5.QtCore import QSize, Qt, pyqtSignal, QTimer, QIODevice
 from PyQt5.QtWidgets import (QToolBar, QAction, QDesktopWidget, QWidget,
                              QVBoxLayout, QTabWidget, QFileDialog, QMessageBox,
                              QLabel, QMainWindow, QStatusBar, QDockWidget,
                              QShortcut)
-from PyQt5.QtGui import QKeySequence, QStandardItemModel
-from PyQt5.QtSerialPort import QSerialPort
+from PyQt5.QtGui import QKeySequence
 from mu import __version__
-from mu.interface.dialogs import ModeSelector, AdminDialog, FindReplaceDialog
+from mu.interface.dialogs import (ModeSelector, AdminDialog, FindReplaceDialog,
+                                  BreakpointOptionsDialog)
 from mu.interface.themes import (DayTheme, NightTheme, ContrastTheme,
                                  DEFAULT_FONT_SIZE)
-from mu.interface.panes import (DebugInspector, DebugInspectorItem,
-                                PythonProcessPane, JupyterREPLPane,
-                                MicroPythonREPLPane, FileSystemPane,
-                                PlotterPane)
-from mu.interface.editor import EditorPane
+from mu.interface.panes import (DebugInspector, DebugInspectorModel,
+                                PythonProcessPane, MicroPythonREPLPane,
+                                FileSystemPane, ProfilerPane)
+from mu.interface.editor import EditorPane, EditorPlaceholder
 from mu.resources import load_icon, load_pixmap
 
 
 logger = logging.getLogger(__name__)
 
 
+# The theme of the editor tabs and the icon of the theme button, by the name
+# of the theme.
+THEMES = {
+    'day': (DayTheme, 'theme'),
+    'night': (NightTheme, 'theme_contrast'),
+    'contrast': (ContrastTheme, 'theme_day'),
+}
+
+
 class ButtonBar(QToolBar):
     """
     Represents the bar of buttons across the top of the editor and defines
@@ -168,6 +175,9 @@ class FileTabs(QTabWidget):
             window.update_title(current_tab.label)
         else:
             window.update_title(None)
+        if isinstance(current_tab, EditorPlaceholder):
+            # The tab is focused for the first time, so load the file.
+            window.placeholder_focused.emit(current_tab)
 
 
 class Window(QMainWindow):
@@ -182,6 +192,9 @@ class Window(QMainWindow):
     serial = None
     repl = None
     plotter = None
+    theme = None
+    loaded_theme = None  # The theme of the loaded stylesheet.
+    painted = False  # Whether the window has been painted yet.
 
     _zoom_in = pyqtSignal(int)
     _zoom_out = pyqtSignal(int)
@@ -190,6 +203,10 @@ class Window(QMainWindow):
     data_received = pyqtSignal(bytes)
     open_file = pyqtSignal(str)
     load_theme = pyqtSignal(str)
+    text_changed = pyqtSignal(object)  # Emitted with the edited tab.
+    placeholder_focused = pyqtSignal(object)  # Emitted with the placeholder.
+    first_paint = pyqtSignal()  # Emitted when the window is ready to use.
+    selecting_mode = pyqtSignal()  # Emitted before the mode selector opens.
 
     def zoom_in(self):
         """
@@ -213,9 +230,23 @@ class Window(QMainWindow):
     @property
     def current_tab(self):
         """
-        Returns the currently focussed tab.
+        Returns the currently focussed tab (or None if its file is yet to be
+        loaded, see realize_current).
         """
-        return self.tabs.currentWidget()
+        tab = self.tabs.currentWidget()
+        if isinstance(tab, EditorPlaceholder):
+            return None
+        return tab
+
+    def realize_current(self):
+        """
+        Loads the file of the currently focussed tab if it's yet to be loaded
+        (see placeholder_focused), and returns the tab.
+        """
+        tab = self.tabs.currentWidget()
+        if isinstance(tab, EditorPlaceholder):
+            self.placeholder_focused.emit(tab)
+        return self.current_tab
 
     def set_read_only(self, is_readonly):
         """
@@ -256,13 +287,17 @@ class Window(QMainWindow):
         logger.debug('Getting micro:bit path: {}'.format(path))
         return path
 
-    def add_tab(self, path, text, api, newline):
+    def add_tab(self, path, text, api, newline, index=None):
         """
-        Adds a tab with the referenced path and text to the editor.
+        Adds a tab with the referenced path and text to the editor (at the end,
+        unless an index is given).
         """
         new_tab = EditorPane(path, text, newline)
         new_tab.connect_margin(self.breakpoint_toggle)
-        new_tab_index = self.tabs.addTab(new_tab, new_tab.label)
+        if index is None:
+            new_tab_index = self.tabs.addTab(new_tab, new_tab.label)
+        else:
+            new_tab_index = self.tabs.insertTab(index, new_tab, new_tab.label)
         new_tab.set_api(api)
 
         @new_tab.modificationChanged.connect
@@ -276,17 +311,53 @@ class Window(QMainWindow):
             # Bubble the signal up
             self.open_file.emit(file)
 
+        @new_tab.textChanged.connect
+        def on_text_changed():
+            self.text_changed.emit(new_tab)
+
         self.tabs.setCurrentIndex(new_tab_index)
         self.connect_zoom(new_tab)
-        self.set_theme(self.theme)
+        new_tab.set_theme(THEMES.get(self.theme, THEMES['day'])[0])
         new_tab.setFocus()
         if self.read_only_tabs:
             new_tab.setReadOnly(self.read_only_tabs)
 
+    def add_placeholder(self, path):
+        """
+        Adds and returns a tab for the referenced path, whose file is only
+        loaded when the tab is first focused (see placeholder_focused).
+        """
+        placeholder = EditorPlaceholder(path)
+        # Adding the first tab focuses it, which mustn't load the file.
+        self.tabs.blockSignals(True)
+        self.tabs.addTab(placeholder, placeholder.label)
+        self.tabs.blockSignals(False)
+        return placeholder
+
+    def realize_tab(self, placeholder, text, api, newline):
+        """
+        Replaces the referenced placeholder with a tab containing the text of
+        its file.
+        """
+        index = self.tabs.indexOf(placeholder)
+        self.add_tab(placeholder.path, text, api, newline, index)
+        self.remove_placeholder(placeholder)
+
+    def remove_placeholder(self, placeholder):
+        """
+        Removes the tab of the referenced placeholder.
+        """
+        self.tabs.removeTab(self.tabs.indexOf(placeholder))
+        placeholder.deleteLater()
+
     def focus_tab(self, tab):
         index = self.tabs.indexOf(tab)
         self.tabs.setCurrentIndex(index)
-        tab.setFocus()
+        # The tab may be a placeholder (which is replaced once loaded) that
+        # was already current, so its file wasn't loaded on changing tab.
+        tab = self.realize_current()
+        if tab:
+            tab.setFocus()
 
     @property
     def tab_count(self):
@@ -299,7 +370,25 @@ class Window(QMainWindow):
     def widgets(self):
         """
         Returns a list of references to the widgets representing tabs in the
-        editor.
+        editor (apart from those yet to be loaded, see placeholders).
+        """
+        return [widget for widget in self.all_tabs
+                if not isinstance(widget, EditorPlaceholder)]
+
+    @property
+    def placeholders(self):
+        """
+        Returns a list of references to the placeholders of the tabs whose
+        files are yet to be loaded.
+        """
+        return [widget for widget in self.all_tabs
+                if isinstance(widget, EditorPlaceholder)]
+
+    @property
+    def all_tabs(self):
+        """
+        Returns a list of references to the widgets of every tab, loaded or
+        not (see placeholders), in the order the tabs are shown.
         """
         return [self.tabs.widget(i) for i in range(self.tab_count)]
 
@@ -334,6 +423,9 @@ class Window(QMainWindow):
         """
         Creates a new serial link instance.
         """
+        # Only needed by the REPL and plotter of a connected device.
+        import serial
+        from PyQt5.QtSerialPort import QSerialPort
         self.input_buffer = []
         self.serial = QSerialPort()
         self.serial.setPortName(port)
@@ -417,6 +509,7 @@ class Window(QMainWindow):
         """
         if not self.serial:
             self.open_serial_link(port)
+        from mu.interface.plotter import PlotterPane  # Loads QtChart.
         plotter_pane = PlotterPane()
         self.data_received.connect(plotter_pane.process_bytes)
         plotter_pane.data_flood.connect(mode.on_data_flood)
@@ -429,17 +522,29 @@ class Window(QMainWindow):
         running script are running (but not at the same time), it'll just grab
         data emitted by the REPL or script via data_received.
         """
+        from mu.interface.plotter import PlotterPane  # Loads QtChart.
         plotter_pane = PlotterPane()
         self.data_received.connect(plotter_pane.process_bytes)
         plotter_pane.data_flood.connect(mode.on_data_flood)
         self.add_plotter(plotter_pane, _('Python3 data tuple'))
 
+    def add_data_capture_plotter(self, path, data):
+        """
+        Add a plotter that displays (and can replay) previously captured data
+        read from the CSV file at the referenced path.
+        """
+        from mu.interface.plotter import PlotterPane  # Loads QtChart.
+        plotter_pane = PlotterPane()
+        plotter_pane.load_capture(data)
+        self.add_plotter(plotter_pane, os.path.basename(path))
+
     def add_jupyter_repl(self, kernel_manager, kernel_client):
         """
         Adds a Jupyter based REPL pane to the application.
         """
         kernel_manager.kernel.gui = 'qt4'
         kernel_client.start_channels()
+        from mu.interface.jupyter import JupyterREPLPane  # Loads Jupyter.
         ipython_widget = JupyterREPLPane()
         ipython_widget.kernel_manager = kernel_manager
         ipython_widget.kernel_client = kernel_client
@@ -480,7 +585,7 @@ class Window(QMainWindow):
     def add_python3_runner(self, script_name, working_directory,
                            interactive=False, debugger=False,
                            command_args=None, runner=None, envars=None,
-                           python_args=None):
+                           python_args=None, process=None):
         """
         Display console output for the referenced Python script.
 
@@ -506,6 +611,9 @@ class Window(QMainWindow):
 
         If python_args is given, these will be passed as arguments to the
         Python runtime used to launch the child process.
+
+        If process is given, it's a pre-warmed interpreter in which to run
+        the script (see InterpreterPool).
         """
         self.process_runner = PythonProcessPane(self)
         self.runner = QDockWidget(_("Running: {}").format(
@@ -518,19 +626,32 @@ class Window(QMainWindow):
         self.addDockWidget(Qt.BottomDockWidgetArea, self.runner)
         self.process_runner.start_process(script_name, working_directory,
                                           interactive, debugger, command_args,
-                                          envars, runner, python_args)
+                                          envars, runner, python_args,
+                                          process)
         self.process_runner.setFocus()
         self.process_runner.on_append_text.connect(self.on_stdout_write)
         self.connect_zoom(self.process_runner)
         return self.process_runner
 
-    def add_debug_inspector(self):
+    def add_debug_inspector(self, on_expand=None, on_add_watch=None,
+                            on_remove_watch=None):
         """
         Display a debug inspector to view the call stack.
+
+        The on_expand handler is called with the stack frame, path, start and
+        count of the children of a variable the user wants to see. The watch
+        handlers are called with an expression the user adds or removes.
         """
         self.debug_inspector = DebugInspector()
-        self.debug_model = QStandardItemModel()
+        self.debug_model = DebugInspectorModel()
+        if on_expand:
+            self.debug_model.fetch_children.connect(on_expand)
+        if on_add_watch:
+            self.debug_inspector.add_watch.connect(on_add_watch)
+        if on_remove_watch:
+            self.debug_inspector.remove_watch.connect(on_remove_watch)
         self.debug_inspector.setModel(self.debug_model)
+        self.debug_inspector.activated.connect(self.debug_model.fetch_more_at)
         self.inspector = QDockWidget(_('Debug Inspector'))
         self.inspector.setWidget(self.debug_inspector)
         self.inspector.setFeatures(QDockWidget.DockWidgetMovable)
@@ -540,53 +661,20 @@ class Window(QMainWindow):
         self.addDockWidget(Qt.RightDockWidgetArea, self.inspector)
         self.connect_zoom(self.debug_inspector)
 
-    def update_debug_inspector(self, locals_dict):
-        """
-        Given the contents of a dict representation of the locals in the
-        current stack frame, update the debug inspector with the new values.
-        """
-        excluded_names = ['__builtins__', '__debug_code__',
-                          '__debug_script__', ]
-        names = sorted([x for x in locals_dict if x not in excluded_names])
-        self.debug_model.clear()
-        self.debug_model.setHorizontalHeaderLabels([_('Name'), _('Value'), ])
-        for name in names:
-            try:
-                # DANGER!
-                val = eval(locals_dict[name])
-            except Exception:
-                val = None
-            if isinstance(val, list):
-                # Show a list consisting of rows of position/value
-                list_item = DebugInspectorItem(name)
-                for i, i_val in enumerate(val):
-                    list_item.appendRow([
-                        DebugInspectorItem(str(i)),
-                        DebugInspectorItem(repr(i_val))
-                    ])
-                self.debug_model.appendRow([
-                    list_item,
-                    DebugInspectorItem(_('(A list of {} items.)')
-                                       .format(len(val)))
-                ])
-            elif isinstance(val, dict):
-                # Show a dict consisting of rows of key/value pairs.
-                dict_item = DebugInspectorItem(name)
-                for k, k_val in val.items():
-                    dict_item.appendRow([
-                        DebugInspectorItem(repr(k)),
-                        DebugInspectorItem(repr(k_val))
-                    ])
-                self.debug_model.appendRow([
-                    dict_item,
-                    DebugInspectorItem(_('(A dict of {} items.)')
-                                       .format(len(val)))
-                ])
-            else:
-                self.debug_model.appendRow([
-                    DebugInspectorItem(name),
-                    DebugInspectorItem(locals_dict[name]),
-                ])
+    def update_debug_inspector(self, locals_dict, watches=None):
+        """
+        Given a dict of summaries of the locals in the current stack (each
+        with the index of the frame in which it was found), and of the values
+        of the watch expressions, update the debug inspector with the new
+        values.
+        """
+        self.debug_model.set_variables(locals_dict, watches)
+
+    def expand_debug_inspector(self, frame, path, children, more, start):
+        """
+        Show the children of the referenced variable in the debug inspector.
+        """
+        self.debug_model.set_children(frame, path, children, more, start)
 
     def remove_filesystem(self):
         """
@@ -632,6 +720,35 @@ class Window(QMainWindow):
             self.runner.deleteLater()
             self.runner = None
 
+    def add_profiler(self, entries):
+        """
+        Display a table of the cost of each function called by a profiled
+        script.
+        """
+        self.remove_profiler()
+        self.profiler_pane = ProfilerPane()
+        self.profiler_pane.set_entries(entries)
+        self.profiler = QDockWidget(_('Profile'))
+        self.profiler.setWidget(self.profiler_pane)
+        # The results are shown (after the script stops) until closed.
+        self.profiler.setFeatures(QDockWidget.DockWidgetMovable |
+                                  QDockWidget.DockWidgetClosable)
+        self.profiler.setAllowedAreas(Qt.BottomDockWidgetArea |
+                                      Qt.LeftDockWidgetArea |
+                                      Qt.RightDockWidgetArea)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.profiler)
+        self.connect_zoom(self.profiler_pane)
+
+    def remove_profiler(self):
+        """
+        Removes the profile table from the application.
+        """
+        if hasattr(self, 'profiler') and self.profiler:
+            self.profiler_pane = None
+            self.profiler.setParent(None)
+            self.profiler.deleteLater()
+            self.profiler = None
+
     def remove_debug_inspector(self):
         """
         Removes the debug inspector pane from the application.
@@ -646,21 +763,22 @@ class Window(QMainWindow):
     def set_theme(self, theme):
         """
         Sets the theme for the REPL and editor tabs.
+
+        The stylesheet is only loaded if the theme is different from that
+        already loaded. The tabs and panes are styled with the window's theme
+        as they're added, so are only styled again if the theme has changed.
         """
+        changed = theme != self.theme
         self.theme = theme
-        self.load_theme.emit(theme)
-        if theme == 'contrast':
-            new_theme = ContrastTheme
-            new_icon = 'theme_day'
-        elif theme == 'night':
-            new_theme = NightTheme
-            new_icon = 'theme_contrast'
-        else:
-            new_theme = DayTheme
-            new_icon = 'theme'
+        if theme != self.loaded_theme:
+            self.loaded_theme = theme
+            self.load_theme.emit(theme)
+        new_theme, new_icon = THEMES.get(theme, THEMES['day'])
+        self.button_bar.slots['theme'].setIcon(load_icon(new_icon))
+        if not changed:
+            return
         for widget in self.widgets:
             widget.set_theme(new_theme)
-        self.button_bar.slots['theme'].setIcon(load_icon(new_icon))
         if hasattr(self, 'repl') and self.repl:
             self.repl_pane.set_theme(theme)
         if hasattr(self, 'plotter') and self.plotter:
@@ -803,6 +921,15 @@ class Window(QMainWindow):
         self.show()
         self.autosize_window()
 
+    def paintEvent(self, paintEvent):
+        """
+        Signal the window is ready to use the first time it's painted.
+        """
+        super().paintEvent(paintEvent)
+        if not self.painted:
+            self.painted = True
+            self.first_paint.emit()
+
     def resizeEvent(self, resizeEvent):
         """
         Respond to window getting too small for the button bar to fit well.
@@ -816,6 +943,7 @@ class Window(QMainWindow):
         """
         mode_select = ModeSelector(self)
         mode_select.setup(modes, current_mode)
+        self.selecting_mode.emit()
         mode_select.exec()
         try:
             return mode_select.get_mode()
@@ -901,6 +1029,18 @@ class Window(QMainWindow):
         if finder.exec():
             return (finder.find(), finder.replace(), finder.replace_flag())
 
+    def show_breakpoint_options(self, condition, hit_count, log_message):
+        """
+        Display the breakpoint options dialog. If the dialog's OK button was
+        clicked return a tuple containing the condition, hit count and log
+        message.
+        """
+        options = BreakpointOptionsDialog(self)
+        options.setup(condition, hit_count, log_message)
+        if options.exec():
+            return (options.condition(), options.hit_count(),
+                    options.log_message())
+
     def replace_text(self, target_text, replace, global_replace):
         """
         Given target_text, replace the first instance after the cursor with
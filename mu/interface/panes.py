@@ -22,95 +22,51 @@ import re
 import platform
 import logging
 import signal
+import json
 import string
-import bisect
+import codecs
 import os.path
+import importlib.util
 from PyQt5.QtCore import (Qt, QProcess, QProcessEnvironment, pyqtSignal,
-                          QTimer, QUrl)
-from collections import deque
+                          QTimer, QUrl, QObject, QAbstractItemModel,
+                          QModelIndex)
 from PyQt5.QtWidgets import (QMessageBox, QTextEdit, QFrame, QListWidget,
                              QGridLayout, QLabel, QMenu, QApplication,
-                             QTreeView)
-from PyQt5.QtGui import (QKeySequence, QTextCursor, QCursor, QPainter,
-                         QDesktopServices, QStandardItem)
-from qtconsole.rich_jupyter_widget import RichJupyterWidget
+                             QTreeView, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QInputDialog)
+from PyQt5.QtGui import (QKeySequence, QTextCursor, QCursor,
+                         QDesktopServices, QFont, QColor)
 from mu.interface.themes import Font
 from mu.interface.themes import DEFAULT_FONT_SIZE
+from mu.debugger.utils import read_port_handshake, WATCH_FRAME
 
 
 logger = logging.getLogger(__name__)
 
 
-CHARTS = True
-try:  # pragma: no cover
-    from PyQt5.QtChart import QChart, QLineSeries, QChartView, QValueAxis
-except ImportError:  # pragma: no cover
+# Milliseconds between updates of the output of a running Python process. Any
+# output received in the meantime is added to the pane in a single insert.
+OUTPUT_FLUSH_INTERVAL = 16
+# Number of children of a variable fetched at a time by the debug inspector.
+DEBUG_PAGE_SIZE = 100
+# Colour of the values in the debug inspector that changed with the last step.
+DEBUG_CHANGED_COLOUR = '#e5533d'
+# Modules imported by pre-warmed interpreters (see InterpreterPool) so scripts
+# that use them start quickly.
+WARM_MODULES = ['turtle', 'random', 'math', 'time', 'pgzero']
+# Milliseconds to wait after an interpreter is taken from the pool before a
+# replacement is started, so it doesn't slow down the script just started.
+POOL_REFILL_DELAY = 3000
+# Milliseconds a process is given to terminate before it is killed.
+STOP_TIMEOUT = 2000
+# Maximum number of functions listed in the profiler's table of hot spots.
+MAX_PROFILE_ENTRIES = 200
+
+
+# Check if QtChart is available, without importing it (see plotter.py).
+CHARTS = importlib.util.find_spec('PyQt5.QtChart') is not None
+if not CHARTS:  # pragma: no cover
     logger.info('Unable to find QChart. Plotter button will not display.')
-    QChartView = object
-    CHARTS = False
-
-
-class JupyterREPLPane(RichJupyterWidget):
-    """
-    REPL = Read, Evaluate, Print, Loop.
-
-    Displays a Jupyter iPython session.
-    """
-
-    on_append_text = pyqtSignal(bytes)
-
-    def __init__(self, theme='day', parent=None):
-        super().__init__(parent)
-        self.set_theme(theme)
-        self.console_height = 10
-
-    def _append_plain_text(self, text, *args, **kwargs):
-        super()._append_plain_text(text, *args, **kwargs)
-        self.on_append_text.emit(text.encode('utf-8'))
-
-    def set_font_size(self, new_size=DEFAULT_FONT_SIZE):
-        """
-        Sets the font size for all the textual elements in this pane.
-        """
-        stylesheet = ("QWidget{font-size: " + str(new_size) +
-                      "pt; font-family: Monospace;}")
-        self.setStyleSheet(stylesheet)
-
-    def zoomIn(self, delta=2):
-        """
-        Zoom in (increase) the size of the font by delta amount difference in
-        point size upto 34 points.
-        """
-        old_size = self.font.pointSize()
-        new_size = min(old_size + delta, 34)
-        self.set_font_size(new_size)
-
-    def zoomOut(self, delta=2):
-        """
-        Zoom out (decrease) the size of the font by delta amount difference in
-        point size down to 4 points.
-        """
-        old_size = self.font.pointSize()
-        new_size = max(old_size - delta, 4)
-        self.set_font_size(new_size)
-
-    def set_theme(self, theme):
-        """
-        Sets the theme / look for the REPL pane.
-        """
-        if theme == 'contrast':
-            self.set_default_style(colors='nocolor')
-        elif theme == 'night':
-            self.set_default_style(colors='nocolor')
-        else:
-            self.set_default_style()
-
-    def setFocus(self):
-        """
-        Override base setFocus so the focus happens to the embedded _control
-        within this widget.
-        """
-        self._control.setFocus()
 
 
 class MicroPythonREPLPane(QTextEdit):
@@ -587,6 +543,136 @@ class FileSystemPane(QFrame):
         self.set_font_size(new_size)
 
 
+def python_environment():
+    """
+    Return the environment in which child Python processes are run.
+    """
+    env = QProcessEnvironment.systemEnvironment()
+    # Force buffers to flush immediately.
+    env.insert('PYTHONUNBUFFERED', '1')
+    env.insert('PYTHONIOENCODING', 'utf-8')
+    if sys.platform == 'darwin':
+        parent_dir = os.path.dirname(__file__)
+        if '/mu-editor.app/Contents/Resources/app/mu' in parent_dir:
+            # Mu is running as a macOS app bundle. Ensure the expected
+            # paths are in PYTHONPATH of the subprocess.
+            env.insert('PYTHONPATH', ':'.join(sys.path))
+    return env
+
+
+class InterpreterPool(QObject):
+    """
+    Keeps a number of idle Python interpreters, with commonly used modules
+    already imported, ready to run a script as soon as the user asks. Each
+    interpreter runs one script and is then discarded.
+
+    The interpreters are started in the working directory, and with the
+    environment variables, that scripts are run with, since the modules may
+    use them when imported.
+    """
+
+    def __init__(self, size=1, modules=None, working_directory=None,
+                 envars=None, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.modules = WARM_MODULES if modules is None else modules
+        self.working_directory = working_directory
+        self.envars = list(envars or [])
+        self.idle = []  # Interpreters waiting for a script to run.
+
+    def fill(self):
+        """
+        Start enough interpreters to bring the pool up to size.
+        """
+        parent_dir = os.path.join(os.path.dirname(__file__), '..')
+        bootstrap = os.path.join(os.path.abspath(parent_dir), 'mu-warm.py')
+        while len(self.idle) < self.size:
+            process = QProcess(self)
+            process.setProcessChannelMode(QProcess.MergedChannels)
+            env = python_environment()
+            for name, value in self.envars:
+                env.insert(name, value)
+            process.setProcessEnvironment(env)
+            if self.working_directory:
+                process.setWorkingDirectory(self.working_directory)
+            process.finished.connect(lambda code, status, process=process:
+                                     self.discard(process))
+            process.start(sys.executable, ['-i', bootstrap, ] + self.modules)
+            self.idle.append(process)
+            logger.info('Started warm interpreter.')
+
+    def discard(self, process):
+        """
+        Forget about an idle interpreter that has unexpectedly finished.
+        """
+        if process in self.idle:
+            logger.warning('Warm interpreter finished unexpectedly.')
+            self.idle.remove(process)
+
+    def take(self, script, working_directory, envars):
+        """
+        Return an idle interpreter (or None if there isn't a suitable one) for
+        the referenced script to be run in, with the given working directory
+        and environment variables, and schedule a replacement to be started.
+
+        If the working directory or environment variables have changed, the
+        idle interpreters are replaced by ones started with the new values.
+        """
+        if self.shadows_module(script):
+            logger.info('Script shadows a warm module, so not using the '
+                        'pool.')
+            return None
+        envars = list(envars or [])
+        if (working_directory, envars) != (self.working_directory,
+                                           self.envars):
+            logger.info('Restarting warm interpreters with new settings.')
+            self.working_directory = working_directory
+            self.envars = envars
+            self.stop_idle()
+        process = None
+        while self.idle and process is None:
+            candidate = self.idle.pop(0)
+            candidate.finished.disconnect()
+            if candidate.state() == QProcess.NotRunning:
+                candidate.deleteLater()
+            else:
+                process = candidate
+        QTimer.singleShot(POOL_REFILL_DELAY, self.fill)
+        return process
+
+    def shadows_module(self, script):
+        """
+        Return True if the directory of the referenced script contains a
+        module (or package) named like one of the warm modules, which the
+        script would import in place of the one already imported.
+        """
+        directory = os.path.dirname(os.path.abspath(script))
+        for name in self.modules:
+            name = name.split('.')[0]
+            if os.path.isfile(os.path.join(directory, name + '.py')) or \
+                    os.path.isfile(os.path.join(directory, name,
+                                                '__init__.py')):
+                return True
+        return False
+
+    def shutdown(self):
+        """
+        Stop all the idle interpreters.
+        """
+        self.size = 0
+        self.stop_idle()
+
+    def stop_idle(self):
+        """
+        Stop the idle interpreters.
+        """
+        while self.idle:
+            process = self.idle.pop()
+            process.finished.disconnect()
+            process.kill()
+            process.deleteLater()
+
+
 class PythonProcessPane(QTextEdit):
     """
     Handles / displays a Python process's stdin/out with working command
@@ -594,6 +680,10 @@ class PythonProcessPane(QTextEdit):
     """
 
     on_append_text = pyqtSignal(bytes)
+    # Emitted when the process first produces output.
+    first_output = pyqtSignal()
+    # Emitted with the port on which the debug runner is listening.
+    debugger_port = pyqtSignal(int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -609,10 +699,19 @@ class PythonProcessPane(QTextEdit):
         self.input_history = []  # history of inputs entered in this session.
         self.start_of_current_line = 0  # start position of the input line.
         self.history_position = 0  # current position when navigation history.
+        # Decodes stdout, keeping any incomplete multi-byte character back
+        # until the rest of its bytes arrive.
+        self.decoder = codecs.getincrementaldecoder('utf-8')('replace')
+        self.output_buffer = []  # Decoded output waiting to be displayed.
+        self.awaiting_output = False  # Flag to show there's been no output.
+        self.handshake = None  # Output while waiting for the debugger's port.
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush_output)
 
     def start_process(self, script_name, working_directory, interactive=True,
                       debugger=False, command_args=None, envars=None,
-                      runner=None, python_args=None):
+                      runner=None, python_args=None, process=None):
         """
         Start the child Python process.
 
@@ -637,7 +736,11 @@ class PythonProcessPane(QTextEdit):
 
         If python_args is given, these are passed as arguments to the Python
         runtime used to launch the child process.
+
+        If process is given, it's an already running interactive interpreter
+        taken from an InterpreterPool, which is told to run the script.
         """
+        self.awaiting_output = True
         self.script = os.path.abspath(os.path.normcase(script_name))
         logger.info('Running script: {}'.format(self.script))
         if interactive:
@@ -645,18 +748,13 @@ class PythonProcessPane(QTextEdit):
         if command_args is None:
             command_args = []
         logger.info('Command args: {}'.format(command_args))
+        if process is not None:
+            self.run_in_process(process, working_directory, command_args,
+                                envars)
+            return
         self.process = QProcess(self)
         self.process.setProcessChannelMode(QProcess.MergedChannels)
-        # Force buffers to flush immediately.
-        env = QProcessEnvironment.systemEnvironment()
-        env.insert('PYTHONUNBUFFERED', '1')
-        env.insert('PYTHONIOENCODING', 'utf-8')
-        if sys.platform == 'darwin':
-            parent_dir = os.path.dirname(__file__)
-            if '/mu-editor.app/Contents/Resources/app/mu' in parent_dir:
-                # Mu is running as a macOS app bundle. Ensure the expected
-                # paths are in PYTHONPATH of the subprocess.
-                env.insert('PYTHONPATH', ':'.join(sys.path))
+        env = python_environment()
         if envars:
             logger.info('Running with environment variables: '
                         '{}'.format(envars))
@@ -669,7 +767,9 @@ class PythonProcessPane(QTextEdit):
         self.process.finished.connect(self.finished)
         logger.info('Python path: {}'.format(sys.path))
         if debugger:
-            # Start the mu-debug runner for the script.
+            # Start the mu-debug runner for the script. It announces the port
+            # on which it's listening before anything else.
+            self.handshake = b''
             parent_dir = os.path.join(os.path.dirname(__file__), '..')
             mu_dir = os.path.abspath(parent_dir)
             runner = os.path.join(mu_dir, 'mu-debug.py')
@@ -694,11 +794,74 @@ class PythonProcessPane(QTextEdit):
             self.process.start(python_exec, args)
             self.running = True
 
+    def run_in_process(self, process, working_directory, command_args,
+                       envars):
+        """
+        Run the script in the referenced pre-warmed interpreter (see
+        InterpreterPool and mu-warm.py).
+        """
+        logger.info('Using warm interpreter.')
+        logger.info('Working directory: {}'.format(working_directory))
+        self.process = process
+        self.process.setParent(self)
+        self.process.readyRead.connect(self.read_from_stdout)
+        self.process.finished.connect(self.finished)
+        # The interpreter was started in the same working directory and with
+        # the same environment variables (see InterpreterPool.take), but
+        # they're set again in case the script's imports changed them.
+        request = {
+            'script': self.script,
+            'cwd': working_directory,
+            'args': command_args,
+            'envars': dict(envars or []),
+        }
+        self.process.write(json.dumps(request).encode('utf-8') + b'\n')
+        self.running = True
+
+    def stop_process(self):
+        """
+        Stop the child process without blocking the UI.
+
+        The process is asked to terminate and killed if it hasn't finished
+        after STOP_TIMEOUT milliseconds. It is detached from this pane (which
+        is usually about to be removed) and cleans itself up once finished.
+        """
+        process = self.process
+        if process is None:
+            return
+        self.process = None
+        self.running = False
+        for process_signal in (process.readyRead, process.finished,
+                               process.errorOccurred):
+            try:
+                process_signal.disconnect()
+            except TypeError:
+                pass  # Nothing was connected.
+        if process.state() == QProcess.NotRunning:
+            process.deleteLater()
+            return
+        logger.info('Stopping process {}.'.format(process.processId()))
+        process.setParent(QApplication.instance())
+        process.finished.connect(process.deleteLater)
+        kill_timer = QTimer(process)
+        kill_timer.setSingleShot(True)
+        kill_timer.timeout.connect(process.kill)
+        kill_timer.start(STOP_TIMEOUT)
+        process.terminate()
+
     def finished(self, code, status):
         """
         Handle when the child process finishes.
         """
         self.running = False
+        if self.handshake:
+            # The debug runner finished without giving its port.
+            self.output_buffer.append(self.decoder.decode(self.handshake))
+        self.handshake = None
+        remainder = self.decoder.decode(b'', final=True)
+        if remainder:
+            self.output_buffer.append(remainder)
+        self.flush_output()
         cursor = self.textCursor()
         cursor.movePosition(cursor.End)
         cursor.insertText('\n\n---------- FINISHED ----------\n')
@@ -878,12 +1041,63 @@ class PythonProcessPane(QTextEdit):
     def read_from_stdout(self):
         """
         Process incoming data from the process's stdout.
+
+        The data is decoded and buffered, to be added to the text area by
+        flush_output at most every OUTPUT_FLUSH_INTERVAL milliseconds, so
+        scripts that print lots of output don't make Mu unresponsive.
         """
         data = self.process.readAll().data()
+        if self.handshake is not None:
+            data = self.read_handshake(data)
         if data:
-            self.append(data)
+            if self.awaiting_output:
+                self.awaiting_output = False
+                self.first_output.emit()
+            text = self.decoder.decode(data)
+            if text:
+                self.output_buffer.append(text)
+                if not self.flush_timer.isActive():
+                    self.flush_timer.start(OUTPUT_FLUSH_INTERVAL)
             self.on_append_text.emit(data)
+
+    def read_handshake(self, data):
+        """
+        Look for the debug runner's announcement of its port in its output
+        (emitting debugger_port when found). Returns any lines before it
+        (such as warnings from Python) and the output that follows it, to be
+        displayed as usual.
+        """
+        self.handshake += data
+        output = []
+        while b'\n' in self.handshake:
+            line, newline, rest = self.handshake.partition(b'\n')
+            port = read_port_handshake(line.decode('utf-8', 'replace'))
+            if port is not None:
+                logger.info('Debug runner listening on port {}.'.format(port))
+                self.handshake = None
+                self.debugger_port.emit(port)
+                output.append(rest)
+                break
+            logger.warning('Debug runner output before its port: '
+                           '{}'.format(line))
+            output.append(line + newline)
+            self.handshake = rest
+        # Anything else waits for the rest of its line.
+        return b''.join(output)
+
+    def flush_output(self):
+        """
+        Add all the buffered output from the process to the end of the text
+        area.
+        """
+        self.flush_timer.stop()
+        if self.output_buffer:
+            text = ''.join(self.output_buffer)
+            self.output_buffer = []
             cursor = self.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+            self.setTextCursor(cursor)
             self.start_of_current_line = cursor.position()
 
     def write_to_stdin(self, data):
@@ -897,6 +1111,8 @@ class PythonProcessPane(QTextEdit):
         """
         Append text to the text area.
         """
+        # Ensure output from the process is displayed before the new text.
+        self.flush_output()
         cursor = self.textCursor()
         cursor.movePosition(QTextCursor.End)
         cursor.insertText(msg.decode('utf-8'))
@@ -974,22 +1190,390 @@ class PythonProcessPane(QTextEdit):
         pass
 
 
-class DebugInspectorItem(QStandardItem):
-    def __init__(self, *args):
-        super().__init__(*args)
-        self.setEditable(False)
+class DebugVariable:
+    """
+    A variable (or a child of a variable) shown in the debug inspector.
 
+    The key is the index of the stack frame containing the variable followed
+    by its path (see mu.debugger.runner.Debugger.do_expand). The summary is
+    as sent by the debug runner.
+    """
 
-class DebugInspector(QTreeView):
+    def __init__(self, parent, key, summary, changed=False):
+        self.parent = parent
+        self.key = key
+        self.summary = summary
+        self.changed = changed  # Since the previous step.
+        self.row = 0
+        self.children = []
+        self.more = 0  # The number of children not (yet) fetched.
+        self.fetched = False  # The children have been asked for.
+        self.pending = False  # Waiting for the runner to send children.
+        self.refreshing = False  # Children asked for again after a step.
+        self.more_row = None  # Placeholder for the children not fetched.
+
+    @property
+    def name(self):
+        return self.summary['name']
+
+    def value(self):
+        """
+        The text describing the value of the variable.
+        """
+        summary = self.summary
+        if summary['type'] == 'list' and summary['length'] is not None:
+            return _('(A list of {} items.)').format(summary['length'])
+        if summary['type'] == 'dict' and summary['length'] is not None:
+            return _('(A dict of {} items.)').format(summary['length'])
+        return summary['repr']
+
+
+class DebugInspectorModel(QAbstractItemModel):
     """
-    Presents a tree like representation of the current state of the call stack
-    to the user.
+    The local variables in the call stack of a debugged script (after the
+    values of the watch expressions), as shown in the debug inspector.
+
+    With each step the model is updated in place from the differences to the
+    previous step (so the inspector keeps its expanded rows and scroll
+    position) and values that changed are highlighted. The children of a
+    variable are only fetched from the debug runner, a page at a time, when
+    the user wants to see them.
+    """
+
+    #: Emitted with the frame, path, start and count of the children to fetch.
+    fetch_children = pyqtSignal(int, list, int, int)
+
+    excluded_names = ['__builtins__', '__debug_code__', '__debug_script__', ]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.root = DebugVariable(None, (), None)
+        self.nodes = {}  # Every variable in the model by its key.
+        self.first_update = True
+
+    # QAbstractItemModel API.
+
+    def node(self, index):
+        """
+        Return the variable (or placeholder) the referenced index refers to.
+        """
+        if index.isValid():
+            return index.internalPointer()
+        return self.root
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        node = self.node(parent)
+        if row < len(node.children):
+            return self.createIndex(row, column, node.children[row])
+        return self.createIndex(row, column, node.more_row)
+
+    def parent(self, index):
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        node = self.node(parent)
+        return len(node.children) + (1 if node.more_row else 0)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 2
+
+    def hasChildren(self, parent=QModelIndex()):
+        node = self.node(parent)
+        if node is self.root:
+            return bool(node.children)
+        if node.summary is None:  # A placeholder.
+            return False
+        return bool(node.children) or bool(node.summary['expandable'])
+
+    def canFetchMore(self, parent):
+        node = self.node(parent)
+        if node is self.root or node.summary is None or node.pending:
+            return False
+        if not node.fetched:
+            return bool(node.summary['expandable'])
+        return node.more > 0
+
+    def fetchMore(self, parent):
+        if self.canFetchMore(parent):
+            node = self.node(parent)
+            self.request_children(node, len(node.children), DEBUG_PAGE_SIZE)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return [_('Name'), _('Value')][section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        column = index.column()
+        if node.summary is None:  # The placeholder for more children.
+            if role == Qt.DisplayRole:
+                if column == 0:
+                    return '...'
+                return _('({} more items.)').format(node.parent.more)
+            return None
+        if role == Qt.DisplayRole:
+            return node.name if column == 0 else node.value()
+        if role == Qt.ToolTipRole and column == 1:
+            return node.summary['type']
+        if role == Qt.FontRole and column == 0 and self.is_watch(node):
+            font = QFont()
+            font.setItalic(True)
+            return font
+        if node.changed and column == 1:
+            if role == Qt.FontRole:
+                font = QFont()
+                font.setBold(True)
+                return font
+            if role == Qt.ForegroundRole:
+                return QColor(DEBUG_CHANGED_COLOUR)
+        return None
+
+    # Updates from the debugger.
+
+    def set_variables(self, locals_dict, watches=None):
+        """
+        Update the top level variables from the dict of summaries of the
+        locals in the current stack (each with the index of the frame in
+        which it was found) and the list of summaries of the values of the
+        watch expressions.
+        """
+        entries = [dict(summary, frame=WATCH_FRAME)
+                   for summary in watches or []]
+        entries += [dict(locals_dict[name], name=name)
+                    for name in sorted(locals_dict)
+                    if name not in self.excluded_names]
+        wanted = set((summary['frame'], summary['name'])
+                     for summary in entries)
+        for node in reversed(list(self.root.children)):
+            if node.key not in wanted:
+                self.remove_rows(self.root, node.row, node.row + 1)
+        # The remaining variables are in the same order as the entries.
+        for position, summary in enumerate(entries):
+            key = (summary['frame'], summary['name'])
+            children = self.root.children
+            if position < len(children) and children[position].key == key:
+                self.update_node(children[position], summary, True)
+                continue
+            self.insert_nodes(self.root, position,
+                              [(key, summary, not self.first_update)])
+        self.first_update = False
+        self.refresh_children()
+
+    def set_children(self, frame, path, children, more, start):
+        """
+        Show the children sent by the debug runner, from the start position,
+        of the variable at the referenced path in the stack frame (and how
+        many more there are).
+        """
+        node = self.nodes.get((frame, ) + tuple(path))
+        if node is None or not node.fetched:
+            return  # No longer shown.
+        refresh = node.refreshing
+        node.pending = node.refreshing = False
+        self.set_more(node, 0)
+        new_nodes = []
+        for offset, summary in enumerate(children):
+            position = start + offset
+            key = node.key + (position, )
+            if position < len(node.children):
+                child = node.children[position]
+                if child.name == summary['name']:
+                    self.update_node(child, summary, refresh)
+                    continue
+                # A different child at this position, so start afresh.
+                self.remove_rows(node, position, len(node.children))
+            new_nodes.append((key, summary, refresh))
+        if new_nodes:
+            self.insert_nodes(node, len(node.children), new_nodes)
+        end = start + len(children)
+        if not more and end < len(node.children):
+            # The variable has fewer children than before.
+            self.remove_rows(node, end, len(node.children))
+        self.set_more(node, more)
+
+    # Helpers for keeping the model (and its views) up to date.
+
+    def request_children(self, node, start, count, refresh=False):
+        """
+        Ask for count of the children of the node from the start position.
+        """
+        node.fetched = True
+        node.pending = True
+        node.refreshing = refresh
+        self.fetch_children.emit(node.key[0], list(node.key[1:]), start,
+                                 count)
+
+    def refresh_children(self):
+        """
+        Ask for the children of every variable the user has expanded again,
+        since they may have changed (even if the parent's summary didn't).
+        """
+        for node in list(self.nodes.values()):
+            if node.fetched:
+                count = max(len(node.children), DEBUG_PAGE_SIZE)
+                self.request_children(node, 0, count, refresh=True)
+
+    def update_node(self, node, summary, highlight):
+        """
+        Update the node with the new summary of its variable, highlighting
+        the change (if any and if wanted).
+        """
+        was_changed = node.changed
+        node.changed = highlight and summary != node.summary
+        node.summary = summary
+        if node.changed or was_changed:
+            parent = self.index_of(node.parent)
+            self.dataChanged.emit(self.index(node.row, 0, parent),
+                                  self.index(node.row, 1, parent))
+        if not summary['expandable'] and (node.children or node.fetched):
+            self.set_more(node, 0)
+            self.remove_rows(node, 0, len(node.children))
+            node.fetched = node.pending = node.refreshing = False
+
+    def insert_nodes(self, parent, position, new_nodes):
+        """
+        Insert new nodes, each made from a (key, summary, changed) tuple, into
+        the parent's children at the given position.
+        """
+        self.beginInsertRows(self.index_of(parent), position,
+                             position + len(new_nodes) - 1)
+        nodes = [DebugVariable(parent, key, summary, changed)
+                 for key, summary, changed in new_nodes]
+        parent.children[position:position] = nodes
+        for node in nodes:
+            self.nodes[node.key] = node
+        self.renumber(parent, position)
+        self.endInsertRows()
+
+    def remove_rows(self, parent, first, last):
+        """
+        Remove the parent's children from the first position up to (but not
+        including) the last position.
+        """
+        if first >= last:
+            return
+        self.beginRemoveRows(self.index_of(parent), first, last - 1)
+        for node in parent.children[first:last]:
+            self.forget(node)
+        del parent.children[first:last]
+        self.renumber(parent, first)
+        self.endRemoveRows()
+
+    def set_more(self, node, more):
+        """
+        Show (or hide) the placeholder for the node's children not yet
+        fetched.
+        """
+        node.more = more
+        parent = self.index_of(node)
+        row = len(node.children)
+        if more and not node.more_row:
+            self.beginInsertRows(parent, row, row)
+            node.more_row = DebugVariable(node, None, None)
+            node.more_row.row = row
+            self.endInsertRows()
+        elif more:
+            index = self.index(row, 1, parent)
+            self.dataChanged.emit(index, index)
+        elif node.more_row:
+            self.beginRemoveRows(parent, row, row)
+            node.more_row = None
+            self.endRemoveRows()
+
+    def forget(self, node):
+        """
+        Forget the node and all its descendants.
+        """
+        self.nodes.pop(node.key, None)
+        for child in node.children:
+            self.forget(child)
+
+    def renumber(self, parent, start):
+        """
+        Update the row numbers of the parent's children from the start.
+        """
+        for row in range(start, len(parent.children)):
+            parent.children[row].row = row
+        if parent.more_row:
+            parent.more_row.row = len(parent.children)
+
+    def index_of(self, node):
+        """
+        Return the model index (of the first column) of the node.
+        """
+        if node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def is_watch(self, node):
+        """
+        Return True if the node is the value of a watch expression.
+        """
+        return node.parent is self.root and node.key[0] == WATCH_FRAME
+
+    def fetch_more_at(self, index):
+        """
+        Fetch the next page of children if the referenced index is the
+        placeholder for them.
+        """
+        node = self.node(index)
+        if node is not self.root and node.summary is None:
+            self.fetchMore(self.index_of(node.parent))
+
+
+class ProfilerPane(QTableWidget):
+    """
+    Presents a sortable table of the functions called by a profiled script,
+    so the user can see where the script spends its time.
     """
 
     def __init__(self):
         super().__init__()
-        self.setUniformRowHeights(True)
-        self.setSelectionBehavior(QTreeView.SelectRows)
+        self.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.setSelectionBehavior(QTableWidget.SelectRows)
+        self.verticalHeader().setVisible(False)
+        headers = [_('Function'), _('File'), _('Line'), _('Calls'),
+                   _('Own time (s)'), _('Total time (s)'), _('% of run')]
+        self.setColumnCount(len(headers))
+        self.setHorizontalHeaderLabels(headers)
+        self.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.Stretch)
+
+    def set_entries(self, entries):
+        """
+        Fill the table with the (most expensive) entries read from the
+        profiler's output (see mu.logic.read_profile).
+        """
+        self.setSortingEnabled(False)  # Otherwise rows move while filling.
+        entries = entries[:MAX_PROFILE_ENTRIES]
+        self.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            filename = entry['filename']
+            if filename != '~':  # cProfile's name for built-ins.
+                filename = os.path.basename(filename)
+            values = [entry['function'], filename, entry['line'] + 1,
+                      entry['calls'], round(entry['own_time'], 4),
+                      round(entry['total_time'], 4),
+                      round(entry['percent'], 1)]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem()
+                # Numbers are set as numbers so they're sorted correctly.
+                item.setData(Qt.DisplayRole, value)
+                self.setItem(row, column, item)
+        self.setSortingEnabled(True)
+        self.sortItems(5, Qt.DescendingOrder)
 
     def set_font_size(self, new_size=DEFAULT_FONT_SIZE):
         """
@@ -1021,174 +1605,68 @@ class DebugInspector(QTreeView):
         pass
 
 
-class PlotterPane(QChartView):
+class DebugInspector(QTreeView):
     """
-    This plotter widget makes viewing sensor data easy!
-
-    This widget represents a chart that will look for tuple data from
-    the MicroPython REPL, Python 3 REPL or Python 3 code runner and will
-    auto-generate a graph.
+    Presents a tree like representation of the current state of the call stack
+    to the user.
     """
 
-    data_flood = pyqtSignal()
+    #: Emitted with an expression the user wants to watch.
+    add_watch = pyqtSignal(str)
+    #: Emitted with a watch expression the user wants to remove.
+    remove_watch = pyqtSignal(str)
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        # Holds the raw input to be checked for actionable data to display.
-        self.input_buffer = []
-        # Holds the raw actionable data detected while plotting.
-        self.raw_data = []
-        self.setObjectName('plotterpane')
-        self.max_x = 100  # Maximum value along x axis
-        self.max_y = 1000  # Maximum value +/- along y axis
-        self.flooded = False  # Flag to indicate if data flooding is happening.
-
-        # Holds deques for each slot of incoming data (assumes 1 to start with)
-        self.data = [deque([0] * self.max_x), ]
-        # Holds line series for each slot of incoming data (assumes 1 to start
-        # with).
-        self.series = [QLineSeries(), ]
-
-        # Ranges used for the Y axis (up to 1000, after which we just double
-        # the range).
-        self.y_ranges = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
-
-        # Set up the chart with sensible defaults.
-        self.chart = QChart()
-        self.chart.legend().hide()
-        self.chart.addSeries(self.series[0])
-        self.axis_x = QValueAxis()
-        self.axis_y = QValueAxis()
-        self.axis_x.setRange(0, self.max_x)
-        self.axis_y.setRange(-self.max_y, self.max_y)
-        self.axis_x.setLabelFormat("time")
-        self.axis_y.setLabelFormat("%d")
-        self.chart.setAxisX(self.axis_x, self.series[0])
-        self.chart.setAxisY(self.axis_y, self.series[0])
-        self.setChart(self.chart)
-        self.setRenderHint(QPainter.Antialiasing)
+    def __init__(self):
+        super().__init__()
+        self.setUniformRowHeights(True)
+        self.setSelectionBehavior(QTreeView.SelectRows)
 
-    def process_bytes(self, data):
+    def set_font_size(self, new_size=DEFAULT_FONT_SIZE):
+        """
+        Sets the font size for all the textual elements in this pane.
         """
-        Takes raw bytes and, if a valid tuple is detected, adds the data to
-        the plotter.
+        stylesheet = ("QWidget{font-size: " + str(new_size) +
+                      "pt; font-family: Monospace;}")
+        self.setStyleSheet(stylesheet)
 
-        The the length of the bytes data > 1024 then a data_flood signal is
-        emitted to ensure Mu can take action to remain responsive.
+    def zoomIn(self, delta=2):
         """
-        # Data flooding guards.
-        if self.flooded:
-            return
-        if len(data) > 1024:
-            self.flooded = True
-            self.data_flood.emit()
-            return
-        data = data.replace(b'\r\n', b'\n')
-        self.input_buffer.append(data)
-        # Check if the data contains a Python tuple, containing numbers, on a
-        # single line (i.e. ends with \n).
-        input_bytes = b''.join(self.input_buffer)
-        lines = input_bytes.split(b'\n')
-        for line in lines:
-            if line.startswith(b'(') and line.endswith(b')'):
-                # Candidate tuple. Extract the raw bytes into a numeric tuple.
-                raw_values = [val.strip() for val in line[1:-1].split(b',')]
-                numeric_values = []
-                for raw in raw_values:
-                    try:
-                        numeric_values.append(int(raw))
-                        # It worked, so move onto the next value.
-                        continue
-                    except ValueError:
-                        # Try again as a float.
-                        pass
-                    try:
-                        numeric_values.append(float(raw))
-                    except ValueError:
-                        # Not an int or float, so ignore this value.
-                        continue
-                if numeric_values:
-                    # There were numeric values in the tuple, so use them!
-                    self.add_data(tuple(numeric_values))
-        # Reset the input buffer.
-        self.input_buffer = []
-        if lines[-1]:
-            # Append any bytes that are not yet at the end of a line, for
-            # processing next time we read data from self.serial.
-            self.input_buffer.append(lines[-1])
-
-    def add_data(self, values):
-        """
-        Given a tuple of values, ensures there are the required number of line
-        series, add the data to the line series, update the range of the chart
-        so the chart displays nicely.
-        """
-        # Store incoming data to dump as CSV at the end of the session.
-        self.raw_data.append(values)
-        # Check the number of incoming values.
-        if len(values) != len(self.series):
-            # Adjust the number of line series.
-            value_len = len(values)
-            series_len = len(self.series)
-            if value_len > series_len:
-                # Add new line series.
-                for i in range(value_len - series_len):
-                    new_series = QLineSeries()
-                    self.chart.addSeries(new_series)
-                    self.chart.setAxisX(self.axis_x, new_series)
-                    self.chart.setAxisY(self.axis_y, new_series)
-                    self.series.append(new_series)
-                    self.data.append(deque([0] * self.max_x))
-            else:
-                # Remove old line series.
-                for old_series in self.series[value_len:]:
-                    self.chart.removeSeries(old_series)
-                self.series = self.series[:value_len]
-                self.data = self.data[:value_len]
-
-        # Add the incoming values to the data to be displayed, and compute
-        # max range.
-        max_ranges = []
-        for i, value in enumerate(values):
-            self.data[i].appendleft(value)
-            max_ranges.append(max([max(self.data[i]), abs(min(self.data[i]))]))
-            if len(self.data[i]) > self.max_x:
-                self.data[i].pop()
-
-        # Re-scale y-axis.
-        max_y_range = max(max_ranges)
-        y_range = bisect.bisect_left(self.y_ranges, max_y_range)
-        if y_range < len(self.y_ranges):
-            self.max_y = self.y_ranges[y_range]
-        elif max_y_range > self.max_y:
-            self.max_y += self.max_y
-        elif max_y_range < self.max_y / 2:
-            self.max_y = self.max_y / 2
-        self.axis_y.setRange(-self.max_y, self.max_y)
-
-        # Ensure floats are used to label y axis if the range is small.
-        if self.max_y <= 5:
-            self.axis_y.setLabelFormat("%2.2f")
-        else:
-            self.axis_y.setLabelFormat("%d")
-
-        # Update the line series with the data.
-        for i, line_series in enumerate(self.series):
-            line_series.clear()
-            xy_vals = []
-            for j in range(self.max_x):
-                val = self.data[i][self.max_x - 1 - j]
-                xy_vals.append((j, val))
-            for point in xy_vals:
-                line_series.append(*point)
+        Zoom in (increase) the size of the font by delta amount difference in
+        point size upto 34 points.
+        """
+        old_size = self.font().pointSize()
+        new_size = min(old_size + delta, 34)
+        self.set_font_size(new_size)
 
-    def set_theme(self, theme):
+    def zoomOut(self, delta=2):
         """
-        Sets the theme / look for the plotter pane.
+        Zoom out (decrease) the size of the font by delta amount difference in
+        point size down to 4 points.
         """
-        if theme == 'day':
-            self.chart.setTheme(QChart.ChartThemeLight)
-        elif theme == 'night':
-            self.chart.setTheme(QChart.ChartThemeDark)
-        else:
-            self.chart.setTheme(QChart.ChartThemeHighContrast)
+        old_size = self.font().pointSize()
+        new_size = max(old_size - delta, 4)
+        self.set_font_size(new_size)
+
+    def contextMenuEvent(self, event):
+        """
+        Offer to add a watch expression, or remove the one clicked on.
+        """
+        model = self.model()
+        node = model.node(self.indexAt(event.pos()))
+        menu = QMenu(self)
+        add_action = menu.addAction(_('Add watch expression'))
+        remove_action = None
+        if node is not model.root and node.summary and model.is_watch(node):
+            remove_action = menu.addAction(_('Remove watch expression'))
+        action = menu.exec_(self.mapToGlobal(event.pos()))
+        if action == add_action:
+            expression, ok = QInputDialog.getText(
+                self, _('Watch expression'),
+                _('An expression to evaluate whenever the script stops:'))
+            if ok and expression.strip():
+                self.add_watch.emit(expression.strip())
+        elif remove_action and action == remove_action:
+            self.remove_watch.emit(node.name)
+
+    def set_theme(self, theme):
+        pass
@@ -0,0 +1,381 @@
+"""
+Contains the pane used by Mu to plot data.
+
+It's kept apart from the other panes, and only imported when the plotter is
+first shown, so QtChart is only loaded when needed.
+
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import bisect
+from collections import deque
+from PyQt5.QtCore import QPointF, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QMenu
+from PyQt5.QtGui import QPainter
+from PyQt5.QtChart import QChart, QLineSeries, QChartView, QValueAxis
+
+
+# Maximum number of buckets used when downsampling a data capture for display.
+CAPTURE_BUCKETS = 1000
+# Milliseconds between each update of the plotter when replaying a capture.
+REPLAY_INTERVAL = 50
+# Maximum number of captured rows replayed with each update of the plotter.
+MAX_REPLAY_SPEED = 1024
+
+
+def downsample(values, buckets=CAPTURE_BUCKETS):
+    """
+    Given a one dimensional numpy array of values, return a list of QPointF
+    (with the index of the value as x) that, if there are more than twice as
+    many values as buckets, only contains the smallest and largest value
+    found in each of the buckets so spikes in the data are still visible.
+
+    NaN values (padding from irregular captures) are dropped.
+    """
+    import numpy
+    count = len(values)
+    if count <= buckets * 2:
+        xs = numpy.arange(count)
+    else:
+        size = -(-count // buckets)  # Values per bucket, rounded up.
+        padded = numpy.full(size * buckets, numpy.nan)
+        padded[:count] = values
+        missing = numpy.isnan(padded).reshape(buckets, size)
+        chunks = padded.reshape(buckets, size)
+        lows = numpy.where(missing, numpy.inf, chunks).argmin(axis=1)
+        highs = numpy.where(missing, -numpy.inf, chunks).argmax(axis=1)
+        starts = numpy.arange(buckets) * size
+        xs = numpy.unique(numpy.concatenate((starts + lows, starts + highs)))
+        xs = xs[xs < count]
+    ys = values[xs]
+    keep = ~numpy.isnan(ys)
+    return [QPointF(x, y) for x, y in zip(xs[keep].tolist(),
+                                          ys[keep].tolist())]
+
+
+class PlotterPane(QChartView):
+    """
+    This plotter widget makes viewing sensor data easy!
+
+    This widget represents a chart that will look for tuple data from
+    the MicroPython REPL, Python 3 REPL or Python 3 code runner and will
+    auto-generate a graph.
+    """
+
+    data_flood = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Holds the raw input to be checked for actionable data to display.
+        self.input_buffer = []
+        # Holds the raw actionable data detected while plotting.
+        self.raw_data = []
+        self.setObjectName('plotterpane')
+        self.max_x = 100  # Maximum value along x axis
+        self.max_y = 1000  # Maximum value +/- along y axis
+        self.flooded = False  # Flag to indicate if data flooding is happening.
+
+        # Holds deques for each slot of incoming data (assumes 1 to start with)
+        self.data = [deque([0] * self.max_x), ]
+        # Holds line series for each slot of incoming data (assumes 1 to start
+        # with).
+        self.series = [QLineSeries(), ]
+
+        # Ranges used for the Y axis (up to 1000, after which we just double
+        # the range).
+        self.y_ranges = [1, 5, 10, 25, 50, 100, 250, 500, 1000]
+
+        # Set up the chart with sensible defaults.
+        self.chart = QChart()
+        self.chart.legend().hide()
+        self.chart.addSeries(self.series[0])
+        self.axis_x = QValueAxis()
+        self.axis_y = QValueAxis()
+        self.axis_x.setRange(0, self.max_x)
+        self.axis_y.setRange(-self.max_y, self.max_y)
+        self.axis_x.setLabelFormat("time")
+        self.axis_y.setLabelFormat("%d")
+        self.chart.setAxisX(self.axis_x, self.series[0])
+        self.chart.setAxisY(self.axis_y, self.series[0])
+        self.setChart(self.chart)
+        self.setRenderHint(QPainter.Antialiasing)
+
+        # Holds a previously captured data set loaded from a CSV file (see
+        # load_capture) and the state needed to replay it.
+        self.capture = None
+        self.replay_position = 0  # Next row of the capture to be replayed.
+        self.replay_speed = 1  # Rows of the capture replayed with each tick.
+        self.replay_timer = QTimer(self)
+        self.replay_timer.timeout.connect(self.replay_step)
+
+    def process_bytes(self, data):
+        """
+        Takes raw bytes and, if a valid tuple is detected, adds the data to
+        the plotter.
+
+        The the length of the bytes data > 1024 then a data_flood signal is
+        emitted to ensure Mu can take action to remain responsive.
+        """
+        # Data flooding guards.
+        if self.flooded:
+            return
+        if len(data) > 1024:
+            self.flooded = True
+            self.data_flood.emit()
+            return
+        data = data.replace(b'\r\n', b'\n')
+        self.input_buffer.append(data)
+        # Check if the data contains a Python tuple, containing numbers, on a
+        # single line (i.e. ends with \n).
+        input_bytes = b''.join(self.input_buffer)
+        lines = input_bytes.split(b'\n')
+        for line in lines:
+            if line.startswith(b'(') and line.endswith(b')'):
+                # Candidate tuple. Extract the raw bytes into a numeric tuple.
+                raw_values = [val.strip() for val in line[1:-1].split(b',')]
+                numeric_values = []
+                for raw in raw_values:
+                    try:
+                        numeric_values.append(int(raw))
+                        # It worked, so move onto the next value.
+                        continue
+                    except ValueError:
+                        # Try again as a float.
+                        pass
+                    try:
+                        numeric_values.append(float(raw))
+                    except ValueError:
+                        # Not an int or float, so ignore this value.
+                        continue
+                if numeric_values:
+                    # There were numeric values in the tuple, so use them!
+                    self.add_data(tuple(numeric_values))
+        # Reset the input buffer.
+        self.input_buffer = []
+        if lines[-1]:
+            # Append any bytes that are not yet at the end of a line, for
+            # processing next time we read data from self.serial.
+            self.input_buffer.append(lines[-1])
+
+    def add_data(self, values):
+        """
+        Given a tuple of values, ensures there are the required number of line
+        series, add the data to the line series, update the range of the chart
+        so the chart displays nicely.
+        """
+        # Store incoming data to dump as CSV at the end of the session.
+        self.raw_data.append(values)
+        self.push_values(values)
+        self.update_series()
+
+    def set_series_count(self, count):
+        """
+        Ensure there are exactly count line series in the chart, each with
+        an associated deque of data.
+        """
+        series_len = len(self.series)
+        if count > series_len:
+            # Add new line series.
+            for i in range(count - series_len):
+                new_series = QLineSeries()
+                self.chart.addSeries(new_series)
+                self.chart.setAxisX(self.axis_x, new_series)
+                self.chart.setAxisY(self.axis_y, new_series)
+                self.series.append(new_series)
+                self.data.append(deque([0] * self.max_x))
+        elif count < series_len:
+            # Remove old line series.
+            for old_series in self.series[count:]:
+                self.chart.removeSeries(old_series)
+            self.series = self.series[:count]
+            self.data = self.data[:count]
+
+    def push_values(self, values):
+        """
+        Add a tuple of values to the data to be displayed and re-scale the
+        y-axis to fit, without updating the line series.
+        """
+        # Check the number of incoming values.
+        if len(values) != len(self.series):
+            # Adjust the number of line series.
+            self.set_series_count(len(values))
+
+        # Add the incoming values to the data to be displayed, and compute
+        # max range.
+        max_ranges = []
+        for i, value in enumerate(values):
+            self.data[i].appendleft(value)
+            max_ranges.append(max([max(self.data[i]), abs(min(self.data[i]))]))
+            if len(self.data[i]) > self.max_x:
+                self.data[i].pop()
+
+        # Re-scale y-axis.
+        max_y_range = max(max_ranges)
+        y_range = bisect.bisect_left(self.y_ranges, max_y_range)
+        if y_range < len(self.y_ranges):
+            self.max_y = self.y_ranges[y_range]
+        elif max_y_range > self.max_y:
+            self.max_y += self.max_y
+        elif max_y_range < self.max_y / 2:
+            self.max_y = self.max_y / 2
+        self.axis_y.setRange(-self.max_y, self.max_y)
+
+        # Ensure floats are used to label y axis if the range is small.
+        if self.max_y <= 5:
+            self.axis_y.setLabelFormat("%2.2f")
+        else:
+            self.axis_y.setLabelFormat("%d")
+
+    def update_series(self):
+        """
+        Update the line series with the data.
+        """
+        for i, line_series in enumerate(self.series):
+            line_series.clear()
+            xy_vals = []
+            for j in range(self.max_x):
+                val = self.data[i][self.max_x - 1 - j]
+                xy_vals.append((j, val))
+            for point in xy_vals:
+                line_series.append(*point)
+
+    def load_capture(self, data):
+        """
+        Display a previously captured data set (a two dimensional numpy array
+        with a row for each tuple, see mu.logic.read_data_capture) in its
+        entirety.
+        """
+        self.stop_replay()
+        self.capture = data
+        self.replay_position = 0
+        self.show_capture()
+
+    def show_capture(self):
+        """
+        Draw the whole of the loaded capture.
+
+        Each line series is downsampled so no more than two points per bucket
+        (see CAPTURE_BUCKETS) are drawn, so rendering is quick however big the
+        capture may be.
+        """
+        rows, columns = self.capture.shape
+        self.set_series_count(columns)
+        max_y_range = 0
+        for i, line_series in enumerate(self.series):
+            points = downsample(self.capture[:, i])
+            line_series.replace(points)
+            if points:
+                max_y_range = max(max_y_range,
+                                  max(abs(point.y()) for point in points))
+        self.axis_x.setRange(0, max(rows - 1, 1))
+        self.axis_x.setLabelFormat("%d")
+        y_range = bisect.bisect_left(self.y_ranges, max_y_range)
+        if y_range < len(self.y_ranges):
+            self.max_y = self.y_ranges[y_range]
+        else:
+            self.max_y = self.y_ranges[-1]
+            while self.max_y < max_y_range:
+                self.max_y += self.max_y
+        self.axis_y.setRange(-self.max_y, self.max_y)
+        if self.max_y <= 5:
+            self.axis_y.setLabelFormat("%2.2f")
+        else:
+            self.axis_y.setLabelFormat("%d")
+
+    def start_replay(self):
+        """
+        Replay the loaded capture, from where the last replay stopped, through
+        the live (scrolling) view of the plotter.
+        """
+        if self.capture is None or not len(self.capture):
+            return
+        if self.replay_position == 0:
+            self.data = [deque([0] * self.max_x) for s in self.series]
+        self.axis_x.setRange(0, self.max_x)
+        self.axis_x.setLabelFormat("time")
+        self.replay_timer.start(REPLAY_INTERVAL)
+
+    def stop_replay(self):
+        """
+        Pause the replay of the loaded capture.
+        """
+        self.replay_timer.stop()
+
+    def replay_step(self):
+        """
+        Add the next replay_speed rows of the capture to the plotter and
+        update the chart once they have all been added.
+        """
+        end = min(self.replay_position + self.replay_speed, len(self.capture))
+        for row in self.capture[self.replay_position:end].tolist():
+            # Drop the NaN padding of rows shorter than the widest row.
+            while row and row[-1] != row[-1]:
+                row.pop()
+            if row:
+                self.push_values(tuple(row))
+        self.update_series()
+        self.replay_position = end
+        if end >= len(self.capture):
+            self.stop_replay()
+            self.replay_position = 0
+
+    def set_replay_speed(self, speed):
+        """
+        Set the number of captured rows replayed with each update, between 1
+        and MAX_REPLAY_SPEED.
+        """
+        self.replay_speed = max(1, min(int(speed), MAX_REPLAY_SPEED))
+
+    def contextMenuEvent(self, event):
+        """
+        Offer ways to explore and replay a capture loaded into the plotter.
+        """
+        if self.capture is None:
+            return super().contextMenuEvent(event)
+        menu = QMenu(self)
+        replaying = self.replay_timer.isActive()
+        if replaying:
+            replay_action = menu.addAction(_('Pause replay'))
+        else:
+            replay_action = menu.addAction(_('Replay'))
+        faster_action = menu.addAction(_('Replay faster'))
+        slower_action = menu.addAction(_('Replay slower'))
+        show_action = menu.addAction(_('Show all the data'))
+        action = menu.exec_(self.mapToGlobal(event.pos()))
+        if action == replay_action:
+            if replaying:
+                self.stop_replay()
+            else:
+                self.start_replay()
+        elif action == faster_action:
+            self.set_replay_speed(self.replay_speed * 2)
+        elif action == slower_action:
+            self.set_replay_speed(self.replay_speed // 2)
+        elif action == show_action:
+            self.stop_replay()
+            self.replay_position = 0
+            self.show_capture()
+
+    def set_theme(self, theme):
+        """
+        Sets the theme / look for the plotter pane.
+        """
+        if theme == 'day':
+            self.chart.setTheme(QChart.ChartThemeLight)
+        elif theme == 'night':
+            self.chart.setTheme(QChart.ChartThemeDark)
+        else:
+            self.chart.setTheme(QChart.ChartThemeHighContrast)
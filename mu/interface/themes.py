@@ -19,7 +19,7 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import logging
 import platform
 
-from PyQt5.QtGui import QColor, QFontDatabase
+from PyQt5.QtGui import QColor, QFont, QFontDatabase
 from mu.resources import load_stylesheet, load_font_data
 
 
@@ -72,6 +72,7 @@ class Font:
     editor.
     """
     _DATABASE = None
+    _FONTS = {}  # Fonts loaded from the database, by style name and size.
 
     def __init__(self, color='black', paper='white', bold=False, italic=False):
         self.color = color
@@ -88,6 +89,7 @@ class Font:
         """
         if cls._DATABASE is None:
             cls._DATABASE = QFontDatabase()
+            cls._FONTS = {}
             for variant in FONT_VARIANTS:
                 filename = FONT_FILENAME_PATTERN.format(variant=variant)
                 font_data = load_font_data(filename)
@@ -97,8 +99,15 @@ class Font:
     def load(self, size=DEFAULT_FONT_SIZE):
         """
         Load the font from the font database, using the correct size and style
+
+        Each font is only looked up in the database once. A copy is returned,
+        so it may be changed (e.g. zoomed) without affecting other users.
         """
-        return Font.get_database().font(FONT_NAME, self.stylename, size)
+        database = Font.get_database()
+        key = (self.stylename, size)
+        if key not in Font._FONTS:
+            Font._FONTS[key] = database.font(FONT_NAME, self.stylename, size)
+        return QFont(Font._FONTS[key])
 
     @property
     def stylename(self):
@@ -120,19 +129,31 @@ class Theme:
     Defines a font and other theme specific related information.
     """
 
+    @classmethod
+    def styles(cls):
+        """
+        Return a list of (name, color, paper, font) tuples describing each
+        style of the theme. The QColor and QFont objects are made once and
+        shared by every lexer the theme is applied to.
+        """
+        if '_styles' not in cls.__dict__:
+            cls._styles = [(name, QColor(font.color), QColor(font.paper),
+                            font.load())
+                           for name, font in cls.__dict__.items()
+                           if isinstance(font, Font)]
+        return cls._styles
+
     @classmethod
     def apply_to(cls, lexer):
         # Apply a font for all styles
         lexer.setFont(Font().load())
 
-        for name, font in cls.__dict__.items():
-            if not isinstance(font, Font):
-                continue
+        for name, color, paper, font in cls.styles():
             style_num = getattr(lexer, name)
-            lexer.setColor(QColor(font.color), style_num)
+            lexer.setColor(color, style_num)
             lexer.setEolFill(True, style_num)
-            lexer.setPaper(QColor(font.paper), style_num)
-            lexer.setFont(font.load(), style_num)
+            lexer.setPaper(paper, style_num)
+            lexer.setFont(font, style_num)
 
 
 class DayTheme(Theme):
@@ -159,6 +180,7 @@ class DayTheme(Theme):
     Margin = QColor('#EEE')
     IndicatorError = QColor('red')
     IndicatorStyle = QColor('blue')
+    IndicatorProfile = QColor('#ff8c00')
     DebugStyle = QColor('#ffcc33')
     IndicatorWordMatch = QColor('lightGrey')
     BraceBackground = QColor('lightGrey')
@@ -194,6 +216,7 @@ class NightTheme(Theme):
     Margin = QColor('#424446')
     IndicatorError = QColor('#c93827')
     IndicatorStyle = QColor('#2f5692')
+    IndicatorProfile = QColor('#de935f')
     DebugStyle = QColor('#444')
     IndicatorWordMatch = QColor('#f14721')
     BraceBackground = QColor('#ed1596')
@@ -228,6 +251,7 @@ class ContrastTheme(Theme):
     Margin = QColor('#333')
     IndicatorError = QColor('white')
     IndicatorStyle = QColor('cyan')
+    IndicatorProfile = QColor('yellow')
     DebugStyle = QColor('#666')
     IndicatorWordMatch = QColor('grey')
     BraceBackground = QColor('white')
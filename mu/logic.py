@@ -20,20 +20,25 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import sys
 import codecs
+import csv
 import io
 import re
 import json
 import logging
-import tempfile
 import platform
-import webbrowser
 import random
 import locale
 import shutil
+import hashlib
+import tempfile
+import threading
+import warnings
+from collections import OrderedDict
 import appdirs
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QMessageBox
 from pyflakes.api import check
-from pycodestyle import StyleGuide, Checker
+from pycodestyle import StyleGuide, Checker, BaseReport
 from mu.resources import path
 from mu.debugger.utils import is_breakpoint_line
 from mu import __version__
@@ -49,8 +54,6 @@ DATA_DIR = appdirs.user_data_dir(appname='mu', appauthor='python')
 LOG_DIR = appdirs.user_log_dir(appname='mu', appauthor='python')
 # The path to the log file for the application.
 LOG_FILE = os.path.join(LOG_DIR, 'mu.log')
-# Regex to match pycodestyle (PEP8) output.
-STYLE_REGEX = re.compile(r'.*:(\d+):(\d+):\s+(.*)')
 # Regex to match flake8 output.
 FLAKE_REGEX = re.compile(r'.*:(\d+):\s+(.*)')
 # Regex to match false positive flake errors if microbit.* is expanded.
@@ -62,8 +65,13 @@ EXPANDED_IMPORT = ("from microbit import pin15, pin2, pin0, pin1, "
                    "sleep, pin20, button_a, button_b, running_time, "
                    "accelerometer, display, uart, spi, panic, pin13, "
                    "pin12, pin11, pin10, compass")
-# Port number for debugger.
-DEBUGGER_PORT = 31415
+# Port number for debugger (0 for any free port, which the debug runner then
+# reports to Mu).
+DEBUGGER_PORT = 0
+# Milliseconds to wait after the last edit before checking code as you type.
+LIVE_CHECK_DELAY = 750
+# Number of results of checking code to remember (see CodeChecker).
+CHECK_CACHE_SIZE = 32
 MOTD = [  # Candidate phrases for the message of the day (MOTD).
     _('Hello, World!'),
     _("This editor is free software written in Python. You can modify it, "
@@ -159,11 +167,11 @@ def write_and_flush(fileobj, content):
     os.fsync(fileobj)
 
 
-def save_and_encode(text, filepath, newline=os.linesep):
+def get_encoding(text):
     """
-    Detect the presence of an encoding cookie and use that encoding; if
-    none is present, do not add one and use the Mu default encoding.
-    If the codec is invalid, log a warning and fall back to the default.
+    Detect the presence of an encoding cookie and return that encoding; if
+    none is present, return the Mu default encoding. If the codec is invalid,
+    log a warning and fall back to the default.
     """
     match = ENCODING_COOKIE_RE.match(text)
     if match:
@@ -175,11 +183,61 @@ def save_and_encode(text, filepath, newline=os.linesep):
             encoding = ENCODING
     else:
         encoding = ENCODING
+    return encoding
+
 
+def save_and_encode(text, filepath, newline=os.linesep):
+    """
+    Detect the presence of an encoding cookie and use that encoding; if
+    none is present, do not add one and use the Mu default encoding.
+    If the codec is invalid, log a warning and fall back to the default.
+    """
+    encoding = get_encoding(text)
     with open(filepath, "w", encoding=encoding, newline='') as f:
         write_and_flush(f, newline.join(text.splitlines()))
 
 
+def replace_and_encode(text, filepath, newline=os.linesep, fsync=True):
+    """
+    Save the text like save_and_encode, but to a temporary file in the same
+    directory which then (atomically) replaces the existing file, so a crash
+    mid-save can't leave the file half written. The file is only fsync-ed if
+    fsync is True.
+
+    Symbolic links are written through to the file they refer to. A file with
+    other (hard) links is written in place, since replacing it would separate
+    it from them.
+    """
+    encoding = get_encoding(text)
+    content = newline.join(text.splitlines())
+    filepath = os.path.realpath(filepath)
+    if os.path.isfile(filepath) and os.stat(filepath).st_nlink == 1:
+        directory, filename = os.path.split(filepath)
+        fd, temp_path = tempfile.mkstemp(prefix='.{}.'.format(filename),
+                                         suffix='.tmp', dir=directory)
+        f = open(fd, "w", encoding=encoding, newline='')
+    else:
+        # There's no existing file to protect, or it can't be replaced.
+        temp_path = None
+        f = open(filepath, "w", encoding=encoding, newline='')
+    try:
+        with f:
+            if fsync:
+                write_and_flush(f, content)
+            else:
+                f.write(content)
+        if temp_path:
+            shutil.copymode(filepath, temp_path)
+            os.replace(temp_path, filepath)
+    except BaseException:
+        if temp_path:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        raise
+
+
 def sniff_encoding(filepath):
     """Determine the encoding of a file:
 
@@ -289,6 +347,72 @@ def read_and_decode(filepath):
     return text, newline
 
 
+def read_data_capture(filepath):
+    """
+    Read a CSV file of data captured by the plotter (see
+    BaseMode.remove_plotter) and return a two dimensional numpy array of
+    floats containing a row for each captured tuple.
+
+    Captures may contain millions of rows, so if every row has the same
+    number of values the whole file is parsed by numpy in a single pass.
+    Otherwise (the size of the tuples changed while capturing) the csv module
+    is used and missing values are padded with NaN.
+    """
+    import numpy  # Only needed by the (rarely used) capture viewer.
+    try:
+        with warnings.catch_warnings():
+            # An empty capture is reported as a warning.
+            warnings.simplefilter('ignore', UserWarning)
+            result = numpy.loadtxt(filepath, delimiter=',', comments=None,
+                                   ndmin=2)
+    except ValueError:
+        # Non-numeric content or rows of differing lengths.
+        logger.info('Reading irregular data capture: {}'.format(filepath))
+    else:
+        return result if result.size else numpy.empty((0, 0))
+    with open(filepath, encoding='utf-8', errors='replace', newline='') as f:
+        parsed = list(csv.reader(io.StringIO(f.read().strip())))
+    result = numpy.full((len(parsed), max(len(row) for row in parsed)),
+                        numpy.nan)
+    for i, row in enumerate(parsed):
+        for j, value in enumerate(row):
+            try:
+                result[i, j] = float(value)
+            except ValueError:
+                pass
+    return result
+
+
+def read_profile(filepath):
+    """
+    Read the statistics written by cProfile (run with the -o flag) to the
+    referenced file and return a list of dictionaries describing the cost of
+    each function called, most expensive first.
+
+    Each dictionary contains the filename, line (zero based, for annotating
+    the code) and name of the function, the number of calls, the time spent
+    in the function itself (own_time), including the functions it called
+    (total_time) and the total_time as a percentage of the whole run.
+    """
+    import pstats  # Only needed when a script has been profiled.
+    stats = pstats.Stats(filepath)
+    run_time = stats.total_tt or 1
+    result = []
+    for (filename, line, function), data in stats.stats.items():
+        primitive_calls, calls, own_time, total_time, callers = data
+        result.append({
+            'filename': filename,
+            'line': max(line - 1, 0),
+            'function': function,
+            'calls': calls,
+            'own_time': own_time,
+            'total_time': total_time,
+            'percent': 100 * total_time / run_time,
+        })
+    result.sort(key=lambda entry: entry['total_time'], reverse=True)
+    return result
+
+
 def get_admin_file_path(filename):
     """
     Given an admin related filename, this function will attempt to get the
@@ -348,6 +472,25 @@ def get_settings_path():
     return get_admin_file_path('settings.json')
 
 
+def get_fsync_policy():
+    """
+    Return the fsync policy from the "fsync" key of the settings file. This is
+    either True or False (whether to fsync all saved files) or an object
+    whose keys are the paths of devices (e.g. "/media/me/NETDRIVE") and whose
+    values are whether to fsync the files saved to them. By default all files
+    are fsync-ed.
+    """
+    try:
+        with open(get_settings_path()) as f:
+            policy = json.load(f).get('fsync', True)
+    except (OSError, ValueError, AttributeError):
+        return True
+    if isinstance(policy, dict):
+        return {os.path.normcase(os.path.realpath(device)): bool(fsync)
+                for device, fsync in policy.items()}
+    return bool(policy)
+
+
 def extract_envars(raw):
     """
     Returns a list of environment variables given a string containing
@@ -404,47 +547,23 @@ def check_pycodestyle(code):
 
     https://pycodestyle.readthedocs.io/en/latest/intro.html
     """
-    # PyCodeStyle reads input from files, so make a temporary file containing
-    # the code.
-    code_fd, code_filename = tempfile.mkstemp()
-    os.close(code_fd)
-    save_and_encode(code, code_filename)
     # Configure which PEP8 rules to ignore.
     ignore = ('E121', 'E123', 'E126', 'E226', 'E302', 'E305', 'E24', 'E704',
               'W291', 'W292', 'W293', 'W391', 'W503', )
     style = StyleGuide(parse_argv=False, config_file=False)
     style.options.ignore = ignore
-    checker = Checker(code_filename, options=style.options)
-    # Re-route stdout to a temporary buffer to be parsed below.
-    temp_out = io.StringIO()
-    sys.stdout = temp_out
-    # Check the code.
+    # Check the code in memory, with the results gathered by the reporter
+    # rather than printed.
+    reporter = MuStyleCodeReporter(style.options)
+    lines = [line + '\n' for line in code.splitlines()]
+    checker = Checker(None, lines=lines, options=style.options,
+                      report=reporter)
     checker.check_all()
-    # Put stdout back and read the content of the buffer. Remove the temporary
-    # file created at the start.
-    sys.stdout = sys.__stdout__
-    temp_out.seek(0)
-    results = temp_out.read()
-    temp_out.close()
-    os.remove(code_filename)
-    # Parse the output from the tool into a dictionary of structured data.
     style_feedback = {}
-    for result in results.split('\n'):
-        matcher = STYLE_REGEX.match(result)
-        if matcher:
-            line_no, col, msg = matcher.groups()
-            line_no = int(line_no) - 1
-            code, description = msg.split(' ', 1)
-            if code == 'E303':
-                description += _(' above this line')
-            if line_no not in style_feedback:
-                style_feedback[line_no] = []
-            style_feedback[line_no].append({
-                'line_no': line_no,
-                'column': int(col) - 1,
-                'message': description.capitalize(),
-                'code': code,
-            })
+    for log in reporter.log:
+        if log['line_no'] not in style_feedback:
+            style_feedback[log['line_no']] = []
+        style_feedback[log['line_no']].append(log)
     return style_feedback
 
 
@@ -510,6 +629,325 @@ class MuFlakeCodeReporter:
             })
 
 
+class MuStyleCodeReporter(BaseReport):
+    """
+    The class instantiates a reporter that creates structured data about
+    code style for Mu. Used by the PyCodeStyle module.
+    """
+
+    def __init__(self, options):
+        """
+        Set up the reporter object to be used to report PyCodeStyle's results.
+        """
+        super().__init__(options)
+        self.log = []
+
+    def error(self, line_number, offset, text, check):
+        """
+        PyCodeStyle found something wrong with the code. The text starts with
+        the code of the problem (e.g. "E303") followed by its description.
+
+        Returns the code if the problem is to be reported (i.e. it isn't
+        ignored).
+        """
+        code = super().error(line_number, offset, text, check)
+        if code:
+            description = text[5:]
+            if code == 'E303':
+                description += _(' above this line')
+            self.log.append({
+                'line_no': line_number - 1,  # Zero based counting in Mu.
+                'column': offset,
+                'message': description.capitalize(),
+                'code': code,
+            })
+        return code
+
+
+class CodeCheckWorker(QObject):
+    """
+    Checks code with PyFlakes and PyCodeStyle in its own thread, so checking
+    a big file doesn't freeze the editor.
+    """
+
+    checked = pyqtSignal(int, object, object)
+
+    def __init__(self, checker):
+        """
+        The checker is the CodeChecker making the requests, whose latest
+        request is consulted between stages so stale requests are dropped.
+        """
+        super().__init__()
+        self.checker = checker
+
+    def is_stale(self, request):
+        """
+        Returns True if the request has been cancelled or superseded.
+        """
+        return request != self.checker.request
+
+    @pyqtSlot(int, str, str, object)
+    def check(self, request, filename, code, builtins):
+        """
+        Check the code and emit the results, unless the request becomes stale
+        on the way.
+        """
+        if self.is_stale(request):
+            return
+        flake = check_flake(filename, code, builtins)
+        if self.is_stale(request):
+            return
+        pep8 = check_pycodestyle(code)
+        if self.is_stale(request):
+            return
+        self.checked.emit(request, flake, pep8)
+
+
+class CodeChecker(QObject):
+    """
+    Requests code checks of a tab from a CodeCheckWorker in a background
+    thread, emitting finished with the tab and the results of PyFlakes and
+    PyCodeStyle. A request is cancelled if the tab's text changes before its
+    results arrive.
+
+    The results of recent checks are cached by a hash of the code checked
+    (and how), so returning to code that was checked (e.g. by undo or redo)
+    doesn't check it again.
+    """
+
+    finished = pyqtSignal(object, object, object)
+    requested = pyqtSignal(int, str, str, object)
+
+    def __init__(self):
+        super().__init__()
+        self.request = 0  # Incremented to cancel outstanding requests.
+        self.tab = None  # The tab whose code is being checked.
+        self.key = None  # The cache key of the code being checked.
+        self.cache = OrderedDict()  # Results by key, least recent first.
+        self.thread = None
+        self.worker = None
+
+    @staticmethod
+    def cache_key(filename, code, builtins):
+        """
+        Returns the key of the results of checking the code with the
+        referenced filename and additional builtins.
+        """
+        content = '\0'.join([filename, code] + list(builtins or []))
+        return hashlib.sha1(content.encode('utf-8', 'surrogatepass')).\
+            hexdigest()
+
+    def start(self):
+        """
+        Start the worker's thread.
+        """
+        self.thread = QThread()
+        self.worker = CodeCheckWorker(self)
+        self.worker.moveToThread(self.thread)
+        self.requested.connect(self.worker.check)
+        self.worker.checked.connect(self.on_checked)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Stop the worker's thread (if it was started).
+        """
+        self.cancel()
+        if self.thread:
+            self.thread.quit()
+            self.thread.wait()
+            self.thread = None
+            self.worker = None
+
+    def check(self, tab, filename, code, builtins=None):
+        """
+        Request a check of the code from the referenced tab, superseding any
+        outstanding request. Cached results are emitted straight away.
+        """
+        self.cancel()
+        key = self.cache_key(filename, code, builtins)
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            flake, pep8 = self.cache[key]
+            self.finished.emit(tab, flake, pep8)
+            return
+        if self.thread is None:
+            self.start()
+        self.request += 1
+        self.tab = tab
+        self.key = key
+        tab.textChanged.connect(self.cancel)
+        self.requested.emit(self.request, filename, code, builtins)
+
+    def cancel(self, tab=None):
+        """
+        Cancel the outstanding request, if there is one (and it's a check of
+        the referenced tab, if one is given).
+        """
+        if tab is not None and tab is not self.tab:
+            return
+        self.request += 1
+        if self.tab is not None:
+            try:
+                self.tab.textChanged.disconnect(self.cancel)
+            except (TypeError, RuntimeError):
+                pass  # Not connected, or the tab has been closed.
+            self.tab = None
+            self.key = None
+
+    def on_checked(self, request, flake, pep8):
+        """
+        Emit the results of the check, unless it was cancelled.
+        """
+        if request != self.request or self.tab is None:
+            return
+        tab = self.tab
+        self.cache[self.key] = (flake, pep8)
+        if len(self.cache) > CHECK_CACHE_SIZE:
+            self.cache.popitem(last=False)
+        self.cancel()
+        self.finished.emit(tab, flake, pep8)
+
+
+class SaveWorker(QObject):
+    """
+    Writes the files saved via a SaveService in its own thread, so saving to
+    a slow device (such as a network drive) doesn't freeze the editor.
+    """
+
+    saved = pyqtSignal(str, str)
+    failed = pyqtSignal(str, object)
+
+    def __init__(self, service):
+        super().__init__()
+        self.service = service
+
+    @pyqtSlot(str)
+    def save(self, filepath):
+        """
+        Write the latest text saved to the referenced path (if it hasn't been
+        written already) and emit the result.
+        """
+        try:
+            text = self.service.write(filepath)
+        except (OSError, UnicodeEncodeError) as ex:
+            self.failed.emit(filepath, ex)
+        else:
+            if text is not None:
+                self.saved.emit(filepath, text)
+
+
+class SaveService(QObject):
+    """
+    Saves text to files in a background thread (see SaveWorker), emitting
+    saved with the path and the text written, or failed with the path and
+    the exception raised.
+
+    The text is written to a temporary file which then replaces the file, so
+    a crash mid-save can't truncate it (see replace_and_encode). Saves to a
+    file which arrive before it's written are coalesced, so only the latest
+    text is written. Whether a file is fsync-ed depends on the device it's on
+    (see get_fsync_policy).
+    """
+
+    saved = pyqtSignal(str, str)
+    failed = pyqtSignal(str, object)
+    requested = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.pending = {}  # The (text, newline) to write to each path.
+        self.lock = threading.Lock()  # Guards pending.
+        self.writing = threading.Lock()  # Held while a file is written.
+        self.fsync_policy = True  # See get_fsync_policy.
+        self.thread = None
+        self.worker = None
+
+    def start(self):
+        """
+        Read the fsync policy and start the worker's thread.
+        """
+        self.fsync_policy = get_fsync_policy()
+        self.thread = QThread()
+        self.worker = SaveWorker(self)
+        self.worker.moveToThread(self.thread)
+        self.requested.connect(self.worker.save)
+        self.worker.saved.connect(self.saved)
+        self.worker.failed.connect(self.failed)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Write any outstanding saves, then stop the worker's thread (if it was
+        started).
+        """
+        for filepath in list(self.pending):
+            try:
+                text = self.write(filepath)
+            except (OSError, UnicodeEncodeError) as ex:
+                self.failed.emit(filepath, ex)
+            else:
+                if text is not None:
+                    self.saved.emit(filepath, text)
+        if self.thread:
+            self.thread.quit()
+            self.thread.wait()
+            self.thread = None
+            self.worker = None
+
+    def save(self, filepath, text, newline):
+        """
+        Request the text is saved to the referenced path, superseding any
+        outstanding save to the same path.
+        """
+        if self.thread is None:
+            self.start()
+        with self.lock:
+            coalesced = filepath in self.pending
+            self.pending[filepath] = (text, newline)
+        if not coalesced:
+            self.requested.emit(filepath)
+
+    def cancel(self, filepath):
+        """
+        Discard any outstanding save to the referenced path, waiting for the
+        file to be written if it's being written, so it can be saved directly.
+        """
+        with self.writing:
+            with self.lock:
+                self.pending.pop(filepath, None)
+
+    def fsync(self, filepath):
+        """
+        Returns True if files saved to the referenced path are to be fsync-ed,
+        according to the policy of the device (the longest matching path) on
+        which the file (or the file a link refers to) is stored.
+        """
+        if not isinstance(self.fsync_policy, dict):
+            return self.fsync_policy
+        normalised_path = os.path.normcase(os.path.realpath(filepath))
+        devices = [device for device in self.fsync_policy
+                   if normalised_path == device or
+                   normalised_path.startswith(device.rstrip(os.sep) + os.sep)]
+        if devices:
+            return self.fsync_policy[max(devices, key=len)]
+        return True
+
+    def write(self, filepath):
+        """
+        Write the outstanding save to the referenced path, returning the text
+        written or None if there's nothing to write.
+        """
+        with self.writing:
+            with self.lock:
+                text_newline = self.pending.pop(filepath, None)
+            if text_newline is None:
+                return None
+            text, newline = text_newline
+            replace_and_encode(text, filepath, newline, self.fsync(filepath))
+            return text
+
+
 class REPL:
     """
     Read, Evaluate, Print, Loop.
@@ -546,12 +984,26 @@ class Editor:
         self.modes = {}  # See set_modes.
         self.envars = []  # See restore session and show_admin
         self.minify = False
+        self.warm_pool = 0  # Number of pre-warmed interpreters for running.
+        self.debug_recording = False  # Record history to step backwards.
         self.microbit_runtime = ''
         self.connected_devices = set()
         self.find = ''
         self.replace = ''
         self.global_replace = False
         self.selecting_mode = False  # Flag to stop auto-detection of modes.
+        self.live_check = True  # Check code as you type.
+        self.code_checker = CodeChecker()  # Checks code in the background.
+        self.code_checker.finished.connect(self.on_code_checked)
+        self.saver = SaveService()  # Autosaves files in the background.
+        self.saver.saved.connect(self.on_saved)
+        self.saver.failed.connect(self.on_save_failed)
+        self.confirm_check = False  # Confirm there are no problems found.
+        self.live_check_tab = None  # The tab to check as you type.
+        self.live_check_timer = QTimer()  # Waits for typing to pause.
+        self.live_check_timer.setSingleShot(True)
+        self.live_check_timer.setInterval(LIVE_CHECK_DELAY)
+        self.live_check_timer.timeout.connect(self.live_check_code)
         if not os.path.exists(DATA_DIR):
             logger.debug('Creating directory: {}'.format(DATA_DIR))
             os.makedirs(DATA_DIR)
@@ -565,14 +1017,21 @@ class Editor:
             # Open the file
             self.direct_load(file)
 
+        view.text_changed.connect(self.on_text_changed)
+        view.placeholder_focused.connect(self.realize_tab)
+
     def setup(self, modes):
         """
-        Define the available modes and ensure there's a default working
-        directory.
+        Define the available modes.
         """
         self.modes = modes
         logger.info('Available modes: {}'.format(', '.join(self.modes.keys())))
-        # Ensure there is a workspace directory.
+
+    def setup_workspace(self):
+        """
+        Ensure there's a default working directory, containing the assets
+        used by Pygame Zero.
+        """
         wd = self.modes['python'].workspace_dir()
         if not os.path.exists(wd):
             logger.debug('Creating directory: {}'.format(wd))
@@ -600,8 +1059,12 @@ class Editor:
         if not os.path.exists(music_path):
             logger.debug('Creating directory: {}'.format(music_path))
             os.makedirs(music_path)
-        # Start the timer to poll every second for an attached or removed
-        # USB device.
+
+    def start_usb_checker(self):
+        """
+        Start the timer to poll every second for an attached or removed USB
+        device.
+        """
         self._view.set_usb_checker(1, self.check_usb)
 
     def restore_session(self, paths=None):
@@ -636,12 +1099,22 @@ class Editor:
                     self.select_mode(None)
                 if 'paths' in old_session:
                     old_paths = self._abspath(old_session['paths'])
-                    launch_paths = self._abspath(paths) if paths else set()
+                    launch_paths = self._abspath(paths) if paths else []
+                    placeholder = None  # Of the last tab, if it's unfocused.
                     for old_path in old_paths:
                         # if the os passed in a file, defer loading it now
                         if old_path in launch_paths:
                             continue
-                        self.direct_load(old_path)
+                        if old_path.lower().endswith('.py') and \
+                                os.path.isfile(old_path):
+                            # Only load the file when its tab is focused.
+                            placeholder = self._view.add_placeholder(old_path)
+                        else:
+                            self.direct_load(old_path)
+                            placeholder = None
+                    if placeholder:
+                        # Like loaded files, the last restored is focused.
+                        self._view.focus_tab(placeholder)
                     logger.info('Loaded files.')
                 if 'envars' in old_session:
                     self.envars = old_session['envars']
@@ -651,6 +1124,18 @@ class Editor:
                     self.minify = old_session['minify']
                     logger.info('Minify scripts on micro:bit? '
                                 '{}'.format(self.minify))
+                if 'live_check' in old_session:
+                    self.live_check = old_session['live_check']
+                    logger.info('Check code as you type? '
+                                '{}'.format(self.live_check))
+                if 'debug_recording' in old_session:
+                    self.debug_recording = old_session['debug_recording']
+                    logger.info('Record history when debugging? '
+                                '{}'.format(self.debug_recording))
+                if 'warm_pool' in old_session:
+                    self.warm_pool = old_session['warm_pool']
+                    logger.info('Pre-warmed interpreters: '
+                                '{}'.format(self.warm_pool))
                 if 'microbit_runtime' in old_session:
                     self.microbit_runtime = old_session['microbit_runtime']
                     if self.microbit_runtime:
@@ -693,7 +1178,7 @@ class Editor:
         logger.info('Added a new tab.')
         self._view.add_tab(None, '', self.modes[self.mode].api(), NEWLINE)
 
-    def _load(self, path):
+    def _load(self, path, placeholder=None):
         """
         Attempt to load a Python script from the passed in path. This path may
         be a .py file containing Python source code, or a .hex file, created
@@ -702,6 +1187,9 @@ class Editor:
         This method will work its way around duplicate paths and also attempt
         to cleanly handle / report / log errors when encountered in a helpful
         manner.
+
+        If a placeholder is given, the script is loaded into its tab (see
+        realize_tab).
         """
         logger.info('Loading script from: {}'.format(path))
         error = _("The file contains characters Mu expects to be encoded as "
@@ -714,10 +1202,23 @@ class Editor:
         if not os.path.isfile(path):
             logger.info('The file {} does not exist.'.format(path))
             return
+        if path.lower().endswith('.csv'):
+            # Data captured by the plotter is displayed, not edited.
+            mode = self.modes[self.mode]
+            if hasattr(mode, 'toggle_plotter'):
+                mode.open_capture(path)
+            else:
+                message = _('Mu was not able to open this file')
+                info = _('Data captured by the plotter can only be viewed '
+                         'in a mode with a plotter.')
+                self._view.show_message(message, info)
+            return
         # see if file is open first
-        for widget in self._view.widgets:
+        for widget in self._view.all_tabs:
             if widget.path is None:  # this widget is an unsaved buffer
                 continue
+            if widget is placeholder:  # the tab being loaded
+                continue
             if os.path.samefile(path, widget.path):
                 logger.info('Script already open.')
                 msg = _('The file "{}" is already open.')
@@ -738,10 +1239,14 @@ class Editor:
                     return
                 name = path
             else:
-                # Delegate the open operation to the Mu modes. Leave the name
-                # as None, thus forcing the user to work out what to name the
-                # recovered script.
-                for mode_name, mode in self.modes.items():
+                # Delegate the open operation to the Mu modes which handle the
+                # type of file. Leave the name as None, thus forcing the user
+                # to work out what to name the recovered script.
+                extension = os.path.splitext(path)[1][1:].lower()
+                for mode_name, descriptor in self.modes.descriptors.items():
+                    if extension not in descriptor.file_extensions:
+                        continue
+                    mode = self.modes[mode_name]
                     try:
                         text = mode.open_file(path)
                     except Exception as exc:
@@ -778,8 +1283,23 @@ class Editor:
                         message, info, icon='Question') == QMessageBox.Ok:
                     self.change_mode(file_mode)
             logger.debug(text)
-            self._view.add_tab(
-                name, text, self.modes[self.mode].api(), newline)
+            if placeholder:
+                self._view.realize_tab(placeholder, text,
+                                       self.modes[self.mode].api(), newline)
+            else:
+                self._view.add_tab(
+                    name, text, self.modes[self.mode].api(), newline)
+
+    def realize_tab(self, placeholder):
+        """
+        Loads the file of a tab restored from the last session, when the tab
+        is first focused, in place of the tab's placeholder. The tab is closed
+        if the file can't be loaded.
+        """
+        logger.info('Loading restored script.')
+        self._load(placeholder.path, placeholder)
+        if placeholder in self._view.placeholders:
+            self._view.remove_placeholder(placeholder)
 
     def load(self):
         """
@@ -788,9 +1308,11 @@ class Editor:
         """
         # Get all supported extensions from the different modes
         extensions = ['py']
-        for mode_name, mode in self.modes.items():
-            if mode.file_extensions:
-                extensions += mode.file_extensions
+        for descriptor in self.modes.descriptors.values():
+            extensions += descriptor.file_extensions
+        if hasattr(self.modes[self.mode], 'toggle_plotter'):
+            # Data captured by the plotter.
+            extensions.append('csv')
         extensions = set([e.lower() for e in extensions])
         extensions = '*.{} *.{}'.format(' *.'.join(extensions),
                                         ' *.'.join(extensions).upper())
@@ -821,14 +1343,17 @@ class Editor:
     def _abspath(self, paths):
         """
         Safely convert an arrary of paths to their absolute forms and remove
-        duplicate items.
+        duplicate items, keeping the order of the paths.
         """
-        result = set()
+        result = []
         for p in paths:
             try:
-                result.add(os.path.abspath(p))
+                absolute = os.path.abspath(p)
             except Exception as ex:
                 logger.error('Could not get path for {}: {}'.format(p, ex))
+                continue
+            if absolute not in result:
+                result.append(absolute)
         return result
 
     def save_tab_to_file(self, tab):
@@ -839,27 +1364,52 @@ class Editor:
         """
         logger.info('Saving script to: {}'.format(tab.path))
         logger.debug(tab.text())
+        # Don't let an outstanding autosave overwrite the text saved here.
+        self.saver.cancel(tab.path)
         try:
             save_and_encode(tab.text(), tab.path, tab.newline)
-        except OSError as e:
-            logger.error(e)
-            error_message = _('Could not save file (disk problem)')
-            information = _("Error saving file to disk. Ensure you have "
-                            "permission to write the file and "
-                            "sufficient disk space.")
-        except UnicodeEncodeError:
+        except (OSError, UnicodeEncodeError) as e:
+            self.show_save_error(e)
+        else:
+            tab.setModified(False)
+            self.show_status_message(_("Saved file: {}").format(tab.path))
+
+    def show_save_error(self, error):
+        """
+        Log and report the referenced error raised while saving a file.
+        """
+        if isinstance(error, UnicodeEncodeError):
             error_message = _("Could not save file (encoding problem)")
-            logger.exception(error_message)
+            logger.error(error_message, exc_info=error)
             information = _("Unable to convert all the characters. If you "
                             "have an encoding line at the top of the file, "
                             "remove it and try again.")
         else:
-            error_message = information = None
-        if error_message:
-            self._view.show_message(error_message, information)
-        else:
-            tab.setModified(False)
-            self.show_status_message(_("Saved file: {}").format(tab.path))
+            logger.error(error)
+            error_message = _('Could not save file (disk problem)')
+            information = _("Error saving file to disk. Ensure you have "
+                            "permission to write the file and "
+                            "sufficient disk space.")
+        self._view.show_message(error_message, information)
+
+    def on_saved(self, filepath, text):
+        """
+        Handles the referenced text having been autosaved to the path. Tabs
+        for the path whose text hasn't changed since are no longer modified.
+        """
+        logger.info('Autosaved changes to {}.'.format(filepath))
+        for tab in self._view.widgets:
+            if tab.path == filepath and tab.text() == text:
+                tab.setModified(False)
+        self.show_status_message(_("Saved file: {}").format(filepath))
+
+    def on_save_failed(self, filepath, error):
+        """
+        Handles the referenced error raised while autosaving to the path (the
+        tabs for the path continue to show as modified).
+        """
+        logger.info('Could not autosave changes to {}.'.format(filepath))
+        self.show_save_error(error)
 
     def check_for_shadow_module(self, path):
         """
@@ -913,12 +1463,15 @@ class Editor:
         loads a new tab for the path.
         """
         normalised_path = os.path.normcase(os.path.abspath(path))
-        for tab in self._view.widgets:
+        for tab in self._view.all_tabs:
             if tab.path:
                 tab_path = os.path.normcase(os.path.abspath(tab.path))
                 if tab_path == normalised_path:
                     self._view.focus_tab(tab)
-                    return tab
+                    if tab in self._view.widgets:
+                        return tab
+                    # Focusing a placeholder replaces it with a loaded tab.
+                    return self._view.current_tab
         self.direct_load(path)
         return self._view.current_tab
 
@@ -939,42 +1492,90 @@ class Editor:
     def check_code(self):
         """
         Uses PyFlakes and PyCodeStyle to gather information about potential
-        problems with the code in the current tab.
+        problems with the code in the current tab. The code is checked in the
+        background and the results annotated by on_code_checked.
         """
         tab = self._view.current_tab
         if tab is None:
             # There is no active text editor so abort.
             return
+        # Only the results of checking on request are toggled off, those of
+        # checking as you type are checked again (and confirmed).
         tab.has_annotations = not tab.has_annotations
         if tab.has_annotations:
             logger.info('Checking code.')
             self._view.reset_annotations()
-            filename = tab.path if tab.path else _('untitled')
-            builtins = self.modes[self.mode].builtins
-            flake = check_flake(filename, tab.text(), builtins)
-            if flake:
-                logger.info(flake)
-                self._view.annotate_code(flake, 'error')
-            pep8 = check_pycodestyle(tab.text())
-            if pep8:
-                logger.info(pep8)
-                self._view.annotate_code(pep8, 'style')
-            self._view.show_annotations()
-            tab.has_annotations = bool(flake or pep8)
-            if not tab.has_annotations:
-                # No problems detected, so confirm this with a friendly
-                # message.
-                ok_messages = [
-                    _('Good job! No problems found.'),
-                    _('Hurrah! Checker turned up no problems.'),
-                    _('Nice one! Zero problems detected.'),
-                    _('Well done! No problems here.'),
-                    _('Awesome! Zero problems found.'),
-                ]
-                self.show_status_message(random.choice(ok_messages))
+            self.confirm_check = True
+            self.request_check(tab)
         else:
+            self.code_checker.cancel(tab)
             self._view.reset_annotations()
 
+    def request_check(self, tab):
+        """
+        Request the check of the code in the referenced tab (see
+        on_code_checked for the results).
+        """
+        filename = tab.path if tab.path else _('untitled')
+        builtins = self.modes[self.mode].builtins
+        self.code_checker.check(tab, filename, tab.text(), builtins)
+
+    def on_text_changed(self, tab):
+        """
+        The code in the referenced tab has been edited, so check it as you
+        type, once the typing pauses.
+        """
+        if self.live_check:
+            self.live_check_tab = tab
+            self.live_check_timer.start()
+
+    def live_check_code(self):
+        """
+        Check the code of the tab most recently edited, updating its
+        annotations with the results.
+        """
+        tab = self.live_check_tab
+        self.live_check_tab = None
+        if tab is None or tab not in self._view.widgets:
+            return  # The tab was closed.
+        self.confirm_check = False
+        self.request_check(tab)
+
+    def on_code_checked(self, tab, flake, pep8):
+        """
+        Annotate the tab with the problems found by checking its code (see
+        check_code and live_check_code).
+        """
+        if tab not in self._view.widgets:
+            return  # The tab was closed.
+        if not self.confirm_check:
+            # Checked as you type, so only update what has changed. These
+            # aren't the results of checking on request (see check_code).
+            tab.update_annotations({'error': flake, 'style': pep8})
+            tab.has_annotations = False
+            return
+        if not tab.has_annotations:
+            return  # The annotations were toggled off.
+        if flake:
+            logger.info(flake)
+            tab.annotate_code(flake, 'error')
+        if pep8:
+            logger.info(pep8)
+            tab.annotate_code(pep8, 'style')
+        tab.show_annotations()
+        tab.has_annotations = bool(flake or pep8)
+        if not tab.has_annotations:
+            # No problems detected, so confirm this with a friendly
+            # message.
+            ok_messages = [
+                _('Good job! No problems found.'),
+                _('Hurrah! Checker turned up no problems.'),
+                _('Nice one! Zero problems detected.'),
+                _('Well done! No problems here.'),
+                _('Awesome! Zero problems found.'),
+            ]
+            self.show_status_message(random.choice(ok_messages))
+
     def show_help(self):
         """
         Display browser based help about Mu.
@@ -988,6 +1589,7 @@ class Editor:
         major_version = '.'.join(__version__.split('.')[:2])
         url = 'https://codewith.mu/{}/help/{}'.format(language_code,
                                                       major_version)
+        import webbrowser  # Slow to import, so only imported when needed.
         webbrowser.open_new(url)
 
     def quit(self, *args, **kwargs):
@@ -1005,13 +1607,18 @@ class Editor:
                     args[0].ignore()
                 return
         paths = []
-        for widget in self._view.widgets:
+        for widget in self._view.all_tabs:
             if widget.path:
                 paths.append(os.path.abspath(widget.path))
         if self.modes[self.mode].is_debugger:
             # If quitting while debugging, make sure everything is cleaned
             # up.
             self.modes[self.mode].stop()
+        if hasattr(self.modes[self.mode], 'set_warm_pool'):
+            # Don't leave pre-warmed interpreters running.
+            self.modes[self.mode].set_warm_pool(0)
+        self.code_checker.stop()
+        self.saver.stop()
         session = {
             'theme': self.theme,
             'mode': self.mode,
@@ -1019,6 +1626,9 @@ class Editor:
             'envars': self.envars,
             'minify': self.minify,
             'microbit_runtime': self.microbit_runtime,
+            'warm_pool': self.warm_pool,
+            'debug_recording': self.debug_recording,
+            'live_check': self.live_check,
         }
         session_path = get_session_path()
         with open(session_path, 'w') as out:
@@ -1039,13 +1649,25 @@ class Editor:
                             self.envars])
         settings = {
             'envars': envars,
+            'warm_pool': self.warm_pool,
             'minify': self.minify,
             'microbit_runtime': self.microbit_runtime,
+            'debug_recording': self.debug_recording,
+            'live_check': self.live_check,
         }
+        debugger = self.modes.get('debugger')
+        if debugger:
+            settings['debug_latency'] = debugger.latency
         with open(LOG_FILE, 'r', encoding='utf8') as logfile:
             new_settings = self._view.show_admin(logfile.read(), settings)
             self.envars = extract_envars(new_settings['envars'])
             self.minify = new_settings['minify']
+            self.debug_recording = new_settings['debug_recording']
+            self.live_check = new_settings['live_check']
+            if new_settings['warm_pool'] != self.warm_pool:
+                self.warm_pool = new_settings['warm_pool']
+                if hasattr(self.modes[self.mode], 'set_warm_pool'):
+                    self.modes[self.mode].set_warm_pool(self.warm_pool)
             runtime = new_settings['microbit_runtime'].strip()
             if runtime and not os.path.isfile(runtime):
                 self.microbit_runtime = ''
@@ -1066,7 +1688,7 @@ class Editor:
         logger.info('Showing available modes: {}'.format(
             list(self.modes.keys())))
         self.selecting_mode = True  # Flag to stop auto-detection of modes.
-        new_mode = self._view.select_mode(self.modes, self.mode)
+        new_mode = self._view.select_mode(self.modes.descriptors, self.mode)
         self.selecting_mode = False
         if new_mode and new_mode != self.mode:
             logger.info('New mode selected: {}'.format(new_mode))
@@ -1081,6 +1703,8 @@ class Editor:
         old_mode = self.modes[self.mode]
         if hasattr(old_mode, 'remove_repl'):
             old_mode.remove_repl()
+        if hasattr(old_mode, 'set_warm_pool'):
+            old_mode.set_warm_pool(0)
         if hasattr(old_mode, 'remove_fs'):
             old_mode.remove_fs()
         if hasattr(old_mode, 'remove_plotter'):
@@ -1105,6 +1729,8 @@ class Editor:
         button_bar.connect("help", self.show_help, "Ctrl+H")
         button_bar.connect("quit", self.quit, "Ctrl+Q")
         self._view.status_bar.set_mode(mode)
+        if hasattr(self.modes[mode], 'set_warm_pool'):
+            self.modes[mode].set_warm_pool(self.warm_pool)
         # Update references to default file locations.
         logger.info('Workspace directory: {}'.format(
             self.modes[mode].workspace_dir()))
@@ -1119,6 +1745,7 @@ class Editor:
         if not (self.modes[mode].is_debugger or self.modes[mode].has_debugger):
             for tab in self._view.widgets:
                 tab.breakpoint_handles = set()
+                tab.breakpoint_options = {}
                 tab.reset_annotations()
         self.show_status_message(_('Changed to {} mode.').format(
             mode.capitalize()))
@@ -1128,12 +1755,12 @@ class Editor:
         Cycles through each tab and, if changed, saves it to the filesystem.
         """
         if self._view.modified:
-            # Something has changed, so save it!
+            # Something has changed, so save it (in the background)!
             for tab in self._view.widgets:
                 if tab.path and tab.isModified():
-                    self.save_tab_to_file(tab)
-                    logger.info('Autosave detected and saved '
-                                'changes in {}.'.format(tab.path))
+                    self.saver.save(tab.path, tab.text(), tab.newline)
+                    logger.info('Autosave detected changes in '
+                                '{}.'.format(tab.path))
 
     def check_usb(self):
         """
@@ -1145,13 +1772,11 @@ class Editor:
         devices = []
         device_types = set()
         # Detect connected devices.
-        for name, mode in self.modes.items():
-            if hasattr(mode, 'find_device'):
-                # The mode can detect an attached device.
-                port, serial = mode.find_device(with_logging=False)
-                if port:
-                    devices.append((name, port))
-                    device_types.add(name)
+        for name, mode in self.modes.device_modes():
+            port, serial = mode.find_device(with_logging=False)
+            if port:
+                devices.append((name, port))
+                device_types.add(name)
         # Remove no-longer connected devices.
         to_remove = []
         for connected in self.connected_devices:
@@ -1187,12 +1812,16 @@ class Editor:
 
     def debug_toggle_breakpoint(self, margin, line, modifiers):
         """
-        How to handle the toggling of a breakpoint.
+        How to handle the toggling of a breakpoint. Shift-clicking edits the
+        breakpoint's options instead (see edit_breakpoint).
         """
         if (self.modes[self.mode].has_debugger or
                 self.modes[self.mode].is_debugger):
             tab = self._view.current_tab
             code = tab.text(line)
+            if modifiers & Qt.ShiftModifier and is_breakpoint_line(code):
+                self.edit_breakpoint(line, tab)
+                return
             if self.mode == 'debugger':
                 # The debugger is running.
                 if is_breakpoint_line(code):
@@ -1212,6 +1841,32 @@ class Editor:
                      "statements cannot have breakpoints.")
             self._view.show_message(msg, info)
 
+    def edit_breakpoint(self, line, tab):
+        """
+        Ask the user for the condition, hit count and log message of the
+        breakpoint on the referenced line of the tab (adding the breakpoint
+        if there isn't one).
+        """
+        options = tab.breakpoint_options.get(tab.breakpoint_handle(line), {})
+        result = self._view.show_breakpoint_options(
+            options.get('condition'), options.get('hit_count'),
+            options.get('log_message'))
+        if result is None:
+            return
+        condition, hit_count, log_message = result
+        if self.mode == 'debugger':
+            # The debugger is running, so its breakpoint must change too.
+            self.modes['debugger'].set_breakpoint_options(
+                line, tab, condition, hit_count, log_message)
+        elif tab.breakpoint_handle(line) is None:
+            handle = tab.markerAdd(line, tab.BREAKPOINT_MARKER)
+            tab.breakpoint_handles.add(handle)
+        tab.breakpoint_options[tab.breakpoint_handle(line)] = {
+            'condition': condition,
+            'hit_count': hit_count,
+            'log_message': log_message,
+        }
+
     def rename_tab(self, tab_id=None):
         """
         How to handle double-clicking a tab in order to rename the file. If
@@ -1241,7 +1896,7 @@ class Editor:
                     # No extension given, default to .py
                     new_path += '.py'
                 # Check for duplicate path with currently open tab.
-                for other_tab in self._view.widgets:
+                for other_tab in self._view.all_tabs:
                     if other_tab.path == new_path:
                         logger.info('Cannot rename, a file of that name is '
                                     'already open in Mu')
@@ -1,8 +1,138 @@
-from .python3 import PythonMode
-from .adafruit import AdafruitMode
-from .microbit import MicrobitMode
-from .debugger import DebugMode
-from .pygamezero import PyGameZeroMode
-
-__all__ = ['PythonMode', 'AdafruitMode', 'MicrobitMode', 'DebugMode',
-           'PyGameZeroMode', ]
+"""
+Contains the registry of the modes into which Mu can be put.
+
+Each mode is declared by a lightweight descriptor holding the details shown
+by the mode selector. A mode's module is only imported, and its class only
+instantiated, when the mode is first used.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import importlib
+import importlib.util
+import logging
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+logger = logging.getLogger(__name__)
+
+
+class ModeDescriptor:
+    """
+    Describes a mode without importing the module which defines it.
+
+    The name, description, icon and file extensions must match those of the
+    mode's class.
+    """
+
+    def __init__(self, key, name, description, icon, class_path,
+                 is_debugger=False, finds_devices=False, requires=None,
+                 file_extensions=None):
+        self.key = key  #: The name by which the editor refers to the mode.
+        self.name = name
+        self.description = description
+        self.icon = icon
+        self.class_path = class_path  #: e.g. "mu.modes.python3.PythonMode".
+        self.is_debugger = is_debugger
+        self.finds_devices = finds_devices  #: Polled for connected devices.
+        self.requires = requires  #: Module needed for the mode to be used.
+        #: Extensions of the (non-Python) files the mode can open.
+        self.file_extensions = file_extensions or []
+
+    @property
+    def available(self):
+        """
+        Whether the module needed by the mode is installed (checked without
+        importing it).
+        """
+        if not self.requires:
+            return True
+        return importlib.util.find_spec(self.requires) is not None
+
+    def load(self):
+        """
+        Return the class which defines the mode, importing its module.
+        """
+        module_name, class_name = self.class_path.rsplit('.', 1)
+        return getattr(importlib.import_module(module_name), class_name)
+
+
+MODES = [
+    ModeDescriptor('python', _('Python 3'),
+                   _('Create code using standard Python 3.'), 'python',
+                   'mu.modes.python3.PythonMode'),
+    ModeDescriptor('adafruit', _('Adafruit CircuitPython'),
+                   _("Use CircuitPython on Adafruit's line of boards."),
+                   'adafruit', 'mu.modes.adafruit.AdafruitMode',
+                   finds_devices=True),
+    ModeDescriptor('microbit', _('BBC micro:bit'),
+                   _("Write MicroPython for the BBC micro:bit."), 'microbit',
+                   'mu.modes.microbit.MicrobitMode', finds_devices=True,
+                   file_extensions=['hex']),
+    ModeDescriptor('debugger', _('Graphical Debugger'),
+                   _('Debug your Python 3 code.'), 'python',
+                   'mu.modes.debugger.DebugMode', is_debugger=True),
+    ModeDescriptor('pygamezero', _('Pygame Zero'),
+                   _('Make games with Pygame Zero.'), 'pygamezero',
+                   'mu.modes.pygamezero.PyGameZeroMode', requires='pgzero'),
+]
+
+
+class ModeRegistry(Mapping):
+    """
+    A mapping of the names of the available modes to their instances. Each
+    mode is instantiated when it is first looked up.
+    """
+
+    def __init__(self, editor, view, descriptors):
+        self.editor = editor
+        self.view = view
+        self.descriptors = OrderedDict((d.key, d) for d in descriptors)
+        self.instances = {}  #: The modes instantiated so far, by name.
+
+    def __getitem__(self, key):
+        if key not in self.instances:
+            mode_class = self.descriptors[key].load()
+            logger.debug('Instantiating {} mode.'.format(key))
+            self.instances[key] = mode_class(self.editor, self.view)
+        return self.instances[key]
+
+    def __contains__(self, key):
+        return key in self.descriptors
+
+    def __iter__(self):
+        return iter(self.descriptors)
+
+    def __len__(self):
+        return len(self.descriptors)
+
+    def device_modes(self):
+        """
+        Return a list of the names and instances of the modes which detect
+        connected devices.
+        """
+        return [(key, self[key]) for key, descriptor in
+                self.descriptors.items() if descriptor.finds_devices]
+
+
+def available_modes():
+    """
+    Return the descriptors of the modes whose requirements are installed.
+    """
+    return [descriptor for descriptor in MODES if descriptor.available]
+
+
+__all__ = ['ModeDescriptor', 'ModeRegistry', 'MODES', 'available_modes', ]
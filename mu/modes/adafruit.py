@@ -20,7 +20,7 @@ import os
 import ctypes
 from subprocess import check_output
 from mu.modes.base import MicroPythonMode
-from mu.modes.api import ADAFRUIT_APIS, SHARED_APIS
+from mu.modes.api import load_apis
 from mu.interface.panes import CHARTS
 
 
@@ -164,4 +164,4 @@ class AdafruitMode(MicroPythonMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + ADAFRUIT_APIS
+        return load_apis('shared', 'adafruit')
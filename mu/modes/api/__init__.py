@@ -1,9 +1,51 @@
-from .adafruit import ADAFRUIT_APIS
-from .microbit import MICROBIT_APIS
-from .python3 import PYTHON3_APIS
-from .pi import PI_APIS
-from .shared import SHARED_APIS
-from .pygamezero import PYGAMEZERO_APIS
-
-__all__ = ['ADAFRUIT_APIS', 'MICROBIT_APIS', 'PYTHON3_APIS', 'PI_APIS',
-           'SHARED_APIS', 'PYGAMEZERO_APIS', ]
+"""
+Contains the definitions of the APIs used by the editor for autocomplete and
+call tips. Each API is stored (untranslated) in a JSON file in this package,
+generated by utils/mkapi.py, and only loaded when a mode first needs it. The
+entries are translated when a call tip is shown (see mu.interface.editor).
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import json
+from mu.resources import resource_string
+
+
+# The APIs loaded so far, by name.
+_loaded = {}
+
+
+def load_api(name):
+    """
+    Return the list of (untranslated) API definitions with the referenced
+    name (e.g. "python3"), loading them on first use.
+    """
+    if name not in _loaded:
+        _loaded[name] = json.loads(
+            resource_string(__name__, name + '.json').decode('utf-8'))
+    return _loaded[name]
+
+
+def load_apis(*names):
+    """
+    Return the list of API definitions of all the referenced APIs.
+    """
+    result = []
+    for name in names:
+        result.extend(load_api(name))
+    return result
+
+
+__all__ = ['load_api', 'load_apis', ]
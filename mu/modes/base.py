@@ -23,9 +23,9 @@ import csv
 import time
 import logging
 import pkgutil
-from PyQt5.QtSerialPort import QSerialPortInfo
 from PyQt5.QtCore import QObject
-from mu.logic import HOME_DIRECTORY, WORKSPACE_NAME, get_settings_path
+from mu.logic import (HOME_DIRECTORY, WORKSPACE_NAME, get_settings_path,
+                      read_data_capture)
 
 
 logger = logging.getLogger(__name__)
@@ -44,10 +44,21 @@ BOARD_IDS = set([
 ])
 
 
-# Cache module names for filename shadow checking later.
-MODULE_NAMES = set([name for _, name, _ in pkgutil.iter_modules()])
-MODULE_NAMES.add('sys')
-MODULE_NAMES.add('builtins')
+# Cache of module names for filename shadow checking (see get_module_names).
+_module_names = None
+
+
+def get_module_names():
+    """
+    Return the set of the names of the modules which can be imported. Finding
+    them scans every directory on the path, so is only done when first needed.
+    """
+    global _module_names
+    if _module_names is None:
+        _module_names = set([name for _, name, _ in pkgutil.iter_modules()])
+        _module_names.add('sys')
+        _module_names.add('builtins')
+    return _module_names
 
 
 def get_default_workspace():
@@ -94,13 +105,20 @@ class BaseMode(QObject):
     save_timeout = 5  #: Number of seconds to wait before saving work.
     builtins = None  #: Symbols to assume as builtins when checking code style.
     file_extensions = []
-    module_names = MODULE_NAMES
 
     def __init__(self, editor, view):
         self.editor = editor
         self.view = view
         super().__init__()
 
+    @property
+    def module_names(self):
+        """
+        The names of the modules which mustn't be used as file names for
+        source code.
+        """
+        return get_module_names()
+
     def actions(self):
         """
         Return an ordered list of actions provided by this module. An action
@@ -149,20 +167,44 @@ class BaseMode(QObject):
         called 'data_capture' in the workspace directory. The file contains
         CSV data and is named with a timestamp for easy identification.
         """
-        data_dir = os.path.join(get_default_workspace(), 'data_capture')
-        if not os.path.exists(data_dir):
-            logger.debug('Creating directory: {}'.format(data_dir))
-            os.makedirs(data_dir)
-        # Save the raw data as CSV
-        filename = "{}.csv".format(time.strftime("%Y%m%d-%H%M%S"))
-        f = os.path.join(data_dir, filename)
-        with open(f, 'w') as csvfile:
-            csv_writer = csv.writer(csvfile)
-            csv_writer.writerows(self.view.plotter_pane.raw_data)
+        raw_data = self.view.plotter_pane.raw_data
+        if raw_data:
+            # Nothing new is captured while viewing an existing capture.
+            data_dir = os.path.join(get_default_workspace(), 'data_capture')
+            if not os.path.exists(data_dir):
+                logger.debug('Creating directory: {}'.format(data_dir))
+                os.makedirs(data_dir)
+            # Save the raw data as CSV
+            filename = "{}.csv".format(time.strftime("%Y%m%d-%H%M%S"))
+            f = os.path.join(data_dir, filename)
+            with open(f, 'w') as csvfile:
+                csv_writer = csv.writer(csvfile)
+                csv_writer.writerows(raw_data)
         self.view.remove_plotter()
         self.plotter = None
         logger.info('Removing plotter')
 
+    def open_capture(self, path):
+        """
+        Display the data in the referenced CSV file (previously saved by
+        remove_plotter into the 'data_capture' directory) in the plotter so
+        it can be explored and replayed.
+        """
+        logger.info('Opening data capture: {}'.format(path))
+        try:
+            data = read_data_capture(path)
+        except (OSError, ValueError) as ex:
+            logger.error(ex)
+            message = _('Could not open the data capture.')
+            information = _('Please check the file exists and contains data '
+                            'saved by the plotter.')
+            self.view.show_message(message, information)
+            return
+        if self.plotter:
+            self.remove_plotter()
+        self.view.add_data_capture_plotter(path, data)
+        self.plotter = True
+
     def on_data_flood(self):
         """
         Handle when the plotter is being flooded by data (which usually causes
@@ -205,6 +247,8 @@ class MicroPythonMode(BaseMode):
         found connected to the host computer. If no device is found, returns
         the tuple (None, None).
         """
+        # Only needed once devices are looked for.
+        from PyQt5.QtSerialPort import QSerialPortInfo
         available_ports = QSerialPortInfo.availablePorts()
         for port in available_ports:
             pid = port.productIdentifier()
@@ -18,15 +18,25 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import logging
 import os.path
+from collections import deque
 from mu.modes.base import BaseMode
 from mu.logic import DEBUGGER_PORT, write_and_flush
 from mu.debugger.client import Debugger
 from mu.debugger.utils import is_breakpoint_line
+from PyQt5.QtCore import QProcess, QTimer
 
 
 logger = logging.getLogger(__name__)
 
 
+#: The number of recent steps whose latency is kept (see debug_on_timings).
+LATENCY_HISTORY = 100
+
+#: Milliseconds to wait for the debug runner to say on which port it's
+#: listening. The Raspberry Pi is quite slow, so it needs time to start up.
+HANDSHAKE_TIMEOUT = 10000
+
+
 class DebugMode(BaseMode):
     """
     Represents the functionality required by the Python 3 visual debugger.
@@ -36,9 +46,19 @@ class DebugMode(BaseMode):
     description = _('Debug your Python 3 code.')
     icon = 'python'
     runner = None
+    debugger = None
+    handshake_timer = None  # Running until the debug runner gives its port.
     is_debugger = True
     save_timeout = 0  # No need to auto-save when in read-only debug mode.
 
+    def __init__(self, editor, view):
+        super().__init__(editor, view)
+        # The expressions to evaluate whenever the debugger stops, kept for
+        # the next debug session too.
+        self.watch_expressions = []
+        # The latency of each stage of the recent steps, for the admin dialog.
+        self.latency = deque(maxlen=LATENCY_HISTORY)
+
     def actions(self):
         """
         Return an ordered list of actions provided by this module. An action
@@ -59,6 +79,14 @@ class DebugMode(BaseMode):
                 'handler': self.button_continue,
                 'shortcut': 'F5',
             },
+            {
+                'name': 'pause',
+                'display_name': _('Pause'),
+                'description': _('Pause the running script at the next '
+                                 'line.'),
+                'handler': self.button_pause,
+                'shortcut': 'F6',
+            },
             {
                 'name': 'step-over',
                 'display_name': _('Step Over'),
@@ -80,6 +108,13 @@ class DebugMode(BaseMode):
                 'handler': self.button_step_out,
                 'shortcut': 'Shift+F11',
             },
+            {
+                'name': 'step-back',
+                'display_name': _('Step Back'),
+                'description': _('Step back through the recorded history.'),
+                'handler': self.button_step_back,
+                'shortcut': 'Shift+F10',
+            },
         ]
 
     def api(self):
@@ -103,7 +138,9 @@ class DebugMode(BaseMode):
             # Unsaved file.
             self.editor.save()
         if tab.path:
-            # If needed, save the script.
+            # If needed, save the script (superseding any outstanding
+            # autosave, so the script run is the one in the tab).
+            self.editor.saver.cancel(tab.path)
             if tab.isModified():
                 with open(tab.path, 'w', newline='') as f:
                     logger.info('Saving script to: {}'.format(tab.path))
@@ -112,19 +149,27 @@ class DebugMode(BaseMode):
                     tab.setModified(False)
             logger.debug(tab.text())
             self.set_buttons(modes=False)
+            # There's only history to step back through when it's recorded.
+            self.set_buttons(**{'step-back': self.editor.debug_recording})
             envars = self.editor.envars
             self.runner = self.view.add_python3_runner(tab.path,
                                                        self.workspace_dir(),
                                                        debugger=True,
                                                        envars=envars)
-            self.runner.process.waitForStarted()
             self.runner.process.finished.connect(self.finished)
-            self.view.add_debug_inspector()
+            self.runner.process.errorOccurred.connect(self.on_process_error)
+            self.view.add_debug_inspector(self.expand_variable,
+                                          self.add_watch, self.remove_watch)
             self.view.set_read_only(True)
             self.debugger = Debugger('localhost', DEBUGGER_PORT,
                                      proc=self.runner.process)
             self.debugger.view = self
-            self.debugger.start()
+            # Only connect once the debug runner says where it's listening.
+            self.runner.debugger_port.connect(self.on_debugger_port)
+            self.handshake_timer = QTimer(self)
+            self.handshake_timer.setSingleShot(True)
+            self.handshake_timer.timeout.connect(self.on_handshake_timeout)
+            self.handshake_timer.start(HANDSHAKE_TIMEOUT)
         else:
             logger.debug('Current script has not been saved. Aborting debug.')
             self.stop()
@@ -134,9 +179,11 @@ class DebugMode(BaseMode):
         Stop the debug runner and reset the UI.
         """
         logger.debug('Stopping debugger.')
+        if self.handshake_timer:
+            self.handshake_timer.stop()
+            self.handshake_timer = None
         if self.runner:
-            self.runner.process.kill()
-            self.runner.process.waitForFinished()
+            self.runner.stop_process()
             self.runner = None
             self.debugger = None
             self.view.remove_python_runner()
@@ -146,10 +193,63 @@ class DebugMode(BaseMode):
         self.editor.mode = 'python'
         self.view.set_read_only(False)
 
+    def on_debugger_port(self, port):
+        """
+        Connect the debugger to the runner now it is listening on the
+        referenced port.
+        """
+        if self.handshake_timer:
+            self.handshake_timer.stop()
+        if self.debugger:
+            self.debugger.port = port
+            self.debugger.start()
+
+    def on_handshake_timeout(self):
+        """
+        If the debug runner hasn't said on which port it's listening in time,
+        tell the user and return to Python 3 mode.
+        """
+        logger.error('No port from debug runner after {} ms.'.format(
+            HANDSHAKE_TIMEOUT))
+        self.no_handshake(_('The debugger took too long to start. Is your '
+                            'machine slow or busy? Free up some of the '
+                            "machine's resources and try again."))
+
+    def no_handshake(self, information):
+        """
+        Stop the debug runner, which never said on which port it's listening,
+        and tell the user why the debugger couldn't be started.
+        """
+        if self.runner:
+            logger.error('Debug runner output: {}'.format(
+                self.runner.toPlainText()))
+        self.stop()
+        self.view.show_message(_('Could not start the debugger.'),
+                               information)
+
+    def on_process_error(self, error):
+        """
+        If the debug runner failed to start, tell the user and return to
+        Python 3 mode.
+        """
+        if error == QProcess.FailedToStart and self.runner:
+            logger.error('Debug runner failed to start.')
+            self.stop()
+            self.view.show_message(_('Could not start the debugger.'),
+                                   _('Python could not be started. Please '
+                                     'check your computer has enough free '
+                                     'resources and try again.'))
+
     def finished(self):
         """
         Called when the debugged Python process is finished.
         """
+        if self.handshake_timer and self.handshake_timer.isActive():
+            logger.error('Debug runner finished without giving its port.')
+            self.no_handshake(_('The debugger stopped before it could '
+                                'start debugging your script. Please try '
+                                'again.'))
+            return
         buttons = {action['name']: False for action in self.actions()
                    if action['name'] != 'stop'}
         self.set_buttons(**buttons)
@@ -171,6 +271,12 @@ class DebugMode(BaseMode):
         self.view.current_tab.reset_debugger_highlight()
         self.debugger.do_run()
 
+    def button_pause(self, event):
+        """
+        Button clicked to pause the running script.
+        """
+        self.debugger.do_pause()
+
     def button_step_over(self, event):
         """
         Button clicked to step over the current line of code.
@@ -192,6 +298,13 @@ class DebugMode(BaseMode):
         self.view.current_tab.reset_debugger_highlight()
         self.debugger.do_return()
 
+    def button_step_back(self, event):
+        """
+        Button clicked to step back through the recorded history.
+        """
+        self.view.current_tab.reset_debugger_highlight()
+        self.debugger.do_back()
+
     def toggle_breakpoint(self, line, tab):
         """
         Toggle a breakpoint in the debugger.
@@ -210,13 +323,32 @@ class DebugMode(BaseMode):
             else:
                 self.debugger.create_breakpoint(tab.path, line + 1)
 
+    def set_breakpoint_options(self, line, tab, condition, hit_count,
+                               log_message):
+        """
+        Set the condition, hit count and log message of the breakpoint on the
+        referenced line of the tab, creating (or enabling) the breakpoint if
+        needed.
+        """
+        bp = self.debugger.breakpoints(tab.path).get(line + 1, None)
+        if not tab.markersAtLine(line):
+            handle = tab.markerAdd(line, tab.BREAKPOINT_MARKER)
+            tab.breakpoint_handles.add(handle)
+            if bp:
+                self.debugger.enable_breakpoint(bp)
+        if bp:
+            self.debugger.set_breakpoint_options(bp, condition, hit_count,
+                                                 log_message)
+        else:
+            self.debugger.create_breakpoint(tab.path, line + 1,
+                                            condition=condition,
+                                            hit_count=hit_count,
+                                            log_message=log_message)
+
     def debug_on_fail(self, message):
         """
         Called when, for any reason, the debug client was unable to connect to
-        the debug runner. On a Raspberry Pi this is usually because it's an
-        underpowereed machine and it takes time to start the debug runner
-        process. (However, the debug client waits for 10 seconds for the
-        runner to start.)
+        the debug runner after it said on which port it's listening.
         """
         # Report the problem.
         process_runner = self.view.process_runner
@@ -243,11 +375,17 @@ class DebugMode(BaseMode):
                 code = tab.text(line)
                 if line > -1 and line not in break_lines and \
                         is_breakpoint_line(code):
-                    self.debugger.create_breakpoint(tab.path, line + 1)
+                    options = tab.breakpoint_options.get(handle, {})
+                    self.debugger.create_breakpoint(tab.path, line + 1,
+                                                    **options)
                     break_lines.add(line)
                 else:
                     tab.breakpoint_handles.remove(handle)
                     tab.markerDelete(line, -1)
+        if self.editor.debug_recording:
+            self.debugger.record(True)
+        if self.watch_expressions:
+            self.debugger.watch(self.watch_expressions)
         # Start the script running.
         self.debugger.do_run()
 
@@ -279,16 +417,72 @@ class DebugMode(BaseMode):
         tab = self.editor.get_tab(filename)
         tab.debugger_at_line(line - 1)
 
-    def debug_on_stack(self, stack):
+    def debug_on_history(self, filename, line, locals_dict, steps):
+        """
+        Handle when the debugger sends the line (and locals) at the referenced
+        number of steps back in the recorded history.
+        """
+        self.view.current_tab.setSelection(0, 0, 0, 0)
+        tab = self.editor.get_tab(filename)
+        tab.debugger_at_line(line - 1)
+        # Recorded variables aren't in any current stack frame.
+        self.view.update_debug_inspector({k: dict(v, frame=None)
+                                          for k, v in locals_dict.items()})
+        self.editor.show_status_message(
+            _('Looking back {} steps through the history.').format(steps))
+
+    def debug_on_stack(self, stack, watches=None):
         """
-        Handle when the debugger sends an updated stack.
+        Handle when the debugger sends an updated stack (and the values of the
+        watch expressions).
         """
         if stack:
             locals_dict = {}
-            for frame in stack:
+            for index, frame in enumerate(stack):
                 for k, v in frame[1]['locals'].items():
-                    locals_dict[k] = v
-            self.view.update_debug_inspector(locals_dict)
+                    # Remember the frame so the variable can be expanded.
+                    locals_dict[k] = dict(v, frame=index)
+            self.view.update_debug_inspector(locals_dict, watches or [])
+
+    def add_watch(self, expression):
+        """
+        Handle when the user wants to watch the value of an expression.
+        """
+        if expression not in self.watch_expressions:
+            self.watch_expressions.append(expression)
+            if self.debugger:
+                self.debugger.watch(self.watch_expressions)
+
+    def remove_watch(self, expression):
+        """
+        Handle when the user no longer wants to watch an expression.
+        """
+        if expression in self.watch_expressions:
+            self.watch_expressions.remove(expression)
+            if self.debugger:
+                self.debugger.watch(self.watch_expressions)
+
+    def debug_on_timings(self, latency):
+        """
+        Handle when the debugger has worked out how long each stage of the
+        last step took.
+        """
+        self.latency.append(latency)
+
+    def expand_variable(self, frame, path, start, count):
+        """
+        Handle when the user wants to see (count of) the children, from the
+        start position, of the variable at the referenced path in a stack
+        frame.
+        """
+        if self.debugger:
+            self.debugger.expand(frame, path, start, count)
+
+    def debug_on_expansion(self, frame, path, children, more, start):
+        """
+        Handle when the debugger sends the children of a variable.
+        """
+        self.view.expand_debug_inspector(frame, path, children, more, start)
 
     def debug_on_postmortem(self, args, kwargs):
         """
@@ -350,6 +544,13 @@ class DebugMode(BaseMode):
         """
         pass
 
+    def debug_on_breakpoint_options(self, breakpoint):
+        """
+        Handle when the options of a breakpoint have been set.
+        """
+        self.editor.show_status_message(
+            _('Breakpoint options set for line {}.').format(breakpoint.line))
+
     def debug_on_breakpoint_clear(self, breakpoint):
         """
         Handle the clearing of the referenced breakpoint. Currently an
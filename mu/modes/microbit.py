@@ -21,21 +21,17 @@ import os
 import sys
 import os.path
 import logging
-import semver
+import importlib.util
 from tokenize import TokenError
 from mu.logic import HOME_DIRECTORY
-from mu.contrib import uflash, microfs
-from mu.modes.api import MICROBIT_APIS, SHARED_APIS
+from mu.contrib import microfs
+from mu.modes.api import load_apis
 from mu.modes.base import MicroPythonMode
 from mu.interface.panes import CHARTS
 from PyQt5.QtCore import QObject, QThread, pyqtSignal, QTimer
 
-# We can run without nudatus
-can_minify = True
-try:
-    import nudatus
-except ImportError:  # pragma: no cover
-    can_minify = False
+# We can run without nudatus (only imported when minifying).
+can_minify = importlib.util.find_spec('nudatus') is not None
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +61,7 @@ class DeviceFlasher(QThread):
         """
         Flash the device.
         """
+        from mu.contrib import uflash  # Large, so only imported when needed.
         try:
             uflash.flash(paths_to_microbits=self.paths_to_microbits,
                          python_script=self.python_script,
@@ -224,7 +221,7 @@ class MicrobitMode(MicroPythonMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + MICROBIT_APIS
+        return load_apis('shared', 'microbit')
 
     def flash(self):
         """
@@ -249,6 +246,8 @@ class MicrobitMode(MicroPythonMode):
         logger.debug('Python script:')
         logger.debug(python_script)
         # Check minification status.
+        from mu.contrib import uflash  # Large, so only imported when needed.
+        import semver
         minify = False
         if uflash.get_minifier():
             minify = self.editor.minify
@@ -259,6 +258,7 @@ class MicrobitMode(MicroPythonMode):
                 orginal = len(python_script)
                 script = python_script.decode('utf-8')
                 try:
+                    import nudatus
                     mangled = nudatus.mangle(script).encode('utf-8')
                 except TokenError as e:
                     msg, (line, col) = e.args
@@ -654,6 +654,7 @@ class MicrobitMode(MicroPythonMode):
         if path.lower().endswith('.hex'):
             # Try to open the hex and extract the Python script
             try:
+                from mu.contrib import uflash
                 with open(path, newline='') as f:
                     text = uflash.extract_script(f.read())
             except Exception:
@@ -19,9 +19,10 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
 import logging
 from mu.modes.base import BaseMode
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS, PYGAMEZERO_APIS
+from mu.modes.api import load_apis
 from mu.logic import write_and_flush
 from mu.resources import load_icon
+from PyQt5.QtCore import QProcess
 
 
 logger = logging.getLogger(__name__)
@@ -88,7 +89,7 @@ class PyGameZeroMode(BaseMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + PYTHON3_APIS + PI_APIS + PYGAMEZERO_APIS
+        return load_apis('shared', 'python3', 'pi', 'pygamezero')
 
     def play_toggle(self, event):
         """
@@ -124,7 +125,9 @@ class PyGameZeroMode(BaseMode):
             # Unsaved file.
             self.editor.save()
         if tab.path:
-            # If needed, save the script.
+            # If needed, save the script (superseding any outstanding
+            # autosave, so the script run is the one in the tab).
+            self.editor.saver.cancel(tab.path)
             if tab.isModified():
                 with open(tab.path, 'w', newline='') as f:
                     logger.info('Saving script to: {}'.format(tab.path))
@@ -139,7 +142,7 @@ class PyGameZeroMode(BaseMode):
                                                        interactive=False,
                                                        envars=envars,
                                                        python_args=args)
-            self.runner.process.waitForStarted()
+            self.runner.process.errorOccurred.connect(self.on_process_error)
 
     def stop_game(self):
         """
@@ -147,11 +150,23 @@ class PyGameZeroMode(BaseMode):
         """
         logger.debug('Stopping script.')
         if self.runner:
-            self.runner.process.kill()
-            self.runner.process.waitForFinished()
+            self.runner.stop_process()
             self.runner = None
         self.view.remove_python_runner()
 
+    def on_process_error(self, error):
+        """
+        If the game's process failed to start, tell the user and reset the UI
+        so they can try again.
+        """
+        if error == QProcess.FailedToStart and self.runner:
+            logger.error('Pygame Zero process failed to start.')
+            self.play_toggle(None)
+            self.view.show_message(_('Could not play your game.'),
+                                   _('Python could not be started. Please '
+                                     'check your computer has enough free '
+                                     'resources and try again.'))
+
     def show_images(self, event):
         """
         Open the directory containing the image assets used by PyGame Zero.
@@ -19,14 +19,14 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import sys
 import os
 import logging
+import tempfile
+import time
 from mu.modes.base import BaseMode
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS
-from mu.logic import write_and_flush
+from mu.modes.api import load_apis
+from mu.logic import write_and_flush, read_profile
 from mu.resources import load_icon
-from mu.interface.panes import CHARTS
-from qtconsole.manager import QtKernelManager
-from qtconsole.client import QtKernelClient
-from PyQt5.QtCore import QObject, QThread, pyqtSignal
+from mu.interface.panes import CHARTS, InterpreterPool
+from PyQt5.QtCore import QObject, QThread, QProcess, pyqtSignal
 
 
 logger = logging.getLogger(__name__)
@@ -37,7 +37,7 @@ class KernelRunner(QObject):
     Used to control the iPython kernel in a non-blocking manner so the UI
     remains responsive.
     """
-    kernel_started = pyqtSignal(QtKernelManager, QtKernelClient)
+    kernel_started = pyqtSignal(object, object)  # Manager and client.
     kernel_finished = pyqtSignal()
     # Used to build context with user defined envars when running the REPL.
     default_envars = os.environ.copy()
@@ -70,6 +70,8 @@ class KernelRunner(QObject):
                 # paths are in PYTHONPATH of the subprocess so the kernel can
                 # be found.
                 os.environ['PYTHONPATH'] = ':'.join(sys.path)
+        # Jupyter is only imported (on this thread) when the REPL is used.
+        from qtconsole.manager import QtKernelManager
         self.repl_kernel_manager = QtKernelManager()
         self.repl_kernel_manager.start_kernel()
         self.repl_kernel_client = self.repl_kernel_manager.client()
@@ -100,6 +102,9 @@ class PythonMode(BaseMode):
     runner = None
     has_debugger = True
     kernel_runner = None
+    pool = None  # Pre-warmed interpreters to run scripts (see set_warm_pool).
+    run_time = None  # When the user last asked to run a script.
+    profile_path = None  # Where the profiler writes results (see profile).
     stop_kernel = pyqtSignal()
 
     def actions(self):
@@ -122,6 +127,14 @@ class PythonMode(BaseMode):
                 'handler': self.debug,
                 'shortcut': 'F6',
             },
+            {
+                'name': 'profile',
+                'display_name': _('Profile'),
+                'description': _('Find out where your Python script spends '
+                                 'its time.'),
+                'handler': self.profile,
+                'shortcut': 'F7',
+            },
             {
                 'name': 'repl',
                 'display_name': _('REPL'),
@@ -145,11 +158,13 @@ class PythonMode(BaseMode):
         Return a list of API specifications to be used by auto-suggest and call
         tips.
         """
-        return SHARED_APIS + PYTHON3_APIS + PI_APIS
+        return load_apis('shared', 'python3', 'pi')
 
-    def run_toggle(self, event):
+    def run_toggle(self, event, profile=False):
         """
         Handles the toggling of the run button to start/stop a script.
+
+        If profile is True the script is started with the profiler.
         """
         run_slot = self.view.button_bar.slots['run']
         if self.runner:
@@ -157,20 +172,33 @@ class PythonMode(BaseMode):
             run_slot.setIcon(load_icon('run'))
             run_slot.setText(_('Run'))
             run_slot.setToolTip(_('Run your Python script.'))
-            self.set_buttons(debug=True, modes=True)
+            self.set_buttons(debug=True, modes=True, profile=True)
         else:
-            self.run_script()
+            self.run_script(profile)
             if self.runner:
                 # If the script started, toggle the button state. See #338.
                 run_slot.setIcon(load_icon('stop'))
                 run_slot.setText(_('Stop'))
                 run_slot.setToolTip(_('Stop your Python script.'))
-                self.set_buttons(debug=False, modes=False)
+                self.set_buttons(debug=False, modes=False, profile=False)
+
+    def profile(self, event):
+        """
+        Run the current script with the profiler. Once it finishes, the cost
+        of each function is annotated in the code and listed in a table.
+        """
+        if not self.runner:
+            self.run_toggle(event, profile=True)
 
-    def run_script(self):
+    def run_script(self, profile=False):
         """
         Run the current script.
+
+        If profile is True the script is run (not interactively) with
+        cProfile, the results of which are shown when it finishes.
         """
+        # How long the script takes to start is timed from here.
+        self.run_time = time.monotonic()
         # Grab the Python file.
         tab = self.view.current_tab
         if tab is None:
@@ -181,7 +209,9 @@ class PythonMode(BaseMode):
             # Unsaved file.
             self.editor.save()
         if tab.path:
-            # If needed, save the script.
+            # If needed, save the script (superseding any outstanding
+            # autosave, so the script run is the one in the tab).
+            self.editor.saver.cancel(tab.path)
             if tab.isModified():
                 with open(tab.path, 'w', newline='') as f:
                     logger.info('Saving script to: {}'.format(tab.path))
@@ -190,28 +220,142 @@ class PythonMode(BaseMode):
                     tab.setModified(False)
             logger.debug(tab.text())
             envars = self.editor.envars
+            # The results of profiling are shown until the next run.
+            self.view.remove_profiler()
+            if profile:
+                self.profile_script(tab, envars)
+                return
+            working_directory = self.workspace_dir()
+            process = None
+            if self.pool:
+                process = self.pool.take(tab.path, working_directory, envars)
             self.runner = self.view.add_python3_runner(tab.path,
-                                                       self.workspace_dir(),
+                                                       working_directory,
                                                        interactive=True,
-                                                       envars=envars)
-            self.runner.process.waitForStarted()
+                                                       envars=envars,
+                                                       process=process)
+            self.runner.first_output.connect(self.on_first_output)
+            self.runner.process.errorOccurred.connect(self.on_process_error)
             if self.kernel_runner:
                 self.set_buttons(plotter=False)
             elif self.plotter:
                 self.set_buttons(repl=False)
 
+    def profile_script(self, tab, envars):
+        """
+        Run the script in the referenced tab with cProfile, writing the
+        results to a temporary file to be read when the script finishes.
+        """
+        handle, self.profile_path = tempfile.mkstemp(prefix='mu-',
+                                                     suffix='.prof')
+        os.close(handle)
+        args = ['-m', 'cProfile', '-o', self.profile_path]
+        self.profiled_tab = tab
+        self.runner = self.view.add_python3_runner(tab.path,
+                                                   self.workspace_dir(),
+                                                   interactive=False,
+                                                   envars=envars,
+                                                   python_args=args)
+        self.runner.process.errorOccurred.connect(self.on_process_error)
+        self.runner.process.finished.connect(self.on_profile_finished)
+        self.set_buttons(plotter=False, repl=False)
+
+    def on_profile_finished(self, code, status):
+        """
+        Read the results of profiling the script, annotate the hot spots in
+        the code of the script and list them in a table.
+        """
+        try:
+            entries = read_profile(self.profile_path)
+        except Exception as ex:
+            # The script failed before any results were written.
+            logger.error(ex)
+            self.editor.show_status_message(_('No profile results were '
+                                              'recorded.'))
+            return
+        finally:
+            self.remove_profile_results()
+        self.view.add_profiler(entries)
+        self.editor.show_status_message(_('Profiling finished.'))
+        tab = self.profiled_tab
+        if tab not in self.view.widgets:
+            return  # The tab was closed while the script was running.
+        script = os.path.normcase(os.path.abspath(tab.path))
+        feedback = {}
+        for entry in entries:
+            filename = os.path.normcase(os.path.abspath(entry['filename']))
+            if filename == script and entry['function'] != '<module>' and \
+                    entry['percent'] >= 1:
+                message = _('{function}: {percent:.1f}% of the run time '
+                            '({calls} calls, {time:.3f} seconds)').format(
+                    function=entry['function'], percent=entry['percent'],
+                    calls=entry['calls'], time=entry['total_time'])
+                line = entry['line']
+                feedback.setdefault(line, []).append({'line_no': line,
+                                                      'message': message})
+        tab.reset_annotations()
+        tab.annotate_code(feedback, 'profile')
+        tab.show_annotations()
+        tab.has_annotations = bool(feedback)
+
+    def remove_profile_results(self):
+        """
+        Delete the file containing the results of profiling, if there is one.
+        """
+        if self.profile_path:
+            if os.path.exists(self.profile_path):
+                os.remove(self.profile_path)
+            self.profile_path = None
+
     def stop_script(self):
         """
         Stop the currently running script.
         """
         logger.debug('Stopping script.')
         if self.runner:
-            self.runner.process.kill()
-            self.runner.process.waitForFinished()
+            self.runner.stop_process()
             self.runner = None
+        self.remove_profile_results()
         self.view.remove_python_runner()
         self.set_buttons(plotter=True, repl=True)
 
+    def on_process_error(self, error):
+        """
+        If the script's process failed to start, tell the user and reset the
+        UI so they can try again.
+        """
+        if error == QProcess.FailedToStart and self.runner:
+            logger.error('Python process failed to start.')
+            self.run_toggle(None)
+            self.view.show_message(_('Could not run your Python script.'),
+                                   _('Python could not be started. Please '
+                                     'check your computer has enough free '
+                                     'resources and try again.'))
+
+    def on_first_output(self):
+        """
+        Tell the user how long the script took (since they asked for it to be
+        run) to start producing output.
+        """
+        elapsed = time.monotonic() - self.run_time
+        logger.info('First output after {:.3f} seconds.'.format(elapsed))
+        self.editor.show_status_message(_('Script started in {:.2f} '
+                                          'seconds.').format(elapsed))
+
+    def set_warm_pool(self, size):
+        """
+        Keep size (may be zero) pre-warmed interpreters ready to run scripts.
+        """
+        if self.pool:
+            self.pool.shutdown()
+            self.pool = None
+        if size:
+            logger.info('Warming {} interpreter(s).'.format(size))
+            self.pool = InterpreterPool(
+                size, working_directory=self.workspace_dir(),
+                envars=self.editor.envars)
+            self.pool.fill()
+
     def debug(self, event):
         """
         Debug the script using the debug mode.
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+A pre-warmed Python interpreter for running scripts from Mu.
+
+The modules named as arguments are imported (quietly) and the process then
+waits for Mu to send a single line of JSON describing the script to run: its
+path, working directory, command line arguments and environment variables.
+The script is run as __main__, as "python -i script" would run it, since this
+bootstrap is itself started with the -i flag.
+
+The difference is that the warm modules (and those they use) are imported
+before the script's directory is on the path. Mu starts the process in the
+script's working directory, with its environment variables, and doesn't use
+it for scripts next to a module named like a warm module (see
+InterpreterPool in mu/interface/panes.py).
+
+This file must not import Mu (or anything else expensive) itself.
+"""
+import sys
+
+
+def main():
+    """
+    Warm up, wait for the script to run and then run it.
+
+    Everything needed is referenced locally, since the __main__ namespace
+    (where this function lives) is cleared to become the script's namespace.
+    """
+    import builtins
+    import io
+    import json
+    import os
+    import traceback
+    # The modules are imported without this file's directory (i.e. Mu's) on
+    # the path. The script's directory takes its place.
+    del sys.path[0]
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = io.StringIO()  # Silence noisy imports.
+    for name in sys.argv[1:]:
+        try:
+            __import__(name)
+        except Exception:
+            pass
+    sys.stdout, sys.stderr = stdout, stderr
+    # Read the request unbuffered so anything typed afterwards remains for
+    # the script (or the interactive prompt) to read.
+    line = b''
+    while not line.endswith(b'\n'):
+        data = os.read(0, 1)
+        if not data:
+            sys.exit(0)
+        line += data
+    request = json.loads(line.decode('utf-8'))
+    script = request['script']
+    os.chdir(request['cwd'])
+    os.environ.update(request['envars'])
+    sys.argv = [script] + request['args']
+    sys.path.insert(0, os.path.dirname(script))
+    with open(script, 'rb') as f:
+        code = compile(f.read(), script, 'exec')
+    namespace = sys.modules['__main__'].__dict__
+    namespace.clear()
+    namespace.update({
+        '__name__': '__main__',
+        '__file__': script,
+        '__doc__': None,
+        '__builtins__': builtins,
+    })
+    try:
+        exec(code, namespace)
+    except SystemExit:
+        raise
+    except BaseException:
+        # Report the error as if the script had been run directly (i.e.
+        # without this frame in the traceback).
+        etype, value, tb = sys.exc_info()
+        sys.last_type, sys.last_value, sys.last_traceback = etype, value, tb
+        traceback.print_exception(etype, value, tb.tb_next)
+
+
+if __name__ == "__main__":
+    main()
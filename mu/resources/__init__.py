@@ -17,11 +17,32 @@ GNU General Public License for more details.
 You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
-from pkg_resources import resource_filename, resource_string
+import os
+import sys
 from PyQt5.QtGui import QPixmap, QIcon
 from PyQt5.QtCore import QDir
 
 
+def resource_filename(package, resource):
+    """
+    Return the filename of the referenced resource (a path separated by "/")
+    in the referenced package. Mu is always installed unzipped, so this
+    replaces pkg_resources' function of the same name, since pkg_resources
+    takes a long time to import.
+    """
+    directory = os.path.dirname(os.path.abspath(sys.modules[package].__file__))
+    return os.path.join(directory, *resource.split('/'))
+
+
+def resource_string(package, resource):
+    """
+    Return the (binary) content of the referenced resource in the referenced
+    package.
+    """
+    with open(resource_filename(package, resource), 'rb') as f:
+        return f.read()
+
+
 # The following lines add the images and css directories to the search path.
 QDir.addSearchPath('images', resource_filename(__name__, 'images'))
 QDir.addSearchPath('css', resource_filename(__name__, 'css'))
@@ -0,0 +1,231 @@
+"""
+Measures how long Mu takes to start, so start-up regressions are visible.
+
+Each phase of start-up is logged as it finishes. Work which isn't needed to
+show Mu's window is deferred until the window is first painted and then done
+a task at a time, when Mu is otherwise idle. If Mu is run with the
+--profile-startup option, how long each module took to import and each phase
+took is also reported (printed and logged) once start-up has finished.
+
+Copyright (c) 2015-2017 Nicholas H.Tollervey and others (see the AUTHORS file).
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+import builtins
+from collections import deque
+import importlib.util
+import logging
+import sys
+import threading
+import time
+
+
+logger = logging.getLogger(__name__)
+
+
+# The command line option used to report how long Mu takes to start.
+PROFILE_OPTION = '--profile-startup'
+# Maximum number of modules listed in the report, slowest first.
+MAX_REPORTED_IMPORTS = 40
+
+
+class ImportTimer:
+    """
+    Times the import of each module, by wrapping the built-in __import__
+    function, while started. Only imports on the thread which started the
+    timer are timed.
+    """
+
+    def __init__(self):
+        # The time taken by each module imported, in seconds, as a tuple of
+        # the total (including the modules it imported) and its own time.
+        self.timings = {}
+        self.stack = []  # [start, time of nested imports] of each import.
+        self.thread = None
+        self.original_import = None
+
+    def start(self):
+        """
+        Start timing imports.
+        """
+        self.thread = threading.get_ident()
+        self.original_import = builtins.__import__
+        builtins.__import__ = self.timed_import
+
+    def stop(self):
+        """
+        Stop timing imports.
+        """
+        if self.original_import:
+            builtins.__import__ = self.original_import
+            self.original_import = None
+
+    def timed_import(self, name, globals=None, locals=None, fromlist=(),
+                     level=0):
+        """
+        Replaces the built-in __import__ function, timing the import of any
+        modules that aren't already imported.
+        """
+        imported = name in sys.modules
+        if (imported and not fromlist and not level) or \
+                threading.get_ident() != self.thread:
+            return self.original_import(name, globals, locals, fromlist,
+                                        level)
+        count = len(sys.modules)
+        self.stack.append([time.perf_counter(), 0.0])
+        try:
+            return self.original_import(name, globals, locals, fromlist,
+                                        level)
+        finally:
+            start, nested = self.stack.pop()
+            elapsed = time.perf_counter() - start
+            if self.stack:
+                self.stack[-1][1] += elapsed
+            if len(sys.modules) > count:
+                # Something was actually imported.
+                key = self.module_name(name, globals, level)
+                if imported:
+                    # Submodules imported from an already imported package.
+                    key += ' ({})'.format(', '.join(fromlist))
+                self.timings.setdefault(key, (elapsed, elapsed - nested))
+
+    def module_name(self, name, globals, level):
+        """
+        Return the absolute name of the referenced (maybe relative) import.
+        """
+        if not level:
+            return name
+        package = (globals or {}).get('__package__') or ''
+        try:
+            return importlib.util.resolve_name('.' * level + name, package)
+        except (ImportError, ValueError):
+            return name
+
+
+class StartupProfile:
+    """
+    Records how long each phase of start-up takes and, when started (see
+    PROFILE_OPTION), how long each module takes to import.
+    """
+
+    def __init__(self):
+        self.started = self.last = time.perf_counter()
+        self.phases = []  # The name and duration (in seconds) of each phase.
+        self.imports = None  # The ImportTimer, when profiling.
+
+    @property
+    def enabled(self):
+        """
+        Whether start-up is being profiled.
+        """
+        return self.imports is not None
+
+    def start(self):
+        """
+        Start profiling start-up.
+        """
+        self.imports = ImportTimer()
+        self.imports.start()
+
+    def mark(self, phase):
+        """
+        Record (and log) the end of the referenced phase of start-up.
+        """
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last))
+        self.last = now
+        logger.info('Start-up phase "{}" finished after {:.0f} ms.'.format(
+                    phase, (now - self.started) * 1000))
+
+    def report(self):
+        """
+        Stop profiling and print (and log) how long each phase of start-up
+        took and the modules which took longest to import.
+        """
+        if not self.enabled:
+            return
+        self.imports.stop()
+        lines = ['Mu start-up profile', '', '{:>9}  {}'.format('ms', 'phase')]
+        for phase, duration in self.phases:
+            lines.append('{:>9.1f}  {}'.format(duration * 1000, phase))
+        total = self.last - self.started
+        lines.append('{:>9.1f}  {}'.format(total * 1000, 'total'))
+        lines += ['', '{:>9}  {:>9}  {}'.format('ms', 'self ms', 'import')]
+        timings = sorted(self.imports.timings.items(), key=lambda i: i[1],
+                         reverse=True)
+        for name, (total, own) in timings[:MAX_REPORTED_IMPORTS]:
+            lines.append('{:>9.1f}  {:>9.1f}  {}'.format(
+                total * 1000, own * 1000, name))
+        report = '\n'.join(lines)
+        logger.info(report)
+        print(report)
+
+
+class StartupScheduler:
+    """
+    Defers the work which isn't needed to show Mu's window until the window
+    is ready (first painted). The deferred tasks are then run one at a time,
+    each when the event loop is next idle, so Mu stays responsive while it
+    finishes starting.
+    """
+
+    def __init__(self, profile):
+        self.profile = profile
+        self.tasks = deque()  # The phase and callable of each deferred task.
+        self.ready = False
+
+    def defer(self, phase, task):
+        """
+        Defer the referenced callable until after the window is ready. The end
+        of the task is recorded as the referenced phase of start-up.
+        """
+        self.tasks.append((phase, task))
+
+    def start(self):
+        """
+        Called when the window is ready, to start running the deferred tasks.
+        """
+        if self.ready:
+            return
+        self.ready = True
+        self.profile.mark('first paint')
+        self.run_later()
+
+    def run_later(self):
+        """
+        Run the next deferred task once pending events are handled.
+        """
+        from PyQt5.QtCore import QTimer  # Only needed once Mu is running.
+        QTimer.singleShot(0, self.run_next)
+
+    def run_next(self):
+        """
+        Run the next deferred task or, once they're all done, report the
+        profile of start-up. A task which fails is logged, and doesn't stop
+        the tasks after it from being run.
+        """
+        if not self.tasks:
+            self.profile.report()
+            return
+        phase, task = self.tasks.popleft()
+        try:
+            task()
+        except Exception:
+            logger.exception('Start-up task "{}" failed.'.format(phase))
+        self.profile.mark(phase)
+        self.run_later()
+
+
+# The profile of the current start-up of Mu.
+profile = StartupProfile()
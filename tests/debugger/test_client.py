@@ -7,6 +7,7 @@ import pytest
 import json
 import os.path
 import mu.debugger.client
+from mu.debugger.utils import encode_message
 from unittest import mock
 from PyQt5.QtCore import pyqtBoundSignal
 
@@ -22,6 +23,9 @@ def test_Breakpoint_init():
     assert bp.enabled is True
     assert bp.temporary is False
     assert bp.funcname is None
+    assert bp.condition is None
+    assert bp.hit_count is None
+    assert bp.log_message is None
 
 
 def test_Breakpoint_str():
@@ -46,8 +50,8 @@ def test_CommandBufferHandler_init():
 
 def test_CommandBufferHandler_worker_with_connection_refused_error():
     """
-    Check that the connection will try up to 10 times before emitting an
-    on_fail signal.
+    Check that the connection is only tried once (the runner is already
+    listening when it gives its port) before emitting an on_fail signal.
     """
     mock_debugger = mock.MagicMock()
     mock_debugger.host = 'localhost'
@@ -56,18 +60,13 @@ def test_CommandBufferHandler_worker_with_connection_refused_error():
     mock_socket = mock.MagicMock()
     mock_socket.connect.side_effect = ConnectionRefusedError()
     mock_socket_factory.socket.return_value = mock_socket
-    mock_time = mock.MagicMock()
-    mock_debugger = mock.MagicMock()
     cbh = mu.debugger.client.CommandBufferHandler(mock_debugger)
     cbh.on_fail = mock.MagicMock()
-    with mock.patch('mu.debugger.client.socket', mock_socket_factory), \
-            mock.patch('mu.debugger.client.time', mock_time):
+    with mock.patch('mu.debugger.client.socket', mock_socket_factory):
         cbh.worker()
-    msg = ('Connection timed out. Is your machine slow or busy? Free up some '
-           "of the machine's resources and try again.")
+    msg = 'The debug runner refused the connection. Please try again.'
     cbh.on_fail.emit.assert_called_once_with(msg)
-    assert mock_socket.connect.call_count == 50
-    assert mock_time.sleep.call_count == 49
+    mock_socket.connect.assert_called_once_with(('localhost', 9999))
 
 
 def test_CommandBufferHandler_worker_with_address_error():
@@ -107,7 +106,7 @@ def test_CommandBufferHandler_worker_break_loop():
     cbh = mu.debugger.client.CommandBufferHandler(mock_debugger)
     with mock.patch('mu.debugger.client.socket', mock_socket_factory):
         cbh.worker()
-    mock_socket.recv.assert_called_once_with(1024)
+    mock_socket.recv.assert_called_once_with(mu.debugger.client.RECV_SIZE)
 
 
 def test_CommandBufferHandler_worker_exception_breaks_loop():
@@ -125,7 +124,7 @@ def test_CommandBufferHandler_worker_exception_breaks_loop():
     cbh = mu.debugger.client.CommandBufferHandler(mock_debugger)
     with mock.patch('mu.debugger.client.socket', mock_socket_factory):
         cbh.worker()
-    mock_socket.recv.assert_called_once_with(1024)
+    mock_socket.recv.assert_called_once_with(mu.debugger.client.RECV_SIZE)
     assert cbh.stopped
 
 
@@ -135,14 +134,12 @@ def test_command_buffer_message():
     message results in the expected command, associated arguments and the
     remainder is correctly populated.
     """
-    msg = json.dumps(["bootstrap", {'arg': 'value'}]).encode('utf-8')
-    msg += mu.debugger.client.Debugger.ETX
+    msg = encode_message('bootstrap', {'arg': 'value'})
     # Splitting the message in two ensures remainder handling is exercised.
     pos = len(msg) // 2
     msg1 = msg[:pos]
     msg2 = msg[pos:]
     mock_debugger = mock.MagicMock()
-    mock_debugger.ETX = mu.debugger.client.Debugger.ETX
     mock_debugger.host = 'localhost'
     mock_debugger.port = 9999
     mock_socket_factory = mock.MagicMock()
@@ -151,12 +148,13 @@ def test_command_buffer_message():
     mock_socket.recv.side_effect = [msg1, msg2, None]
     cbh = mu.debugger.client.CommandBufferHandler(mock_debugger)
     cbh.on_command = mock.MagicMock()
-    with mock.patch('mu.debugger.client.socket', mock_socket_factory):
+    with mock.patch('mu.debugger.client.socket', mock_socket_factory), \
+            mock.patch('mu.debugger.client.time.time', return_value=1.5):
         cbh.worker()
     assert mock_debugger.socket.recv.call_count == 3
-    expected = msg.replace(mu.debugger.client.Debugger.ETX,
-                           b'').decode('utf-8')
-    cbh.on_command.emit.assert_called_once_with(expected)
+    expected = json.dumps(['bootstrap', {'arg': 'value'}],
+                          separators=(',', ':'))
+    cbh.on_command.emit.assert_called_once_with(expected, 1.5)
 
 
 def test_Debugger_init():
@@ -208,6 +206,65 @@ def test_Debugger_on_command():
     db.on_bootstrap.assert_called_once_with(arg='value')
 
 
+def test_Debugger_on_command_step_timings():
+    """
+    Ensure when the messages showing where the program stopped, and its
+    stack, were received and how long they took to handle are kept.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.on_line = mock.MagicMock()
+    db.on_stack = mock.MagicMock()
+    db.on_bootstrap = mock.MagicMock()
+    db.on_command(json.dumps(['line', {'filename': 'a.py', 'line': 1}]), 1.0)
+    db.on_command(json.dumps(['stack', {'stack': []}]), 2.0)
+    db.on_command(json.dumps(['bootstrap', {}]), 3.0)
+    db.on_command(json.dumps(['line', {'filename': 'a.py', 'line': 1}]))
+    assert set(db.step_timings) == {'line', 'stack'}
+    timings = db.step_timings['stack']
+    assert timings['received'] == 2.0
+    assert timings['started'] <= timings['finished']
+    assert timings['decode'] >= 0
+    assert timings['handle'] >= 0
+    assert db.step_timings['line']['received'] == 1.0
+
+
+def test_Debugger_on_timings():
+    """
+    Ensure the latency of each stage of a step is worked out from the times
+    sent by the runner and measured by the client, and given to the view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.step_timings = {
+        'line': {'received': 10.0, 'started': 10.01, 'decode': 0.001,
+                 'handle': 0.02, 'finished': 10.03},
+        'stack': {'received': 10.05, 'started': 10.06, 'decode': 0.002,
+                  'handle': 0.03, 'finished': 10.1},
+    }
+    db.on_timings(stopped=9.9, stack=0.1, encode=0.004, send=0.005,
+                  sent=10.04)
+    latency = db.view.debug_on_timings.call_args[0][0]
+    assert list(latency) == mu.debugger.utils.LATENCY_STAGES
+    expected = {'stack': 0.1, 'encode': 0.004, 'send': 0.005,
+                'transfer': 0.01, 'queue': 0.01, 'decode': 0.002,
+                'editor': 0.02, 'inspector': 0.03, 'total': 0.2}
+    for stage, value in expected.items():
+        assert latency[stage] == pytest.approx(value)
+    assert db.step_timings == {}
+
+
+def test_Debugger_on_timings_no_stack():
+    """
+    Without the times for the stack (e.g. it was sent before the client
+    connected) there's nothing to tell the view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.on_timings(stopped=9.9, stack=0.1, encode=0.004, send=0.005,
+                  sent=10.04)
+    assert db.view.debug_on_timings.call_count == 0
+
+
 def test_Debugger_on_fail():
     """
     If a failure is emitted ensure it's logged.
@@ -246,7 +303,8 @@ def test_Debugger_output():
     db = mu.debugger.client.Debugger('localhost', 1908)
     db.socket = mock.MagicMock()
     db.output('test', foo='bar')
-    db.socket.sendall.assert_called_once_with(b'["test", {"foo": "bar"}]\x03')
+    db.socket.sendall.assert_called_once_with(
+        encode_message('test', {'foo': 'bar'}))
 
 
 def test_Debugger_output_client_error():
@@ -346,7 +404,35 @@ def test_Debugger_create_breakpoint():
     db.output = mock.MagicMock()
     db.create_breakpoint('file.py', 123)
     db.output.assert_called_once_with('break', filename='file.py', line=123,
-                                      temporary=False)
+                                      temporary=False, condition=None,
+                                      hit_count=None, log_message=None)
+
+
+def test_Debugger_create_breakpoint_with_options():
+    """
+    Ensure the condition, hit count and log message of a new breakpoint are
+    passed to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.create_breakpoint('file.py', 123, condition='x > 1', hit_count=5,
+                         log_message='x is {x}')
+    db.output.assert_called_once_with('break', filename='file.py', line=123,
+                                      temporary=False, condition='x > 1',
+                                      hit_count=5, log_message='x is {x}')
+
+
+def test_Debugger_set_breakpoint_options():
+    """
+    Ensure setting the options of a breakpoint results in the expected output
+    call to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    bp = mu.debugger.client.Breakpoint(2, 'file.py', 123)
+    db.set_breakpoint_options(bp, 'x > 1', None, 'x is {x}')
+    db.output.assert_called_once_with('options', bpnum=2, condition='x > 1',
+                                      hit_count=None, log_message='x is {x}')
 
 
 def test_Debugger_enable_breakpoint():
@@ -412,6 +498,27 @@ def test_Debugger_do_run():
     db.output.assert_called_once_with('continue')
 
 
+def test_Debugger_watch():
+    """
+    Ensure the watch expressions are sent to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.watch(['x + 1', 'y'])
+    db.output.assert_called_once_with('watch', expressions=['x + 1', 'y'])
+
+
+def test_Debugger_do_pause():
+    """
+    Ensure instructing the client to pause the running script results in the
+    expected output call to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.do_pause()
+    db.output.assert_called_once_with('pause')
+
+
 def test_Debugger_do_step():
     """
     Ensure instructing the client to step through one stack frame results in
@@ -445,6 +552,28 @@ def test_Debugger_do_return():
     db.output.assert_called_once_with('return')
 
 
+def test_Debugger_do_back():
+    """
+    Ensure instructing the client to step back results in the expected output
+    call to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.do_back()
+    db.output.assert_called_once_with('back')
+
+
+def test_Debugger_record():
+    """
+    Ensure instructing the client to record history results in the expected
+    output call to the debug runner.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.record(True)
+    db.output.assert_called_once_with('record', enabled=True)
+
+
 def test_Debugger_on_bootstrap():
     """
     Test the debug client responds correctly to a signal from the runner that
@@ -580,6 +709,24 @@ def test_Debugger_on_breakpoint_ignore():
     db.view.debug_on_breakpoint_ignore.assert_called_once_with(bp, 5)
 
 
+def test_Debugger_on_breakpoint_options():
+    """
+    Ensure the options set for a breakpoint are remembered and passed to the
+    view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.on_bootstrap([])
+    db.on_breakpoint_create(bpnum=1, filename='file.py', line=10)
+    db.view.reset_mock()
+    db.on_breakpoint_options(1, 'x > 1', 5, 'x is {x}')
+    bp = db.bp_list[1]
+    assert bp.condition == 'x > 1'
+    assert bp.hit_count == 5
+    assert bp.log_message == 'x is {x}'
+    db.view.debug_on_breakpoint_options.assert_called_once_with(bp)
+
+
 def test_Debugger_on_breakpoint_clear():
     """
     Ensure handling of clearing a breakpoint is passed to the view.
@@ -606,10 +753,67 @@ def test_Debugger_on_stack():
     """
     db = mu.debugger.client.Debugger('localhost', 1908)
     db.view = mock.MagicMock()
-    stack = mock.MagicMock()
+    stack = [(1, {'locals': {}}), ]
     db.on_stack(stack)
     assert db.stack == stack
-    db.view.debug_on_stack.assert_called_once_with(stack)
+    db.view.debug_on_stack.assert_called_once_with(stack, [])
+
+
+def test_Debugger_on_stack_watches():
+    """
+    Ensure the values of the watch expressions sent with the stack are
+    passed on to the view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    stack = [(1, {'locals': {}}), ]
+    watches = [{'name': 'x + 1', 'repr': '2'}]
+    db.on_stack(stack, watches)
+    db.view.debug_on_stack.assert_called_once_with(stack, watches)
+
+
+def test_Debugger_on_stack_unchanged():
+    """
+    Ensure frames the runner marks as unchanged are given the locals from the
+    previous update to the stack.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.on_stack([(1, {'locals': {'a': 'foo'}}), ])
+    stack = [(2, {'unchanged': True}), (5, {'unchanged': True})]
+    db.on_stack(stack)
+    assert db.stack == [(2, {'locals': {'a': 'foo'}}), (5, {'locals': {}})]
+
+
+def test_Debugger_expand():
+    """
+    Ensure asking for the children of a variable sends the expected command.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.output = mock.MagicMock()
+    db.expand(1, ['foo', 2], 100, 50)
+    db.output.assert_called_once_with('expand', frame=1, path=['foo', 2],
+                                      start=100, count=50)
+
+
+def test_Debugger_on_expansion():
+    """
+    Ensure the children of a variable are passed on to the view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.on_expansion(1, ['foo'], [], 3, 0)
+    db.view.debug_on_expansion.assert_called_once_with(1, ['foo'], [], 3, 0)
+
+
+def test_Debugger_on_history():
+    """
+    Ensure a line from the recorded history is passed on to the view.
+    """
+    db = mu.debugger.client.Debugger('localhost', 1908)
+    db.view = mock.MagicMock()
+    db.on_history('foo.py', 10, {}, 3)
+    db.view.debug_on_history.assert_called_once_with('foo.py', 10, {}, 3)
 
 
 def test_Debugger_on_restart():
@@ -2,10 +2,14 @@
 """
 Tests for the debug runner.
 """
-import json
+import bdb
 import pytest
+import signal
+import socket
+import time
 import os.path
 import mu.debugger.runner
+from mu.debugger.utils import encode_message
 from unittest import mock
 
 
@@ -17,7 +21,8 @@ def test_command_buffer_break_loop():
     mock_debugger = mock.MagicMock()
     mock_debugger.client.recv.return_value = None
     mu.debugger.runner.command_buffer(mock_debugger)
-    mock_debugger.client.recv.assert_called_once_with(1024)
+    mock_debugger.client.recv.assert_called_once_with(
+        mu.debugger.runner.RECV_SIZE)
     mock_debugger.commands.put.assert_called_once_with(('close', {}))
 
 
@@ -28,14 +33,12 @@ def test_command_buffer_message():
     remainder is correctly populated.
     """
     raw = ["enable", {'bpnum': '1'}]
-    msg = json.dumps(raw).encode('utf-8')
-    msg += mu.debugger.runner.Debugger.ETX
+    msg = encode_message(*raw)
     # Splitting the message in two ensures remainder handling is exercised.
     pos = len(msg) // 2
     msg1 = msg[:pos]
     msg2 = msg[pos:]
     mock_debugger = mock.MagicMock()
-    mock_debugger.ETX = mu.debugger.runner.Debugger.ETX
     mock_debugger.client.recv.side_effect = [msg1, msg2, None]
     mu.debugger.runner.command_buffer(mock_debugger)
     assert mock_debugger.client.recv.call_count == 3
@@ -44,6 +47,19 @@ def test_command_buffer_message():
     assert mock_debugger.commands.put.call_args_list[1][0][0] == ('close', {})
 
 
+def test_command_buffer_pause():
+    """
+    The pause command is dealt with straight away, rather than queued, since
+    nothing reads the queue while the program is running.
+    """
+    mock_debugger = mock.MagicMock()
+    mock_debugger.client.recv.side_effect = [encode_message('pause', {}),
+                                             None]
+    mu.debugger.runner.command_buffer(mock_debugger)
+    mock_debugger.do_pause.assert_called_once_with()
+    mock_debugger.commands.put.assert_called_once_with(('close', {}))
+
+
 def test_Debugger_init():
     """
     Ensure the runner's Debugger class initialises as expected.
@@ -72,7 +88,10 @@ def test_Debugger_output():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.client = mock.MagicMock()
     db.output('test', foo='bar')
-    db.client.sendall.assert_called_once_with(b'["test", {"foo": "bar"}]\x03')
+    db.client.sendall.assert_called_once_with(
+        encode_message('test', {'foo': 'bar'}))
+    encode, send = db.output_times
+    assert encode >= 0 and send >= 0
 
 
 def test_Debugger_output_client_error():
@@ -107,6 +126,30 @@ def test_Debugger_output_no_client_connection():
         mock_logger.call_args_list[1][0] == AttributeError('bang!')
 
 
+def test_interrupt_main():
+    """
+    Where possible, SIGINT is sent to the main thread.
+    """
+    with mock.patch('mu.debugger.runner.signal') as mock_signal, \
+            mock.patch('mu.debugger.runner._thread') as mock_thread:
+        mu.debugger.runner.interrupt_main()
+    mock_signal.pthread_kill.assert_called_once_with(
+        mu.debugger.runner.main_thread().ident, mock_signal.SIGINT)
+    assert mock_thread.interrupt_main.call_count == 0
+
+
+def test_interrupt_main_no_pthread_kill():
+    """
+    Otherwise (e.g. on Windows), the main thread is told to act as if SIGINT
+    was received.
+    """
+    mock_signal = mock.MagicMock(spec=['SIGINT'])
+    with mock.patch('mu.debugger.runner.signal', mock_signal), \
+            mock.patch('mu.debugger.runner._thread') as mock_thread:
+        mu.debugger.runner.interrupt_main()
+    mock_thread.interrupt_main.assert_called_once_with()
+
+
 def test_Debugger_output_stack_normal():
     """
     Ensure that outputting the stack uses the correct frame in a normal
@@ -120,14 +163,8 @@ def test_Debugger_output_stack_normal():
     frame1.f_code.co_filename = '<string>'
     frame2 = mock.MagicMock()
     frame2.f_code.co_filename = 'filename.py'
+    frame2.f_code.co_name = 'func'
     frame2.f_locals = {'locals': 'foo'}
-    frame2.f_globals = {'globals': 'bar'}
-    frame2.f_builtins = {'builtins': 'baz'}
-    frame2.f_restricted = 'f_restricted'
-    frame2.f_lasti = 'f_lasti'
-    frame2.f_exc_type = 'f_exc_type'
-    frame2.f_exc_value = 'f_exc_value'
-    frame2.f_exc_traceback = 'f_exc_traceback'
     db.stack = [
         (None, 1),
         (frame1, 2),
@@ -139,18 +176,21 @@ def test_Debugger_output_stack_normal():
         3,
         {
             'filename': 'filename.py',
-            'locals': {'locals': "'foo'"},
-            'globals': {'globals': "'bar'"},
-            'builtins': {'builtins': "'baz'"},
-            'restricted': 'f_restricted',
-            'lasti': "'f_lasti'",
-            'exc_type': "'f_exc_type'",
-            'exc_value': "'f_exc_value'",
-            'exc_traceback': "'f_exc_traceback'",
+            'function': 'func',
             'current': False,
+            'locals': {
+                'locals': {
+                    'name': 'locals',
+                    'type': 'str',
+                    'repr': "'foo'",
+                    'length': None,
+                    'expandable': False,
+                },
+            },
         }
     )]
-    db.output.assert_called_once_with('stack', stack=expected_stack)
+    db.output.assert_called_once_with('stack', stack=expected_stack,
+                                      watches=[])
 
 
 def test_Debugger_output_stack_exception():
@@ -168,14 +208,8 @@ def test_Debugger_output_stack_exception():
     frame3.f_code.co_filename = '<string>'
     frame4 = mock.MagicMock()
     frame4.f_code.co_filename = 'filename.py'
+    frame4.f_code.co_name = 'func'
     frame4.f_locals = {'locals': 'foo'}
-    frame4.f_globals = {'globals': 'bar'}
-    frame4.f_builtins = {'builtins': 'baz'}
-    frame4.f_restricted = 'f_restricted'
-    frame4.f_lasti = 'f_lasti'
-    frame4.f_exc_type = 'f_exc_type'
-    frame4.f_exc_value = 'f_exc_value'
-    frame4.f_exc_traceback = 'f_exc_traceback'
     db.stack = [
         (None, 1),
         (frame1, 2),
@@ -189,18 +223,415 @@ def test_Debugger_output_stack_exception():
         5,
         {
             'filename': 'filename.py',
-            'locals': {'locals': "'foo'"},
-            'globals': {'globals': "'bar'"},
-            'builtins': {'builtins': "'baz'"},
-            'restricted': 'f_restricted',
-            'lasti': "'f_lasti'",
-            'exc_type': "'f_exc_type'",
-            'exc_value': "'f_exc_value'",
-            'exc_traceback': "'f_exc_traceback'",
+            'function': 'func',
             'current': False,
+            'locals': {
+                'locals': {
+                    'name': 'locals',
+                    'type': 'str',
+                    'repr': "'foo'",
+                    'length': None,
+                    'expandable': False,
+                },
+            },
         }
     )]
-    db.output.assert_called_once_with('stack', stack=expected_stack)
+    db.output.assert_called_once_with('stack', stack=expected_stack,
+                                      watches=[])
+
+
+def test_Debugger_output_stack_unchanged():
+    """
+    Frames whose locals are the same as when the stack was last sent are
+    marked as unchanged rather than sent again, and the frames are remembered
+    so the client can ask to inspect them.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    frame1 = mock.MagicMock()
+    frame1.f_code.co_filename = '<string>'
+    frame2 = mock.MagicMock()
+    frame2.f_code.co_filename = 'filename.py'
+    frame2.f_code.co_name = '<module>'
+    frame2.f_locals = {'a': 1}
+    frame3 = mock.MagicMock()
+    frame3.f_code.co_filename = 'filename.py'
+    frame3.f_code.co_name = 'func'
+    frame3.f_locals = {'b': 2}
+    db.stack = [(None, 1), (frame1, 2), (frame2, 3), (frame3, 4)]
+    db.curframe = frame3
+    db.output_stack()
+    frame3.f_locals['b'] = 3
+    db.output_stack()
+    stack = db.output.call_args[1]['stack']
+    assert stack[0][1]['unchanged'] is True
+    assert 'locals' not in stack[0][1]
+    assert stack[1][1]['locals']['b']['repr'] == '3'
+    assert stack[1][1]['current'] is True
+    assert db.inspected_frames == [frame2, frame3]
+
+
+def test_describe():
+    """
+    Ensure values are summarised with a truncated repr, their length (if a
+    container) and whether they have children to inspect.
+    """
+    summary = mu.debugger.runner.describe('x', list(range(100000)))
+    assert summary['name'] == 'x'
+    assert summary['type'] == 'list'
+    assert summary['length'] == 100000
+    assert summary['expandable'] is True
+    assert len(summary['repr']) < mu.debugger.runner.MAX_REPR_LENGTH
+    summary = mu.debugger.runner.describe('y', 'a' * 1000)
+    assert summary['length'] is None
+    assert summary['expandable'] is False
+    assert len(summary['repr']) <= mu.debugger.runner.MAX_REPR_LENGTH
+    assert mu.debugger.runner.describe('z', {})['expandable'] is False
+
+    class Foo:
+        def __init__(self):
+            self.bar = 1
+
+        def __repr__(self):
+            raise ValueError('BOOM!')
+
+    summary = mu.debugger.runner.describe('foo', Foo())
+    assert summary['type'] == 'Foo'
+    assert 'Foo' in summary['repr']  # Despite the error.
+    assert summary['expandable'] is True
+
+
+def test_get_children():
+    """
+    Ensure the children of containers and objects are labelled as expected.
+    """
+    get_children = mu.debugger.runner.get_children
+    assert list(get_children(['a', 'b'])) == [('0', 'a'), ('1', 'b')]
+    assert list(get_children({'a': 1})) == [("'a'", 1)]
+
+    class Foo:
+        def __init__(self):
+            self.b = 2
+            self.a = 1
+
+    assert list(get_children(Foo())) == [('a', 1), ('b', 2)]
+    assert list(get_children(1)) == []
+
+
+def test_Debugger_do_expand():
+    """
+    Ensure the children of the variable at the referenced path in the
+    referenced frame are sent, along with how many more weren't sent.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    frame = mock.MagicMock()
+    frame.f_locals = {'x': [0, list(range(150))]}
+    db.inspected_frames = [frame, ]
+    db.do_expand(0, ['x', 1])
+    args = db.output.call_args
+    assert args[0] == ('expansion', )
+    assert args[1]['frame'] == 0
+    assert args[1]['path'] == ['x', 1]
+    children = args[1]['children']
+    assert len(children) == mu.debugger.runner.MAX_CHILDREN
+    assert children[5]['name'] == '5'
+    assert children[5]['repr'] == '5'
+    assert args[1]['more'] == 150 - mu.debugger.runner.MAX_CHILDREN
+    assert args[1]['start'] == 0
+    db.do_expand(0, ['x', 1], start=120, count=10)
+    args = db.output.call_args
+    assert [child['name'] for child in args[1]['children']] == \
+        [str(i) for i in range(120, 130)]
+    assert args[1]['more'] == 20
+    assert args[1]['start'] == 120
+
+
+def test_Debugger_do_expand_watch():
+    """
+    Ensure the children of the value of a watch expression can be sent.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.watch_values = {'x + y': [1, 2]}
+    db.do_expand(mu.debugger.runner.WATCH_FRAME, ['x + y'])
+    args = db.output.call_args
+    assert args[1]['frame'] == mu.debugger.runner.WATCH_FRAME
+    assert [child['repr'] for child in args[1]['children']] == ['1', '2']
+    db.do_expand(mu.debugger.runner.WATCH_FRAME, ['z'])
+    assert db.output.call_args[1]['children'] == []
+
+
+def test_Debugger_do_expand_stale():
+    """
+    If the path no longer refers to anything, no children are sent.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    frame = mock.MagicMock()
+    frame.f_locals = {'x': [0]}
+    db.inspected_frames = [frame, ]
+    db.do_expand(0, ['x', 3])
+    db.output.assert_called_once_with('expansion', frame=0, path=['x', 3],
+                                      children=[], more=0, start=0)
+    db.output.reset_mock()
+    db.do_expand(1, ['x'], start=5)
+    db.output.assert_called_once_with('expansion', frame=1, path=['x'],
+                                      children=[], more=0, start=5)
+
+
+def code_for(source, filename):
+    """
+    Return the code objects of the module and its function "f" compiled from
+    the source.
+    """
+    module = compile(source, filename, 'exec')
+    function = [c for c in module.co_consts if hasattr(c, 'co_code')][0]
+    return module, function
+
+
+def test_Debugger_has_breakpoint():
+    """
+    Ensure only code objects with a breakpoint on one of their own lines (not
+    in code nested within them) are found to have a breakpoint.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    filename = os.path.abspath('foo.py')
+    module, function = code_for('def f():\n    return 1\n\nf()\n',
+                                filename)
+    db.breaks = {db.canonic(filename): [2, ]}
+    assert db.has_breakpoint(function) is True
+    assert db.has_breakpoint(module) is False
+    db.breaks = {}
+    assert db.has_breakpoint(function) is True  # Cached.
+    db.breakpoint_code = {}
+    assert db.has_breakpoint(function) is False
+
+
+def test_Debugger_run_to_breakpoint_trace():
+    """
+    Without sys.monitoring, only frames running code with a breakpoint are
+    traced and the system trace function selects which new frames are
+    traced.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.start_monitoring = mock.MagicMock(return_value=False)
+    db.has_breakpoint = mock.MagicMock(side_effect=[False, True])
+    db.botframe = mock.MagicMock()
+    caller = mock.MagicMock()
+    caller.f_back = db.botframe
+    db.curframe = mock.MagicMock()
+    db.curframe.f_back = caller
+    db.breakpoint_code = {'old': True}
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        db.run_to_breakpoint()
+    assert db.breakpoint_code == {}
+    assert db.curframe.f_trace is None
+    assert caller.f_trace == db.trace_dispatch
+    mock_sys.settrace.assert_called_once_with(db.trace_breakpoints)
+
+
+def test_Debugger_run_to_breakpoint_monitoring():
+    """
+    With sys.monitoring, tracing is switched off, the frames running code
+    with breakpoints are monitored and the start of all other code is
+    watched.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.start_monitoring = mock.MagicMock(return_value=True)
+    db.has_breakpoint = mock.MagicMock(return_value=True)
+    db.monitor_code = mock.MagicMock()
+    db.botframe = mock.MagicMock()
+    db.curframe = mock.MagicMock()
+    db.curframe.f_back = db.botframe
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        db.run_to_breakpoint()
+    mock_sys.settrace.assert_called_once_with(None)
+    assert db.curframe.f_trace is None
+    db.monitor_code.assert_called_once_with(db.curframe.f_code)
+    mock_sys.monitoring.set_events.assert_called_once_with(
+        mock_sys.monitoring.DEBUGGER_ID, mock_sys.monitoring.events.PY_START)
+
+
+def test_Debugger_trace_all():
+    """
+    Ensure every frame from the referenced frame is traced once again.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.stop_monitoring = mock.MagicMock()
+    db.botframe = mock.MagicMock()
+    frame = mock.MagicMock()
+    frame.f_back = db.botframe
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        db.trace_all(frame)
+    db.stop_monitoring.assert_called_once_with()
+    assert frame.f_trace == db.trace_dispatch
+    mock_sys.settrace.assert_called_once_with(db.trace_dispatch)
+
+
+def test_Debugger_trace_breakpoints():
+    """
+    Ensure only new frames running code with breakpoints are traced.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.trace_dispatch = mock.MagicMock(return_value='trace')
+    db.has_breakpoint = mock.MagicMock(side_effect=[False, True])
+    frame = mock.MagicMock()
+    assert db.trace_breakpoints(frame, 'call', None) is None
+    assert db.trace_breakpoints(frame, 'call', None) == 'trace'
+    db.trace_dispatch.assert_called_once_with(frame, 'call', None)
+
+
+def test_Debugger_start_monitoring_unavailable():
+    """
+    Without sys.monitoring (Python < 3.12), monitoring can't start.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    with mock.patch('mu.debugger.runner.sys', spec=[]):
+        assert db.start_monitoring() is False
+    assert db.monitoring is False
+
+
+def test_Debugger_start_stop_monitoring():
+    """
+    Ensure the debugger's callbacks are registered with sys.monitoring and
+    everything is undone when monitoring stops.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    code = mock.MagicMock()
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        monitoring = mock_sys.monitoring
+        assert db.start_monitoring() is True
+        monitoring.use_tool_id.assert_called_once_with(
+            monitoring.DEBUGGER_ID, 'mu-debugger')
+        monitoring.register_callback.assert_any_call(
+            monitoring.DEBUGGER_ID, monitoring.events.PY_START,
+            db.monitor_start)
+        monitoring.register_callback.assert_any_call(
+            monitoring.DEBUGGER_ID, monitoring.events.LINE, db.monitor_line)
+        db.monitored_code = {code, }
+        db.stop_monitoring()
+        monitoring.set_events.assert_called_once_with(
+            monitoring.DEBUGGER_ID, 0)
+        monitoring.set_local_events.assert_called_once_with(
+            monitoring.DEBUGGER_ID, code, 0)
+        monitoring.free_tool_id.assert_called_once_with(
+            monitoring.DEBUGGER_ID)
+        monitoring.restart_events.assert_called_once_with()
+        db.stop_monitoring()  # Already stopped, so nothing happens.
+        assert monitoring.free_tool_id.call_count == 1
+    assert db.monitoring is False
+    assert db.monitored_code == set()
+
+
+def test_Debugger_start_monitoring_in_use():
+    """
+    If something else is already using the debugger's tool id, monitoring
+    can't start.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        mock_sys.monitoring.use_tool_id.side_effect = ValueError('in use')
+        assert db.start_monitoring() is False
+    assert db.monitoring is False
+
+
+def test_Debugger_monitor_start():
+    """
+    Ensure the lines of code with breakpoints are monitored, and the start
+    of code is only looked at once.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.has_breakpoint = mock.MagicMock(side_effect=[False, True])
+    db.monitor_code = mock.MagicMock()
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        assert db.monitor_start('code1', 0) == mock_sys.monitoring.DISABLE
+        assert db.monitor_start('code2', 0) == mock_sys.monitoring.DISABLE
+    db.monitor_code.assert_called_once_with('code2')
+
+
+def test_Debugger_monitor_line():
+    """
+    Lines without breakpoints are no longer monitored. Lines with a
+    breakpoint that should break cause the debugger to stop and trace
+    everything again.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.breaks = {db.canonic('foo.py'): [2, ]}
+    code = mock.MagicMock()
+    code.co_filename = 'foo.py'
+    db.break_here = mock.MagicMock(side_effect=[False, True])
+    db.trace_all = mock.MagicMock()
+    db.user_line = mock.MagicMock()
+    with mock.patch('mu.debugger.runner.sys') as mock_sys:
+        assert db.monitor_line(code, 1) == mock_sys.monitoring.DISABLE
+        assert db.monitor_line(code, 2) is None  # Breakpoint disabled.
+        assert db.user_line.call_count == 0
+        db.monitor_line(code, 2)
+        frame = mock_sys._getframe.return_value
+    db.trace_all.assert_called_once_with(frame)
+    db.user_line.assert_called_once_with(frame)
+
+
+def test_Debugger_monitor_line_quit():
+    """
+    If the user quits when stopped at a breakpoint, bdb is told.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.breaks = {db.canonic('foo.py'): [2, ]}
+    code = mock.MagicMock()
+    code.co_filename = 'foo.py'
+    db.break_here = mock.MagicMock(return_value=True)
+    db.trace_all = mock.MagicMock()
+
+    def user_line(frame):
+        db.quitting = True
+
+    db.user_line = user_line
+    with mock.patch('mu.debugger.runner.sys'):
+        with pytest.raises(bdb.BdbQuit):
+            db.monitor_line(code, 2)
+
+
+def test_Debugger_output_stack_timings():
+    """
+    The first time the stack is sent after the program stops it's followed
+    by how long sending it took.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.output_times = (0.25, 0.5)
+    db.stack = []
+    db.stopped_at = 123.0
+    db.output_stack()
+    assert db.output.call_count == 2
+    event, timings = db.output.call_args
+    assert event == ('timings', )
+    assert timings['stopped'] == 123.0
+    assert timings['stack'] >= 0
+    assert timings['encode'] == 0.25
+    assert timings['send'] == 0.5
+    assert timings['sent'] >= 123.0
+    assert db.stopped_at is None
+    db.output_stack()
+    assert db.output.call_count == 3
+    assert db.output.call_args[0][0] == 'stack'
 
 
 def test_Debugger_reset():
@@ -248,6 +679,7 @@ def test_Debugger_interact_good_case():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.setup = mock.MagicMock()
     db.output_stack = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
     db.reset = mock.MagicMock()
     db.commands = mock.MagicMock()
     db.commands.get.return_value = ('quit', {'foo': 'bar'})
@@ -255,6 +687,7 @@ def test_Debugger_interact_good_case():
     db.interact(None, None)
     db.commands.get.assert_called_once_with(block=True)
     db.do_quit.assert_called_once_with(foo='bar')
+    assert db.stopped_at is not None
 
 
 def test_Debugger_interact_unknown_command():
@@ -265,6 +698,7 @@ def test_Debugger_interact_unknown_command():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.setup = mock.MagicMock()
     db.output_stack = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
     db.reset = mock.MagicMock()
     db.commands = mock.MagicMock()
     db.commands.get.side_effect = [('foo', {'bar': 'baz'}),
@@ -284,12 +718,13 @@ def test_Debugger_interact_client_close():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.setup = mock.MagicMock()
     db.output_stack = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
     db.reset = mock.MagicMock()
     db.commands = mock.MagicMock()
     db.commands.get.side_effect = mu.debugger.runner.ClientClose()
     db.do_quit = mock.MagicMock(return_value=True)
     db.socket = mock.MagicMock()
-    mock_client = mock.MagicMock
+    mock_client = mock.MagicMock()
     db.socket.accept.return_value = (mock_client, '127.0.0.1')
     mock_thread_instance = mock.MagicMock()
     mock_thread = mock.MagicMock(return_value=mock_thread_instance)
@@ -302,6 +737,9 @@ def test_Debugger_interact_client_close():
         db.interact(None, None)
     db.output.assert_called_once_with('bootstrap', breakpoints=[])
     assert db.output_stack.call_count == 2
+    assert db.client is mock_client
+    mock_client.setsockopt.assert_called_once_with(
+        socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
 
 def test_Debugger_interact_restart():
@@ -312,6 +750,7 @@ def test_Debugger_interact_restart():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.setup = mock.MagicMock()
     db.output_stack = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
     db.reset = mock.MagicMock()
     db.commands = mock.MagicMock()
     db.commands.get.side_effect = [('next', {}), ]
@@ -329,6 +768,7 @@ def test_Debugger_interact_exception_encountered():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.setup = mock.MagicMock()
     db.output_stack = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
     db.reset = mock.MagicMock()
     db.commands = mock.MagicMock()
     db.commands.get.side_effect = [('next', {}),
@@ -544,7 +984,282 @@ def test_Debugger_do_break():
                                       filename=mock_bp.file,
                                       line=mock_bp.line,
                                       temporary=mock_bp.temporary,
-                                      funcname=mock_bp.funcname)
+                                      funcname=mock_bp.funcname,
+                                      condition=None, hit_count=None,
+                                      log_message=None)
+
+
+def test_Debugger_do_break_with_options():
+    """
+    The condition, hit count and log message of a new breakpoint are set and
+    sent back to the client.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.set_break = mock.MagicMock(return_value=None)
+    mock_bp = mock.MagicMock()
+    mock_bp.number = 123
+    db.get_breaks = mock.MagicMock(return_value=[mock_bp, ])
+    with mock.patch('mu.debugger.runner.is_breakpoint_line',
+                    return_value=True):
+        db.do_break('foo.py', 10, condition='x > 1', hit_count=5,
+                    log_message='x is {x}')
+    assert db.output.call_args[1]['condition'] == 'x > 1'
+    assert db.output.call_args[1]['hit_count'] == 5
+    assert db.output.call_args[1]['log_message'] == 'x is {x}'
+    assert mock_bp.cond == 'x > 1'
+
+
+def test_Debugger_do_break_with_invalid_options():
+    """
+    If the options of a new breakpoint are invalid, the breakpoint is cleared
+    (rather than left to always stop) and the client is told why.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.set_break = mock.MagicMock(return_value=None)
+    db.clear_bpbynumber = mock.MagicMock()
+    mock_bp = mock.MagicMock()
+    mock_bp.number = 123
+    db.get_breaks = mock.MagicMock(return_value=[mock_bp, ])
+    with mock.patch('mu.debugger.runner.is_breakpoint_line',
+                    return_value=True):
+        db.do_break('foo.py', 10, condition='x >')
+    db.clear_bpbynumber.assert_called_once_with(123)
+    assert db.output.call_count == 1
+    assert db.output.call_args[0][0] == 'error'
+    assert 123 not in db.breakpoint_options
+
+
+def test_Debugger_set_breakpoint_options():
+    """
+    The options are remembered and the condition and log message compiled,
+    once, ready for use.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = bdb.Breakpoint('foo.py', 10)
+    try:
+        assert db.set_breakpoint_options(bp, 'x > 1', '5', 'x is {x}') is None
+        assert db.breakpoint_options[bp.number] == {
+            'condition': 'x > 1',
+            'hit_count': 5,
+            'log_message': 'x is {x}',
+        }
+        condition, hit_count, log_message = db.compiled_options[bp.number]
+        assert eval(condition, {}, {'x': 2}) is True
+        assert hit_count == 5
+        assert eval(log_message, {}, {'x': 2}) == 'x is 2'
+        assert bp.cond == 'x > 1'
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_set_breakpoint_options_none():
+    """
+    Empty options are stored as None.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = bdb.Breakpoint('foo.py', 10)
+    try:
+        assert db.set_breakpoint_options(bp, '', 0, '') is None
+        assert db.breakpoint_options[bp.number] == {
+            'condition': None,
+            'hit_count': None,
+            'log_message': None,
+        }
+        assert db.compiled_options[bp.number] == (None, None, None)
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_set_breakpoint_options_invalid():
+    """
+    Invalid options result in an error message and aren't used.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = bdb.Breakpoint('foo.py', 10)
+    try:
+        assert db.set_breakpoint_options(bp, 'x >')
+        assert db.set_breakpoint_options(bp, hit_count='lots')
+        assert db.set_breakpoint_options(bp, hit_count=-1)
+        assert db.set_breakpoint_options(bp, log_message='{x')
+        assert bp.number not in db.breakpoint_options
+    finally:
+        bp.deleteMe()
+
+
+def make_breakpoint(db, condition=None, hit_count=None, log_message=None):
+    """
+    Return a breakpoint (at line 10 of foo.py) with the referenced options.
+    """
+    bp = bdb.Breakpoint('foo.py', 10)
+    db.set_breakpoint_options(bp, condition, hit_count, log_message)
+    return bp
+
+
+def test_Debugger_break_here_no_breakpoint():
+    """
+    There's no need to stop if there's no breakpoint on the frame's line.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    mock_frame = mock.MagicMock()
+    mock_frame.f_code.co_filename = 'foo.py'
+    mock_frame.f_lineno = 10
+    mock_frame.f_code.co_firstlineno = 1
+    assert db.break_here(mock_frame) is False
+    db.breaks = {db.canonic('foo.py'): [11, ]}
+    assert db.break_here(mock_frame) is False
+
+
+def test_Debugger_break_here():
+    """
+    Stop at an enabled breakpoint whose options say so, but not at one that's
+    disabled or whose options say otherwise.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    filename = db.canonic('foo.py')
+    db.breaks = {filename: [10, ]}
+    mock_frame = mock.MagicMock()
+    mock_frame.f_code.co_filename = 'foo.py'
+    mock_frame.f_lineno = 10
+    bp = bdb.Breakpoint(filename, 10)
+    try:
+        db.should_break = mock.MagicMock(return_value=False)
+        assert db.break_here(mock_frame) is False
+        db.should_break.assert_called_once_with(bp, mock_frame)
+        db.should_break.return_value = True
+        bp.disable()
+        assert db.break_here(mock_frame) is False
+        bp.enable()
+        assert db.break_here(mock_frame) is True
+        assert db.currentbp == bp.number
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_break_here_temporary():
+    """
+    A temporary breakpoint is cleared once it's stopped at.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    db.do_clear = mock.MagicMock()
+    filename = db.canonic('foo.py')
+    db.breaks = {filename: [10, ]}
+    mock_frame = mock.MagicMock()
+    mock_frame.f_code.co_filename = 'foo.py'
+    mock_frame.f_lineno = 10
+    bp = bdb.Breakpoint(filename, 10, temporary=True)
+    try:
+        assert db.break_here(mock_frame) is True
+        db.do_clear.assert_called_once_with(bp.number)
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_condition():
+    """
+    A conditional breakpoint only stops (and counts a hit) when its condition
+    is true in the frame.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = make_breakpoint(db, condition='x > 1')
+    mock_frame = mock.MagicMock()
+    mock_frame.f_globals = {}
+    try:
+        mock_frame.f_locals = {'x': 1}
+        assert db.should_break(bp, mock_frame) is False
+        assert bp.hits == 0
+        mock_frame.f_locals = {'x': 2}
+        assert db.should_break(bp, mock_frame) is True
+        assert bp.hits == 1
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_condition_error():
+    """
+    If a condition can't be evaluated, stop and tell the client why.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    bp = make_breakpoint(db, condition='y > 1')
+    mock_frame = mock.MagicMock()
+    mock_frame.f_globals = {}
+    mock_frame.f_locals = {}
+    try:
+        assert db.should_break(bp, mock_frame) is True
+        assert db.output.call_args[0][0] == 'error'
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_hit_count():
+    """
+    A breakpoint with a hit count only stops on that hit.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = make_breakpoint(db, hit_count=3)
+    mock_frame = mock.MagicMock()
+    try:
+        results = [db.should_break(bp, mock_frame) for i in range(5)]
+        assert results == [False, False, True, False, False]
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_ignore():
+    """
+    An ignored breakpoint doesn't stop until the ignore count runs out.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = bdb.Breakpoint('foo.py', 10)
+    bp.ignore = 1
+    mock_frame = mock.MagicMock()
+    try:
+        assert db.should_break(bp, mock_frame) is False
+        assert db.should_break(bp, mock_frame) is True
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_log_message():
+    """
+    A logpoint prints its message (with expressions filled in) instead of
+    stopping.
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    bp = make_breakpoint(db, log_message='x is {x}')
+    mock_frame = mock.MagicMock()
+    mock_frame.f_globals = {}
+    mock_frame.f_locals = {'x': 2}
+    try:
+        with mock.patch('builtins.print') as mock_print:
+            assert db.should_break(bp, mock_frame) is False
+        mock_print.assert_called_once_with('x is 2')
+    finally:
+        bp.deleteMe()
+
+
+def test_Debugger_should_break_log_message_error():
+    """
+    If a log message can't be filled in, tell the client why (but don't
+    stop).
+    """
+    db = mu.debugger.runner.Debugger(None, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    bp = make_breakpoint(db, log_message='y is {y}')
+    mock_frame = mock.MagicMock()
+    mock_frame.f_globals = {}
+    mock_frame.f_locals = {}
+    try:
+        with mock.patch('builtins.print') as mock_print:
+            assert db.should_break(bp, mock_frame) is False
+        assert mock_print.call_count == 0
+        assert db.output.call_args[0][0] == 'error'
+    finally:
+        bp.deleteMe()
 
 
 def test_Debugger_do_enable_no_such_breakpoint():
@@ -720,6 +1435,73 @@ def test_Debugger_do_clear():
                                       bpnum=1)
 
 
+def test_Debugger_do_clear_forgets_options():
+    """
+    The options of a cleared breakpoint are forgotten.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.clear_bpbynumber = mock.MagicMock(return_value='')
+    db.breakpoint_options[1] = {'condition': 'x'}
+    db.compiled_options[1] = (None, None, None)
+    mock_bdb = mock.MagicMock()
+    mock_bdb.Breakpoint.bpbynumber = {1: mock.MagicMock(), 2: 2, }
+    with mock.patch('mu.debugger.runner.bdb', mock_bdb):
+        db.do_clear(1)
+    assert db.breakpoint_options == {}
+    assert db.compiled_options == {}
+
+
+def test_Debugger_do_options_no_breakpoint():
+    """
+    Setting the options of a breakpoint that doesn't exist reports an error.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    mock_bdb = mock.MagicMock()
+    mock_bdb.Breakpoint.bpbynumber = [None, None, ]
+    with mock.patch('mu.debugger.runner.bdb', mock_bdb):
+        db.do_options(1, condition='x')
+        db.do_options(2, condition='x')
+    db.output.assert_called_with('error', message='No breakpoint numbered 2')
+    assert db.output.call_count == 2
+
+
+def test_Debugger_do_options_invalid():
+    """
+    Invalid options are reported to the client.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.set_breakpoint_options = mock.MagicMock(return_value='bang!')
+    mock_bdb = mock.MagicMock()
+    mock_bdb.Breakpoint.bpbynumber = [None, mock.MagicMock(), ]
+    with mock.patch('mu.debugger.runner.bdb', mock_bdb):
+        db.do_options('1', condition='x >')
+    db.output.assert_called_once_with('error', message='bang!')
+
+
+def test_Debugger_do_options():
+    """
+    The options are set and sent back to the client.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.output = mock.MagicMock()
+    mock_bp = mock.MagicMock()
+    mock_bp.number = 1
+    mock_bdb = mock.MagicMock()
+    mock_bdb.Breakpoint.bpbynumber = [None, mock_bp, ]
+    with mock.patch('mu.debugger.runner.bdb', mock_bdb):
+        db.do_options(1, condition='x > 1', hit_count=2)
+    db.output.assert_called_once_with('breakpoint_options', bpnum=1,
+                                      condition='x > 1', hit_count=2,
+                                      log_message=None)
+
+
 def test_Debugger_do_step():
     """
     Calls set_step and returns True.
@@ -773,8 +1555,11 @@ def test_Debugger_do_continue_with_breakpoints():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.get_all_breaks = mock.MagicMock(return_value=True)
     db.set_continue = mock.MagicMock()
+    db.run_to_breakpoint = mock.MagicMock()
+    db.breaks = {'foo.py': [1, ]}
     assert db.do_continue()
     db.set_continue.assert_called_once_with()
+    db.run_to_breakpoint.assert_called_once_with()
 
 
 def test_Debugger_do_continue_no_breakpoints():
@@ -798,9 +1583,582 @@ def test_Debugger_do_continue_no_breakpoints_continue_flag_set():
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.get_all_breaks = mock.MagicMock(return_value=False)
     db.set_continue = mock.MagicMock()
+    db.run_to_breakpoint = mock.MagicMock()
     db.continue_flag = True
     assert db.do_continue()
     db.set_continue.assert_called_once_with()
+    assert db.run_to_breakpoint.call_count == 0
+
+
+def test_Debugger_do_continue_recording():
+    """
+    When recording, keep tracing every line (so it's recorded) and stop
+    looking at the history.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.get_all_breaks = mock.MagicMock(return_value=True)
+    db.set_continue = mock.MagicMock()
+    db.run_to_breakpoint = mock.MagicMock()
+    db._set_stopinfo = mock.MagicMock()
+    db.botframe = mock.MagicMock()
+    db.breaks = {'foo.py': [1, ]}
+    db.recording = True
+    db.history_position = 3
+    assert db.do_continue()
+    db._set_stopinfo.assert_called_once_with(db.botframe, None, -1)
+    assert db.set_continue.call_count == 0
+    assert db.run_to_breakpoint.call_count == 0
+    assert db.history_position is None
+
+
+def make_frame(filename, line, local_vars, caller=None):
+    """
+    Return a mock frame running the referenced line of the file, with the
+    given locals, called from the caller frame.
+    """
+    mock_frame = mock.MagicMock()
+    mock_frame.f_code.co_filename = filename
+    mock_frame.f_lineno = line
+    mock_frame.f_locals = local_vars
+    mock_frame.f_back = caller
+    return mock_frame
+
+
+def recording_debugger():
+    """
+    Return a debugger recording a script in /code.
+    """
+    db = mu.debugger.runner.Debugger(mock.MagicMock(), 'localhost', 9999)
+    db.output = mock.MagicMock()
+    db.mainpyfile = db.canonic('/code/script.py')
+    db.recording = True
+    return db
+
+
+def test_Debugger_is_recorded():
+    """
+    Only code in the same directory as the user's script is recorded, and
+    the answer is cached.
+    """
+    db = recording_debugger()
+    db.canonic = mock.MagicMock(side_effect=lambda x: x)
+    user_code = mock.MagicMock()
+    user_code.co_filename = '/code/lib/helper.py'
+    other_code = mock.MagicMock()
+    other_code.co_filename = '/usr/lib/python3/os.py'
+    assert db.is_recorded(user_code) is True
+    assert db.is_recorded(other_code) is False
+    assert db.is_recorded(user_code) is True
+    assert db.canonic.call_count == 2
+
+
+def test_Debugger_record():
+    """
+    Each line records only the locals that changed (or were deleted) since
+    the previous line in the same frame, and the depth of the frame.
+    """
+    db = recording_debugger()
+    caller = make_frame('/code/script.py', 10, {'a': 1})
+    db.record(caller)
+    frame = make_frame('/code/script.py', 2, {'x': 1, 'y': 2}, caller)
+    db.record(frame)
+    frame.f_lineno = 3
+    frame.f_locals = {'x': 1, 'z': 3}
+    db.record(frame)
+    assert len(db.history) == 3
+    first, second, third = db.history
+    assert first.start is True
+    assert first.depth == 0
+    assert second.start is True
+    assert second.depth == 1
+    assert set(second.changes) == {'x', 'y'}
+    assert third.start is False
+    assert third.line == 3
+    assert third.changes == {
+        'z': mu.debugger.runner.describe('z', 3),
+        'y': None,
+    }
+    assert db.history_size == sum(entry.size for entry in db.history)
+
+
+def test_Debugger_record_unchanged_values():
+    """
+    Values of immutable types that are still the same object aren't described
+    again, and the runner's own names (and the builtins) aren't recorded.
+    """
+    db = recording_debugger()
+    value = 'hello'
+    frame = make_frame('/code/script.py', 1, {'x': value, 'y': [],
+                                              '__builtins__': {}})
+    db.record(frame)
+    frame.f_lineno = 2
+    with mock.patch('mu.debugger.runner.describe',
+                    wraps=mu.debugger.runner.describe) as mock_describe:
+        db.record(frame)
+    mock_describe.assert_called_once_with('y', [])
+    assert set(db.history[0].changes) == {'x', 'y'}
+    assert db.history[1].changes == {}
+
+
+def test_Debugger_record_not_user_code():
+    """
+    Code that isn't part of the user's program isn't recorded.
+    """
+    db = recording_debugger()
+    db.record(make_frame('/usr/lib/python3/os.py', 10, {'a': 1}))
+    assert len(db.history) == 0
+
+
+def test_Debugger_record_forgets_oldest():
+    """
+    The oldest history is forgotten once MAX_HISTORY_SIZE is reached.
+    """
+    db = recording_debugger()
+    frame = make_frame('/code/script.py', 1, {})
+    with mock.patch('mu.debugger.runner.MAX_HISTORY_SIZE', 1000):
+        for i in range(20):
+            frame.f_lineno = i
+            frame.f_locals = {'i': i}
+            db.record(frame)
+    assert db.history_size <= 1000
+    assert 1 < len(db.history) < 20
+    assert db.history[-1].line == 19
+
+
+def test_Debugger_recorded_locals():
+    """
+    The locals at a position in the history are rebuilt from the changes
+    recorded in its frame, and can't be expanded.
+    """
+    db = recording_debugger()
+    caller = make_frame('/code/script.py', 10, {'a': 1})
+    frame = make_frame('/code/script.py', 2, {'x': 1, 'y': 2}, caller)
+    db.record(frame)
+    db.record(caller)
+    frame.f_lineno = 3
+    frame.f_locals = {'x': 5}
+    db.record(frame)
+    frame.f_lineno = 4
+    frame.f_locals = {'x': 6}
+    db.record(frame)
+    result = db.recorded_locals(2)
+    assert set(result) == {'x'}
+    assert result['x']['repr'] == '5'
+    assert result['x']['expandable'] is False
+    assert set(db.recorded_locals(1)) == {'a'}
+    assert db.recorded_locals(0)['y']['repr'] == '2'
+
+
+def test_Debugger_do_back_no_history():
+    """
+    If there's no earlier history, tell the client.
+    """
+    db = recording_debugger()
+    db.record(make_frame('/code/script.py', 1, {}))
+    db.do_back()
+    db.output.assert_called_once_with('info',
+                                      message='There is no earlier history.')
+    assert db.history_position is None
+
+
+def test_Debugger_do_back():
+    """
+    Stepping back shows the previous line in the history, then the one before
+    that.
+    """
+    db = recording_debugger()
+    frame = make_frame('/code/script.py', 1, {'x': 1})
+    for line in (1, 2, 3):
+        frame.f_lineno = line
+        db.record(frame)
+    assert db.do_back() is None
+    assert db.history_position == 1
+    assert db.output.call_args[0][0] == 'history'
+    assert db.output.call_args[1]['line'] == 2
+    assert db.output.call_args[1]['steps'] == 1
+    db.do_back()
+    assert db.history_position == 0
+    assert db.output.call_args[1]['line'] == 1
+    assert db.output.call_args[1]['steps'] == 2
+    db.do_back()
+    assert db.history_position == 0
+    assert db.output.call_args[0][0] == 'info'
+
+
+def make_history(db):
+    """
+    Record a call to a function from the user's script and return the frame
+    that is paused in the present.
+    """
+    caller = make_frame('/code/script.py', 1, {})
+    db.record(caller)
+    frame = make_frame('/code/script.py', 10, {}, caller)
+    db.record(frame)
+    frame.f_lineno = 11
+    db.record(frame)
+    db.recorded_frames.pop(id(frame))
+    caller.f_lineno = 2
+    db.record(caller)
+    db.curframe = caller
+    return caller
+
+
+def test_Debugger_do_step_history():
+    """
+    Stepping while looking at the history goes to the next line in it rather
+    than running anything.
+    """
+    db = recording_debugger()
+    make_history(db)
+    db.history_position = 0
+    db.set_step = mock.MagicMock()
+    assert db.do_step() is None
+    assert db.set_step.call_count == 0
+    assert db.history_position == 1
+    assert db.output.call_args[1]['line'] == 10
+
+
+def test_Debugger_do_next_history():
+    """
+    Stepping over a line while looking at the history skips the lines in the
+    functions it calls, back to the present.
+    """
+    db = recording_debugger()
+    db.output_stack = mock.MagicMock()
+    caller = make_history(db)
+    db.history_position = 0
+    db.set_next = mock.MagicMock()
+    assert db.do_next() is None
+    assert db.set_next.call_count == 0
+    assert db.history_position is None
+    db.output.assert_called_once_with('line', filename=db.canonic(
+        '/code/script.py'), line=caller.f_lineno)
+    db.output_stack.assert_called_once_with()
+
+
+def test_Debugger_do_return_history():
+    """
+    Stepping out while looking at the history goes to the next line in a
+    calling frame.
+    """
+    db = recording_debugger()
+    db.output_stack = mock.MagicMock()
+    make_history(db)
+    db.history_position = 1
+    db.set_return = mock.MagicMock()
+    assert db.do_return() is None
+    assert db.set_return.call_count == 0
+    assert db.history_position is None
+    db.output_stack.assert_called_once_with()
+
+
+def test_Debugger_do_record():
+    """
+    Starting to record forgets any earlier history and records the current
+    line.
+    """
+    db = recording_debugger()
+    db.recording = False
+    db.history.append(mock.MagicMock())
+    db.history_size = 100
+    db.history_position = 0
+    db.curframe = make_frame('/code/script.py', 1, {})
+    db.do_record(True)
+    assert db.recording is True
+    assert len(db.history) == 1
+    assert db.history[0].line == 1
+    assert db.history_position is None
+    db.do_record(False)
+    assert db.recording is False
+    assert len(db.history) == 0
+    assert db.history_size == 0
+
+
+def test_Debugger_dispatch_line_recording():
+    """
+    Lines are recorded before deciding whether to stop at them.
+    """
+    db = recording_debugger()
+    db.record = mock.MagicMock()
+    mock_frame = mock.MagicMock()
+    with mock.patch('bdb.Bdb.dispatch_line', return_value='x') as mock_line:
+        assert db.dispatch_line(mock_frame) == 'x'
+    db.record.assert_called_once_with(mock_frame)
+    mock_line.assert_called_once_with(mock_frame)
+    db.recording = False
+    with mock.patch('bdb.Bdb.dispatch_line', return_value='x'):
+        db.dispatch_line(mock_frame)
+    assert db.record.call_count == 1
+
+
+def test_Debugger_dispatch_call_recording():
+    """
+    When recording, the user's code is traced even if Bdb has no need to.
+    """
+    db = recording_debugger()
+    db.is_recorded = mock.MagicMock(return_value=True)
+    mock_frame = mock.MagicMock()
+    with mock.patch('bdb.Bdb.dispatch_call', return_value=None):
+        assert db.dispatch_call(mock_frame, None) == db.trace_dispatch
+        db.is_recorded.return_value = False
+        assert db.dispatch_call(mock_frame, None) is None
+        db.recording = False
+        db.is_recorded.return_value = True
+        assert db.dispatch_call(mock_frame, None) is None
+
+
+def test_Debugger_dispatch_return_recording():
+    """
+    The locals recorded for a returning frame are forgotten.
+    """
+    db = recording_debugger()
+    mock_frame = mock.MagicMock()
+    db.recorded_frames[id(mock_frame)] = (0, {}, {})
+    with mock.patch('bdb.Bdb.dispatch_return', return_value='x'):
+        assert db.dispatch_return(mock_frame, None) == 'x'
+    assert db.recorded_frames == {}
+
+
+def test_Debugger_do_watch():
+    """
+    The watch expressions are compiled once, keeping the error for those that
+    can't be, and the stack (with their values) is sent again if the program
+    is paused.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.reset()
+    db.output_stack = mock.MagicMock()
+    db.do_watch(['x + 1', 'x +'])
+    assert db.output_stack.call_count == 0
+    assert db.watches[0][0] == 'x + 1'
+    assert eval(db.watches[0][1], {'x': 1}) == 2
+    assert db.watches[0][2] is None
+    assert db.watches[1][:2] == ('x +', None)
+    assert db.watches[1][2].startswith('SyntaxError: ')
+    db.curframe = mock.MagicMock()
+    db.do_watch([])
+    assert db.watches == []
+    db.output_stack.assert_called_once_with()
+    db.history_position = 1
+    db.do_watch(['x'])
+    assert db.output_stack.call_count == 1
+
+
+def test_Debugger_evaluate_watches():
+    """
+    Ensure each watch expression is summarised, in order, with a summary of
+    the error if it couldn't be evaluated.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.curframe = mock.MagicMock()
+    db.curframe.f_globals = {'y': 2}
+    db.curframe.f_locals = {'x': 1}
+    db.output_stack = mock.MagicMock()
+    db.do_watch(['x + y', '1 / 0', 'x +', 'exit()', 'slow()'])
+
+    def evaluate_watch(expression, code, frame, real=db.evaluate_watch):
+        if expression == 'slow()':
+            raise mu.debugger.runner.WatchTimeout()
+        return real(expression, code, frame)
+
+    db.evaluate_watch = evaluate_watch
+    with mock.patch('mu.debugger.runner.Timer'):
+        summaries = db.evaluate_watches()
+    assert [s['name'] for s in summaries] == ['x + y', '1 / 0', 'x +',
+                                              'exit()', 'slow()']
+    assert summaries[0]['repr'] == '3'
+    assert summaries[1] == {'name': '1 / 0', 'type': 'error',
+                            'repr': 'ZeroDivisionError: division by zero',
+                            'length': None, 'expandable': False}
+    assert summaries[2]['repr'].startswith('SyntaxError: ')
+    assert summaries[3]['repr'].startswith('SystemExit')
+    assert summaries[4]['repr'] == 'Took longer than {} seconds.'.format(
+        mu.debugger.runner.WATCH_TIME_LIMIT)
+    assert db.watch_values == {'x + y': 3}
+
+
+def test_Debugger_evaluate_watch():
+    """
+    Ensure the expression is evaluated (and described) with a timer running
+    to interrupt it if it takes too long, and its value is kept.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    frame = mock.MagicMock()
+    frame.f_globals = {}
+    frame.f_locals = {'x': [1, 2]}
+    timer = mock.MagicMock()
+    code = compile('x', '<watch>', 'eval')
+    with mock.patch('mu.debugger.runner.Timer',
+                    return_value=timer) as mock_timer:
+        summary = db.evaluate_watch('x', code, frame)
+    mock_timer.assert_called_once_with(mu.debugger.runner.WATCH_TIME_LIMIT,
+                                       mu.debugger.runner.interrupt_main)
+    timer.start.assert_called_once_with()
+    timer.cancel.assert_called_once_with()
+    timer.join.assert_called_once_with()
+    assert summary['repr'] == '[1, 2]'
+    assert db.watch_values['x'] == [1, 2]
+    assert not db.evaluating_watch
+
+
+def test_Debugger_evaluate_watch_error():
+    """
+    The timer is stopped even if the expression fails.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    frame = mock.MagicMock()
+    frame.f_globals = {}
+    frame.f_locals = {}
+    timer = mock.MagicMock()
+    code = compile('x', '<watch>', 'eval')
+    with mock.patch('mu.debugger.runner.Timer', return_value=timer):
+        with pytest.raises(NameError):
+            db.evaluate_watch('x', code, frame)
+    timer.cancel.assert_called_once_with()
+    assert not db.evaluating_watch
+    assert db.watch_values == {}
+
+
+def test_Debugger_evaluate_watch_timeout():
+    """
+    A watch expression blocked in Python (or a call such as time.sleep) is
+    interrupted once WATCH_TIME_LIMIT has passed.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.interacting = True  # The program is paused while watches are shown.
+    frame = mock.MagicMock()
+    frame.f_globals = {'time': time}
+    frame.f_locals = {}
+    code = compile('time.sleep(10)', '<watch>', 'eval')
+    handler = signal.signal(signal.SIGINT, db.on_pause_signal)
+    try:
+        with mock.patch('mu.debugger.runner.WATCH_TIME_LIMIT', 0.01):
+            start = time.perf_counter()
+            with pytest.raises(mu.debugger.runner.WatchTimeout):
+                db.evaluate_watch('time.sleep(10)', code, frame)
+    finally:
+        signal.signal(signal.SIGINT, handler)
+    assert time.perf_counter() - start < 5
+    assert not db.evaluating_watch
+
+
+def test_Debugger_evaluate_watch_c_code():
+    """
+    A watch expression stuck in a single call into C code can't be
+    interrupted: WATCH_TIME_LIMIT is only enforced once the call returns.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.interacting = True
+    frame = mock.MagicMock()
+    frame.f_globals = {}
+    frame.f_locals = {'n': 5 * 10 ** 6}
+    code = compile('sum(range(n))', '<watch>', 'eval')
+    start = time.perf_counter()
+    eval(code, frame.f_globals, frame.f_locals)
+    duration = time.perf_counter() - start
+    handler = signal.signal(signal.SIGINT, db.on_pause_signal)
+    try:
+        with mock.patch('mu.debugger.runner.WATCH_TIME_LIMIT',
+                        duration / 20):
+            start = time.perf_counter()
+            try:
+                db.evaluate_watch('sum(range(n))', code, frame)
+            except mu.debugger.runner.WatchTimeout:
+                pass
+    finally:
+        signal.signal(signal.SIGINT, handler)
+    # The call ran to the end, long after the time limit.
+    assert time.perf_counter() - start > duration / 2
+    assert not db.evaluating_watch
+
+
+def test_Debugger_do_pause():
+    """
+    Pausing the running program interrupts the main thread.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    with mock.patch('mu.debugger.runner.interrupt_main') as mock_interrupt:
+        db.do_pause()
+    mock_interrupt.assert_called_once_with()
+    assert db.pause_requested
+
+
+def test_Debugger_do_pause_already_paused():
+    """
+    There's nothing to interrupt if the program is already paused, or about
+    to be.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.interacting = True
+    with mock.patch('mu.debugger.runner.interrupt_main') as mock_interrupt:
+        db.do_pause()
+        db.interacting = False
+        db.pause_requested = True
+        db.do_pause()
+    assert mock_interrupt.call_count == 0
+
+
+def test_Debugger_on_pause_signal():
+    """
+    When asked to pause, trace everything again and stop at the next line of
+    the interrupted frame.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.set_next = mock.MagicMock()
+    db.trace_all = mock.MagicMock()
+    db.pause_requested = True
+    frame = mock.MagicMock()
+    db.on_pause_signal(2, frame)
+    assert not db.pause_requested
+    db.set_next.assert_called_once_with(frame)
+    db.trace_all.assert_called_once_with(frame)
+
+
+def test_Debugger_on_pause_signal_watch():
+    """
+    The signal interrupts a watch expression that takes too long.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.interacting = True
+    db.evaluating_watch = True
+    with pytest.raises(mu.debugger.runner.WatchTimeout):
+        db.on_pause_signal(2, mock.MagicMock())
+
+
+def test_Debugger_on_pause_signal_interrupt():
+    """
+    Any other interruption of the running program is a KeyboardInterrupt, as
+    usual.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.trace_all = mock.MagicMock()
+    with pytest.raises(KeyboardInterrupt):
+        db.on_pause_signal(2, mock.MagicMock())
+    assert db.trace_all.call_count == 0
+
+
+def test_Debugger_on_pause_signal_interacting():
+    """
+    Interruptions are ignored while the program is paused.
+    """
+    mock_socket = mock.MagicMock()
+    db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
+    db.trace_all = mock.MagicMock()
+    db.interacting = True
+    db.on_pause_signal(2, mock.MagicMock())
+    assert db.trace_all.call_count == 0
 
 
 def test_Debugger_do_quit():
@@ -837,7 +2195,16 @@ def test_Debugger_runscript():
     mock_socket = mock.MagicMock()
     db = mu.debugger.runner.Debugger(mock_socket, 'localhost', 9999)
     db.run = mock.MagicMock()
-    db._runscript('x.py')
+    db.stop_monitoring = mock.MagicMock()
+    mock_signal = mock.MagicMock()
+    mock_signal.signal.return_value = 'handler'
+    with mock.patch('mu.debugger.runner.signal', mock_signal):
+        db._runscript('x.py')
+    db.stop_monitoring.assert_called_once_with()
+    assert mock_signal.signal.call_args_list == [
+        mock.call(mock_signal.SIGINT, db.on_pause_signal),
+        mock.call(mock_signal.SIGINT, 'handler'),
+    ]
     assert db._run_state == mu.debugger.runner.DebugState.STARTING
     assert db.mainpyfile == db.canonic('x.py')
     assert db._user_requested_quit
@@ -859,10 +2226,14 @@ def test_run_with_user_requested_quit():
     mock_sys.argv = [None, None]
     mock_sys.path = [None]
     mock_socket = mock.MagicMock()
+    listener = mock_socket.socket.return_value
+    listener.getsockname.return_value = ('127.0.0.1', 1908)
     with mock.patch('mu.debugger.runner.Debugger', mock_debugger_class), \
             mock.patch('mu.debugger.runner.sys', mock_sys), \
-            mock.patch('mu.debugger.runner.socket', mock_socket):
+            mock.patch('mu.debugger.runner.socket', mock_socket), \
+            mock.patch('builtins.print') as mock_print:
         mu.debugger.runner.run('localhost', 1908, 'foo.py', 'bar', 'baz')
+    mock_print.assert_called_once_with('mu-debugger-port: 1908', flush=True)
     mock_debugger.reset.assert_called_once_with()
     mock_debugger._runscript.assert_called_once_with('foo.py')
     mock_debugger.client.shutdown.assert_called_once_with(mock_socket.SHUT_WR)
@@ -2,7 +2,11 @@
 """
 Tests for the debug utils.
 """
-from mu.debugger.utils import is_breakpoint_line
+import json
+import zlib
+from mu.debugger.utils import (is_breakpoint_line, encode_message,
+                               MessageBuffer, HEADER, COMPRESSED,
+                               PORT_HANDSHAKE, read_port_handshake)
 
 
 def test_is_breakpoint_line_valid_code():
@@ -71,3 +75,55 @@ def test_is_breakpoint_line_closing_collection():
     assert is_breakpoint_line(']') is False
     assert is_breakpoint_line('}') is False
     assert is_breakpoint_line(')') is False
+
+
+def test_encode_message():
+    """
+    Ensure messages are compact JSON preceded by a header of flags and the
+    length of the payload.
+    """
+    message = encode_message('test', {'foo': 'bar'})
+    payload = b'["test",{"foo":"bar"}]'
+    assert message == HEADER.pack(0, len(payload)) + payload
+
+
+def test_encode_message_compressed():
+    """
+    Ensure payloads larger than the threshold are compressed and flagged as
+    such.
+    """
+    data = {'foo': 'x' * 1000}
+    message = encode_message('test', data, compress_threshold=100)
+    flags, length = HEADER.unpack_from(message)
+    assert flags == COMPRESSED
+    assert length == len(message) - HEADER.size
+    assert length < 1000
+    payload = zlib.decompress(message[HEADER.size:])
+    assert json.loads(payload.decode('utf-8')) == ['test', data]
+
+
+def test_MessageBuffer_feed():
+    """
+    Ensure messages split across, or sharing, reads are extracted whole and
+    in order, even if they contain the old ETX terminator.
+    """
+    first = encode_message('first', {'text': 'ETX \x03 inside'})
+    second = encode_message('second', {'n': 1}, compress_threshold=0)
+    data = first + second
+    buffer = MessageBuffer()
+    assert buffer.feed(data[:3]) == []  # Incomplete header.
+    assert buffer.feed(data[3:10]) == []  # Incomplete payload.
+    messages = buffer.feed(data[10:])
+    assert [json.loads(m)[0] for m in messages] == ['first', 'second']
+    assert json.loads(messages[0])[1]['text'] == 'ETX \x03 inside'
+    assert buffer.buffer == bytearray()
+
+
+def test_read_port_handshake():
+    """
+    Ensure the port is read from the debug runner's handshake, and anything
+    else is not mistaken for it.
+    """
+    assert read_port_handshake(PORT_HANDSHAKE.format(1234) + '\n') == 1234
+    assert read_port_handshake('mu-debugger-port: lots') is None
+    assert read_port_handshake('Hello') is None
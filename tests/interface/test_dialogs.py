@@ -4,8 +4,9 @@ Tests for the user interface elements of Mu.
 """
 from PyQt5.QtWidgets import QApplication, QDialog, QWidget
 from unittest import mock
-from mu.modes import PythonMode, AdafruitMode, MicrobitMode, DebugMode
+from mu.modes import MODES
 import mu.interface.dialogs
+import mu.debugger.utils
 import pytest
 
 
@@ -41,19 +42,13 @@ def test_ModeItem_init():
 
 def test_ModeSelector_setup():
     """
-    Ensure the ModeSelector dialog is setup properly given a list of modes.
+    Ensure the ModeSelector dialog is setup properly given the descriptors of
+    the modes.
 
     If a mode has debugger = True it is ignored since debug mode is not a mode
     to be selected by users.
     """
-    editor = mock.MagicMock()
-    view = mock.MagicMock()
-    modes = {
-        'python': PythonMode(editor, view),
-        'adafruit': AdafruitMode(editor, view),
-        'microbit': MicrobitMode(editor, view),
-        'debugger': DebugMode(editor, view),
-    }
+    modes = {descriptor.key: descriptor for descriptor in MODES}
     current_mode = 'python'
     mock_item = mock.MagicMock()
     with mock.patch('mu.interface.dialogs.ModeItem', mock_item):
@@ -63,7 +58,7 @@ def test_ModeSelector_setup():
                 ms.setLayout = mock.MagicMock()
                 ms.setup(modes, current_mode)
                 assert ms.setLayout.call_count == 1
-    assert mock_item.call_count == 3
+    assert mock_item.call_count == 4
 
 
 def test_ModeSelector_select_and_accept():
@@ -115,9 +110,20 @@ def test_EnvironmentVariablesWidget_setup():
     """
     envars = 'name=value'
     evw = mu.interface.dialogs.EnvironmentVariablesWidget()
-    evw.setup(envars)
+    evw.setup(envars, 2)
     assert evw.text_area.toPlainText() == envars
     assert not evw.text_area.isReadOnly()
+    assert evw.warm_pool.value() == 2
+
+
+def test_EditorSettingsWidget_setup():
+    """
+    Ensure the widget for editing settings related to the editor displays the
+    referenced settings data in the expected way.
+    """
+    esw = mu.interface.dialogs.EditorSettingsWidget()
+    esw.setup(False)
+    assert not esw.live_check.isChecked()
 
 
 def test_MicrobitSettingsWidget_setup():
@@ -133,6 +139,47 @@ def test_MicrobitSettingsWidget_setup():
     assert mbsw.runtime_path.text() == '/foo/bar'
 
 
+def test_DebuggerSettingsWidget_setup():
+    """
+    Ensure the widget for editing settings related to the debugger displays
+    the referenced settings data in the expected way.
+    """
+    dsw = mu.interface.dialogs.DebuggerSettingsWidget()
+    dsw.setup(True)
+    assert dsw.recording.isChecked()
+
+
+def test_DebuggerLatencyWidget_setup():
+    """
+    Ensure the latency of the last step, the mean and the slowest is shown
+    for each stage of the steps in the debugger, in milliseconds.
+    """
+    stages = mu.debugger.utils.LATENCY_STAGES
+    latency = [dict.fromkeys(stages, 0.001), dict.fromkeys(stages, 0.003)]
+    dlw = mu.interface.dialogs.DebuggerLatencyWidget()
+    dlw.setup(latency)
+    assert dlw.table.rowCount() == len(stages)
+    total = stages.index('total')
+    assert dlw.table.verticalHeaderItem(total).text() == 'Total'
+    assert [dlw.table.item(total, i).text() for i in range(3)] == \
+        ['3.0', '2.0', '3.0']
+    assert '2' in dlw.label.text()
+    assert dlw.timer.isActive()
+    # It's updated as more steps are taken.
+    latency.append(dict.fromkeys(stages, 0.011))
+    dlw.refresh()
+    assert dlw.table.item(total, 0).text() == '11.0'
+
+
+def test_DebuggerLatencyWidget_no_steps():
+    """
+    Ensure nothing is shown if there are no steps.
+    """
+    dlw = mu.interface.dialogs.DebuggerLatencyWidget()
+    dlw.setup([])
+    assert dlw.table.item(0, 1).text() == '-'
+
+
 def test_AdminDialog_setup():
     """
     Ensure the admin dialog is setup properly given the content of a log
@@ -141,8 +188,11 @@ def test_AdminDialog_setup():
     log = 'this is the contents of a log file'
     settings = {
         'envars': 'name=value',
+        'warm_pool': 1,
         'minify': True,
         'microbit_runtime': '/foo/bar',
+        'debug_recording': True,
+        'live_check': False,
     }
     mock_window = QWidget()
     ad = mu.interface.dialogs.AdminDialog(mock_window)
@@ -176,3 +226,26 @@ def test_FindReplaceDialog_setup_with_args():
     assert frd.find() == find
     assert frd.replace() == replace
     assert frd.replace_flag()
+
+
+def test_BreakpointOptionsDialog_setup():
+    """
+    Ensure the breakpoint options dialog is setup properly with no options.
+    """
+    bod = mu.interface.dialogs.BreakpointOptionsDialog()
+    bod.setup()
+    assert bod.condition() is None
+    assert bod.hit_count() is None
+    assert bod.log_message() is None
+
+
+def test_BreakpointOptionsDialog_setup_with_args():
+    """
+    Ensure the breakpoint options dialog is setup properly given the existing
+    options.
+    """
+    bod = mu.interface.dialogs.BreakpointOptionsDialog()
+    bod.setup(' x > 1 ', 5, 'x is {x}')
+    assert bod.condition() == 'x > 1'
+    assert bod.hit_count() == 5
+    assert bod.log_message() == 'x is {x}'
@@ -3,7 +3,9 @@
 Tests for the user interface elements of Mu.
 """
 from unittest import mock
+import mu
 import mu.interface.editor
+import mu.interface.themes
 import keyword
 import re
 from PyQt5.QtCore import Qt, QMimeData, QUrl, QPointF
@@ -118,19 +120,154 @@ def test_Editor_connect_margin():
 
 def test_EditorPane_set_theme():
     """
-    Check all the expected configuration calls are made to ensure the widget's
-    theme is updated.
+    Check the tab uses the API entries prepared for tooltips, calltips and the
+    like, which are shared by the tabs.
     """
     api = ['api help text', ]
     ep = mu.interface.editor.EditorPane('/foo/bar.py', 'baz')
     ep.lexer = mock.MagicMock()
     mock_api = mock.MagicMock()
-    with mock.patch('mu.interface.editor.QsciAPIs',
-                    return_value=mock_api) as mapi:
+    with mock.patch('mu.interface.editor.prepared_apis') as mock_prepared:
+        mock_prepared.get.return_value = mock_api
         ep.set_api(api)
-        mapi.assert_called_once_with(ep.lexer)
+    mock_prepared.get.assert_called_once_with(api)
+    ep.lexer.setAPIs.assert_called_once_with(mock_api)
+    assert ep.api == mock_api
+
+
+def test_EditorPane_set_theme_indicators():
+    """
+    Ensure the indicators (including those of profiled lines) are coloured by
+    each theme.
+    """
+    ep = mu.interface.editor.EditorPane('/foo/bar.py', 'baz')
+    for theme in (mu.interface.themes.DayTheme, mu.interface.themes.NightTheme,
+                  mu.interface.themes.ContrastTheme):
+        ep.setIndicatorForegroundColor = mock.MagicMock()
+        ep.set_theme(theme)
+        ep.setIndicatorForegroundColor.assert_any_call(
+            theme.IndicatorProfile, ep.check_indicators['profile']['id'])
+        ep.setIndicatorForegroundColor.assert_any_call(
+            theme.IndicatorError, ep.check_indicators['error']['id'])
+
+
+def test_TranslatedAPIs_callTips():
+    """
+    Call tips are translated when they're shown, including those shown
+    without the qualifiers of their entry.
+    """
+    entries = ['foo(a) \nDo foo.', 'bar.baz.qux(b) \nDo qux.', ]
+    api = mu.interface.editor.TranslatedAPIs(
+        mu.interface.editor.PythonLexer(), entries)
+    translations = {
+        'foo(a) \nDo foo.': 'foo(a) \nFaire foo.',
+        'bar.baz.qux(b) \nDo qux.': 'bar.baz.qux(b) \nFaire qux.',
+    }
+    tips = ['foo(a) \nDo foo.', 'qux(b) \nDo qux.',
+            'bar.baz.qux(b) \nDo qux.', 'unknown()']
+    with mock.patch('mu.interface.editor.QsciAPIs.callTips',
+                    return_value=tips), \
+            mock.patch('builtins._', lambda s: translations.get(s, s)):
+        result = api.callTips(['qux', ''], 0, 0, [])
+    assert result == ['foo(a) \nFaire foo.', 'qux(b) \nFaire qux.',
+                      'bar.baz.qux(b) \nFaire qux.', 'unknown()']
+
+
+def test_PreparedAPIs_get():
+    """
+    The API entries are prepared once, in the background, and shared by the
+    tabs using the same entries. The result is saved once prepared.
+    """
+    pa = mu.interface.editor.PreparedAPIs()
+    mock_api = mock.MagicMock()
+    with mock.patch('mu.interface.editor.TranslatedAPIs',
+                    return_value=mock_api) as mapi, \
+            mock.patch('os.path.isfile', return_value=False):
+        assert pa.get(['api help text', ]) == mock_api
+        assert pa.get(['api help text', ]) == mock_api
+        assert mapi.call_count == 1
+        mapi.assert_called_once_with(pa.lexer, ['api help text', ])
         mock_api.add.assert_called_once_with('api help text')
         mock_api.prepare.assert_called_once_with()
+        pa.get(['other help text', ])
+        assert mapi.call_count == 2
+    pa.save = mock.MagicMock()
+    on_finished = mock_api.apiPreparationFinished.connect.call_args[0][0]
+    on_finished()
+    assert pa.save.call_args[0][0] == mock_api
+    assert '-' + mu.__version__ + '-' in pa.save.call_args[0][1]
+
+
+def test_PreparedAPIs_get_load_prepared():
+    """
+    API entries prepared and saved before are loaded rather than prepared
+    again.
+    """
+    pa = mu.interface.editor.PreparedAPIs()
+    mock_api = mock.MagicMock()
+    mock_api.loadPrepared.return_value = True
+    with mock.patch('mu.interface.editor.TranslatedAPIs',
+                    return_value=mock_api), \
+            mock.patch('os.path.isfile', return_value=True):
+        pa.get(['api help text', ])
+    assert mock_api.loadPrepared.call_count == 1
+    assert mock_api.add.call_count == 0
+    assert mock_api.prepare.call_count == 0
+
+
+def test_PreparedAPIs_get_load_prepared_fails():
+    """
+    If the saved API entries can't be loaded, they're prepared again.
+    """
+    pa = mu.interface.editor.PreparedAPIs()
+    mock_api = mock.MagicMock()
+    mock_api.loadPrepared.return_value = False
+    with mock.patch('mu.interface.editor.TranslatedAPIs',
+                    return_value=mock_api), \
+            mock.patch('os.path.isfile', return_value=True):
+        pa.get(['api help text', ])
+    mock_api.prepare.assert_called_once_with()
+
+
+def test_PreparedAPIs_save():
+    """
+    The prepared API entries are saved to the referenced path, logging if it
+    fails.
+    """
+    pa = mu.interface.editor.PreparedAPIs()
+    mock_api = mock.MagicMock()
+    mock_api.savePrepared.return_value = False
+    with mock.patch('mu.interface.editor.logger') as mock_logger:
+        pa.save(mock_api, 'foo.prepared')
+    mock_api.savePrepared.assert_called_once_with('foo.prepared')
+    assert mock_logger.warning.call_count == 1
+
+
+def test_PreparedAPIs_roundtrip(tmpdir):
+    """
+    API entries prepared and saved in one session are loaded in the next.
+    """
+    with mock.patch('mu.interface.editor.DATA_DIR', str(tmpdir)):
+        pa = mu.interface.editor.PreparedAPIs()
+        api = pa.get(['foo.bar(baz)', ])
+        api.apiPreparationFinished.emit()  # Saves it.
+        assert len(tmpdir.listdir()) == 1
+        pa = mu.interface.editor.PreparedAPIs()
+        with mock.patch('mu.interface.editor.TranslatedAPIs.prepare') as \
+                prepare:
+            pa.get(['foo.bar(baz)', ])
+        assert prepare.call_count == 0
+
+
+def test_EditorPlaceholder():
+    """
+    Ensure the placeholder for a restored tab is labelled with the filename
+    and is never modified.
+    """
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    assert placeholder.path == '/foo/bar.py'
+    assert placeholder.label == 'bar.py'
+    assert placeholder.isModified() is False
 
 
 def test_EditorPane_label():
@@ -285,6 +422,18 @@ def test_EditorPane_debugger_at_line_windows_line_endings():
     ep.ensureLineVisible.assert_called_once_with(99)
 
 
+def test_EditorPane_breakpoint_handle():
+    """
+    Ensure the handle of the breakpoint marker on a line is found, or None if
+    there isn't one.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'baz')
+    ep.breakpoint_handles = set([1, 2, ])
+    ep.markerLine = mock.MagicMock(side_effect=lambda handle: handle * 10)
+    assert ep.breakpoint_handle(20) == 2
+    assert ep.breakpoint_handle(30) is None
+
+
 def test_EditorPane_reset_debugger_highlight():
     """
     Ensure all DEBUG_INDICATORs are removed from the editor.
@@ -299,6 +448,74 @@ def test_EditorPane_reset_debugger_highlight():
                                                            ep.DEBUG_INDICATOR)
 
 
+def test_EditorPane_on_lines_changed():
+    """
+    Adding or removing lines flags that the annotations may have moved.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\n')
+    ep.lines_changed = False
+    ep.setText('a\nb\nc\n')
+    assert ep.lines_changed is True
+
+
+def test_EditorPane_update_annotations():
+    """
+    Only the lines whose annotations have changed are re-applied.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\nd\n')
+    ep.lines_changed = False
+    same = [{'line_no': 0, 'column': 0, 'message': 'same'}]
+    old = [{'line_no': 1, 'column': 2, 'message': 'old'}]
+    gone = [{'line_no': 2, 'column': 0, 'message': 'gone'}]
+    new = [{'line_no': 1, 'column': 3, 'message': 'new'}]
+    added = [{'line_no': 3, 'column': 0, 'message': 'added'}]
+    ep.check_indicators['error']['markers'] = {0: same, 1: old, 2: gone}
+    ep.check_indicators['profile']['markers'] = {
+        3: [{'line_no': 3, 'message': 'profile'}]}
+    ep.clearIndicatorRange = mock.MagicMock()
+    ep.fillIndicatorRange = mock.MagicMock()
+    ep.clearAnnotations = mock.MagicMock()
+    ep.annotate = mock.MagicMock()
+    ep.update_annotations({'error': {0: same, 1: new, 3: added},
+                           'style': {}})
+    error_id = ep.check_indicators['error']['id']
+    assert ep.check_indicators['error']['markers'] == {0: same, 1: new,
+                                                       3: added}
+    assert ep.check_indicators['style']['markers'] == {}
+    assert sorted(c[0][0] for c in ep.clearIndicatorRange.call_args_list) \
+        == [1, 2, 3]
+    ep.fillIndicatorRange.assert_called_once_with(1, 2, 1, 4, error_id)
+    assert sorted(c[0][0] for c in ep.clearAnnotations.call_args_list) == \
+        [1, 2, 3]
+    ep.annotate.assert_has_calls([
+        mock.call(1, '\u2191 new', ep.annotationDisplay()),
+        mock.call(3, '\u2191 added\n\u2191 profile',
+                  ep.annotationDisplay()),
+    ], any_order=True)
+    assert ep.annotate.call_count == 2
+
+
+def test_EditorPane_update_annotations_lines_changed():
+    """
+    If the number of lines has changed, all the annotations are re-applied
+    since they may have moved.
+    """
+    ep = mu.interface.editor.EditorPane(None, 'a\nb\nc\n')
+    ep.lines_changed = True
+    same = [{'line_no': 0, 'column': 0, 'message': 'same'}]
+    ep.check_indicators['error']['markers'] = {0: same}
+    ep.clearIndicatorRange = mock.MagicMock()
+    ep.clearAnnotations = mock.MagicMock()
+    ep.annotate = mock.MagicMock()
+    ep.update_annotations({'error': {0: same}})
+    assert ep.lines_changed is False
+    ep.clearIndicatorRange.assert_any_call(
+        0, 0, 3, 0, ep.check_indicators['error']['id'])
+    ep.clearAnnotations.assert_any_call()
+    ep.annotate.assert_called_once_with(0, '\u2191 same',
+                                        ep.annotationDisplay())
+
+
 def test_EditorPane_show_annotations():
     """
     Ensure the annotations are shown in "sentence" case and with an arrow to
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the Jupyter based REPL pane.
+"""
+from PyQt5.QtWidgets import QApplication
+from unittest import mock
+import mu.interface.jupyter
+
+# Required so the QWidget tests don't abort with the message:
+# "QWidget: Must construct a QApplication before a QWidget"
+# The QApplication need only be instantiated once.
+app = QApplication([])
+
+
+def test_JupyterREPLPane_init():
+    """
+    Ensure the widget is setup with the correct defaults.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    assert jw.console_height == 10
+
+
+def test_JupyterREPLPane_append_plain_text():
+    """
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.on_append_text = mock.MagicMock()
+    jw._append_plain_text('hello')
+    jw.on_append_text.emit.assert_called_once_with('hello'.encode('utf-8'))
+
+
+def test_JupyterREPLPane_set_font_size():
+    """
+    Check the correct stylesheet values are being set.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.setStyleSheet = mock.MagicMock()
+    jw.set_font_size(16)
+    style = jw.setStyleSheet.call_args[0][0]
+    assert 'font-size: 16pt;' in style
+    assert 'font-family: Monospace;' in style
+
+
+def test_JupyterREPLPane_zoomIn():
+    """
+    Ensure zooming in increases the font size.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.set_font_size = mock.MagicMock()
+    old_size = jw.font.pointSize()
+    jw.zoomIn(delta=4)
+    jw.set_font_size.assert_called_once_with(old_size + 4)
+
+
+def test_JupyterREPLPane_zoomOut():
+    """
+    Ensure zooming out decreases the font size.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.set_font_size = mock.MagicMock()
+    old_size = jw.font.pointSize()
+    jw.zoomOut(delta=4)
+    jw.set_font_size.assert_called_once_with(old_size - 4)
+
+
+def test_JupyterREPLPane_set_theme_day():
+    """
+    Make sure the theme is correctly set for day.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.set_default_style = mock.MagicMock()
+    jw.set_theme('day')
+    jw.set_default_style.assert_called_once_with()
+
+
+def test_JupyterREPLPane_set_theme_night():
+    """
+    Make sure the theme is correctly set for night.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.set_default_style = mock.MagicMock()
+    jw.set_theme('night')
+    jw.set_default_style.assert_called_once_with(colors='nocolor')
+
+
+def test_JupyterREPLPane_set_theme_contrast():
+    """
+    Make sure the theme is correctly set for high contrast.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw.set_default_style = mock.MagicMock()
+    jw.set_theme('contrast')
+    jw.set_default_style.assert_called_once_with(colors='nocolor')
+
+
+def test_JupyterREPLPane_setFocus():
+    """
+    Ensures setFocus actually occurs to the _control containing the REPL.
+    """
+    jw = mu.interface.jupyter.JupyterREPLPane()
+    jw._control = mock.MagicMock()
+    jw.setFocus()
+    jw._control.setFocus.assert_called_once_with()
@@ -228,6 +228,21 @@ def test_FileTabs_change_tab_no_tabs():
     mock_window.update_title.assert_called_once_with(None)
 
 
+def test_FileTabs_change_tab_placeholder():
+    """
+    Ensure the window is asked to load the file of a tab restored from the
+    last session when the tab is first focused.
+    """
+    qtw = mu.interface.main.FileTabs()
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    qtw.widget = mock.MagicMock(return_value=placeholder)
+    mock_window = mock.MagicMock()
+    qtw.nativeParentWidget = mock.MagicMock(return_value=mock_window)
+    qtw.change_tab(0)
+    mock_window.update_title.assert_called_once_with('bar.py')
+    mock_window.placeholder_focused.emit.assert_called_once_with(placeholder)
+
+
 def test_Window_attributes():
     """
     Expect the title and icon to be set correctly.
@@ -252,6 +267,23 @@ def test_Window_resizeEvent():
     w.button_bar.set_responsive_mode.assert_called_with(1024, 768)
 
 
+def test_Window_paintEvent():
+    """
+    Ensure the first_paint signal is only emitted the first time the window
+    is painted.
+    """
+    w = mu.interface.main.Window()
+    w.first_paint = mock.MagicMock()
+    paintEvent = mock.MagicMock()
+    with mock.patch('mu.interface.main.QMainWindow.paintEvent') as mock_paint:
+        w.paintEvent(paintEvent)
+        w.paintEvent(paintEvent)
+    mock_paint.assert_called_with(paintEvent)
+    assert mock_paint.call_count == 2
+    w.first_paint.emit.assert_called_once_with()
+    assert w.painted
+
+
 def test_Window_select_mode_selected():
     """
     Handle the selection of a new mode.
@@ -264,9 +296,11 @@ def test_Window_select_mode_selected():
     current_mode = 'python'
     with mock.patch('mu.interface.main.ModeSelector', mock_mode_selector):
         w = mu.interface.main.Window()
+        w.selecting_mode = mock.MagicMock()
         result = w.select_mode(mock_modes, current_mode)
         assert result == 'foo'
         mock_selector.setup.assert_called_once_with(mock_modes, current_mode)
+        w.selecting_mode.emit.assert_called_once_with()
         mock_selector.exec.assert_called_once_with()
 
 
@@ -356,6 +390,60 @@ def test_Window_current_tab():
     assert w.current_tab == 'foo'
 
 
+def test_Window_current_tab_placeholder():
+    """
+    If the focussed tab's file is yet to be loaded, there's no current tab
+    (and reading it doesn't load the file).
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    w.tabs.currentWidget = mock.MagicMock(return_value=placeholder)
+    w.placeholder_focused = mock.MagicMock()
+    assert w.current_tab is None
+    assert w.placeholder_focused.emit.call_count == 0
+
+
+def test_Window_realize_current():
+    """
+    If the focussed tab's file is yet to be loaded, it's loaded and the tab
+    which replaces the placeholder is returned.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    w.tabs.currentWidget = mock.MagicMock(return_value=placeholder)
+    w.placeholder_focused = mock.MagicMock()
+    w.placeholder_focused.emit.side_effect = lambda placeholder: \
+        setattr(w.tabs.currentWidget, 'return_value', 'foo')
+    assert w.realize_current() == 'foo'
+    w.placeholder_focused.emit.assert_called_once_with(placeholder)
+
+
+def test_Window_realize_current_loaded():
+    """
+    If the focussed tab's file is already loaded, the tab is returned.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.currentWidget = mock.MagicMock(return_value='foo')
+    w.placeholder_focused = mock.MagicMock()
+    assert w.realize_current() == 'foo'
+    assert w.placeholder_focused.emit.call_count == 0
+
+
+def test_Window_realize_current_not_loaded():
+    """
+    If the focussed tab's file can't be loaded, there's no current tab.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    w.tabs.currentWidget = mock.MagicMock(return_value=placeholder)
+    w.placeholder_focused = mock.MagicMock()
+    assert w.realize_current() is None
+
+
 def test_Window_set_read_only():
     """
     Ensure all the tabs have the setReadOnly method set to the boolean passed
@@ -441,10 +529,11 @@ def test_Window_add_tab():
     w.tabs.setTabText = mock.MagicMock(return_value=None)
     w.connect_zoom = mock.MagicMock(return_value=None)
     w.set_theme = mock.MagicMock(return_value=None)
-    w.theme = mock.MagicMock()
+    w.theme = 'night'
     w.api = ['an api help text', ]
     ep = mu.interface.editor.EditorPane('/foo/bar.py', 'baz')
     ep.set_api = mock.MagicMock()
+    ep.set_theme = mock.MagicMock()
     ep.modificationChanged = mock.MagicMock()
     ep.modificationChanged.connect = mock.MagicMock(return_value=None)
     ep.connect_margin = mock.MagicMock()
@@ -461,7 +550,9 @@ def test_Window_add_tab():
     w.tabs.addTab.assert_called_once_with(ep, ep.label)
     w.tabs.setCurrentIndex.assert_called_once_with(new_tab_index)
     w.connect_zoom.assert_called_once_with(ep)
-    w.set_theme.assert_called_once_with(w.theme)
+    # Only the new tab is styled.
+    assert w.set_theme.call_count == 0
+    ep.set_theme.assert_called_once_with(mu.interface.themes.NightTheme)
     ep.connect_margin.assert_called_once_with(w.breakpoint_toggle)
     ep.set_api.assert_called_once_with(api)
     ep.setFocus.assert_called_once_with()
@@ -471,6 +562,91 @@ def test_Window_add_tab():
     w.tabs.setTabText.assert_called_once_with(new_tab_index, ep.label)
 
 
+def test_Window_add_tab_text_changed():
+    """
+    Ensure editing a tab emits the window's text_changed signal with the tab.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.connect_zoom = mock.MagicMock()
+    w.set_theme = mock.MagicMock()
+    w.theme = mock.MagicMock()
+    w.read_only_tabs = False
+    w.breakpoint_toggle = mock.MagicMock()
+    w.text_changed = mock.MagicMock()
+    w.add_tab('/foo/bar.py', 'baz', [], '\n')
+    tab = w.tabs.addTab.call_args[0][0]
+    tab.setText('qux')
+    w.text_changed.emit.assert_called_with(tab)
+
+
+def test_Window_add_tab_index():
+    """
+    Ensure a tab is inserted at the referenced index, if given.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.read_only_tabs = False
+    w.tabs.insertTab.return_value = 1
+    w.connect_zoom = mock.MagicMock()
+    w.breakpoint_toggle = mock.MagicMock()
+    ep = mock.MagicMock()
+    with mock.patch('mu.interface.main.EditorPane', return_value=ep):
+        w.add_tab('/foo/bar.py', 'baz', [], '\n', 1)
+    assert w.tabs.addTab.call_count == 0
+    w.tabs.insertTab.assert_called_once_with(1, ep, ep.label)
+    w.tabs.setCurrentIndex.assert_called_once_with(1)
+
+
+def test_Window_add_placeholder():
+    """
+    Ensure a tab is added with a placeholder for the referenced path, without
+    loading the file.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.add_tab = mock.MagicMock()
+    placeholder = w.add_placeholder('/foo/bar.py')
+    assert isinstance(placeholder, mu.interface.editor.EditorPlaceholder)
+    assert placeholder.path == '/foo/bar.py'
+    w.tabs.addTab.assert_called_once_with(placeholder, 'bar.py')
+    assert w.tabs.blockSignals.call_args_list == [mock.call(True),
+                                                  mock.call(False)]
+    assert w.add_tab.call_count == 0
+    assert w.tabs.setCurrentIndex.call_count == 0
+
+
+def test_Window_realize_tab():
+    """
+    Ensure the placeholder is replaced by a tab with the text of its file, in
+    the same place.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.indexOf.return_value = 2
+    w.add_tab = mock.MagicMock()
+    w.remove_placeholder = mock.MagicMock()
+    placeholder = mock.MagicMock()
+    placeholder.path = '/foo/bar.py'
+    w.realize_tab(placeholder, 'baz', ['api'], '\n')
+    w.add_tab.assert_called_once_with('/foo/bar.py', 'baz', ['api'], '\n', 2)
+    w.remove_placeholder.assert_called_once_with(placeholder)
+
+
+def test_Window_remove_placeholder():
+    """
+    Ensure the tab of the placeholder is removed.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.indexOf.return_value = 2
+    placeholder = mock.MagicMock()
+    w.remove_placeholder(placeholder)
+    w.tabs.indexOf.assert_called_once_with(placeholder)
+    w.tabs.removeTab.assert_called_once_with(2)
+    placeholder.deleteLater.assert_called_once_with()
+
+
 def test_Window_focus_tab():
     """
     Given a tab instance, ensure it has focus.
@@ -479,11 +655,32 @@ def test_Window_focus_tab():
     w.tabs = mock.MagicMock()
     w.tabs.indexOf.return_value = 1
     tab = mock.MagicMock()
+    w.tabs.currentWidget.return_value = tab
     w.focus_tab(tab)
     w.tabs.setCurrentIndex.assert_called_once_with(1)
     tab.setFocus.assert_called_once_with()
 
 
+def test_Window_focus_tab_placeholder():
+    """
+    Given the placeholder of a tab yet to be loaded, ensure the tab which
+    replaces it, once loaded, has focus.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.indexOf.return_value = 1
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    tab = mock.MagicMock()
+    w.tabs.currentWidget.return_value = placeholder
+    w.placeholder_focused = mock.MagicMock()
+    w.placeholder_focused.emit.side_effect = lambda placeholder: \
+        setattr(w.tabs.currentWidget, 'return_value', tab)
+    w.focus_tab(placeholder)
+    w.tabs.setCurrentIndex.assert_called_once_with(1)
+    w.placeholder_focused.emit.assert_called_once_with(placeholder)
+    tab.setFocus.assert_called_once_with()
+
+
 def test_Window_tab_count():
     """
     Ensure the number from Window.tabs.count() is returned.
@@ -510,6 +707,36 @@ def test_Window_widgets():
     w.tabs.count.assert_called_once_with()
 
 
+def test_Window_widgets_placeholders():
+    """
+    Ensure the placeholders of tabs whose files are yet to be loaded are kept
+    apart from the widgets.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.count = mock.MagicMock(return_value=2)
+    tab = mock.MagicMock()
+    placeholder = mu.interface.editor.EditorPlaceholder('/foo/bar.py')
+    w.tabs.widget = mock.MagicMock(side_effect=[tab, placeholder] * 2)
+    assert w.widgets == [tab]
+    assert w.placeholders == [placeholder]
+
+
+def test_Window_all_tabs():
+    """
+    Ensure every tab, loaded or not, is returned in the order of the tabs.
+    """
+    w = mu.interface.main.Window()
+    w.tabs = mock.MagicMock()
+    w.tabs.count = mock.MagicMock(return_value=3)
+    tab = mock.MagicMock()
+    placeholder1 = mu.interface.editor.EditorPlaceholder('/foo/a.py')
+    placeholder2 = mu.interface.editor.EditorPlaceholder('/foo/c.py')
+    w.tabs.widget = mock.MagicMock(side_effect=[placeholder1, tab,
+                                                placeholder2])
+    assert w.all_tabs == [placeholder1, tab, placeholder2]
+
+
 def test_Window_modified():
     """
     Ensure the window's modified attribute is derived from the modified state
@@ -562,7 +789,7 @@ def test_Window_open_serial_link():
     mock_serial.readyRead = mock.MagicMock()
     mock_serial.readyRead.connect = mock.MagicMock(return_value=None)
     mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.main.QSerialPort', mock_serial_class):
+    with mock.patch('PyQt5.QtSerialPort.QSerialPort', mock_serial_class):
         w = mu.interface.main.Window()
         w.open_serial_link('COM0')
         assert w.input_buffer == []
@@ -581,7 +808,7 @@ def test_Window_open_serial_link_unable_to_connect():
     mock_serial.setBaudRate = mock.MagicMock(return_value=None)
     mock_serial.open = mock.MagicMock(return_value=False)
     mock_serial_class = mock.MagicMock(return_value=mock_serial)
-    with mock.patch('mu.interface.main.QSerialPort', mock_serial_class):
+    with mock.patch('PyQt5.QtSerialPort.QSerialPort', mock_serial_class):
         with pytest.raises(IOError):
             w = mu.interface.main.Window()
             w.open_serial_link('COM0')
@@ -595,16 +822,16 @@ def test_Window_open_serial_link_DTR_unset():
     """
     mock_qt_serial = mock.MagicMock()
     mock_qt_serial.isDataTerminalReady.return_value = False
-    mock_py_serial = mock.MagicMock()
+    mock_py_serial_class = mock.MagicMock()
     mock_serial_class = mock.MagicMock(return_value=mock_qt_serial)
-    with mock.patch('mu.interface.main.QSerialPort', mock_serial_class):
-        with mock.patch('mu.interface.main.serial', mock_py_serial):
+    with mock.patch('PyQt5.QtSerialPort.QSerialPort', mock_serial_class):
+        with mock.patch('serial.Serial', mock_py_serial_class):
             w = mu.interface.main.Window()
             w.open_serial_link('COM0')
     mock_qt_serial.close.assert_called_once_with()
     assert mock_qt_serial.open.call_count == 2
-    mock_py_serial.Serial.assert_called_once_with('COM0')
-    mock_pyser = mock_py_serial.Serial('COM0')
+    mock_py_serial_class.assert_called_once_with('COM0')
+    mock_pyser = mock_py_serial_class.return_value
     assert mock_pyser.dtr is True
     mock_pyser.close.assert_called_once_with()
 
@@ -752,7 +979,7 @@ def test_Window_add_micropython_plotter():
     mock_plotter = mock.MagicMock()
     mock_plotter_class = mock.MagicMock(return_value=mock_plotter)
     mock_mode = mock.MagicMock()
-    with mock.patch('mu.interface.main.PlotterPane', mock_plotter_class):
+    with mock.patch('mu.interface.plotter.PlotterPane', mock_plotter_class):
         w.add_micropython_plotter('COM0', 'MicroPython Plotter', mock_mode)
     mock_plotter_class.assert_called_once_with()
     w.open_serial_link.assert_called_once_with('COM0')
@@ -773,7 +1000,7 @@ def test_Window_add_python3_plotter():
     mock_plotter = mock.MagicMock()
     mock_plotter_class = mock.MagicMock(return_value=mock_plotter)
     mock_mode = mock.MagicMock()
-    with mock.patch('mu.interface.main.PlotterPane', mock_plotter_class):
+    with mock.patch('mu.interface.plotter.PlotterPane', mock_plotter_class):
         w.add_python3_plotter(mock_mode)
     w.data_received.connect.assert_called_once_with(mock_plotter.process_bytes)
     mock_plotter.data_flood.connect.\
@@ -781,6 +1008,22 @@ def test_Window_add_python3_plotter():
     w.add_plotter.assert_called_once_with(mock_plotter, 'Python3 data tuple')
 
 
+def test_Window_add_data_capture_plotter():
+    """
+    Ensure a plotter displaying the captured data is created and named after
+    the CSV file.
+    """
+    w = mu.interface.main.Window()
+    w.add_plotter = mock.MagicMock()
+    mock_plotter = mock.MagicMock()
+    mock_plotter_class = mock.MagicMock(return_value=mock_plotter)
+    data = mock.MagicMock()
+    with mock.patch('mu.interface.plotter.PlotterPane', mock_plotter_class):
+        w.add_data_capture_plotter("foo/bar.csv", data)
+    mock_plotter.load_capture.assert_called_once_with(data)
+    w.add_plotter.assert_called_once_with(mock_plotter, 'bar.csv')
+
+
 def test_Window_add_jupyter_repl():
     """
     Ensure the expected object is instantiated and add_repl is called for a
@@ -794,7 +1037,7 @@ def test_Window_add_jupyter_repl():
     mock_kernel_client = mock.MagicMock()
     mock_pane = mock.MagicMock()
     mock_pane_class = mock.MagicMock(return_value=mock_pane)
-    with mock.patch('mu.interface.main.JupyterREPLPane', mock_pane_class):
+    with mock.patch('mu.interface.jupyter.JupyterREPLPane', mock_pane_class):
         w.add_jupyter_repl(mock_kernel_manager, mock_kernel_client)
     mock_pane_class.assert_called_once_with()
     assert mock_pane.kernel_manager == mock_kernel_manager
@@ -882,14 +1125,24 @@ def test_Window_add_debug_inspector():
     mock_model_class = mock.MagicMock(return_value=mock_model)
     mock_dock = mock.MagicMock()
     mock_dock_class = mock.MagicMock(return_value=mock_dock)
+    on_expand = mock.MagicMock()
+    on_add_watch = mock.MagicMock()
+    on_remove_watch = mock.MagicMock()
     with mock.patch('mu.interface.main.DebugInspector',
                     mock_debug_inspector_class), \
-            mock.patch('mu.interface.main.QStandardItemModel',
+            mock.patch('mu.interface.main.DebugInspectorModel',
                        mock_model_class), \
             mock.patch('mu.interface.main.QDockWidget', mock_dock_class):
-        w.add_debug_inspector()
+        w.add_debug_inspector(on_expand, on_add_watch, on_remove_watch)
     assert w.debug_inspector == mock_debug_inspector
     assert w.debug_model == mock_model
+    mock_model.fetch_children.connect.assert_called_once_with(on_expand)
+    mock_debug_inspector.add_watch.connect.\
+        assert_called_once_with(on_add_watch)
+    mock_debug_inspector.remove_watch.connect.\
+        assert_called_once_with(on_remove_watch)
+    mock_debug_inspector.activated.connect.\
+        assert_called_once_with(mock_model.fetch_more_at)
     mock_debug_inspector.setModel.assert_called_once_with(mock_model)
     mock_dock.setWidget.assert_called_once_with(mock_debug_inspector)
     w.addDockWidget.assert_called_once_with(Qt.RightDockWidgetArea, mock_dock)
@@ -897,50 +1150,27 @@ def test_Window_add_debug_inspector():
 
 def test_Window_update_debug_inspector():
     """
-    Given a representation of the local objects in the debug runner's call
-    stack. Ensure the debug inspector's model is populated in the correct way
-    to show the different types of value.
-    """
-    locals_dict = {
-        '__builtins__': ['some', 'builtin', 'methods', ],
-        '__debug_code__': '<debug code details>',
-        '__debug_script__': '<debug script details',
-        '__file__': "'/path/to/script.py'",
-        '__name__': "'__main__'",
-        'foo': "'hello'",
-        'bar': "['this', 'is', 'a', 'list']",
-        'baz': "{'this': 'is', 'a': 'dict'}",
-    }
+    Ensure the summaries of the locals in the debug runner's call stack are
+    passed to the debug inspector's model.
+    """
     w = mu.interface.main.Window()
     w.debug_model = mock.MagicMock()
-    mock_standard_item = mock.MagicMock()
-    with mock.patch('mu.interface.main.DebugInspectorItem',
-                    mock_standard_item):
-        w.update_debug_inspector(locals_dict)
-    w.debug_model.clear.assert_called_once_with()
-    w.debug_model.setHorizontalHeaderLabels(['Name', 'Value', ])
-    # You just have to believe this is correct. I checked! :-)
-    assert mock_standard_item.call_count == 22
+    locals_dict = {'foo': {'repr': "'hello'"}}
+    watches = [{'name': 'foo * 2', 'repr': "'hellohello'"}]
+    w.update_debug_inspector(locals_dict, watches)
+    w.debug_model.set_variables.assert_called_once_with(locals_dict, watches)
 
 
-def test_Window_update_debug_inspector_with_exception():
+def test_Window_expand_debug_inspector():
     """
-    If an exception is encountered when working out the type of the value,
-    make sure it just reverts to the repr of the object.
+    Ensure the children of a variable are passed to the debug inspector's
+    model.
     """
-    locals_dict = {
-        'bar': "['this', 'is', 'a', 'list']",
-    }
     w = mu.interface.main.Window()
     w.debug_model = mock.MagicMock()
-    mock_standard_item = mock.MagicMock()
-    mock_eval = mock.MagicMock(side_effect=Exception('BOOM!'))
-    with mock.patch(
-        'mu.interface.main.DebugInspectorItem', mock_standard_item), \
-            mock.patch('builtins.eval', mock_eval):
-        w.update_debug_inspector(locals_dict)
-    # You just have to believe this is correct. I checked! :-)
-    assert mock_standard_item.call_count == 2
+    w.expand_debug_inspector(0, ['bar'], [], 2, 100)
+    w.debug_model.set_children.assert_called_once_with(0, ['bar'], [], 2,
+                                                       100)
 
 
 def test_Window_remove_filesystem():
@@ -1038,6 +1268,48 @@ def test_Window_remove_python_runner():
     assert w.runner is None
 
 
+def test_Window_add_profiler():
+    """
+    Ensure the table of profile results is created and displayed, replacing
+    any existing one.
+    """
+    w = mu.interface.main.Window()
+    w.connect_zoom = mock.MagicMock()
+    w.addDockWidget = mock.MagicMock()
+    w.remove_profiler = mock.MagicMock()
+    mock_pane = mock.MagicMock()
+    mock_dock = mock.MagicMock()
+    entries = [{'function': 'foo'}, ]
+    with mock.patch('mu.interface.main.ProfilerPane',
+                    return_value=mock_pane), \
+            mock.patch('mu.interface.main.QDockWidget',
+                       return_value=mock_dock):
+        w.add_profiler(entries)
+    w.remove_profiler.assert_called_once_with()
+    mock_pane.set_entries.assert_called_once_with(entries)
+    assert w.profiler_pane == mock_pane
+    assert w.profiler == mock_dock
+    mock_dock.setWidget.assert_called_once_with(mock_pane)
+    w.addDockWidget.assert_called_once_with(Qt.BottomDockWidgetArea, mock_dock)
+    w.connect_zoom.assert_called_once_with(mock_pane)
+
+
+def test_Window_remove_profiler():
+    """
+    Check the table of profile results is removed, if there is one.
+    """
+    w = mu.interface.main.Window()
+    w.remove_profiler()  # Nothing to remove.
+    mock_dock = mock.MagicMock()
+    w.profiler = mock_dock
+    w.profiler_pane = mock.MagicMock()
+    w.remove_profiler()
+    assert w.profiler is None
+    assert w.profiler_pane is None
+    mock_dock.setParent.assert_called_once_with(None)
+    mock_dock.deleteLater.assert_called_once_with()
+
+
 def test_Window_remove_debug_inspector():
     """
     Check all the necessary calls to remove / reset the debug inspector are
@@ -1058,6 +1330,50 @@ def test_Window_remove_debug_inspector():
     mock_inspector.deleteLater.assert_called_once_with()
 
 
+def test_Window_set_theme_unchanged():
+    """
+    If the theme hasn't changed, the stylesheet isn't loaded again and the
+    tabs and panes (styled as they're added) aren't styled again.
+    """
+    w = mu.interface.main.Window()
+    w.theme = 'night'
+    w.loaded_theme = 'night'
+    w.tabs = mock.MagicMock()
+    w.tabs.count = mock.MagicMock(return_value=1)
+    tab = mock.MagicMock()
+    w.tabs.widget = mock.MagicMock(return_value=tab)
+    w.button_bar = mock.MagicMock()
+    w.button_bar.slots = {'theme': mock.MagicMock()}
+    w.repl = mock.MagicMock()
+    w.repl_pane = mock.MagicMock()
+    w.load_theme = mock.MagicMock()
+    w.set_theme('night')
+    assert w.load_theme.emit.call_count == 0
+    assert tab.set_theme.call_count == 0
+    assert w.repl_pane.set_theme.call_count == 0
+    assert w.button_bar.slots['theme'].setIcon.call_count == 1
+
+
+def test_Window_set_theme_first_load():
+    """
+    The stylesheet is loaded the first time the theme is set, even if the
+    theme is that the tabs were styled with as they were added.
+    """
+    w = mu.interface.main.Window()
+    w.theme = 'day'
+    w.tabs = mock.MagicMock()
+    w.tabs.count = mock.MagicMock(return_value=1)
+    tab = mock.MagicMock()
+    w.tabs.widget = mock.MagicMock(return_value=tab)
+    w.button_bar = mock.MagicMock()
+    w.button_bar.slots = {'theme': mock.MagicMock()}
+    w.load_theme = mock.MagicMock()
+    w.set_theme('day')
+    w.load_theme.emit.assert_called_once_with('day')
+    assert w.loaded_theme == 'day'
+    assert tab.set_theme.call_count == 0
+
+
 def test_Window_set_theme():
     """
     Check the theme is correctly applied to the window.
@@ -1550,6 +1866,38 @@ def test_Window_show_find_replace():
     assert result == ('foo', 'bar', True)
 
 
+def test_Window_show_breakpoint_options():
+    """
+    The breakpoint options dialog is setup with the right arguments and, if
+    successfully closed, returns the expected result.
+    """
+    window = mu.interface.main.Window()
+    mock_dialog = mock.MagicMock()
+    mock_dialog.exec.return_value = True
+    mock_dialog.condition.return_value = 'x > 1'
+    mock_dialog.hit_count.return_value = 5
+    mock_dialog.log_message.return_value = None
+    mock_BODialog = mock.MagicMock(return_value=mock_dialog)
+    with mock.patch('mu.interface.main.BreakpointOptionsDialog',
+                    mock_BODialog):
+        result = window.show_breakpoint_options('x', None, None)
+    mock_dialog.setup.assert_called_once_with('x', None, None)
+    assert result == ('x > 1', 5, None)
+
+
+def test_Window_show_breakpoint_options_cancelled():
+    """
+    If the breakpoint options dialog is cancelled, return None.
+    """
+    window = mu.interface.main.Window()
+    mock_dialog = mock.MagicMock()
+    mock_dialog.exec.return_value = False
+    mock_BODialog = mock.MagicMock(return_value=mock_dialog)
+    with mock.patch('mu.interface.main.BreakpointOptionsDialog',
+                    mock_BODialog):
+        assert window.show_breakpoint_options(None, None, None) is None
+
+
 def test_Window_replace_text_not_current_tab():
     """
     If there is currently no open tab in which to search, return 0 (to indicate
@@ -3,16 +3,17 @@
 Tests for the user interface elements of Mu.
 """
 from PyQt5.QtWidgets import QApplication, QMessageBox, QLabel
-from PyQt5.QtChart import QChart, QLineSeries, QValueAxis
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QModelIndex
+from PyQt5.QtTest import QAbstractItemModelTester
 from PyQt5.QtGui import QTextCursor
 from unittest import mock
 import sys
 import os
+import json
 import signal
+import time
 import mu
 import platform
-from collections import deque
 import mu.interface.panes
 
 # Required so the QWidget tests don't abort with the message:
@@ -843,97 +844,6 @@ def test_FileSystemPane_zoom_out():
     fsp.set_font_size.assert_called_once_with(expected)
 
 
-def test_JupyterREPLPane_init():
-    """
-    Ensure the widget is setup with the correct defaults.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    assert jw.console_height == 10
-
-
-def test_JupyterREPLPane_append_plain_text():
-    """
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.on_append_text = mock.MagicMock()
-    jw._append_plain_text('hello')
-    jw.on_append_text.emit.assert_called_once_with('hello'.encode('utf-8'))
-
-
-def test_JupyterREPLPane_set_font_size():
-    """
-    Check the correct stylesheet values are being set.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.setStyleSheet = mock.MagicMock()
-    jw.set_font_size(16)
-    style = jw.setStyleSheet.call_args[0][0]
-    assert 'font-size: 16pt;' in style
-    assert 'font-family: Monospace;' in style
-
-
-def test_JupyterREPLPane_zoomIn():
-    """
-    Ensure zooming in increases the font size.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.set_font_size = mock.MagicMock()
-    old_size = jw.font.pointSize()
-    jw.zoomIn(delta=4)
-    jw.set_font_size.assert_called_once_with(old_size + 4)
-
-
-def test_JupyterREPLPane_zoomOut():
-    """
-    Ensure zooming out decreases the font size.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.set_font_size = mock.MagicMock()
-    old_size = jw.font.pointSize()
-    jw.zoomOut(delta=4)
-    jw.set_font_size.assert_called_once_with(old_size - 4)
-
-
-def test_JupyterREPLPane_set_theme_day():
-    """
-    Make sure the theme is correctly set for day.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.set_default_style = mock.MagicMock()
-    jw.set_theme('day')
-    jw.set_default_style.assert_called_once_with()
-
-
-def test_JupyterREPLPane_set_theme_night():
-    """
-    Make sure the theme is correctly set for night.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.set_default_style = mock.MagicMock()
-    jw.set_theme('night')
-    jw.set_default_style.assert_called_once_with(colors='nocolor')
-
-
-def test_JupyterREPLPane_set_theme_contrast():
-    """
-    Make sure the theme is correctly set for high contrast.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw.set_default_style = mock.MagicMock()
-    jw.set_theme('contrast')
-    jw.set_default_style.assert_called_once_with(colors='nocolor')
-
-
-def test_JupyterREPLPane_setFocus():
-    """
-    Ensures setFocus actually occurs to the _control containing the REPL.
-    """
-    jw = mu.interface.panes.JupyterREPLPane()
-    jw._control = mock.MagicMock()
-    jw.setFocus()
-    jw._control.setFocus.assert_called_once_with()
-
-
 def test_PythonProcessPane_init():
     """
     Check the font and input_buffer is set.
@@ -1011,6 +921,7 @@ def test_PythonProcessPane_start_process_debugger():
     expected_script = os.path.abspath(os.path.normcase('script.py'))
     expected_args = [runner, expected_script, 'foo', 'bar', ]
     ppp.process.start.assert_called_once_with(python_exec, expected_args)
+    assert ppp.handshake == b''  # Waiting for the runner's port.
 
 
 def test_PythonProcessPane_start_process_not_interactive():
@@ -1134,6 +1045,253 @@ def test_PythonProcessPane_start_process_custom_python_args():
     ppp.process.start.assert_called_once_with(runner, expected_args)
 
 
+def test_PythonProcessPane_start_process_warm_interpreter():
+    """
+    Ensure that a pre-warmed interpreter is told which script to run, and
+    where and how to run it, rather than a new process being started.
+    """
+    mock_process = mock.MagicMock()
+    mock_process_class = mock.MagicMock()
+    with mock.patch('mu.interface.panes.QProcess', mock_process_class):
+        ppp = mu.interface.panes.PythonProcessPane()
+        ppp.start_process('script.py', 'workspace', command_args=['foo'],
+                          envars=[['name', 'value']], process=mock_process)
+    assert mock_process_class.call_count == 0
+    assert ppp.process == mock_process
+    assert ppp.running is True
+    mock_process.setParent.assert_called_once_with(ppp)
+    mock_process.readyRead.connect.\
+        assert_called_once_with(ppp.read_from_stdout)
+    mock_process.finished.connect.assert_called_once_with(ppp.finished)
+    request = mock_process.write.call_args[0][0]
+    assert request.endswith(b'\n')
+    assert json.loads(request.decode('utf-8')) == {
+        'script': os.path.abspath(os.path.normcase('script.py')),
+        'cwd': 'workspace',
+        'args': ['foo'],
+        'envars': {'name': 'value'},
+    }
+
+
+def test_PythonProcessPane_read_from_stdout_first_output():
+    """
+    Ensure the first output from the process is signalled once.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.process = mock.MagicMock()
+    ppp.process.readAll().data.return_value = b'hello'
+    ppp.first_output = mock.MagicMock()
+    ppp.awaiting_output = True
+    ppp.read_from_stdout()
+    ppp.read_from_stdout()
+    ppp.first_output.emit.assert_called_once_with()
+    assert ppp.awaiting_output is False
+
+
+def test_InterpreterPool_fill():
+    """
+    Ensure the pool starts enough interpreters, running the bootstrap script
+    with the modules to be imported.
+    """
+    mock_process_class = mock.MagicMock()
+    mock_env = mock.MagicMock()
+    with mock.patch('mu.interface.panes.QProcess', mock_process_class), \
+            mock.patch('mu.interface.panes.python_environment',
+                       return_value=mock_env):
+        pool = mu.interface.panes.InterpreterPool(
+            2, modules=['turtle'], working_directory='/bar',
+            envars=[['name', 'value']])
+        pool.fill()
+        pool.fill()
+    assert mock_process_class.call_count == 2
+    assert len(pool.idle) == 2
+    # Started as the script will be run, since imports may depend on it.
+    mock_env.insert.assert_called_with('name', 'value')
+    pool.idle[0].setProcessEnvironment.assert_called_with(mock_env)
+    pool.idle[0].setWorkingDirectory.assert_called_with('/bar')
+    args = pool.idle[0].start.call_args[0]
+    assert args[0] == sys.executable
+    assert args[1][0] == '-i'
+    assert args[1][1].endswith('mu-warm.py')
+    assert os.path.isfile(args[1][1])
+    assert args[1][2:] == ['turtle']
+
+
+def test_InterpreterPool_discard():
+    """
+    Ensure an idle interpreter that finishes is removed from the pool.
+    """
+    pool = mu.interface.panes.InterpreterPool()
+    process = mock.MagicMock()
+    pool.idle = [process]
+    pool.discard(process)
+    assert pool.idle == []
+    pool.discard(process)  # Already discarded, so nothing happens.
+
+
+def test_InterpreterPool_take():
+    """
+    Ensure a running interpreter is handed out (skipping dead ones) and a
+    replacement is scheduled.
+    """
+    pool = mu.interface.panes.InterpreterPool(working_directory='/bar',
+                                              envars=[['name', 'value']])
+    pool.shadows_module = mock.MagicMock(return_value=False)
+    dead = mock.MagicMock()
+    dead.state.return_value = mu.interface.panes.QProcess.NotRunning
+    alive = mock.MagicMock()
+    alive.state.return_value = mu.interface.panes.QProcess.Running
+    pool.idle = [dead, alive]
+    with mock.patch('mu.interface.panes.QTimer') as mock_timer:
+        assert pool.take('/bar/foo.py', '/bar', [['name', 'value']]) == alive
+        mock_timer.singleShot.assert_called_once_with(
+            mu.interface.panes.POOL_REFILL_DELAY, pool.fill)
+        assert pool.idle == []
+        dead.deleteLater.assert_called_once_with()
+        alive.finished.disconnect.assert_called_once_with()
+        assert pool.take('/bar/foo.py', '/bar', [['name', 'value']]) is None
+
+
+def test_InterpreterPool_take_new_settings():
+    """
+    If the script is to be run in another working directory, or with other
+    environment variables, the idle interpreters are replaced by ones started
+    with them.
+    """
+    pool = mu.interface.panes.InterpreterPool(working_directory='/bar')
+    pool.shadows_module = mock.MagicMock(return_value=False)
+    process = mock.MagicMock()
+    pool.idle = [process]
+    with mock.patch('mu.interface.panes.QTimer') as mock_timer:
+        assert pool.take('/baz/foo.py', '/baz', [['name', 'value']]) is None
+    process.kill.assert_called_once_with()
+    assert pool.idle == []
+    assert pool.working_directory == '/baz'
+    assert pool.envars == [['name', 'value']]
+    mock_timer.singleShot.assert_called_once_with(
+        mu.interface.panes.POOL_REFILL_DELAY, pool.fill)
+
+
+def test_InterpreterPool_take_shadowed_module():
+    """
+    A script next to a module named like a warm module isn't run by the pool,
+    whose interpreters have already imported the other module.
+    """
+    pool = mu.interface.panes.InterpreterPool(working_directory='/bar')
+    pool.shadows_module = mock.MagicMock(return_value=True)
+    process = mock.MagicMock()
+    pool.idle = [process]
+    assert pool.take('/bar/foo.py', '/bar', []) is None
+    pool.shadows_module.assert_called_once_with('/bar/foo.py')
+    assert pool.idle == [process]
+
+
+def test_InterpreterPool_shadows_module(tmpdir):
+    """
+    Ensure modules and packages named like the warm modules are found next to
+    the script.
+    """
+    pool = mu.interface.panes.InterpreterPool(modules=['random', 'pgzero'])
+    script = tmpdir.join('foo.py')
+    script.write('')
+    assert not pool.shadows_module(str(script))
+    tmpdir.mkdir('pgzero')
+    assert not pool.shadows_module(str(script))  # Not a package.
+    tmpdir.join('pgzero', '__init__.py').write('')
+    assert pool.shadows_module(str(script))
+    tmpdir.join('pgzero', '__init__.py').remove()
+    tmpdir.join('random.py').write('')
+    assert pool.shadows_module(str(script))
+
+
+def test_InterpreterPool_shutdown():
+    """
+    Ensure all the idle interpreters are stopped.
+    """
+    pool = mu.interface.panes.InterpreterPool(3)
+    process = mock.MagicMock()
+    pool.idle = [process]
+    pool.shutdown()
+    process.kill.assert_called_once_with()
+    assert pool.idle == []
+    assert pool.size == 0
+
+
+def test_PythonProcessPane_stop_process():
+    """
+    Ensure the process is asked to terminate, is killed if it doesn't finish
+    in time, and is detached from the pane so stopping doesn't block.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    mock_process = mock.MagicMock()
+    mock_process.state.return_value = mu.interface.panes.QProcess.Running
+    ppp.process = mock_process
+    ppp.running = True
+    mock_timer = mock.MagicMock()
+    with mock.patch('mu.interface.panes.QTimer',
+                    return_value=mock_timer) as mock_timer_class:
+        ppp.stop_process()
+    assert ppp.process is None
+    assert ppp.running is False
+    mock_process.readyRead.disconnect.assert_called_once_with()
+    mock_process.finished.disconnect.assert_called_once_with()
+    mock_process.errorOccurred.disconnect.assert_called_once_with()
+    mock_process.setParent.assert_called_once_with(QApplication.instance())
+    mock_process.finished.connect.\
+        assert_called_once_with(mock_process.deleteLater)
+    mock_timer_class.assert_called_once_with(mock_process)
+    mock_timer.timeout.connect.assert_called_once_with(mock_process.kill)
+    mock_timer.start.\
+        assert_called_once_with(mu.interface.panes.STOP_TIMEOUT)
+    mock_process.terminate.assert_called_once_with()
+    assert mock_process.kill.call_count == 0
+
+
+def test_PythonProcessPane_stop_process_not_running():
+    """
+    If the process has already finished it's just cleaned up.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    mock_process = mock.MagicMock()
+    mock_process.state.return_value = mu.interface.panes.QProcess.NotRunning
+    mock_process.errorOccurred.disconnect.side_effect = TypeError('nothing')
+    ppp.process = mock_process
+    ppp.stop_process()
+    assert ppp.process is None
+    mock_process.deleteLater.assert_called_once_with()
+    assert mock_process.terminate.call_count == 0
+    ppp.stop_process()  # No process, so nothing happens.
+
+
+def test_PythonProcessPane_stop_process_hung():
+    """
+    Ensure a real process that ignores the request to terminate is killed,
+    without blocking.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    script = ('import signal, sys, time\n'
+              'signal.signal(signal.SIGTERM, signal.SIG_IGN)\n'
+              'print("ready", flush=True)\n'
+              'time.sleep(30)\n')
+    process = mu.interface.panes.QProcess()
+    process.start(sys.executable, ['-c', script])
+    assert process.waitForReadyRead(10000)
+    ppp.process = process
+    process.readyRead.connect(ppp.read_from_stdout)
+    process.finished.connect(ppp.finished)
+    finished = []
+    with mock.patch('mu.interface.panes.STOP_TIMEOUT', 100):
+        ppp.stop_process()
+    process.finished.connect(lambda *args: finished.append(args))
+    assert process.state() != mu.interface.panes.QProcess.NotRunning
+    # The kill is scheduled via the event loop.
+    deadline = time.monotonic() + 10
+    while not finished and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.01)
+    assert finished
+
+
 def test_PythonProcessPane_finished():
     """
     Check the functionality to handle the process finishing is correct.
@@ -1679,21 +1837,141 @@ def test_PythonProcessPane_history_forward_at_last_item():
 
 def test_PythonProcessPane_read_from_stdout():
     """
-    Ensure incoming bytes from sub-process's stout are processed correctly.
+    Ensure incoming bytes from sub-process's stout are processed correctly:
+    decoded, buffered to be displayed by flush_output and emitted to any
+    other interested party (such as the plotter).
     """
     ppp = mu.interface.panes.PythonProcessPane()
-    mock_cursor = mock.MagicMock()
-    mock_cursor.position.return_value = 123
-    ppp.textCursor = mock.MagicMock(return_value=mock_cursor)
-    ppp.append = mock.MagicMock()
+    ppp.flush_timer = mock.MagicMock()
+    ppp.flush_timer.isActive.return_value = False
     ppp.process = mock.MagicMock()
     ppp.process.readAll().data.return_value = b'hello world'
     ppp.on_append_text = mock.MagicMock()
     ppp.read_from_stdout()
-    assert ppp.append.call_count == 1
     assert ppp.process.readAll().data.call_count == 1
-    assert ppp.start_of_current_line == 123
+    assert ppp.output_buffer == ['hello world']
+    ppp.flush_timer.start.\
+        assert_called_once_with(mu.interface.panes.OUTPUT_FLUSH_INTERVAL)
     ppp.on_append_text.emit.assert_called_once_with(b'hello world')
+    # A pending flush isn't restarted by further output.
+    ppp.flush_timer.isActive.return_value = True
+    ppp.read_from_stdout()
+    assert ppp.output_buffer == ['hello world', 'hello world']
+    assert ppp.flush_timer.start.call_count == 1
+
+
+def test_PythonProcessPane_read_from_stdout_split_character():
+    """
+    Ensure a multi-byte character split between reads from stdout is decoded
+    once all its bytes have arrived.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.process = mock.MagicMock()
+    ppp.on_append_text = mock.MagicMock()
+    encoded = 'caf\u00e9'.encode('utf-8')
+    ppp.process.readAll().data.return_value = encoded[:-1]
+    ppp.read_from_stdout()
+    assert ppp.output_buffer == ['caf']
+    ppp.process.readAll().data.return_value = encoded[-1:]
+    ppp.read_from_stdout()
+    assert ppp.output_buffer == ['caf', '\u00e9']
+    ppp.flush_output()
+    assert ppp.toPlainText() == 'caf\u00e9'
+    assert ppp.start_of_current_line == 4
+
+
+def test_PythonProcessPane_read_from_stdout_handshake():
+    """
+    Ensure the port announced by the debug runner (even if split between
+    reads) is emitted rather than displayed, and the output after it is
+    displayed as usual.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.process = mock.MagicMock()
+    ppp.debugger_port = mock.MagicMock()
+    ppp.handshake = b''
+    ppp.process.readAll().data.return_value = b'mu-debugger-'
+    ppp.read_from_stdout()
+    assert ppp.output_buffer == []
+    assert ppp.debugger_port.emit.call_count == 0
+    ppp.process.readAll().data.return_value = b'port: 4321\nhello'
+    ppp.read_from_stdout()
+    ppp.debugger_port.emit.assert_called_once_with(4321)
+    assert ppp.handshake is None
+    assert ppp.output_buffer == ['hello']
+
+
+def test_PythonProcessPane_read_from_stdout_output_before_handshake():
+    """
+    Lines output by the debug runner before its port (such as warnings) are
+    displayed, and the port is still found.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.process = mock.MagicMock()
+    ppp.debugger_port = mock.MagicMock()
+    ppp.handshake = b''
+    ppp.process.readAll().data.return_value = b'Warning\nmu-debugger-'
+    ppp.read_from_stdout()
+    assert ppp.debugger_port.emit.call_count == 0
+    assert ppp.output_buffer == ['Warning\n']
+    ppp.process.readAll().data.return_value = b'port: 4321\r\nhello'
+    ppp.read_from_stdout()
+    ppp.debugger_port.emit.assert_called_once_with(4321)
+    assert ppp.handshake is None
+    assert ppp.output_buffer == ['Warning\n', 'hello']
+
+
+def test_PythonProcessPane_read_from_stdout_no_handshake():
+    """
+    If the debug runner fails before giving its port, its output is
+    displayed so the user can see what happened (including the last line,
+    once the runner has finished).
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.process = mock.MagicMock()
+    ppp.debugger_port = mock.MagicMock()
+    ppp.handshake = b''
+    ppp.process.readAll().data.return_value = b'Traceback\nError'
+    ppp.read_from_stdout()
+    assert ppp.debugger_port.emit.call_count == 0
+    assert ppp.output_buffer == ['Traceback\n']
+    ppp.finished(1, 0)
+    assert ppp.handshake is None
+    assert 'Traceback\nError' in ppp.toPlainText()
+
+
+def test_PythonProcessPane_flush_output():
+    """
+    Ensure buffered output is added to the end of the text area in one go.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    mock_cursor = mock.MagicMock()
+    mock_cursor.position.return_value = 123
+    ppp.textCursor = mock.MagicMock(return_value=mock_cursor)
+    ppp.setTextCursor = mock.MagicMock()
+    ppp.output_buffer = ['hello', ' world']
+    ppp.flush_output()
+    mock_cursor.insertText.assert_called_once_with('hello world')
+    ppp.setTextCursor.assert_called_once_with(mock_cursor)
+    assert ppp.output_buffer == []
+    assert ppp.start_of_current_line == 123
+    # Nothing to flush means nothing happens.
+    ppp.flush_output()
+    assert mock_cursor.insertText.call_count == 1
+
+
+def test_PythonProcessPane_finished_flushes_output():
+    """
+    Ensure pending output (including any incomplete character) is displayed
+    before the process is reported as finished.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.output_buffer = ['hello']
+    ppp.decoder.decode(b'\xe2\x82')
+    ppp.finished(0, 1)
+    text = ppp.toPlainText()
+    assert text.startswith('hello\ufffd')
+    assert text.index('hello') < text.index('FINISHED')
 
 
 def test_PythonProcessPane_write_to_stdin():
@@ -1720,6 +1998,17 @@ def test_PythonProcessPane_append():
     assert mock_cursor.movePosition.call_count == 2
 
 
+def test_PythonProcessPane_append_after_pending_output():
+    """
+    Ensure any output from the process still waiting to be displayed is added
+    before the appended text.
+    """
+    ppp = mu.interface.panes.PythonProcessPane()
+    ppp.output_buffer = ['hello ']
+    ppp.append(b'world')
+    assert ppp.toPlainText() == 'hello world'
+
+
 def test_PythonProcessPane_insert_within_input_line():
     """
     Ensure text is inserted at the end of the document if the current cursor
@@ -1900,10 +2189,303 @@ def test_PythonProcessPane_set_theme():
     ppp.set_theme('test')
 
 
-def test_DebugInspectorItem():
-    item = mu.interface.panes.DebugInspectorItem('test')
-    assert item.text() == 'test'
-    assert not item.isEditable()
+def test_ProfilerPane_set_entries():
+    """
+    Ensure the entries from the profiler are listed, most expensive first,
+    and numbers are sorted as numbers.
+    """
+    pp = mu.interface.panes.ProfilerPane()
+    entries = [
+        {'filename': '/foo/bar.py', 'line': 9, 'function': 'baz',
+         'calls': 10, 'own_time': 0.5, 'total_time': 1.5, 'percent': 75.0},
+        {'filename': '~', 'line': 0, 'function': '<built-in method sum>',
+         'calls': 2, 'own_time': 0.25, 'total_time': 0.25, 'percent': 12.5},
+        {'filename': '/foo/bar.py', 'line': 0, 'function': '<module>',
+         'calls': 1, 'own_time': 0.1, 'total_time': 2.0, 'percent': 100.0},
+    ]
+    pp.set_entries(entries)
+    assert pp.rowCount() == 3
+    assert pp.isSortingEnabled()
+    assert pp.item(0, 0).text() == '<module>'
+    assert pp.item(1, 0).text() == 'baz'
+    assert pp.item(1, 1).text() == 'bar.py'
+    assert pp.item(1, 2).data(Qt.DisplayRole) == 10  # One based.
+    assert pp.item(2, 1).text() == '~'
+    pp.sortItems(3)
+    assert [pp.item(i, 3).data(Qt.DisplayRole) for i in range(3)] == \
+        [1, 2, 10]
+
+
+def test_ProfilerPane_set_entries_limit():
+    """
+    Only the most expensive entries are listed.
+    """
+    pp = mu.interface.panes.ProfilerPane()
+    entry = {'filename': 'foo.py', 'line': 0, 'function': 'foo', 'calls': 1,
+             'own_time': 0, 'total_time': 0, 'percent': 0}
+    pp.set_entries([entry] * (mu.interface.panes.MAX_PROFILE_ENTRIES + 1))
+    assert pp.rowCount() == mu.interface.panes.MAX_PROFILE_ENTRIES
+
+
+def test_ProfilerPane_zoom():
+    """
+    Ensure zooming changes the font size within the expected bounds.
+    """
+    pp = mu.interface.panes.ProfilerPane()
+    pp.set_font_size = mock.MagicMock()
+    mock_font = mock.MagicMock()
+    mock_font.pointSize.return_value = 33
+    pp.font = mock.MagicMock(return_value=mock_font)
+    pp.zoomIn()
+    pp.set_font_size.assert_called_once_with(34)
+    pp.set_font_size.reset_mock()
+    mock_font.pointSize.return_value = 5
+    pp.zoomOut()
+    pp.set_font_size.assert_called_once_with(4)
+
+
+def summary(name, type_name, text, length=None, expandable=False, frame=0):
+    """
+    Return a summary of a variable as sent by the debug runner.
+    """
+    return {'name': name, 'type': type_name, 'repr': text, 'length': length,
+            'expandable': expandable, 'frame': frame}
+
+
+def inspector_model(checked=True):
+    """
+    Return a debug inspector model (checked for consistency as it's used,
+    although this also fetches children) and a list of the requests for
+    children it makes.
+    """
+    model = mu.interface.panes.DebugInspectorModel()
+    if checked:
+        model.tester = QAbstractItemModelTester(
+            model, QAbstractItemModelTester.FailureReportingMode.Fatal)
+    requests = []
+    model.fetch_children.connect(lambda *args: requests.append(args))
+    return model, requests
+
+
+def test_DebugVariable_value():
+    """
+    Ensure lists and dicts are described by their length and everything else
+    by its repr.
+    """
+    DebugVariable = mu.interface.panes.DebugVariable
+    node = DebugVariable(None, (0, 'x'), summary('x', 'list', '[1]', 1))
+    assert node.name == 'x'
+    assert node.value() == '(A list of 1 items.)'
+    node.summary = summary('x', 'dict', '{}', 0)
+    assert node.value() == '(A dict of 0 items.)'
+    node.summary = summary('x', 'str', "'hi'")
+    assert node.value() == "'hi'"
+
+
+def test_DebugInspectorModel_set_variables():
+    """
+    Ensure the variables are listed by name (excluding those of the
+    debugger) and those with children can be fetched.
+    """
+    model, requests = inspector_model(checked=False)
+    model.set_variables({
+        '__builtins__': summary('', 'module', "<module 'builtins'>"),
+        'foo': summary('', 'str', "'hello'"),
+        'bar': summary('', 'list', '[1, 2]', 2, True),
+    })
+    assert model.rowCount() == 2
+    assert model.columnCount() == 2
+    assert model.headerData(1, Qt.Horizontal) == 'Value'
+    bar = model.index(0, 0)
+    assert model.data(bar) == 'bar'
+    assert model.data(model.index(0, 1)) == '(A list of 2 items.)'
+    assert model.data(model.index(0, 1), Qt.ToolTipRole) == 'list'
+    assert model.data(model.index(1, 1)) == "'hello'"
+    assert model.hasChildren(bar)
+    assert not model.hasChildren(model.index(1, 0))
+    # Nothing is highlighted the first time.
+    assert model.data(model.index(1, 1), Qt.FontRole) is None
+    assert model.canFetchMore(bar)
+    assert not model.canFetchMore(model.index(1, 0))
+
+
+def test_DebugInspectorModel_set_variables_watches():
+    """
+    Ensure the values of the watch expressions are listed first, in the
+    order given, and are told apart from variables of the same name.
+    """
+    model, requests = inspector_model()
+    model.set_variables({
+        'x': summary('', 'int', '1'),
+    }, [
+        summary('x', 'int', '1'),
+        summary('a + 1', 'list', '[2]', 1, True),
+    ])
+    assert [model.data(model.index(i, 0)) for i in range(3)] == \
+        ['x', 'a + 1', 'x']
+    assert model.data(model.index(0, 0), Qt.FontRole).italic()
+    assert model.data(model.index(2, 0), Qt.FontRole) is None
+    watch_frame = mu.interface.panes.WATCH_FRAME
+    assert set(model.nodes) == {(watch_frame, 'x'), (watch_frame, 'a + 1'),
+                                (0, 'x')}
+    model.fetchMore(model.index(1, 0))
+    assert requests[-1] == (watch_frame, ['a + 1'], 0,
+                            mu.interface.panes.DEBUG_PAGE_SIZE)
+    x_node = model.node(model.index(2, 0))
+    model.set_variables({
+        'x': summary('', 'int', '2'),
+    }, [
+        summary('a + 1', 'list', '[2]', 1, True),
+    ])
+    assert [model.data(model.index(i, 0)) for i in range(2)] == \
+        ['a + 1', 'x']
+    assert model.node(model.index(1, 0)) is x_node
+    assert model.data(model.index(1, 1)) == '2'
+
+
+def test_DebugInspectorModel_set_variables_diff():
+    """
+    Ensure the model is updated in place with each step: unchanged rows stay
+    as they were, changed and new values are highlighted and old ones go.
+    """
+    model, requests = inspector_model()
+    model.set_variables({
+        'a': summary('', 'int', '1'),
+        'b': summary('', 'int', '2'),
+        'c': summary('', 'int', '3'),
+    })
+    persistent = model.index(0, 0)
+    a_node = model.node(persistent)
+    model.set_variables({
+        'a': summary('', 'int', '1'),
+        'c': summary('', 'int', '4'),
+        'd': summary('', 'int', '5', frame=1),
+    })
+    assert [model.data(model.index(i, 0)) for i in range(3)] == \
+        ['a', 'c', 'd']
+    assert model.node(model.index(0, 0)) is a_node
+    assert model.data(model.index(0, 1), Qt.FontRole) is None
+    assert model.data(model.index(1, 1)) == '4'
+    assert model.data(model.index(1, 1), Qt.FontRole).bold()
+    assert model.data(model.index(2, 1), Qt.ForegroundRole) is not None
+    assert set(model.nodes) == {(0, 'a'), (0, 'c'), (1, 'd')}
+    # The same name in another frame is another variable.
+    model.set_variables({
+        'a': summary('', 'int', '1', frame=2),
+    })
+    assert model.rowCount() == 1
+    assert model.node(model.index(0, 0)) is not a_node
+    assert set(model.nodes) == {(2, 'a')}
+
+
+def test_DebugInspectorModel_fetch_children():
+    """
+    Ensure the children of a variable are fetched a page at a time when
+    asked for, with a placeholder for the rest.
+    """
+    model, requests = inspector_model(checked=False)
+    model.set_variables({
+        'x': summary('', 'list', '[0, 1, ...]', 150, True),
+    })
+    x = model.index(0, 0)
+    del requests[:]
+    model.fetchMore(x)
+    assert requests == [(0, ['x'], 0, mu.interface.panes.DEBUG_PAGE_SIZE)]
+    assert not model.canFetchMore(x)  # Already asked.
+    children = [summary(str(i), 'int', str(i)) for i in range(100)]
+    model.set_children(0, ['x'], children, 50, 0)
+    assert model.rowCount(x) == 101
+    assert model.data(model.index(5, 1, x)) == '5'
+    placeholder = model.index(100, 0, x)
+    assert model.data(placeholder) == '...'
+    assert model.data(model.index(100, 1, x)) == '(50 more items.)'
+    assert not model.hasChildren(placeholder)
+    assert model.canFetchMore(x)
+    model.fetch_more_at(model.index(5, 0, x))  # Not the placeholder.
+    assert len(requests) == 1
+    model.fetch_more_at(placeholder)
+    assert requests[-1] == (0, ['x'], 100, mu.interface.panes.DEBUG_PAGE_SIZE)
+    more = [summary(str(i), 'int', str(i)) for i in range(100, 150)]
+    model.set_children(0, ['x'], more, 0, 100)
+    assert model.rowCount(x) == 150
+    assert model.data(model.index(149, 0, x)) == '149'
+    assert not model.canFetchMore(x)
+    assert (0, 'x', 149) in model.nodes
+    # Children for variables that are no longer shown are ignored.
+    model.set_children(0, ['y'], more, 0, 0)
+
+
+def test_DebugInspectorModel_refresh_children():
+    """
+    Ensure the children of expanded variables are asked for again with each
+    step and updated in place, highlighting the changes.
+    """
+    model, requests = inspector_model()
+    x_summary = summary('', 'list', '[[1], 2, 3]', 3, True)
+    model.set_variables({'x': x_summary})
+    x = model.index(0, 0)
+    model.fetchMore(x)
+    model.set_children(0, ['x'], [
+        summary('0', 'list', '[1]', 1, True),
+        summary('1', 'int', '2'),
+        summary('2', 'int', '3'),
+    ], 0, 0)
+    first = model.index(0, 0, x)
+    model.fetchMore(first)
+    model.set_children(0, ['x', 0], [summary('0', 'int', '1')], 0, 0)
+    del requests[:]
+    model.set_variables({'x': x_summary})
+    assert sorted(requests) == [(0, ['x'], 0, 100), (0, ['x', 0], 0, 100)]
+    model.set_children(0, ['x'], [
+        summary('0', 'str', "'a'"),
+        summary('1', 'int', '5'),
+    ], 0, 0)
+    assert model.rowCount(x) == 2
+    assert model.data(model.index(1, 1, x), Qt.FontRole).bold()
+    first = model.index(0, 0, x)
+    assert model.data(model.index(0, 1, x)) == "'a'"
+    # No longer expandable, so its children are gone.
+    assert model.rowCount(first) == 0
+    assert not model.canFetchMore(first)
+    assert (0, 'x', 0, 0) not in model.nodes
+    model.set_children(0, ['x', 0], [summary('0', 'int', '1')], 0, 0)
+    assert model.rowCount(first) == 0
+
+
+def test_DebugInspectorModel_refresh_children_replaced():
+    """
+    If a different child is found at a position when refreshing, it and those
+    after it are replaced.
+    """
+    model, requests = inspector_model()
+    model.set_variables({'d': summary('', 'dict', '{...}', 2, True)})
+    d = model.index(0, 0)
+    model.fetchMore(d)
+    model.set_children(0, ['d'], [
+        summary("'a'", 'int', '1'),
+        summary("'b'", 'int', '2'),
+    ], 0, 0)
+    old = model.node(model.index(1, 0, d))
+    model.set_variables({'d': summary('', 'dict', '{...}', 2, True)})
+    model.set_children(0, ['d'], [
+        summary("'a'", 'int', '1'),
+        summary("'c'", 'int', '2'),
+    ], 0, 0)
+    assert model.data(model.index(1, 0, d)) == "'c'"
+    assert model.node(model.index(1, 0, d)) is not old
+    assert model.data(model.index(0, 1, d), Qt.FontRole) is None
+    assert model.data(model.index(1, 1, d), Qt.FontRole).bold()
+
+
+def test_DebugInspectorModel_invalid_index():
+    """
+    Ensure invalid indexes are handled as Qt expects.
+    """
+    model, requests = inspector_model()
+    assert model.parent(QModelIndex()) == QModelIndex()
+    assert model.data(QModelIndex()) is None
+    assert not model.index(5, 0).isValid()
+    assert not model.canFetchMore(QModelIndex())
 
 
 def test_DebugInspector_set_font_size():
@@ -1948,211 +2530,53 @@ def test_DebugInspector_set_theme():
     di.set_theme('test')
 
 
-def test_PlotterPane_init():
-    """
-    Ensure the plotter pane is created in the expected manner.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    assert pp.input_buffer == []
-    assert pp.raw_data == []
-    assert pp.max_x == 100
-    assert pp.max_y == 1000
-    assert len(pp.data) == 1
-    assert isinstance(pp.data[0], deque)
-    assert len(pp.series) == 1
-    assert isinstance(pp.series[0], QLineSeries)
-    assert isinstance(pp.chart, QChart)
-    assert isinstance(pp.axis_x, QValueAxis)
-    assert isinstance(pp.axis_y, QValueAxis)
-
-
-def test_PlotterPane_process_bytes():
-    """
-    If a byte representation of a Python tuple containing numeric values,
-    starting at the beginning of a new line and terminating with a new line is
-    received, then the add_data method is called with the resulting Python
-    tuple.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.add_data = mock.MagicMock()
-    pp.process_bytes(b'(1, 2.3, 4)\r\n')
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
-
-
-def test_PlotterPane_process_bytes_guards_against_data_flood():
-    """
-    If the process_bytes method gets data of more than 1024 bytes then trigger
-    a data_flood signal and ensure the plotter no longer processes incoming
-    bytes.
-
-    (The assumption is that Mu will clean up once the data_flood signal is
-    emitted.)
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.data_flood = mock.MagicMock()
-    pp.add_data = mock.MagicMock()
-    data_flood = b'X' * 1025
-    pp.process_bytes(data_flood)
-    assert pp.flooded is True
-    pp.data_flood.emit.assert_called_once_with()
-    assert pp.add_data.call_count == 0
-    pp.process_bytes(data_flood)
-    assert pp.add_data.call_count == 0
-
-
-def test_PlotterPane_process_bytes_tuple_not_numeric():
-    """
-    If a byte representation of a tuple is received but it doesn't contain
-    numeric values, then the add_data method MUST NOT be called.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.add_data = mock.MagicMock()
-    pp.process_bytes(b'("a", "b", "c")\r\n')
-    assert pp.add_data.call_count == 0
-
-
-def test_PlotterPane_process_bytes_overrun_input_buffer():
+def test_DebugInspector_contextMenuEvent_add_watch():
     """
-    If the incoming bytes are not complete, ensure the input_buffer caches them
-    until the newline is detected.
+    Ensure the user can add a watch expression from the context menu.
     """
-    pp = mu.interface.panes.PlotterPane()
-    pp.add_data = mock.MagicMock()
-    pp.process_bytes(b'(1, 2.3, 4)\r\n')
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
-    pp.add_data.reset_mock()
-    pp.process_bytes(b'(1, 2.')
-    assert pp.add_data.call_count == 0
-    pp.process_bytes(b'3, 4)\r\n')
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
-    pp.add_data.reset_mock()
-    pp.process_bytes(b'(1, 2.3, 4)\r\n')
-    pp.add_data.assert_called_once_with((1, 2.3, 4))
-
-
-def test_PlotterPane_add_data():
-    """
-    Given a tuple with a single value, ensure it is logged and correctly added
-    to the chart.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    mock_line_series = mock.MagicMock()
-    pp.series = [mock_line_series, ]
-    pp.add_data((1, ))
-    assert (1, ) in pp.raw_data
-    mock_line_series.clear.assert_called_once_with()
-    for i in range(99):
-        mock_line_series.append.call_args_list[i][0] == (i, 0)
-    mock_line_series.append.call_args_list[99][0] == (99, 1)
-
-
-def test_PlotterPane_add_data_adjust_values_up():
-    """
-    If more values than have been encountered before are added to the incoming
-    data then increase the number of QLineSeries instances.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.series = [mock.MagicMock(), ]
-    pp.chart = mock.MagicMock()
-    with mock.patch('mu.interface.panes.QLineSeries'):
-        pp.add_data((1, 2, 3, 4))
-    assert len(pp.series) == 4
-    assert pp.chart.addSeries.call_count == 3
-    assert pp.chart.setAxisX.call_count == 3
-    assert pp.chart.setAxisY.call_count == 3
-    assert len(pp.data) == 4
-
-
-def test_PlotterPane_add_data_adjust_values_down():
-    """
-    If less values are encountered, before they are added to the incoming
-    data then decrease the number of QLineSeries instances.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.series = [mock.MagicMock(), mock.MagicMock(), mock.MagicMock()]
-    pp.data.append(mock.MagicMock())
-    pp.data.append(mock.MagicMock())
-    pp.chart = mock.MagicMock()
-    with mock.patch('mu.interface.panes.QLineSeries'):
-        pp.add_data((1, ))
-    assert len(pp.series) == 1
-    assert len(pp.data) == 1
-    assert pp.chart.removeSeries.call_count == 2
-
-
-def test_PlotterPane_add_data_re_scale_up():
-    """
-    If the y axis contains data greater than the current range, then ensure
-    the range is doubled.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.axis_y = mock.MagicMock()
-    mock_line_series = mock.MagicMock()
-    pp.series = [mock_line_series, ]
-    pp.add_data((1001, ))
-    assert pp.max_y == 2000
-    pp.axis_y.setRange.assert_called_once_with(-2000, 2000)
-
-
-def test_PlotterPane_add_data_re_scale_down():
-    """
-    If the y axis contains data less than half of the current range, then
-    ensure the range is halved.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.max_y = 4000
-    pp.axis_y = mock.MagicMock()
-    mock_line_series = mock.MagicMock()
-    pp.series = [mock_line_series, ]
-    pp.add_data((1999, ))
-    assert pp.max_y == 2000
-    pp.axis_y.setRange.assert_called_once_with(-2000, 2000)
-
-
-def test_PlotterPane_set_label_format_to_float_when_range_small():
-    """
-    If the max_y is 5 or less, make sure the label format is set to being a
-    float with two decimal places.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.max_y = 10
-    pp.axis_y = mock.MagicMock()
-    mock_line_series = mock.MagicMock()
-    pp.series = [mock_line_series, ]
-    pp.add_data((1, ))
-    assert pp.max_y == 1
-    pp.axis_y.setRange.assert_called_once_with(-1, 1)
-    pp.axis_y.setLabelFormat.assert_called_once_with("%2.2f")
-
-
-def test_PlotterPane_set_label_format_to_int_when_range_large():
-    """
-    If the max_y is 5 or less, make sure the label format is set to being a
-    float with two decimal places.
-    """
-    pp = mu.interface.panes.PlotterPane()
-    pp.max_y = 5
-    pp.axis_y = mock.MagicMock()
-    mock_line_series = mock.MagicMock()
-    pp.series = [mock_line_series, ]
-    pp.add_data((10, ))
-    assert pp.max_y == 10
-    pp.axis_y.setRange.assert_called_once_with(-10, 10)
-    pp.axis_y.setLabelFormat.assert_called_once_with("%d")
-
-
-def test_PlotterPane_set_theme():
-    """
-    Ensure the themes for the chart relate correctly to the theme names used
-    by Mu.
+    di = mu.interface.panes.DebugInspector()
+    di.setModel(mu.interface.panes.DebugInspectorModel())
+    di.indexAt = mock.MagicMock(return_value=QModelIndex())
+    di.mapToGlobal = mock.MagicMock()
+    di.add_watch = mock.MagicMock()
+    di.remove_watch = mock.MagicMock()
+    mock_menu = mock.MagicMock()
+    add_action = mock.MagicMock()
+    mock_menu.addAction.return_value = add_action
+    mock_menu.exec_.return_value = add_action
+    mock_dialog = mock.MagicMock()
+    mock_dialog.getText.return_value = (' x + 1 ', True)
+    with mock.patch('mu.interface.panes.QMenu', return_value=mock_menu), \
+            mock.patch('mu.interface.panes.QInputDialog', mock_dialog):
+        di.contextMenuEvent(mock.MagicMock())
+        # Nothing was clicked on, so nothing can be removed.
+        assert mock_menu.addAction.call_count == 1
+        mock_dialog.getText.return_value = ('x', False)
+        di.contextMenuEvent(mock.MagicMock())
+    di.add_watch.emit.assert_called_once_with('x + 1')
+    assert di.remove_watch.emit.call_count == 0
+
+
+def test_DebugInspector_contextMenuEvent_remove_watch():
+    """
+    Ensure the user can remove the watch expression they clicked on (but
+    not a variable).
     """
-    pp = mu.interface.panes.PlotterPane()
-    pp.chart = mock.MagicMock()
-    pp.set_theme('day')
-    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeLight)
-    pp.chart.setTheme.reset_mock()
-    pp.set_theme('night')
-    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeDark)
-    pp.chart.setTheme.reset_mock()
-    pp.set_theme('contrast')
-    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeHighContrast)
+    di = mu.interface.panes.DebugInspector()
+    model = mu.interface.panes.DebugInspectorModel()
+    model.set_variables({'y': summary('', 'int', '1')},
+                        [summary('x + 1', 'int', '2')])
+    di.setModel(model)
+    di.mapToGlobal = mock.MagicMock()
+    di.remove_watch = mock.MagicMock()
+    mock_menu = mock.MagicMock()
+    add_action = mock.MagicMock()
+    remove_action = mock.MagicMock()
+    mock_menu.addAction.side_effect = [add_action, remove_action, add_action]
+    mock_menu.exec_.return_value = remove_action
+    di.indexAt = mock.MagicMock(return_value=model.index(0, 1))
+    with mock.patch('mu.interface.panes.QMenu', return_value=mock_menu):
+        di.contextMenuEvent(mock.MagicMock())
+        di.indexAt.return_value = model.index(1, 1)
+        di.contextMenuEvent(mock.MagicMock())
+    di.remove_watch.emit.assert_called_once_with('x + 1')
@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the plotter pane.
+"""
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtChart import QChart, QLineSeries, QValueAxis
+from collections import deque
+from unittest import mock
+import numpy
+import mu.interface.plotter
+
+# Required so the QWidget tests don't abort with the message:
+# "QWidget: Must construct a QApplication before a QWidget"
+# The QApplication need only be instantiated once.
+app = QApplication([])
+
+
+def test_PlotterPane_init():
+    """
+    Ensure the plotter pane is created in the expected manner.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    assert pp.input_buffer == []
+    assert pp.raw_data == []
+    assert pp.max_x == 100
+    assert pp.max_y == 1000
+    assert len(pp.data) == 1
+    assert isinstance(pp.data[0], deque)
+    assert len(pp.series) == 1
+    assert isinstance(pp.series[0], QLineSeries)
+    assert isinstance(pp.chart, QChart)
+    assert isinstance(pp.axis_x, QValueAxis)
+    assert isinstance(pp.axis_y, QValueAxis)
+
+
+def test_PlotterPane_process_bytes():
+    """
+    If a byte representation of a Python tuple containing numeric values,
+    starting at the beginning of a new line and terminating with a new line is
+    received, then the add_data method is called with the resulting Python
+    tuple.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    pp.process_bytes(b'(1, 2.3, 4)\r\n')
+    pp.add_data.assert_called_once_with((1, 2.3, 4))
+
+
+def test_PlotterPane_process_bytes_guards_against_data_flood():
+    """
+    If the process_bytes method gets data of more than 1024 bytes then trigger
+    a data_flood signal and ensure the plotter no longer processes incoming
+    bytes.
+
+    (The assumption is that Mu will clean up once the data_flood signal is
+    emitted.)
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.data_flood = mock.MagicMock()
+    pp.add_data = mock.MagicMock()
+    data_flood = b'X' * 1025
+    pp.process_bytes(data_flood)
+    assert pp.flooded is True
+    pp.data_flood.emit.assert_called_once_with()
+    assert pp.add_data.call_count == 0
+    pp.process_bytes(data_flood)
+    assert pp.add_data.call_count == 0
+
+
+def test_PlotterPane_process_bytes_tuple_not_numeric():
+    """
+    If a byte representation of a tuple is received but it doesn't contain
+    numeric values, then the add_data method MUST NOT be called.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    pp.process_bytes(b'("a", "b", "c")\r\n')
+    assert pp.add_data.call_count == 0
+
+
+def test_PlotterPane_process_bytes_overrun_input_buffer():
+    """
+    If the incoming bytes are not complete, ensure the input_buffer caches them
+    until the newline is detected.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.add_data = mock.MagicMock()
+    pp.process_bytes(b'(1, 2.3, 4)\r\n')
+    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    pp.add_data.reset_mock()
+    pp.process_bytes(b'(1, 2.')
+    assert pp.add_data.call_count == 0
+    pp.process_bytes(b'3, 4)\r\n')
+    pp.add_data.assert_called_once_with((1, 2.3, 4))
+    pp.add_data.reset_mock()
+    pp.process_bytes(b'(1, 2.3, 4)\r\n')
+    pp.add_data.assert_called_once_with((1, 2.3, 4))
+
+
+def test_PlotterPane_add_data():
+    """
+    Given a tuple with a single value, ensure it is logged and correctly added
+    to the chart.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series, ]
+    pp.add_data((1, ))
+    assert (1, ) in pp.raw_data
+    mock_line_series.clear.assert_called_once_with()
+    for i in range(99):
+        mock_line_series.append.call_args_list[i][0] == (i, 0)
+    mock_line_series.append.call_args_list[99][0] == (99, 1)
+
+
+def test_PlotterPane_add_data_adjust_values_up():
+    """
+    If more values than have been encountered before are added to the incoming
+    data then increase the number of QLineSeries instances.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.series = [mock.MagicMock(), ]
+    pp.chart = mock.MagicMock()
+    with mock.patch('mu.interface.plotter.QLineSeries'):
+        pp.add_data((1, 2, 3, 4))
+    assert len(pp.series) == 4
+    assert pp.chart.addSeries.call_count == 3
+    assert pp.chart.setAxisX.call_count == 3
+    assert pp.chart.setAxisY.call_count == 3
+    assert len(pp.data) == 4
+
+
+def test_PlotterPane_add_data_adjust_values_down():
+    """
+    If less values are encountered, before they are added to the incoming
+    data then decrease the number of QLineSeries instances.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.series = [mock.MagicMock(), mock.MagicMock(), mock.MagicMock()]
+    pp.data.append(mock.MagicMock())
+    pp.data.append(mock.MagicMock())
+    pp.chart = mock.MagicMock()
+    with mock.patch('mu.interface.plotter.QLineSeries'):
+        pp.add_data((1, ))
+    assert len(pp.series) == 1
+    assert len(pp.data) == 1
+    assert pp.chart.removeSeries.call_count == 2
+
+
+def test_PlotterPane_add_data_re_scale_up():
+    """
+    If the y axis contains data greater than the current range, then ensure
+    the range is doubled.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.axis_y = mock.MagicMock()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series, ]
+    pp.add_data((1001, ))
+    assert pp.max_y == 2000
+    pp.axis_y.setRange.assert_called_once_with(-2000, 2000)
+
+
+def test_PlotterPane_add_data_re_scale_down():
+    """
+    If the y axis contains data less than half of the current range, then
+    ensure the range is halved.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.max_y = 4000
+    pp.axis_y = mock.MagicMock()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series, ]
+    pp.add_data((1999, ))
+    assert pp.max_y == 2000
+    pp.axis_y.setRange.assert_called_once_with(-2000, 2000)
+
+
+def test_PlotterPane_set_label_format_to_float_when_range_small():
+    """
+    If the max_y is 5 or less, make sure the label format is set to being a
+    float with two decimal places.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.max_y = 10
+    pp.axis_y = mock.MagicMock()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series, ]
+    pp.add_data((1, ))
+    assert pp.max_y == 1
+    pp.axis_y.setRange.assert_called_once_with(-1, 1)
+    pp.axis_y.setLabelFormat.assert_called_once_with("%2.2f")
+
+
+def test_PlotterPane_set_label_format_to_int_when_range_large():
+    """
+    If the max_y is 5 or less, make sure the label format is set to being a
+    float with two decimal places.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.max_y = 5
+    pp.axis_y = mock.MagicMock()
+    mock_line_series = mock.MagicMock()
+    pp.series = [mock_line_series, ]
+    pp.add_data((10, ))
+    assert pp.max_y == 10
+    pp.axis_y.setRange.assert_called_once_with(-10, 10)
+    pp.axis_y.setLabelFormat.assert_called_once_with("%d")
+
+
+def test_PlotterPane_set_theme():
+    """
+    Ensure the themes for the chart relate correctly to the theme names used
+    by Mu.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.chart = mock.MagicMock()
+    pp.set_theme('day')
+    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeLight)
+    pp.chart.setTheme.reset_mock()
+    pp.set_theme('night')
+    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeDark)
+    pp.chart.setTheme.reset_mock()
+    pp.set_theme('contrast')
+    pp.chart.setTheme.assert_called_once_with(QChart.ChartThemeHighContrast)
+
+
+def test_downsample_small():
+    """
+    Ensure short series are not downsampled, but NaN padding is dropped.
+    """
+    values = numpy.array([1.0, numpy.nan, 3.0])
+    points = mu.interface.plotter.downsample(values)
+    assert [(p.x(), p.y()) for p in points] == [(0, 1.0), (2, 3.0)]
+
+
+def test_downsample_keeps_extremes():
+    """
+    Ensure long series are reduced to the smallest and largest values in each
+    bucket, so spikes in the data remain visible.
+    """
+    values = numpy.zeros(1000)
+    values[123] = 99
+    values[789] = -99
+    points = mu.interface.plotter.downsample(values, buckets=10)
+    assert len(points) <= 20
+    ys = [p.y() for p in points]
+    assert 99 in ys
+    assert -99 in ys
+    assert (123, 99) in [(p.x(), p.y()) for p in points]
+
+
+def test_PlotterPane_load_capture():
+    """
+    Ensure a capture is displayed in its entirety with the expected number of
+    line series and scale.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    data = numpy.array([[1, 2, 3], [4, 5, 60], [7, 8, 9]], dtype=float)
+    pp.load_capture(data)
+    assert pp.capture is data
+    assert len(pp.series) == 3
+    assert len(pp.data) == 3
+    assert pp.series[2].count() == 3
+    assert pp.axis_x.max() == 2
+    assert pp.max_y == 100
+
+
+def test_PlotterPane_load_capture_huge_range():
+    """
+    Ensure the y axis grows to fit values beyond the largest known range.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.load_capture(numpy.array([[3000000.0]]))
+    assert pp.max_y >= 3000000
+
+
+def test_PlotterPane_start_replay_no_capture():
+    """
+    If there's no capture, replay does nothing.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.start_replay()
+    assert not pp.replay_timer.isActive()
+
+
+def test_PlotterPane_replay():
+    """
+    Ensure replaying a capture feeds the rows through the scrolling view of
+    the plotter, a batch of replay_speed rows at a time, until the capture
+    is exhausted.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    data = numpy.array([[1, 2], [3, numpy.nan], [5, 6]], dtype=float)
+    pp.load_capture(data)
+    pp.start_replay()
+    assert pp.replay_timer.isActive()
+    pp.set_replay_speed(2)
+    pp.update_series = mock.MagicMock()
+    pp.replay_step()
+    assert pp.replay_position == 2
+    assert len(pp.series) == 1  # The NaN padding was dropped.
+    assert pp.data[0][0] == 3
+    pp.update_series.assert_called_once_with()
+    pp.replay_step()
+    assert pp.replay_position == 0
+    assert len(pp.series) == 2
+    assert not pp.replay_timer.isActive()
+    assert pp.raw_data == []
+
+
+def test_PlotterPane_set_replay_speed():
+    """
+    Ensure the replay speed stays within sensible bounds.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.set_replay_speed(0)
+    assert pp.replay_speed == 1
+    pp.set_replay_speed(1000000)
+    assert pp.replay_speed == mu.interface.plotter.MAX_REPLAY_SPEED
+
+
+def test_PlotterPane_context_menu_no_capture():
+    """
+    Without a loaded capture there's no replay menu.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    mock_menu = mock.MagicMock()
+    mock_super = mock.MagicMock()
+    with mock.patch('mu.interface.plotter.QMenu', mock_menu), \
+            mock.patch('mu.interface.plotter.QChartView.contextMenuEvent',
+                       mock_super):
+        pp.contextMenuEvent(mock.MagicMock())
+    assert mock_menu.call_count == 0
+    assert mock_super.call_count == 1
+
+
+def test_PlotterPane_context_menu_replay():
+    """
+    Ensure the context menu for a capture starts, pauses and changes the
+    speed of the replay, and shows all the data again.
+    """
+    pp = mu.interface.plotter.PlotterPane()
+    pp.capture = numpy.array([[1.0]])
+    pp.start_replay = mock.MagicMock()
+    pp.stop_replay = mock.MagicMock()
+    pp.show_capture = mock.MagicMock()
+    pp.mapToGlobal = mock.MagicMock()
+    menu = mock.MagicMock()
+    replay, faster, slower, show = (mock.MagicMock() for i in range(4))
+    menu.addAction.side_effect = [replay, faster, slower, show] * 5
+    with mock.patch('mu.interface.plotter.QMenu', return_value=menu):
+        menu.exec_.return_value = replay
+        pp.contextMenuEvent(mock.MagicMock())
+        pp.start_replay.assert_called_once_with()
+        pp.replay_timer = mock.MagicMock()
+        pp.replay_timer.isActive.return_value = True
+        pp.contextMenuEvent(mock.MagicMock())
+        pp.stop_replay.assert_called_once_with()
+        menu.exec_.return_value = faster
+        pp.contextMenuEvent(mock.MagicMock())
+        assert pp.replay_speed == 2
+        menu.exec_.return_value = slower
+        pp.contextMenuEvent(mock.MagicMock())
+        assert pp.replay_speed == 1
+        menu.exec_.return_value = show
+        pp.contextMenuEvent(mock.MagicMock())
+        pp.show_capture.assert_called_once_with()
@@ -3,6 +3,7 @@
 Tests for the user interface elements of Mu.
 """
 from unittest import mock
+from PyQt5.QtGui import QFont
 import mu.interface.themes
 import mu.interface.editor
 
@@ -67,6 +68,7 @@ def test_Font_loading():
         mu.interface.themes.Font._DATABASE = None
         try:
             with mock.patch("mu.interface.themes.QFontDatabase") as db:
+                db.return_value.font.return_value = QFont()
                 mu.interface.themes.Font().load()
                 mu.interface.themes.Font(bold=True).load()
                 mu.interface.themes.Font(italic=True).load()
@@ -80,3 +82,44 @@ def test_Font_loading():
             mock.call('Source Code Pro', 'Italic', 14),
             mock.call('Source Code Pro', 'Semibold Italic', 14),
         ])
+
+
+def test_Font_load_cached():
+    """
+    Ensure each font is only looked up in the font database once, and that a
+    copy is returned so changing it doesn't affect the cached font.
+    """
+    mu.interface.themes.Font._DATABASE = None
+    try:
+        with mock.patch("mu.interface.themes.QFontDatabase") as db:
+            db.return_value.font.return_value = QFont("Source Code Pro", 14)
+            font = mu.interface.themes.Font().load()
+            font.setPointSize(20)
+            again = mu.interface.themes.Font(color='red').load()
+    finally:
+        mu.interface.themes.Font._DATABASE = None
+    assert db().font.call_count == 1
+    assert again.pointSize() == 14
+
+
+def test_theme_styles_shared():
+    """
+    Ensure the colours and fonts of a theme's styles are made once and shared
+    by the lexers the theme is applied to.
+    """
+    theme = mu.interface.themes.NightTheme
+    styles = theme.styles()
+    assert theme.styles() is styles
+    assert mu.interface.themes.DayTheme.styles() is not styles
+    names = [style[0] for style in styles]
+    assert 'Keyword' in names
+    name, color, paper, font = styles[names.index('Keyword')]
+    assert color.name() == '#73a46a'
+    assert paper.name() == '#222222'
+    lexer1 = mock.MagicMock()
+    lexer2 = mock.MagicMock()
+    theme.apply_to(lexer1)
+    theme.apply_to(lexer2)
+    colors1 = [c[0][0] for c in lexer1.setColor.call_args_list]
+    colors2 = [c[0][0] for c in lexer2.setColor.call_args_list]
+    assert all(c1 is c2 for c1, c2 in zip(colors1, colors2))
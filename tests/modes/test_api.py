@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the loading of the API definitions.
+"""
+from unittest import mock
+import mu.modes.api
+
+
+def test_load_api():
+    """
+    Ensure the untranslated API definitions are loaded on first use and then
+    reused.
+    """
+    with mock.patch('mu.modes.api._loaded', {}):
+        with mock.patch('mu.modes.api.resource_string',
+                        return_value=b'["foo(a) \\\\nDo foo."]') as rs:
+            assert mu.modes.api.load_api('foo') == ['foo(a) \\nDo foo.']
+            assert mu.modes.api.load_api('foo') == ['foo(a) \\nDo foo.']
+        rs.assert_called_once_with('mu.modes.api', 'foo.json')
+
+
+def test_load_api_stores():
+    """
+    Ensure the stores of the APIs used by the modes can be loaded.
+    """
+    for name in ('adafruit', 'microbit', 'pi', 'pygamezero', 'python3',
+                 'shared'):
+        api = mu.modes.api.load_api(name)
+        assert api
+        assert all(isinstance(entry, str) for entry in api)
+
+
+def test_load_apis():
+    """
+    Ensure the API definitions of the referenced APIs are concatenated.
+    """
+    apis = {'foo': ['foo()'], 'bar': ['bar()', 'baz()']}
+    with mock.patch('mu.modes.api.load_api', apis.get):
+        assert mu.modes.api.load_apis('foo', 'bar') == ['foo()', 'bar()',
+                                                        'baz()']
@@ -28,6 +28,20 @@ def test_base_mode():
     assert bm.builtins is None
 
 
+def test_base_mode_module_names():
+    """
+    Ensure the names of the importable modules are only scanned for when
+    first needed, and then reused.
+    """
+    bm = BaseMode(mock.MagicMock(), mock.MagicMock())
+    with mock.patch('mu.modes.base._module_names', None), \
+            mock.patch('mu.modes.base.pkgutil.iter_modules',
+                       return_value=[(None, 'foo', False)]) as iter_modules:
+        assert bm.module_names == {'foo', 'sys', 'builtins'}
+        assert bm.module_names == {'foo', 'sys', 'builtins'}
+    assert iter_modules.call_count == 1
+
+
 def test_base_mode_workspace_dir():
     """
     Return settings file workspace value.
@@ -166,6 +180,57 @@ def test_base_mode_remove_plotter():
         assert_called_once_with(view.plotter_pane.raw_data)
 
 
+def test_base_mode_remove_plotter_no_data():
+    """
+    Ensure no CSV file is written if no data was captured (for instance, if
+    an existing capture was being viewed).
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.plotter_pane.raw_data = []
+    bm = BaseMode(editor, view)
+    bm.plotter = mock.MagicMock()
+    mock_open = mock.mock_open()
+    with mock.patch('builtins.open', mock_open):
+        bm.remove_plotter()
+    assert bm.plotter is None
+    view.remove_plotter.assert_called_once_with()
+    assert mock_open.call_count == 0
+
+
+def test_base_mode_open_capture():
+    """
+    Ensure the captured data is read and displayed in a new plotter, replacing
+    any existing plotter.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    bm = BaseMode(editor, view)
+    bm.plotter = True
+    bm.remove_plotter = mock.MagicMock()
+    data = mock.MagicMock()
+    with mock.patch('mu.modes.base.read_data_capture', return_value=data):
+        bm.open_capture('foo.csv')
+    bm.remove_plotter.assert_called_once_with()
+    view.add_data_capture_plotter.assert_called_once_with('foo.csv', data)
+    assert bm.plotter is True
+
+
+def test_base_mode_open_capture_fails():
+    """
+    If the capture cannot be read, the user is told and no plotter is added.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    bm = BaseMode(editor, view)
+    with mock.patch('mu.modes.base.read_data_capture',
+                    side_effect=ValueError('bad')):
+        bm.open_capture('foo.csv')
+    assert view.show_message.call_count == 1
+    assert view.add_data_capture_plotter.call_count == 0
+    assert bm.plotter is None
+
+
 def test_base_on_data_flood():
     """
     Ensure the plotter is removed and a helpful message is displayed to the
@@ -207,7 +272,7 @@ def test_micropython_mode_find_device():
         mock_port.serialNumber = mock.MagicMock(return_value='12345')
         mock_os = mock.MagicMock()
         mock_os.name = 'nt'
-        with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+        with mock.patch('PyQt5.QtSerialPort.QSerialPortInfo.availablePorts',
                         return_value=[mock_port, ]), \
                 mock.patch('mu.modes.base.os', mock_os):
             assert mm.find_device() == ('COM0', '12345')
@@ -220,7 +285,7 @@ def test_micropython_mode_find_device_no_ports():
     editor = mock.MagicMock()
     view = mock.MagicMock()
     mm = MicroPythonMode(editor, view)
-    with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+    with mock.patch('PyQt5.QtSerialPort.QSerialPortInfo.availablePorts',
                     return_value=[]):
         assert mm.find_device() == (None, None)
 
@@ -236,7 +301,7 @@ def test_micropython_mode_find_device_but_no_device():
     mock_port.productIdentifier = mock.MagicMock(return_value=666)
     mock_port.vendorIdentifier = mock.MagicMock(return_value=999)
     mock_port.serialNumber = mock.MagicMock(return_value='123456')
-    with mock.patch('mu.modes.base.QSerialPortInfo.availablePorts',
+    with mock.patch('PyQt5.QtSerialPort.QSerialPortInfo.availablePorts',
                     return_value=[mock_port, ]):
         assert mm.find_device() == (None, None)
 
@@ -3,8 +3,10 @@
 Tests for the debug mode.
 """
 from mu.logic import DEBUGGER_PORT
+import mu.modes.debugger
 from mu.modes.debugger import DebugMode
 from unittest import mock
+from PyQt5.QtCore import QProcess
 
 
 def test_debug_mode():
@@ -25,17 +27,21 @@ def test_debug_mode():
     assert dm.api() == []
 
     actions = dm.actions()
-    assert len(actions) == 5
+    assert len(actions) == 7
     assert actions[0]['name'] == 'stop'
     assert actions[0]['handler'] == dm.button_stop
     assert actions[1]['name'] == 'run'
     assert actions[1]['handler'] == dm.button_continue
-    assert actions[2]['name'] == 'step-over'
-    assert actions[2]['handler'] == dm.button_step_over
-    assert actions[3]['name'] == 'step-in'
-    assert actions[3]['handler'] == dm.button_step_in
-    assert actions[4]['name'] == 'step-out'
-    assert actions[4]['handler'] == dm.button_step_out
+    assert actions[2]['name'] == 'pause'
+    assert actions[2]['handler'] == dm.button_pause
+    assert actions[3]['name'] == 'step-over'
+    assert actions[3]['handler'] == dm.button_step_over
+    assert actions[4]['name'] == 'step-in'
+    assert actions[4]['handler'] == dm.button_step_in
+    assert actions[5]['name'] == 'step-out'
+    assert actions[5]['handler'] == dm.button_step_out
+    assert actions[6]['name'] == 'step-back'
+    assert actions[6]['handler'] == dm.button_step_back
 
 
 def test_debug_start():
@@ -44,6 +50,7 @@ def test_debug_start():
     """
     editor = mock.MagicMock()
     editor.envars = [['name', 'value'], ]
+    editor.debug_recording = False
     view = mock.MagicMock()
     view.current_tab.path = '/foo'
     view.current_tab.isModified.return_value = True
@@ -53,24 +60,95 @@ def test_debug_start():
     mock_debugger_class = mock.MagicMock(return_value=mock_debugger)
     dm = DebugMode(editor, view)
     dm.workspace_dir = mock.MagicMock(return_value='/bar')
+    dm.set_buttons = mock.MagicMock()
+    mock_timer = mock.MagicMock()
     with mock.patch('builtins.open') as oa, \
             mock.patch('mu.modes.debugger.Debugger', mock_debugger_class), \
-            mock.patch('mu.modes.debugger.write_and_flush'):
+            mock.patch('mu.modes.debugger.write_and_flush'), \
+            mock.patch('mu.modes.debugger.QTimer',
+                       return_value=mock_timer):
         dm.start()
         oa.assert_called_once_with('/foo', 'w', newline='')
+    # Without recorded history there's nothing to step back through.
+    dm.set_buttons.assert_any_call(**{'step-back': False})
     view.add_python3_runner.assert_called_once_with('/foo', '/bar',
                                                     debugger=True,
                                                     envars=[['name', 'value']])
-    mock_runner.process.waitForStarted.assert_called_once_with()
     mock_runner.process.finished.connect.assert_called_once_with(dm.finished)
-    view.add_debug_inspector.assert_called_once_with()
+    mock_runner.process.errorOccurred.connect.\
+        assert_called_once_with(dm.on_process_error)
+    view.add_debug_inspector.assert_called_once_with(dm.expand_variable,
+                                                     dm.add_watch,
+                                                     dm.remove_watch)
     view.set_read_only.assert_called_once_with(True)
     mock_debugger_class.assert_called_once_with('localhost', DEBUGGER_PORT,
                                                 proc=mock_runner.process)
     assert dm.runner == mock_runner
     assert dm.debugger == mock_debugger
     assert mock_debugger.view == dm
-    mock_debugger.start.assert_called_once_with()
+    # The debugger client only starts once the runner says where it listens.
+    mock_runner.debugger_port.connect.\
+        assert_called_once_with(dm.on_debugger_port)
+    # ...which it must do in time.
+    assert dm.handshake_timer == mock_timer
+    mock_timer.timeout.connect.assert_called_once_with(
+        dm.on_handshake_timeout)
+    mock_timer.start.assert_called_once_with(
+        mu.modes.debugger.HANDSHAKE_TIMEOUT)
+
+
+def test_debug_on_debugger_port():
+    """
+    Ensure the debugger client connects to the port announced by the runner.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.on_debugger_port(1234)  # No debugger, so nothing happens.
+    dm.debugger = mock.MagicMock()
+    dm.handshake_timer = mock.MagicMock()
+    dm.on_debugger_port(1234)
+    assert dm.debugger.port == 1234
+    dm.debugger.start.assert_called_once_with()
+    dm.handshake_timer.stop.assert_called_once_with()
+
+
+def test_debug_on_handshake_timeout():
+    """
+    If the runner doesn't give its port in time, the user is told and the
+    debugger is stopped.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.stop = mock.MagicMock()
+    dm.runner = mock.MagicMock()
+    dm.runner.toPlainText.return_value = 'Hello'
+    dm.on_handshake_timeout()
+    dm.stop.assert_called_once_with()
+    msg = ('The debugger took too long to start. Is your machine slow or '
+           "busy? Free up some of the machine's resources and try again.")
+    view.show_message.assert_called_once_with('Could not start the '
+                                              'debugger.', msg)
+
+
+def test_debug_finished_without_handshake():
+    """
+    If the runner finishes before giving its port, the user is told and the
+    debugger is stopped (rather than waiting for the timeout).
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.stop = mock.MagicMock()
+    dm.set_buttons = mock.MagicMock()
+    dm.runner = mock.MagicMock()
+    dm.handshake_timer = mock.MagicMock()
+    dm.handshake_timer.isActive.return_value = True
+    dm.finished()
+    dm.stop.assert_called_once_with()
+    assert view.show_message.call_count == 1
+    assert dm.set_buttons.call_count == 0
 
 
 def test_debug_start_no_tab():
@@ -110,11 +188,14 @@ def test_debug_stop():
     dm = DebugMode(editor, view)
     mock_runner = mock.MagicMock()
     dm.runner = mock_runner
+    mock_timer = mock.MagicMock()
+    dm.handshake_timer = mock_timer
     dm.stop()
+    mock_timer.stop.assert_called_once_with()
+    assert dm.handshake_timer is None
     assert dm.runner is None
     assert dm.debugger is None
-    mock_runner.process.kill.assert_called_once_with()
-    mock_runner.process.waitForFinished.assert_called_once_with()
+    mock_runner.stop_process.assert_called_once_with()
     view.remove_python_runner.assert_called_once_with()
     view.remove_debug_inspector.assert_called_once_with()
     editor.change_mode.assert_called_once_with('python')
@@ -122,6 +203,23 @@ def test_debug_stop():
     view.set_read_only.assert_called_once_with(False)
 
 
+def test_debug_on_process_error():
+    """
+    If the debug runner fails to start, the user is told and the debugger is
+    stopped.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.stop = mock.MagicMock()
+    dm.runner = mock.MagicMock()
+    dm.on_process_error(QProcess.Crashed)
+    assert dm.stop.call_count == 0
+    dm.on_process_error(QProcess.FailedToStart)
+    dm.stop.assert_called_once_with()
+    assert view.show_message.call_count == 1
+
+
 def test_debug_finished():
     """
     Ensure the end-state of the mode is enacted when the running script has
@@ -231,6 +329,31 @@ def test_debug_button_step_out():
     assert view.current_tab.reset_debugger_highlight.call_count == 1
 
 
+def test_debug_button_pause():
+    """
+    Ensure the do_pause method is called when the pause button is clicked.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    dm.button_pause(None)
+    dm.debugger.do_pause.assert_called_once_with()
+
+
+def test_debug_button_step_back():
+    """
+    Ensure the do_back method is called when the step-back button is clicked.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    dm.button_step_back(None)
+    dm.debugger.do_back.assert_called_once_with()
+    assert view.current_tab.reset_debugger_highlight.call_count == 1
+
+
 def test_debug_toggle_breakpoint_off():
     """
     If a breakpoint is on, it's toggled off.
@@ -322,6 +445,65 @@ def test_debug_toggle_breakpoint_on_existing():
     dm.debugger.create_breakpoint.assert_called_once_with(mock_tab.path, 1)
 
 
+def test_debug_set_breakpoint_options_new():
+    """
+    If there's no breakpoint on the line, one is created with the options.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    dm.debugger.breakpoints.return_value = {}
+    mock_tab = mock.MagicMock()
+    mock_tab.path = 'foo'
+    mock_tab.markersAtLine.return_value = False
+    mock_tab.markerAdd.return_value = 999
+    mock_tab.breakpoint_handles = set()
+    dm.set_breakpoint_options(0, mock_tab, 'x', 2, None)
+    assert 999 in mock_tab.breakpoint_handles
+    dm.debugger.create_breakpoint.assert_called_once_with(
+        'foo', 1, condition='x', hit_count=2, log_message=None)
+
+
+def test_debug_set_breakpoint_options_existing():
+    """
+    If there's already a breakpoint on the line, its options are set.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    mock_breakpoint = mock.MagicMock()
+    dm.debugger.breakpoints.return_value = {1: mock_breakpoint}
+    mock_tab = mock.MagicMock()
+    mock_tab.markersAtLine.return_value = True
+    dm.set_breakpoint_options(0, mock_tab, None, None, 'x is {x}')
+    assert mock_tab.markerAdd.call_count == 0
+    assert dm.debugger.enable_breakpoint.call_count == 0
+    dm.debugger.set_breakpoint_options.assert_called_once_with(
+        mock_breakpoint, None, None, 'x is {x}')
+
+
+def test_debug_set_breakpoint_options_disabled():
+    """
+    If the breakpoint on the line was toggled off, it's enabled again.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    mock_breakpoint = mock.MagicMock()
+    dm.debugger.breakpoints.return_value = {1: mock_breakpoint}
+    mock_tab = mock.MagicMock()
+    mock_tab.markersAtLine.return_value = False
+    mock_tab.breakpoint_handles = set()
+    dm.set_breakpoint_options(0, mock_tab, 'x', None, None)
+    mock_tab.markerAdd.assert_called_once_with(0, mock_tab.BREAKPOINT_MARKER)
+    dm.debugger.enable_breakpoint.assert_called_once_with(mock_breakpoint)
+    dm.debugger.set_breakpoint_options.assert_called_once_with(
+        mock_breakpoint, 'x', None, None)
+
+
 def test_debug_on_fail():
     """
     Ensure an appropriate message is shown to the user and the UI is put into
@@ -357,6 +539,61 @@ def test_debug_on_bootstrap():
     dm.debugger.do_run.assert_called_once_with()
 
 
+def test_debug_on_bootstrap_with_options():
+    """
+    Ensure breakpoints are set with the options remembered by the tab.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    mock_tab = mock.MagicMock()
+    mock_tab.path = 'foo'
+    mock_tab.text.return_value = "print('Hello')"
+    mock_tab.breakpoint_handles = set([0, ])
+    mock_tab.breakpoint_options = {
+        0: {'condition': 'x', 'hit_count': 2, 'log_message': None},
+    }
+    mock_tab.markerLine.return_value = 0
+    view.widgets = [mock_tab, ]
+    dm.debug_on_bootstrap()
+    dm.debugger.create_breakpoint.assert_called_once_with(
+        mock_tab.path, 1, condition='x', hit_count=2, log_message=None)
+
+
+def test_debug_on_bootstrap_recording():
+    """
+    Ensure the runner is asked to record history if the user wants to.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.widgets = []
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    editor.debug_recording = False
+    dm.debug_on_bootstrap()
+    assert dm.debugger.record.call_count == 0
+    editor.debug_recording = True
+    dm.debug_on_bootstrap()
+    dm.debugger.record.assert_called_once_with(True)
+
+
+def test_debug_on_bootstrap_watches():
+    """
+    Ensure the runner is given the watch expressions, if there are any.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.widgets = []
+    dm = DebugMode(editor, view)
+    dm.debugger = mock.MagicMock()
+    dm.debug_on_bootstrap()
+    assert dm.debugger.watch.call_count == 0
+    dm.watch_expressions = ['x']
+    dm.debug_on_bootstrap()
+    dm.debugger.watch.assert_called_once_with(['x'])
+
+
 def test_debug_on_bootstrap_remove_missing_marker_handles():
     """
     Ensure all marker handles that are not currently associated with a line
@@ -522,6 +759,27 @@ def test_debug_on_line():
     mock_tab.setSelection(99, 0, 100, 0)
 
 
+def test_debug_on_history():
+    """
+    Ensure the line and locals from the recorded history are shown.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    mock_tab = mock.MagicMock()
+    editor.get_tab.return_value = mock_tab
+    summary = {'name': 'x', 'repr': '1', 'expandable': False}
+    dm.debug_on_history('foo.py', 100, {'x': summary}, 3)
+    view.current_tab.setSelection.assert_called_once_with(0, 0, 0, 0)
+    editor.get_tab.assert_called_once_with('foo.py')
+    mock_tab.debugger_at_line.assert_called_once_with(99)
+    view.update_debug_inspector.assert_called_once_with({
+        'x': dict(summary, frame=None),
+    })
+    editor.show_status_message.assert_called_once_with(
+        'Looking back 3 steps through the history.')
+
+
 def test_debug_on_stack_no_stack():
     """
     In certain rare situations the runner could send an empty stack.
@@ -548,8 +806,8 @@ def test_debug_on_stack():
             1,
             {
                 'locals': {
-                    'a': 'frame1',
-                    'b': 'frame1',
+                    'a': {'repr': 'frame1'},
+                    'b': {'repr': 'frame1'},
                 }
             }
         ),
@@ -557,18 +815,103 @@ def test_debug_on_stack():
             2,
             {
                 'locals': {
-                    'b': 'frame2',
-                    'c': 'frame2',
+                    'b': {'repr': 'frame2'},
+                    'c': {'repr': 'frame2'},
                 }
             }
         )
     ]
     dm.debug_on_stack(stack)
     view.update_debug_inspector.assert_called_once_with({
-        'a': 'frame1',
-        'b': 'frame2',
-        'c': 'frame2',
-    })
+        'a': {'repr': 'frame1', 'frame': 0},
+        'b': {'repr': 'frame2', 'frame': 1},
+        'c': {'repr': 'frame2', 'frame': 1},
+    }, [])
+
+
+def test_debug_on_stack_watches():
+    """
+    Ensure the values of the watch expressions are passed to the view too.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    watches = [{'name': 'a + 1', 'repr': '2'}]
+    dm.debug_on_stack([(1, {'locals': {}})], watches)
+    view.update_debug_inspector.assert_called_once_with({}, watches)
+
+
+def test_debug_on_timings():
+    """
+    Ensure the latency of the recent steps is kept for the admin dialog.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    for i in range(mu.modes.debugger.LATENCY_HISTORY + 1):
+        dm.debug_on_timings({'total': i})
+    assert len(dm.latency) == mu.modes.debugger.LATENCY_HISTORY
+    assert dm.latency[-1] == {'total': mu.modes.debugger.LATENCY_HISTORY}
+
+
+def test_debug_add_watch():
+    """
+    Ensure a new watch expression is remembered (once) and sent to the
+    debugger, if there is one.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.add_watch('x + 1')
+    assert dm.watch_expressions == ['x + 1']
+    dm.debugger = mock.MagicMock()
+    dm.add_watch('y')
+    dm.add_watch('y')
+    assert dm.watch_expressions == ['x + 1', 'y']
+    dm.debugger.watch.assert_called_once_with(['x + 1', 'y'])
+
+
+def test_debug_remove_watch():
+    """
+    Ensure a removed watch expression is forgotten by the debugger too.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.watch_expressions = ['x + 1', 'y']
+    dm.remove_watch('x + 1')
+    assert dm.watch_expressions == ['y']
+    dm.debugger = mock.MagicMock()
+    dm.remove_watch('z')
+    assert dm.debugger.watch.call_count == 0
+    dm.remove_watch('y')
+    dm.debugger.watch.assert_called_once_with([])
+
+
+def test_debug_expand_variable():
+    """
+    Ensure the debugger is asked for the children of a variable, if there's
+    a debugger.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.expand_variable(0, ['foo'], 0, 100)  # No debugger, nothing happens.
+    dm.debugger = mock.MagicMock()
+    dm.expand_variable(0, ['foo'], 0, 100)
+    dm.debugger.expand.assert_called_once_with(0, ['foo'], 0, 100)
+
+
+def test_debug_on_expansion():
+    """
+    Ensure the children of a variable are shown in the debug inspector.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    dm.debug_on_expansion(0, ['foo'], [], 0, 100)
+    view.expand_debug_inspector.assert_called_once_with(0, ['foo'], [], 0,
+                                                        100)
 
 
 def test_debug_on_postmortem():
@@ -669,6 +1012,20 @@ def test_debug_on_breakpoint_ignore():
     assert dm.debug_on_breakpoint_ignore(None, None) is None
 
 
+def test_debug_on_breakpoint_options():
+    """
+    Confirm the options of the breakpoint were set.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    dm = DebugMode(editor, view)
+    mock_bp = mock.MagicMock()
+    mock_bp.line = 10
+    dm.debug_on_breakpoint_options(mock_bp)
+    editor.show_status_message.assert_called_once_with(
+        'Breakpoint options set for line 10.')
+
+
 def test_debug_on_breakpoint_clear():
     """
     Should do nothing.
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the registry of modes.
+"""
+from unittest import mock
+from mu.modes import ModeDescriptor, ModeRegistry, MODES, available_modes
+
+
+def test_ModeDescriptor_available():
+    """
+    A mode is available if it requires nothing or the module it requires is
+    installed.
+    """
+    descriptor = ModeDescriptor('foo', 'Foo', 'Do foo.', 'foo', 'foo.Foo')
+    assert descriptor.available
+    descriptor.requires = 'bar'
+    with mock.patch('mu.modes.importlib.util.find_spec',
+                    return_value=None) as find_spec:
+        assert not descriptor.available
+    find_spec.assert_called_once_with('bar')
+    with mock.patch('mu.modes.importlib.util.find_spec'):
+        assert descriptor.available
+
+
+def test_ModeDescriptor_load():
+    """
+    Ensure the class which defines the mode is imported and returned.
+    """
+    descriptor = ModeDescriptor('python', 'Python 3', '', 'python',
+                                'mu.modes.python3.PythonMode')
+    from mu.modes.python3 import PythonMode
+    assert descriptor.load() is PythonMode
+
+
+def test_MODES_match_mode_classes():
+    """
+    Ensure the descriptors of the modes describe their classes, so the mode
+    selector shows what each mode will actually be.
+    """
+    for descriptor in MODES:
+        mode_class = descriptor.load()
+        assert descriptor.name == mode_class.name
+        assert descriptor.description == mode_class.description
+        assert descriptor.icon == mode_class.icon
+        assert descriptor.is_debugger == mode_class.is_debugger
+        assert descriptor.finds_devices == hasattr(mode_class, 'find_device')
+        assert descriptor.file_extensions == mode_class.file_extensions
+
+
+def test_available_modes():
+    """
+    Only the descriptors of the modes whose requirements are installed are
+    returned.
+    """
+    with mock.patch('mu.modes.importlib.util.find_spec', return_value=None):
+        keys = [descriptor.key for descriptor in available_modes()]
+    assert keys == ['python', 'adafruit', 'microbit', 'debugger']
+
+
+def test_ModeRegistry_lazy():
+    """
+    Ensure a mode is only instantiated when it is first looked up, and the
+    same instance is used thereafter.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    foo = ModeDescriptor('foo', 'Foo', 'Do foo.', 'foo', 'foo.Foo')
+    foo.load = mock.MagicMock()
+    bar = ModeDescriptor('bar', 'Bar', 'Do bar.', 'bar', 'bar.Bar')
+    bar.load = mock.MagicMock()
+    modes = ModeRegistry(editor, view, [foo, bar])
+    assert list(modes) == ['foo', 'bar']
+    assert len(modes) == 2
+    assert 'foo' in modes
+    assert modes.descriptors['bar'] is bar
+    assert foo.load.call_count == 0
+    mode = modes['foo']
+    foo.load.return_value.assert_called_once_with(editor, view)
+    assert mode is foo.load.return_value.return_value
+    assert modes['foo'] is mode
+    assert foo.load.call_count == 1
+    assert bar.load.call_count == 0
+    assert modes.get('baz') is None
+
+
+def test_ModeRegistry_device_modes():
+    """
+    Only the modes which detect connected devices are instantiated to find
+    devices.
+    """
+    foo = ModeDescriptor('foo', 'Foo', 'Do foo.', 'foo', 'foo.Foo',
+                         finds_devices=True)
+    foo.load = mock.MagicMock()
+    bar = ModeDescriptor('bar', 'Bar', 'Do bar.', 'bar', 'bar.Bar')
+    bar.load = mock.MagicMock()
+    modes = ModeRegistry(None, None, [foo, bar])
+    assert modes.device_modes() == [('foo', modes['foo'])]
+    assert bar.load.call_count == 0
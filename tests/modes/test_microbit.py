@@ -7,7 +7,7 @@ import os.path
 import pytest
 from mu.logic import HOME_DIRECTORY
 from mu.modes.microbit import MicrobitMode, FileManager, DeviceFlasher
-from mu.modes.api import MICROBIT_APIS, SHARED_APIS
+from mu.modes.api import load_apis
 from mu.contrib import uflash
 from unittest import mock
 from tokenize import TokenError
@@ -32,7 +32,7 @@ def test_DeviceFlasher_run():
     """
     df = DeviceFlasher(['path', ], 'script', None)
     mock_flash = mock.MagicMock()
-    with mock.patch('mu.modes.microbit.uflash', mock_flash):
+    with mock.patch('mu.contrib.uflash', mock_flash):
         df.run()
     mock_flash.flash.assert_called_once_with(paths_to_microbits=['path', ],
                                              python_script='script',
@@ -47,7 +47,7 @@ def test_DeviceFlasher_run_fail():
     df.on_flash_fail = mock.MagicMock()
     mock_flash = mock.MagicMock()
     mock_flash.flash.side_effect = Exception('Boom')
-    with mock.patch('mu.modes.microbit.uflash', mock_flash):
+    with mock.patch('mu.contrib.uflash', mock_flash):
         df.run()
     df.on_flash_fail.emit.assert_called_once_with(str(Exception('Boom')))
 
@@ -235,7 +235,7 @@ def test_flash_with_attached_device_has_latest_firmware():
     }
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -273,7 +273,7 @@ def test_flash_device_has_latest_firmware_encounters_serial_problem_windows():
     }
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -320,7 +320,7 @@ def test_flash_device_has_latest_firmware_encounters_serial_problem_unix():
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
     mock_timer = mock.MagicMock()
     mock_timer_class = mock.MagicMock(return_value=mock_timer)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -367,7 +367,7 @@ def test_flash_with_attached_device_has_latest_firmware_encounters_problem():
     }
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -406,7 +406,7 @@ def test_flash_with_attached_device_has_old_firmware():
     }
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -443,7 +443,7 @@ def test_flash_force_with_no_micropython():
     """
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        side_effect=ValueError('bang')),\
@@ -481,7 +481,7 @@ def test_flash_force_with_unsupported_microbit():
     """
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        side_effect=ValueError('bang')),\
@@ -518,7 +518,7 @@ def test_flash_force_with_attached_device_as_windows():
     }
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -565,7 +565,7 @@ def test_flash_forced_with_attached_device_as_not_windows():
     mock_timer_class = mock.MagicMock(return_value=mock_timer)
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -641,7 +641,7 @@ def test_flash_with_attached_known_device_and_forced():
     mock_timer_class = mock.MagicMock(return_value=mock_timer)
     mock_flasher = mock.MagicMock()
     mock_flasher_class = mock.MagicMock(return_value=mock_flasher)
-    with mock.patch('mu.modes.microbit.uflash.find_microbit',
+    with mock.patch('mu.contrib.uflash.find_microbit',
                     return_value='bar'),\
             mock.patch('mu.modes.microbit.microfs.version',
                        return_value=version_info),\
@@ -1290,7 +1290,7 @@ def test_api():
     editor = mock.MagicMock()
     mm = MicrobitMode(editor, view)
     api = mm.api()
-    assert api == SHARED_APIS + MICROBIT_APIS
+    assert api == load_apis('shared', 'microbit')
 
 
 def test_on_data_flood():
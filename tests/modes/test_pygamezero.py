@@ -4,8 +4,9 @@ Tests for the PyGameZero mode.
 """
 import os.path
 from mu.modes.pygamezero import PyGameZeroMode
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS, PYGAMEZERO_APIS
+from mu.modes.api import load_apis
 from unittest import mock
+from PyQt5.QtCore import QProcess
 
 
 def test_pgzero_mode():
@@ -45,7 +46,7 @@ def test_pgzero_api():
     view = mock.MagicMock()
     pm = PyGameZeroMode(editor, view)
     result = pm.api()
-    assert result == SHARED_APIS + PYTHON3_APIS + PI_APIS + PYGAMEZERO_APIS
+    assert result == load_apis('shared', 'python3', 'pi', 'pygamezero')
 
 
 def test_pgzero_play_toggle_on():
@@ -130,7 +131,8 @@ def test_pgzero_run_game():
                                                     interactive=False,
                                                     envars=editor.envars,
                                                     python_args=py_args)
-    mock_runner.process.waitForStarted.assert_called_once_with()
+    mock_runner.process.errorOccurred.connect.\
+        assert_called_once_with(pm.on_process_error)
 
 
 def test_pgzero_run_game_no_editor():
@@ -172,8 +174,7 @@ def test_pgzero_stop_game():
     mock_runner = mock.MagicMock()
     pm.runner = mock_runner
     pm.stop_game()
-    mock_runner.process.kill.assert_called_once_with()
-    mock_runner.process.waitForFinished.assert_called_once_with()
+    mock_runner.stop_process.assert_called_once_with()
     assert pm.runner is None
     view.remove_python_runner.assert_called_once_with()
 
@@ -191,6 +192,22 @@ def test_pgzero_stop_game_no_runner():
     view.remove_python_runner.assert_called_once_with()
 
 
+def test_pgzero_on_process_error():
+    """
+    If the game's process fails to start, the UI is reset and the user told.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PyGameZeroMode(editor, view)
+    pm.play_toggle = mock.MagicMock()
+    pm.runner = mock.MagicMock()
+    pm.on_process_error(QProcess.Crashed)
+    assert pm.play_toggle.call_count == 0
+    pm.on_process_error(QProcess.FailedToStart)
+    pm.play_toggle.assert_called_once_with(None)
+    assert view.show_message.call_count == 1
+
+
 def test_pgzero_show_images():
     """
     The view is called to run the OS's file explorer for the given images path.
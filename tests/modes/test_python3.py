@@ -2,10 +2,12 @@
 """
 Tests for the Python3 mode.
 """
+import os
 import sys
 from mu.modes.python3 import PythonMode, KernelRunner
-from mu.modes.api import PYTHON3_APIS, SHARED_APIS, PI_APIS
+from mu.modes.api import load_apis
 from unittest import mock
+from PyQt5.QtCore import QProcess
 
 
 def test_kernel_runner_start_kernel():
@@ -27,7 +29,7 @@ def test_kernel_runner_start_kernel():
     mock_kernel_manager_class = mock.MagicMock()
     mock_kernel_manager_class.return_value = mock_kernel_manager
     with mock.patch('mu.modes.python3.os', mock_os), \
-            mock.patch('mu.modes.python3.QtKernelManager',
+            mock.patch('qtconsole.manager.QtKernelManager',
                        mock_kernel_manager_class), \
             mock.patch('sys.platform', 'darwin'):
         kr.start_kernel()
@@ -80,15 +82,17 @@ def test_python_mode():
     assert pm.view == view
 
     actions = pm.actions()
-    assert len(actions) == 4
+    assert len(actions) == 5
     assert actions[0]['name'] == 'run'
     assert actions[0]['handler'] == pm.run_toggle
     assert actions[1]['name'] == 'debug'
     assert actions[1]['handler'] == pm.debug
-    assert actions[2]['name'] == 'repl'
-    assert actions[2]['handler'] == pm.toggle_repl
-    assert actions[3]['name'] == 'plotter'
-    assert actions[3]['handler'] == pm.toggle_plotter
+    assert actions[2]['name'] == 'profile'
+    assert actions[2]['handler'] == pm.profile
+    assert actions[3]['name'] == 'repl'
+    assert actions[3]['handler'] == pm.toggle_repl
+    assert actions[4]['name'] == 'plotter'
+    assert actions[4]['handler'] == pm.toggle_plotter
 
 
 def test_python_api():
@@ -99,7 +103,7 @@ def test_python_api():
     view = mock.MagicMock()
     pm = PythonMode(editor, view)
     result = pm.api()
-    assert result == SHARED_APIS + PYTHON3_APIS + PI_APIS
+    assert result == load_apis('shared', 'python3', 'pi')
 
 
 def test_python_run_toggle_on():
@@ -117,12 +121,12 @@ def test_python_run_toggle_on():
     pm = PythonMode(editor, view)
     pm.runner = None
 
-    def runner(pm=pm):
+    def runner(profile, pm=pm):
         pm.runner = True
 
     pm.run_script = mock.MagicMock(side_effect=runner)
     pm.run_toggle(None)
-    pm.run_script.assert_called_once_with()
+    pm.run_script.assert_called_once_with(False)
     slot = pm.view.button_bar.slots['run']
     assert slot.setIcon.call_count == 1
     slot.setText.assert_called_once_with('Stop')
@@ -142,7 +146,7 @@ def test_python_run_toggle_on_cancelled():
     pm.runner = None
     pm.run_script = mock.MagicMock()
     pm.run_toggle(None)
-    pm.run_script.assert_called_once_with()
+    pm.run_script.assert_called_once_with(False)
     slot = pm.view.button_bar.slots['run']
     assert slot.setIcon.call_count == 0
 
@@ -186,13 +190,24 @@ def test_python_run_script():
     pm = PythonMode(editor, view)
     pm.workspace_dir = mock.MagicMock(return_value='/bar')
     with mock.patch('builtins.open') as oa, \
-            mock.patch('mu.modes.python3.write_and_flush'):
+            mock.patch('mu.modes.python3.write_and_flush'), \
+            mock.patch('mu.modes.python3.time.monotonic', return_value=5.0):
         pm.run_script()
         oa.assert_called_once_with('/foo', 'w', newline='')
+    # The start of the script is timed from here.
+    assert pm.run_time == 5.0
+    # Any outstanding autosave mustn't overwrite the script that's run.
+    editor.saver.cancel.assert_called_once_with('/foo')
+    # The results of profiling the last run are removed.
+    view.remove_profiler.assert_called_once_with()
     view.add_python3_runner.assert_called_once_with('/foo', '/bar',
                                                     interactive=True,
-                                                    envars=editor.envars)
-    mock_runner.process.waitForStarted.assert_called_once_with()
+                                                    envars=editor.envars,
+                                                    process=None)
+    mock_runner.first_output.connect.\
+        assert_called_once_with(pm.on_first_output)
+    mock_runner.process.errorOccurred.connect.\
+        assert_called_once_with(pm.on_process_error)
     # Check the buttons are set to the correct state when other aspects of the
     # mode are also in play.
     pm.set_buttons = mock.MagicMock()
@@ -210,6 +225,62 @@ def test_python_run_script():
     pm.set_buttons.assert_called_once_with(repl=False)
 
 
+def test_python_run_script_warm_pool():
+    """
+    Ensure that, if there's a pool of pre-warmed interpreters, one of them is
+    used to run the script.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.current_tab.path = '/foo'
+    view.current_tab.isModified.return_value = False
+    pm = PythonMode(editor, view)
+    pm.workspace_dir = mock.MagicMock(return_value='/bar')
+    pm.pool = mock.MagicMock()
+    pm.run_script()
+    pm.pool.take.assert_called_once_with('/foo', '/bar', editor.envars)
+    view.add_python3_runner.assert_called_once_with(
+        '/foo', '/bar', interactive=True, envars=editor.envars,
+        process=pm.pool.take.return_value)
+
+
+def test_python_on_first_output():
+    """
+    Ensure the user is told how long the script took to start, since they
+    asked for it to be run.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.run_time = 1.0
+    with mock.patch('mu.modes.python3.time.monotonic', return_value=1.25):
+        pm.on_first_output()
+    editor.show_status_message.\
+        assert_called_once_with('Script started in 0.25 seconds.')
+
+
+def test_python_set_warm_pool():
+    """
+    Ensure a pool of interpreters is started with the requested size, any
+    existing pool being shut down first, and removed if the size is zero.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.workspace_dir = mock.MagicMock(return_value='/bar')
+    mock_pool = mock.MagicMock()
+    mock_pool_class = mock.MagicMock(return_value=mock_pool)
+    with mock.patch('mu.modes.python3.InterpreterPool', mock_pool_class):
+        pm.set_warm_pool(2)
+        mock_pool_class.assert_called_once_with(
+            2, working_directory='/bar', envars=editor.envars)
+        mock_pool.fill.assert_called_once_with()
+        assert pm.pool == mock_pool
+        pm.set_warm_pool(0)
+    mock_pool.shutdown.assert_called_once_with()
+    assert pm.pool is None
+
+
 def test_python_run_script_no_editor():
     """
     If there's no active tab, there can be no runner either.
@@ -249,10 +320,11 @@ def test_python_stop_script():
     mock_runner = mock.MagicMock()
     pm.runner = mock_runner
     pm.stop_script()
-    mock_runner.process.kill.assert_called_once_with()
-    mock_runner.process.waitForFinished.assert_called_once_with()
+    mock_runner.stop_process.assert_called_once_with()
     assert pm.runner is None
     view.remove_python_runner.assert_called_once_with()
+    # The results of profiling the script are still shown.
+    assert view.remove_profiler.call_count == 0
 
 
 def test_python_stop_script_no_runner():
@@ -268,6 +340,165 @@ def test_python_stop_script_no_runner():
     view.remove_python_runner.assert_called_once_with()
 
 
+def test_python_on_process_error():
+    """
+    If the process fails to start, the UI is reset and the user told.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.run_toggle = mock.MagicMock()
+    pm.on_process_error(QProcess.FailedToStart)
+    assert pm.run_toggle.call_count == 0  # No runner, so nothing to do.
+    pm.runner = mock.MagicMock()
+    pm.on_process_error(QProcess.Crashed)
+    assert pm.run_toggle.call_count == 0  # Only failure to start matters.
+    pm.on_process_error(QProcess.FailedToStart)
+    pm.run_toggle.assert_called_once_with(None)
+    assert view.show_message.call_count == 1
+
+
+def test_python_profile():
+    """
+    Ensure profiling starts the script with the profiler, unless a script is
+    already running.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.run_toggle = mock.MagicMock()
+    pm.runner = mock.MagicMock()
+    pm.profile(None)
+    assert pm.run_toggle.call_count == 0
+    pm.runner = None
+    pm.profile(None)
+    pm.run_toggle.assert_called_once_with(None, profile=True)
+
+
+def test_python_run_script_profile():
+    """
+    Ensure the script is profiled rather than simply run, if requested.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.current_tab.path = '/foo'
+    view.current_tab.isModified.return_value = False
+    pm = PythonMode(editor, view)
+    pm.profile_script = mock.MagicMock()
+    pm.run_script(profile=True)
+    view.remove_profiler.assert_called_once_with()
+    pm.profile_script.assert_called_once_with(view.current_tab,
+                                              editor.envars)
+    assert view.add_python3_runner.call_count == 0
+
+
+def test_python_profile_script():
+    """
+    Ensure the script is run with cProfile writing to a temporary file.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.path = '/foo'
+    mock_runner = mock.MagicMock()
+    view.add_python3_runner.return_value = mock_runner
+    pm = PythonMode(editor, view)
+    pm.workspace_dir = mock.MagicMock(return_value='/bar')
+    with mock.patch('mu.modes.python3.tempfile.mkstemp',
+                    return_value=(3, '/tmp/mu-x.prof')), \
+            mock.patch('mu.modes.python3.os.close') as mock_close:
+        pm.profile_script(tab, [['name', 'value']])
+    mock_close.assert_called_once_with(3)
+    assert pm.profile_path == '/tmp/mu-x.prof'
+    assert pm.profiled_tab == tab
+    view.add_python3_runner.assert_called_once_with(
+        '/foo', '/bar', interactive=False, envars=[['name', 'value']],
+        python_args=['-m', 'cProfile', '-o', '/tmp/mu-x.prof'])
+    mock_runner.process.finished.connect.\
+        assert_called_once_with(pm.on_profile_finished)
+    mock_runner.process.errorOccurred.connect.\
+        assert_called_once_with(pm.on_process_error)
+
+
+def test_python_on_profile_finished():
+    """
+    Ensure the cost of the expensive functions in the profiled script are
+    annotated in the code and all the results are shown in a table.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.path = 'script.py'
+    view.widgets = [tab, ]
+    pm = PythonMode(editor, view)
+    pm.profiled_tab = tab
+    pm.profile_path = 'results.prof'
+    script = os.path.abspath('script.py')
+    entries = [
+        {'filename': script, 'line': 0, 'function': '<module>', 'calls': 1,
+         'own_time': 0.0, 'total_time': 2.0, 'percent': 100.0},
+        {'filename': script, 'line': 4, 'function': 'slow', 'calls': 3,
+         'own_time': 1.0, 'total_time': 1.5, 'percent': 75.0},
+        {'filename': script, 'line': 8, 'function': 'fast', 'calls': 3,
+         'own_time': 0.0, 'total_time': 0.001, 'percent': 0.05},
+        {'filename': '/lib/other.py', 'line': 1, 'function': 'lib',
+         'calls': 1, 'own_time': 0.5, 'total_time': 0.5, 'percent': 25.0},
+    ]
+    with mock.patch('mu.modes.python3.read_profile',
+                    return_value=entries), \
+            mock.patch('mu.modes.python3.os.path.exists',
+                       return_value=True), \
+            mock.patch('mu.modes.python3.os.remove') as mock_remove:
+        pm.on_profile_finished(0, 0)
+    mock_remove.assert_called_once_with('results.prof')
+    assert pm.profile_path is None
+    view.add_profiler.assert_called_once_with(entries)
+    tab.reset_annotations.assert_called_once_with()
+    feedback = tab.annotate_code.call_args[0][0]
+    assert tab.annotate_code.call_args[0][1] == 'profile'
+    assert list(feedback.keys()) == [4, ]
+    assert feedback[4][0]['line_no'] == 4
+    assert feedback[4][0]['message'] == \
+        'slow: 75.0% of the run time (3 calls, 1.500 seconds)'
+    tab.show_annotations.assert_called_once_with()
+    assert tab.has_annotations is True
+
+
+def test_python_on_profile_finished_no_results():
+    """
+    If no results were written (the script failed), the user is told.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.profile_path = 'results.prof'
+    with mock.patch('mu.modes.python3.read_profile',
+                    side_effect=OSError('boom')), \
+            mock.patch('mu.modes.python3.os.path.exists',
+                       return_value=False):
+        pm.on_profile_finished(1, 0)
+    assert editor.show_status_message.call_count == 1
+    assert view.add_profiler.call_count == 0
+    assert pm.profile_path is None
+
+
+def test_python_on_profile_finished_tab_closed():
+    """
+    If the profiled script's tab was closed, the results are only shown in
+    the table.
+    """
+    editor = mock.MagicMock()
+    view = mock.MagicMock()
+    view.widgets = []
+    tab = mock.MagicMock()
+    pm = PythonMode(editor, view)
+    pm.profiled_tab = tab
+    with mock.patch('mu.modes.python3.read_profile', return_value=[]):
+        pm.on_profile_finished(0, 0)
+    view.add_profiler.assert_called_once_with([])
+    assert tab.annotate_code.call_count == 0
+
+
 def test_python_debug():
     """
     Ensure Python3 mode hands over running of the script to the debug mode.
@@ -10,6 +10,20 @@ from mu.logic import LOG_FILE, LOG_DIR, DEBUGGER_PORT, ENCODING
 from mu.interface.themes import NIGHT_STYLE, DAY_STYLE, CONTRAST_STYLE
 
 
+class DumSig:
+    def __init__(self):
+        @self.connect
+        def default(*args):
+            raise Exception('No signal handler connected')
+
+    def connect(self, func):
+        self.func = func
+        return func
+
+    def emit(self, *args):
+        self.func(*args)
+
+
 def test_setup_logging():
     """
     Ensure that logging is set up in some way.
@@ -29,13 +43,16 @@ def test_setup_logging():
 
 def test_setup_modes_with_pgzero():
     """
-    If pgzero is installed, allow Pygame Zero mode.
+    If pgzero is installed, allow Pygame Zero mode. No mode is instantiated
+    until it is used.
     """
-    with mock.patch('mu.app.pkgutil.iter_modules', return_value=['pgzero', ]):
+    with mock.patch('mu.modes.importlib.util.find_spec') as find_spec:
         mock_editor = mock.MagicMock()
         mock_view = mock.MagicMock()
         modes = setup_modes(mock_editor, mock_view)
         assert 'pygamezero' in modes
+    find_spec.assert_called_once_with('pgzero')
+    assert modes.instances == {}
 
 
 def test_setup_modes_without_pgzero():
@@ -43,7 +60,7 @@ def test_setup_modes_without_pgzero():
     If pgzero is NOT installed, do not add Pygame Zero mode to the list of
     available modes.
     """
-    with mock.patch('mu.app.pkgutil.iter_modules', return_value=['foo', ]):
+    with mock.patch('mu.modes.importlib.util.find_spec', return_value=None):
         mock_editor = mock.MagicMock()
         mock_view = mock.MagicMock()
         modes = setup_modes(mock_editor, mock_view)
@@ -62,21 +79,10 @@ def test_run():
     Testing the call_count and mock_calls allows us to measure the expected
     number of instantiations and method calls.
     """
-    class DumSig:
-        def __init__(self):
-            @self.connect
-            def default(*args):
-                raise Exception('No signal handler connected')
-
-        def connect(self, func):
-            self.func = func
-            return func
-
-        def emit(self, *args):
-            self.func(*args)
-
     class Win(mock.MagicMock):
         load_theme = DumSig()
+        first_paint = DumSig()
+        selecting_mode = DumSig()
 
     window = Win()
 
@@ -86,7 +92,7 @@ def test_run():
             mock.patch('mu.app.Editor') as ed, \
             mock.patch('mu.app.load_pixmap'), \
             mock.patch('mu.app.Window', window) as win, \
-            mock.patch('mu.app.QTimer') as timer, \
+            mock.patch('mu.app.StartupScheduler') as scheduler, \
             mock.patch('sys.argv', ['mu']), \
             mock.patch('sys.exit') as ex:
         run()
@@ -94,11 +100,11 @@ def test_run():
         # foo.call_count is instantiating the class
         assert qa.call_count == 1
         # foo.mock_calls are method calls on the object
-        assert len(qa.mock_calls) == 8
+        assert len(qa.mock_calls) == 9
         assert qsp.call_count == 1
         assert len(qsp.mock_calls) == 2
-        assert timer.call_count == 1
-        assert len(timer.mock_calls) == 4
+        assert scheduler.call_count == 1
+        assert len(scheduler.mock_calls) == 3
         assert ed.call_count == 1
         assert len(ed.mock_calls) == 3
         assert win.call_count == 1
@@ -110,6 +116,42 @@ def test_run():
         qa.assert_has_calls([mock.call().setStyleSheet(NIGHT_STYLE)])
         window.load_theme.emit('contrast')
         qa.assert_has_calls([mock.call().setStyleSheet(CONTRAST_STYLE)])
+        # Once the window is ready the splash is hidden and start-up finished.
+        window.first_paint.emit()
+        qsp.return_value.finish.assert_called_once_with(window())
+        scheduler.return_value.start.assert_called_once_with()
+        # The splash icon is hidden while the mode is selected.
+        window.selecting_mode.emit()
+        qsp.return_value.close.assert_called_once_with()
+
+
+def test_run_painted_during_setup():
+    """
+    If the window is first painted while it's being set up (for instance,
+    while the mode selector is open) the splash is still hidden and start-up
+    finished.
+    """
+    class Win(mock.MagicMock):
+        load_theme = DumSig()
+        first_paint = DumSig()
+        selecting_mode = DumSig()
+
+    window = Win()
+    window.return_value.setup.side_effect = lambda *args: \
+        window.first_paint.emit()
+
+    with mock.patch('mu.app.setup_logging'), \
+            mock.patch('mu.app.QApplication'), \
+            mock.patch('mu.app.QSplashScreen') as qsp, \
+            mock.patch('mu.app.Editor'), \
+            mock.patch('mu.app.load_pixmap'), \
+            mock.patch('mu.app.Window', window), \
+            mock.patch('mu.app.StartupScheduler') as scheduler, \
+            mock.patch('sys.argv', ['mu']), \
+            mock.patch('sys.exit'):
+        run()
+    qsp.return_value.finish.assert_called_once_with(window())
+    scheduler.return_value.start.assert_called_once_with()
 
 
 def test_excepthook():
@@ -135,7 +177,7 @@ def test_debug():
     mock_sys.argv = [None, 'foo.py', 'foo', 'bar', 'baz']
     mock_runner = mock.MagicMock()
     with mock.patch('mu.app.sys', mock_sys), \
-            mock.patch('mu.app.run_debugger', mock_runner):
+            mock.patch('mu.debugger.runner.run', mock_runner):
         debug()
     expected_filename = os.path.normcase(os.path.abspath('foo.py'))
     mock_runner.assert_called_once_with('localhost', DEBUGGER_PORT,
@@ -12,13 +12,15 @@ import re
 import shutil
 import subprocess
 import tempfile
+import time
 from unittest import mock
 import uuid
 
 import pytest
 import mu.logic
+import mu.modes
 from PyQt5.QtWidgets import QMessageBox
-from PyQt5.QtCore import pyqtSignal, QObject
+from PyQt5.QtCore import pyqtSignal, QObject, Qt
 
 from mu import __version__
 
@@ -160,6 +162,23 @@ def mocked_view(text, path, newline):
     return view
 
 
+def mocked_modes(modes, file_extensions=None):
+    """
+    Return a registry of the referenced (mock) modes, which all detect
+    connected devices. The file extensions handled by each mode may be given
+    by mode name.
+    """
+    file_extensions = file_extensions or {}
+    descriptors = [mu.modes.ModeDescriptor(key, mode.name, '', key, '',
+                                           finds_devices=True,
+                                           file_extensions=file_extensions.get(
+                                               key))
+                   for key, mode in modes.items()]
+    registry = mu.modes.ModeRegistry(None, None, descriptors)
+    registry.instances.update(modes)
+    return registry
+
+
 def mocked_editor(mode="python", text=None, path=None, newline=None):
     """Return a mocked editor with a mocked view
 
@@ -174,9 +193,9 @@ def mocked_editor(mode="python", text=None, path=None, newline=None):
     mock_mode.save_timeout = 5
     mock_mode.workspace_dir.return_value = '/fake/path'
     mock_mode.api.return_value = ["API Specification"]
-    ed.modes = {
+    ed.modes = mocked_modes({
         mode: mock_mode,
-    }
+    })
     return ed
 
 
@@ -244,6 +263,182 @@ def test_save_and_encode():
     assert mock_wandf.call_count == 1
 
 
+def test_read_data_capture():
+    """
+    Ensure a regular CSV data capture is read into a two dimensional array of
+    floats with a row for each captured tuple.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'capture.csv')
+        with open(filepath, 'w', newline='') as f:
+            f.write('1,2.5,-3\r\n4,5,6\r\n')
+        with mock.patch('mu.logic.csv.reader') as reader:
+            data = mu.logic.read_data_capture(filepath)
+    # Parsed in one pass, rather than row by row.
+    assert reader.call_count == 0
+    assert data.shape == (2, 3)
+    assert data.tolist() == [[1, 2.5, -3], [4, 5, 6]]
+
+
+def test_read_data_capture_irregular():
+    """
+    Ensure rows of differing lengths, or with values that are not numbers,
+    are padded with NaN.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'capture.csv')
+        with open(filepath, 'w') as f:
+            f.write('1,2\n3\n4,foo,6\n')
+        data = mu.logic.read_data_capture(filepath)
+    assert data.shape == (3, 3)
+    assert data[0, 1] == 2
+    assert data[1, 0] == 3
+    assert data[1, 1] != data[1, 1]  # NaN
+    assert data[2, 1] != data[2, 1]  # NaN
+    assert data[2, 2] == 6
+
+
+def test_read_data_capture_empty():
+    """
+    An empty capture results in an empty array.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filepath = os.path.join(tmpdir, 'capture.csv')
+        with open(filepath, 'w') as f:
+            f.write('\n')
+        data = mu.logic.read_data_capture(filepath)
+    assert data.size == 0
+
+
+def test_replace_and_encode():
+    """
+    The text replaces the existing file, via a temporary file in the same
+    directory, keeping the file's permissions.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        with open(filepath, 'w') as f:
+            f.write('old')
+        os.chmod(filepath, 0o640)
+        with mock.patch('mu.logic.os.fsync') as fsync:
+            mu.logic.replace_and_encode('new\ntext', filepath, '\r\n')
+        assert fsync.call_count == 1
+        with open(filepath, 'rb') as f:
+            assert f.read() == b'new\r\ntext'
+        assert os.stat(filepath).st_mode & 0o777 == 0o640
+        assert os.listdir(directory) == ['foo.py']
+
+
+def test_replace_and_encode_no_fsync():
+    """
+    The file isn't fsync-ed if that's not wanted.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        with open(filepath, 'w') as f:
+            f.write('old')
+        with mock.patch('mu.logic.os.fsync') as fsync:
+            mu.logic.replace_and_encode('new', filepath, fsync=False)
+        assert fsync.call_count == 0
+        with open(filepath) as f:
+            assert f.read() == 'new'
+
+
+def test_replace_and_encode_error():
+    """
+    If the text can't be written the existing file is left as it was and the
+    temporary file is removed.
+    """
+    text = '# -*- coding: ascii -*-\nprint("\u2603")'
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        with open(filepath, 'w') as f:
+            f.write('old')
+        with pytest.raises(UnicodeEncodeError):
+            mu.logic.replace_and_encode(text, filepath)
+        with open(filepath) as f:
+            assert f.read() == 'old'
+        assert os.listdir(directory) == ['foo.py']
+
+
+def test_replace_and_encode_new_file():
+    """
+    A file which doesn't exist yet is simply saved, fsync-ed only if that's
+    wanted.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        with mock.patch('mu.logic.os.fsync') as fsync:
+            mu.logic.replace_and_encode('foo\nbar', filepath, '\r\n',
+                                        fsync=False)
+        assert fsync.call_count == 0
+        with open(filepath, 'rb') as f:
+            assert f.read() == b'foo\r\nbar'
+        assert os.listdir(directory) == ['foo.py']
+
+
+@pytest.mark.skipif(not hasattr(os, 'symlink') or sys.platform == 'win32',
+                    reason='Creating symbolic links needs privileges')
+def test_replace_and_encode_symlink():
+    """
+    A symbolic link is written through to the file it refers to, rather than
+    being replaced.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        target = os.path.join(directory, 'target.py')
+        link = os.path.join(directory, 'link.py')
+        with open(target, 'w') as f:
+            f.write('old')
+        os.symlink(target, link)
+        mu.logic.replace_and_encode('new', link, fsync=False)
+        assert os.path.islink(link)
+        with open(target) as f:
+            assert f.read() == 'new'
+        assert sorted(os.listdir(directory)) == ['link.py', 'target.py']
+
+
+def test_replace_and_encode_hard_link():
+    """
+    A file with other (hard) links is written in place, so it still shares
+    its content with them.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        other = os.path.join(directory, 'bar.py')
+        with open(filepath, 'w') as f:
+            f.write('old')
+        os.link(filepath, other)
+        with mock.patch('mu.logic.tempfile.mkstemp') as mkstemp:
+            mu.logic.replace_and_encode('new', filepath, fsync=False)
+        assert mkstemp.call_count == 0
+        with open(other) as f:
+            assert f.read() == 'new'
+        assert os.path.samefile(filepath, other)
+
+
+def test_get_fsync_policy():
+    """
+    The fsync policy is read from the settings file, defaulting to fsync-ing
+    all files.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        settings_path = os.path.join(directory, 'settings.json')
+        with mock.patch('mu.logic.get_settings_path',
+                        return_value=settings_path):
+            assert mu.logic.get_fsync_policy() is True
+            for settings, policy in (({}, True),
+                                     ({'fsync': False}, False),
+                                     ({'fsync': {directory: False}},
+                                      {os.path.normcase(os.path.realpath(
+                                          directory)): False})):
+                with open(settings_path, 'w') as f:
+                    json.dump(settings, f)
+                assert mu.logic.get_fsync_policy() == policy
+            with open(settings_path, 'w') as f:
+                f.write('corrupt')
+            assert mu.logic.get_fsync_policy() is True
+
+
 def test_sniff_encoding_from_BOM():
     """
     Ensure an expected BOM detected at the start of the referenced file is
@@ -310,6 +505,33 @@ def test_sniff_newline_convention_local():
     assert mu.logic.sniff_newline_convention(text) == os.linesep
 
 
+def test_read_profile():
+    """
+    Ensure the output of cProfile is read into a list of the cost of each
+    function called, most expensive first, with zero based line numbers.
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        script = os.path.join(tmpdir, 'script.py')
+        results = os.path.join(tmpdir, 'results.prof')
+        with open(script, 'w') as f:
+            f.write('def slow():\n'
+                    '    return sum(i for i in range(100000))\n'
+                    '\n'
+                    'for i in range(3):\n'
+                    '    slow()\n')
+        subprocess.check_call([sys.executable, '-m', 'cProfile', '-o',
+                               results, script])
+        entries = mu.logic.read_profile(results)
+    total_times = [entry['total_time'] for entry in entries]
+    assert total_times == sorted(total_times, reverse=True)
+    slow = [entry for entry in entries if entry['function'] == 'slow'][0]
+    assert slow['filename'] == script
+    assert slow['line'] == 0
+    assert slow['calls'] == 3
+    assert 0 < slow['own_time'] <= slow['total_time']
+    assert 0 < slow['percent'] <= 100
+
+
 def test_get_admin_file_path():
     """
     Finds an admin file in the application location, when Mu is run as if
@@ -522,6 +744,218 @@ def test_check_pycodestyle_with_non_ascii():
     #
 
 
+def test_check_pycodestyle_no_files():
+    """
+    Ensure the code is checked in memory, without a temporary file or
+    capturing stdout.
+    """
+    code = "import foo\n\n\n\n\n\ndef bar():\n    pass\n"
+    with mock.patch('builtins.open') as mock_open:
+        result = mu.logic.check_pycodestyle(code)
+    assert mock_open.call_count == 0
+    assert result[6][0]['code'] == 'E303'
+
+
+def test_MuStyleCodeReporter_error():
+    """
+    Problems found by PyCodeStyle are logged as structured data, unless they
+    are ignored.
+    """
+    style = mu.logic.StyleGuide(parse_argv=False, config_file=False)
+    style.options.ignore = ('W291', )
+    r = mu.logic.MuStyleCodeReporter(style.options)
+    r.init_file('foo.py', [], None, None)
+    assert r.error(3, 4, 'E225 missing whitespace around operator',
+                   None) == 'E225'
+    assert r.error(4, 1, 'W291 trailing whitespace', None) is None
+    assert r.log == [{
+        'line_no': 2,
+        'column': 4,
+        'message': 'Missing whitespace around operator',
+        'code': 'E225',
+    }]
+
+
+def test_CodeCheckWorker_check():
+    """
+    The code is checked and the results emitted with the request.
+    """
+    checker = mock.MagicMock()
+    checker.request = 1
+    w = mu.logic.CodeCheckWorker(checker)
+    w.checked = mock.MagicMock()
+    with mock.patch('mu.logic.check_flake', return_value={1: []}) as cf, \
+            mock.patch('mu.logic.check_pycodestyle',
+                       return_value={2: []}) as cp:
+        w.check(1, 'foo.py', 'code', ['foo', ])
+    cf.assert_called_once_with('foo.py', 'code', ['foo', ])
+    cp.assert_called_once_with('code')
+    w.checked.emit.assert_called_once_with(1, {1: []}, {2: []})
+
+
+def test_CodeCheckWorker_check_stale():
+    """
+    A stale request is dropped before, between and after the checks.
+    """
+    checker = mock.MagicMock()
+    checker.request = 2
+    w = mu.logic.CodeCheckWorker(checker)
+    w.checked = mock.MagicMock()
+    with mock.patch('mu.logic.check_flake') as cf:
+        w.check(1, 'foo.py', 'code', None)
+    assert cf.call_count == 0
+
+    def supersede(*args):
+        checker.request += 1
+        return {}
+
+    checker.request = 1
+    with mock.patch('mu.logic.check_flake', side_effect=supersede), \
+            mock.patch('mu.logic.check_pycodestyle') as cp:
+        w.check(1, 'foo.py', 'code', None)
+    assert cp.call_count == 0
+    checker.request = 1
+    with mock.patch('mu.logic.check_flake', return_value={}), \
+            mock.patch('mu.logic.check_pycodestyle', side_effect=supersede):
+        w.check(1, 'foo.py', 'code', None)
+    assert w.checked.emit.call_count == 0
+
+
+def test_CodeChecker_start_stop():
+    """
+    The worker is moved to a thread which is started, and stopped on request.
+    """
+    c = mu.logic.CodeChecker()
+    mock_thread = mock.MagicMock()
+    mock_worker = mock.MagicMock()
+    with mock.patch('mu.logic.QThread', return_value=mock_thread), \
+            mock.patch('mu.logic.CodeCheckWorker', return_value=mock_worker):
+        c.start()
+    mock_worker.moveToThread.assert_called_once_with(mock_thread)
+    mock_worker.checked.connect.assert_called_once_with(c.on_checked)
+    mock_thread.start.assert_called_once_with()
+    c.stop()
+    mock_thread.quit.assert_called_once_with()
+    mock_thread.wait.assert_called_once_with()
+    assert c.thread is None
+    c.stop()  # Stopping again does nothing.
+
+
+def test_CodeChecker_check():
+    """
+    A check starts the thread, if needed, and requests a check of the tab's
+    code, which is cancelled if the tab's text changes.
+    """
+    c = mu.logic.CodeChecker()
+    c.start = mock.MagicMock()
+    c.requested = mock.MagicMock()
+    tab = mock.MagicMock()
+    c.check(tab, 'foo.py', 'code', ['foo', ])
+    c.start.assert_called_once_with()
+    tab.textChanged.connect.assert_called_once_with(c.cancel)
+    c.requested.emit.assert_called_once_with(c.request, 'foo.py', 'code',
+                                             ['foo', ])
+    assert c.tab == tab
+    request = c.request
+    c.cancel()
+    assert c.request > request
+    assert c.tab is None
+    tab.textChanged.disconnect.assert_called_once_with(c.cancel)
+
+
+def test_CodeChecker_cache():
+    """
+    The results of checking code are cached by the code, filename and
+    builtins, so the same code isn't checked again.
+    """
+    c = mu.logic.CodeChecker()
+    c.finished = mock.MagicMock()
+    c.requested = mock.MagicMock()
+    c.thread = mock.MagicMock()
+    tab = mock.MagicMock()
+    c.check(tab, 'foo.py', 'code', ['foo', ])
+    c.on_checked(c.request, {1: []}, {2: []})
+    assert c.requested.emit.call_count == 1
+    c.check(tab, 'foo.py', 'code', ['foo', ])
+    assert c.requested.emit.call_count == 1
+    assert c.finished.emit.call_count == 2
+    c.finished.emit.assert_called_with(tab, {1: []}, {2: []})
+    c.check(tab, 'foo.py', 'code', ['bar', ])
+    assert c.requested.emit.call_count == 2
+
+
+def test_CodeChecker_cache_size():
+    """
+    Only the results of the most recently used checks are cached.
+    """
+    c = mu.logic.CodeChecker()
+    c.finished = mock.MagicMock()
+    c.requested = mock.MagicMock()
+    c.thread = mock.MagicMock()
+    tab = mock.MagicMock()
+    with mock.patch('mu.logic.CHECK_CACHE_SIZE', 2):
+        for code in ('a', 'b'):
+            c.check(tab, 'foo.py', code)
+            c.on_checked(c.request, {}, {})
+        c.check(tab, 'foo.py', 'a')  # Makes "a" the most recently used.
+        c.check(tab, 'foo.py', 'c')
+        c.on_checked(c.request, {}, {})
+    assert c.cache_key('foo.py', 'a', None) in c.cache
+    assert c.cache_key('foo.py', 'b', None) not in c.cache
+    assert c.cache_key('foo.py', 'c', None) in c.cache
+
+
+def test_CodeChecker_cancel_tab():
+    """
+    Cancelling the checks of a tab leaves the outstanding check of another
+    tab alone.
+    """
+    c = mu.logic.CodeChecker()
+    c.requested = mock.MagicMock()
+    c.thread = mock.MagicMock()
+    tab = mock.MagicMock()
+    other_tab = mock.MagicMock()
+    c.check(tab, 'foo.py', 'code')
+    request = c.request
+    c.cancel(other_tab)
+    assert c.request == request
+    assert c.tab is tab
+    c.cancel(tab)
+    assert c.request != request
+    assert c.tab is None
+
+
+def test_CodeChecker_cancel_closed_tab():
+    """
+    Cancelling the check of a tab that has since been closed doesn't fail.
+    """
+    c = mu.logic.CodeChecker()
+    c.tab = mock.MagicMock()
+    c.tab.textChanged.disconnect.side_effect = RuntimeError('deleted')
+    c.cancel()
+    assert c.tab is None
+
+
+def test_CodeChecker_on_checked():
+    """
+    The results of the latest request are emitted with the tab; those of
+    stale requests are dropped.
+    """
+    c = mu.logic.CodeChecker()
+    c.finished = mock.MagicMock()
+    c.requested = mock.MagicMock()
+    c.thread = mock.MagicMock()
+    tab = mock.MagicMock()
+    c.check(tab, 'foo.py', 'code')
+    c.on_checked(c.request - 1, {}, {})
+    assert c.finished.emit.call_count == 0
+    c.on_checked(c.request, {1: []}, {})
+    c.finished.emit.assert_called_once_with(tab, {1: []}, {})
+    assert c.tab is None
+    c.on_checked(c.request, {}, {})
+    assert c.finished.emit.call_count == 1
+
+
 def test_MuFlakeCodeReporter_init():
     """
     Check state is set up as expected.
@@ -587,6 +1021,143 @@ def test_MuFlakeCodeReporter_flake_un_matched():
     assert r.log[0]['message'] == 'something went wrong'
 
 
+def test_SaveWorker_save():
+    """
+    The outstanding save to the path is written and the result emitted.
+    """
+    service = mock.MagicMock()
+    service.write.return_value = 'text'
+    w = mu.logic.SaveWorker(service)
+    w.saved = mock.MagicMock()
+    w.failed = mock.MagicMock()
+    w.save('foo.py')
+    service.write.assert_called_once_with('foo.py')
+    w.saved.emit.assert_called_once_with('foo.py', 'text')
+    # Nothing is emitted if the save was already written.
+    service.write.return_value = None
+    w.save('foo.py')
+    assert w.saved.emit.call_count == 1
+    # Errors are emitted.
+    error = OSError('Boom')
+    service.write.side_effect = error
+    w.save('foo.py')
+    w.failed.emit.assert_called_once_with('foo.py', error)
+
+
+def test_SaveService_start_stop():
+    """
+    The worker is moved to a thread which is started, and outstanding saves
+    are written when it's stopped.
+    """
+    s = mu.logic.SaveService()
+    s.saved = mock.MagicMock()
+    mock_thread = mock.MagicMock()
+    mock_worker = mock.MagicMock()
+    with mock.patch('mu.logic.QThread', return_value=mock_thread), \
+            mock.patch('mu.logic.SaveWorker', return_value=mock_worker), \
+            mock.patch('mu.logic.get_fsync_policy', return_value=False):
+        s.start()
+    assert s.fsync_policy is False
+    mock_worker.moveToThread.assert_called_once_with(mock_thread)
+    mock_worker.saved.connect.assert_called_once_with(s.saved)
+    mock_thread.start.assert_called_once_with()
+    s.pending['foo.py'] = ('text', '\n')
+    with mock.patch('mu.logic.replace_and_encode') as mock_replace:
+        s.stop()
+    mock_replace.assert_called_once_with('text', 'foo.py', '\n', False)
+    s.saved.emit.assert_called_once_with('foo.py', 'text')
+    mock_thread.quit.assert_called_once_with()
+    mock_thread.wait.assert_called_once_with()
+    assert s.thread is None
+    s.stop()  # Stopping again does nothing.
+
+
+def test_SaveService_stop_error():
+    """
+    Errors writing outstanding saves when stopping are emitted.
+    """
+    s = mu.logic.SaveService()
+    s.failed = mock.MagicMock()
+    s.pending['foo.py'] = ('text', '\n')
+    error = OSError('Boom')
+    with mock.patch('mu.logic.replace_and_encode', side_effect=error):
+        s.stop()
+    s.failed.emit.assert_called_once_with('foo.py', error)
+    assert s.pending == {}
+
+
+def test_SaveService_save_coalesced():
+    """
+    A save starts the thread, if needed, and requests the path is written.
+    Saves to the same path before it's written only update the text to
+    write.
+    """
+    s = mu.logic.SaveService()
+    s.start = mock.MagicMock()
+    s.requested = mock.MagicMock()
+    s.save('foo.py', 'one', '\n')
+    s.start.assert_called_once_with()
+    s.requested.emit.assert_called_once_with('foo.py')
+    s.save('foo.py', 'two', '\r\n')
+    assert s.requested.emit.call_count == 1
+    assert s.pending == {'foo.py': ('two', '\r\n')}
+    with mock.patch('mu.logic.replace_and_encode') as mock_replace:
+        assert s.write('foo.py') == 'two'
+        assert s.write('foo.py') is None
+    mock_replace.assert_called_once_with('two', 'foo.py', '\r\n', True)
+    # Once written, the path is requested again.
+    s.save('foo.py', 'three', '\n')
+    assert s.requested.emit.call_count == 2
+
+
+def test_SaveService_cancel():
+    """
+    Cancelling discards the outstanding save to the path.
+    """
+    s = mu.logic.SaveService()
+    s.pending = {'foo.py': ('one', '\n'), 'bar.py': ('two', '\n')}
+    s.cancel('foo.py')
+    s.cancel('baz.py')
+    assert s.pending == {'bar.py': ('two', '\n')}
+
+
+def test_SaveService_fsync():
+    """
+    Files are fsync-ed according to the policy of the device they're on (the
+    longest matching path), by default.
+    """
+    s = mu.logic.SaveService()
+    assert s.fsync('foo.py') is True
+    s.fsync_policy = False
+    assert s.fsync('foo.py') is False
+    device = os.path.normcase(os.path.abspath('media'))
+    s.fsync_policy = {device: False,
+                      os.path.join(device, 'slow'): True}
+    assert s.fsync(os.path.join('media', 'foo.py')) is False
+    assert s.fsync(os.path.join('media', 'slow', 'foo.py')) is True
+    assert s.fsync(os.path.join('mediaeval', 'foo.py')) is True
+
+
+def test_SaveService_thread():
+    """
+    Ensure saves are written by the worker's thread.
+    """
+    s = mu.logic.SaveService()
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = os.path.join(directory, 'foo.py')
+        with mock.patch('mu.logic.get_fsync_policy', return_value=False):
+            s.save(filepath, 'text', '\n')
+        try:
+            for i in range(500):
+                if not s.pending and os.path.isfile(filepath):
+                    break
+                time.sleep(0.01)
+        finally:
+            s.stop()
+        with open(filepath) as f:
+            assert f.read() == 'text'
+
+
 def test_REPL_posix():
     """
     The port is set correctly in a posix environment.
@@ -631,6 +1202,9 @@ def test_editor_init():
         assert e.modes == {}
         assert e.envars == []
         assert e.minify is False
+        assert e.warm_pool == 0
+        assert e.debug_recording is False
+        assert e.live_check is True
         assert e.microbit_runtime == ''
         assert e.connected_devices == set()
         assert e.find == ''
@@ -647,19 +1221,41 @@ def test_editor_setup():
     """
     view = mock.MagicMock()
     e = mu.logic.Editor(view)
+    mock_modes = {
+        'python': mock.MagicMock(),
+    }
+    e.setup(mock_modes)
+    assert e.modes == mock_modes
+
+
+def test_editor_setup_workspace():
+    """
+    Ensure the workspace directory is created, along with the Pygame Zero
+    assets.
+    """
+    view = mock.MagicMock()
+    e = mu.logic.Editor(view)
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = 'foo'
-    mock_modes = {
+    e.modes = {
         'python': mock_mode,
     }
     with mock.patch('os.path.exists', return_value=False), \
             mock.patch('os.makedirs', return_value=None) as mkd, \
             mock.patch('shutil.copy') as mock_shutil:
-        e.setup(mock_modes)
+        e.setup_workspace()
         assert mkd.call_count == 5
         assert mkd.call_args_list[0][0][0] == 'foo'
         assert mock_shutil.call_count == 3
-    assert e.modes == mock_modes
+
+
+def test_editor_start_usb_checker():
+    """
+    Ensure the view polls for USB devices every second.
+    """
+    view = mock.MagicMock()
+    e = mu.logic.Editor(view)
+    e.start_usb_checker()
     view.set_usb_checker.assert_called_once_with(1, e.check_usb)
 
 
@@ -676,13 +1272,52 @@ def test_editor_restore_session_existing_runtime():
             ed.restore_session()
 
     assert ed.theme == theme
-    assert ed._view.add_tab.call_count == len(file_contents)
+    assert ed._view.add_placeholder.call_count == len(file_contents)
+    # The last restored tab is focused.
+    placeholder = ed._view.add_placeholder.return_value
+    ed._view.focus_tab.assert_called_once_with(placeholder)
     ed._view.set_theme.assert_called_once_with(theme)
     assert ed.envars == [['name', 'value'], ]
     assert ed.minify is False
     assert ed.microbit_runtime == '/foo'
 
 
+def test_editor_restore_session_debug_recording():
+    """
+    Ensure whether to record history when debugging is restored from the
+    session.
+    """
+    mode, theme = "python", "night"
+    ed = mocked_editor(mode)
+    with generate_session(theme, mode, debug_recording=True):
+        ed.restore_session()
+    assert ed.debug_recording is True
+
+
+def test_editor_restore_session_live_check():
+    """
+    Ensure whether to check code as you type is restored from the session.
+    """
+    mode, theme = "python", "night"
+    ed = mocked_editor(mode)
+    with generate_session(theme, mode, live_check=False):
+        ed.restore_session()
+    assert ed.live_check is False
+
+
+def test_editor_restore_session_warm_pool():
+    """
+    Ensure the number of pre-warmed interpreters is restored from the
+    session, and used when the mode is set.
+    """
+    mode, theme = "python", "night"
+    ed = mocked_editor(mode)
+    with generate_session(theme, mode, warm_pool=2):
+        ed.restore_session()
+    assert ed.warm_pool == 2
+    ed.modes[mode].set_warm_pool.assert_called_with(2)
+
+
 def test_editor_restore_session_missing_runtime():
     """
     If the referenced microbit_runtime file doesn't exist, reset to '' so Mu
@@ -696,7 +1331,7 @@ def test_editor_restore_session_missing_runtime():
         ed.restore_session()
 
     assert ed.theme == theme
-    assert ed._view.add_tab.call_count == len(file_contents)
+    assert ed._view.add_placeholder.call_count == len(file_contents)
     ed._view.set_theme.assert_called_once_with(theme)
     assert ed.envars == [['name', 'value'], ]
     assert ed.minify is False
@@ -917,6 +1552,54 @@ def test_new():
     view.add_tab.assert_called_once_with(None, '', api, mu.logic.NEWLINE)
 
 
+def test_realize_tab():
+    """
+    Ensure the file of a restored tab is loaded, as any other file, in place
+    of its placeholder.
+    """
+    view = mock.MagicMock()
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    mock_mode = mock.MagicMock()
+    mock_mode.api.return_value = ['API']
+    ed.modes = mocked_modes({'python': mock_mode})
+    placeholder = mock.MagicMock()
+    placeholder.path = '/foo/bar.py'
+    view.placeholders = [placeholder]
+    view.realize_tab.side_effect = lambda *args: view.placeholders.clear()
+    with mock.patch('os.path.isfile', return_value=True), \
+            mock.patch('mu.logic.read_and_decode',
+                       return_value=('baz', '\n')) as rad:
+        ed.realize_tab(placeholder)
+    rad.assert_called_once_with('/foo/bar.py')
+    view.realize_tab.assert_called_once_with(placeholder, 'baz', ['API'],
+                                             '\n')
+    assert view.add_tab.call_count == 0
+    assert view.show_message.call_count == 0
+    assert view.remove_placeholder.call_count == 0
+
+
+def test_realize_tab_fails():
+    """
+    If the file of a restored tab can't be read, ensure the problem is
+    reported as when loading the file, and the placeholder removed.
+    """
+    view = mock.MagicMock()
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.modes = mocked_modes({'python': mock.MagicMock()})
+    placeholder = mock.MagicMock()
+    placeholder.path = '/foo/bar.py'
+    view.placeholders = [placeholder]
+    error = UnicodeDecodeError('utf-8', b'', 0, 1, 'bad')
+    with mock.patch('os.path.isfile', return_value=True), \
+            mock.patch('mu.logic.read_and_decode', side_effect=error):
+        ed.realize_tab(placeholder)
+    assert view.show_message.call_count == 1
+    view.remove_placeholder.assert_called_once_with(placeholder)
+    assert view.realize_tab.call_count == 0
+
+
 def test_load_checks_file_exists():
     """
     If the passed in path does not exist, this is logged and no other side
@@ -1014,15 +1697,17 @@ def test_no_duplicate_load_python_file():
     unsaved_tab.path = None
 
     editor_window.widgets = [unsaved_tab, brown_tab]
+    editor_window.placeholders = []
+    editor_window.all_tabs = [unsaved_tab, brown_tab]
 
     editor_window.get_load_path = mock.MagicMock(return_value=brown_script)
     # Create the "editor" that'll control the "window".
     editor = mu.logic.Editor(view=editor_window)
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = '/fake/path'
-    editor.modes = {
+    editor.modes = mocked_modes({
         'python': mock_mode,
-    }
+    })
 
     editor.load()
     message = 'The file "{}" is already open.'.format(os.path.basename(
@@ -1050,11 +1735,10 @@ def test_load_other_file():
     mock_mb.api.return_value = api
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file.return_value = file_content
-    mock_mb.file_extensions = ['hex']
-    ed.modes = {
+    ed.modes = mocked_modes({
         'python': mock_py,
         'microbit': mock_mb,
-    }
+    }, {'microbit': ['hex']})
     ed.mode = 'microbit'
     with mock.patch('builtins.open', mock.mock_open()), \
             mock.patch('os.path.isfile', return_value=True):
@@ -1065,6 +1749,33 @@ def test_load_other_file():
     view.add_tab.assert_called_once_with(None, file_content, api, os.linesep)
 
 
+def test_load_other_file_instantiates_handling_mode():
+    """
+    Loading a file (like a .hex file) only instantiates the current mode and
+    the mode which handles that type of file.
+    """
+    view = mock.MagicMock()
+    view.get_load_path = mock.MagicMock(return_value='foo.hex')
+    view.show_confirmation = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    descriptors = [
+        mu.modes.ModeDescriptor('python', 'Python 3', '', 'python', ''),
+        mu.modes.ModeDescriptor('adafruit', 'Adafruit', '', 'adafruit', ''),
+        mu.modes.ModeDescriptor('microbit', 'micro:bit', '', 'microbit', '',
+                                file_extensions=['hex']),
+    ]
+    for descriptor in descriptors:
+        descriptor.load = mock.MagicMock()
+    microbit = descriptors[2].load.return_value.return_value
+    microbit.open_file.return_value = 'PYTHON CODE'
+    ed.modes = mu.modes.ModeRegistry(ed, view, descriptors)
+    ed.mode = 'python'
+    with mock.patch('os.path.isfile', return_value=True):
+        ed.load()
+    assert sorted(ed.modes.instances) == ['microbit', 'python']
+    microbit.open_file.assert_called_once_with('foo.hex')
+
+
 def test_load_other_file_change_mode():
     """
     If the user specifies a file supported by a Mu mode (like a .hex file) that
@@ -1087,11 +1798,10 @@ def test_load_other_file_change_mode():
     mock_mb.api.return_value = api
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file.return_value = file_content
-    mock_mb.file_extensions = ['hex']
-    ed.modes = {
+    ed.modes = mocked_modes({
         'python': mock_py,
         'microbit': mock_mb,
-    }
+    }, {'microbit': ['hex']})
     ed.mode = 'python'
     with mock.patch('builtins.open', mock.mock_open()), \
             mock.patch('os.path.isfile', return_value=True):
@@ -1116,10 +1826,9 @@ def test_load_other_file_with_exception():
     mock_mb = mock.MagicMock()
     mock_mb.workspace_dir.return_value = '/fake/path'
     mock_mb.open_file = mock.MagicMock(side_effect=Exception(':('))
-    mock_mb.file_extensions = ['hex']
-    ed.modes = {
+    ed.modes = mocked_modes({
         'microbit': mock_mb,
-    }
+    }, {'microbit': ['hex']})
     ed.mode = 'microbit'
     mock_open = mock.mock_open()
     with mock.patch('builtins.open', mock_open), \
@@ -1139,11 +1848,42 @@ def test_load_not_python_or_hex():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
+    ed.modes = mocked_modes({'python': mock.MagicMock()})
     with mock.patch('os.path.isfile', return_value=True):
         ed._load('unknown_filetype.foo')
     assert view.show_message.call_count == 1
 
 
+def test_load_data_capture():
+    """
+    If the user opens a CSV file in a mode with a plotter, the mode displays
+    the captured data.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    mock_mode = mock.MagicMock()
+    ed.modes = {'python': mock_mode}
+    with mock.patch('os.path.isfile', return_value=True):
+        ed._load('capture.CSV')
+    mock_mode.open_capture.assert_called_once_with('capture.CSV')
+    assert view.add_tab.call_count == 0
+
+
+def test_load_data_capture_no_plotter():
+    """
+    If the current mode has no plotter, opening a CSV file results in a
+    helpful message.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    mock_mode = mock.MagicMock(spec=['name'])
+    ed.modes = {'python': mock_mode}
+    with mock.patch('os.path.isfile', return_value=True):
+        ed._load('capture.csv')
+    assert view.show_message.call_count == 1
+    assert view.add_tab.call_count == 0
+
+
 def test_load_recovers_from_oserror():
     """
     If loading the file results in an OSError (for example, the user doesn't
@@ -1206,9 +1946,9 @@ def test_load_error():
     mock_open = mock.MagicMock(side_effect=FileNotFoundError())
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = '/fake/path'
-    ed.modes = {
+    ed.modes = mocked_modes({
         'python': mock_mode,
-    }
+    })
     with mock.patch('builtins.open', mock_open):
         ed.load()
     assert view.get_load_path.call_count == 1
@@ -1379,6 +2119,8 @@ def test_get_tab_existing_tab():
     mock_tab = mock.MagicMock()
     mock_tab.path = 'foo'
     view.widgets = [mock_tab, ]
+    view.placeholders = []
+    view.all_tabs = [mock_tab, ]
     ed = mu.logic.Editor(view)
     view.focus_tab.reset_mock()
     tab = ed.get_tab('foo')
@@ -1395,6 +2137,7 @@ def test_get_tab_new_tab():
     mock_tab = mock.MagicMock()
     mock_tab.path = 'foo'
     view.widgets = [mock_tab, ]
+    view.placeholders = []
     ed = mu.logic.Editor(view)
     ed.direct_load = mock.MagicMock()
     tab = ed.get_tab('bar')
@@ -1411,6 +2154,7 @@ def test_get_tab_no_path():
     mock_tab = mock.MagicMock()
     mock_tab.path = None
     view.widgets = [mock_tab, ]
+    view.placeholders = []
     ed = mu.logic.Editor(view)
     ed.direct_load = mock.MagicMock()
     tab = ed.get_tab('bar')
@@ -1418,6 +2162,25 @@ def test_get_tab_no_path():
     assert tab == view.current_tab
 
 
+def test_get_tab_placeholder():
+    """
+    If the path is represented by a tab whose file is yet to be loaded, ensure
+    it is focused (so loaded) and the loaded tab is returned.
+    """
+    view = mock.MagicMock()
+    placeholder = mock.MagicMock()
+    placeholder.path = 'foo'
+    view.widgets = []
+    view.placeholders = [placeholder, ]
+    view.all_tabs = [placeholder, ]
+    ed = mu.logic.Editor(view)
+    ed.direct_load = mock.MagicMock()
+    tab = ed.get_tab('foo')
+    view.focus_tab.assert_called_once_with(placeholder)
+    assert tab == view.current_tab
+    assert ed.direct_load.call_count == 0
+
+
 def test_zoom_in():
     """
     Ensure the UI layer is zoomed in.
@@ -1442,7 +2205,8 @@ def test_zoom_out():
 
 def test_check_code_on():
     """
-    Checking code correctly results in something the UI layer can parse.
+    Checking code requests the check of the current tab's code in the
+    background.
     """
     view = mock.MagicMock()
     tab = mock.MagicMock()
@@ -1450,45 +2214,192 @@ def test_check_code_on():
     tab.path = 'foo.py'
     tab.text.return_value = 'import this\n'
     view.current_tab = tab
+    mock_mode = mock.MagicMock()
+    mock_mode.builtins = ['foo', ]
+    ed = mu.logic.Editor(view)
+    ed.code_checker = mock.MagicMock()
+    ed.modes = {'python': mock_mode, }
+    ed.check_code()
+    assert tab.has_annotations is True
+    view.reset_annotations.assert_called_once_with()
+    ed.code_checker.check.assert_called_once_with(tab, 'foo.py',
+                                                  'import this\n', ['foo', ])
+
+
+def test_check_code_on_confirms():
+    """
+    Checking code on request confirms when no problems are found, even if the
+    results were cached.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = False
+    view.current_tab = tab
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed.confirm_check = False
+    ed.code_checker = mock.MagicMock()
+    ed.check_code()
+    assert ed.confirm_check is True
+
+
+def test_on_text_changed():
+    """
+    Editing a tab (re)starts the timer to check its code once typing pauses.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.live_check_timer = mock.MagicMock()
+    tab = mock.MagicMock()
+    ed.on_text_changed(tab)
+    assert ed.live_check_tab == tab
+    ed.live_check_timer.start.assert_called_once_with()
+
+
+def test_on_text_changed_live_check_off():
+    """
+    If checking code as you type is switched off, editing a tab does nothing.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.live_check = False
+    ed.live_check_timer = mock.MagicMock()
+    ed.on_text_changed(mock.MagicMock())
+    assert ed.live_check_tab is None
+    assert ed.live_check_timer.start.call_count == 0
+
+
+def test_live_check_code():
+    """
+    Once typing pauses, the code of the edited tab is checked without
+    confirming there are no problems.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.path = None
+    tab.text.return_value = 'import this\n'
+    view.widgets = [tab, ]
+    mock_mode = mock.MagicMock()
+    mock_mode.builtins = None
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock_mode, }
+    ed.code_checker = mock.MagicMock()
+    ed.confirm_check = True
+    ed.live_check_tab = tab
+    ed.live_check_code()
+    assert ed.live_check_tab is None
+    assert ed.confirm_check is False
+    ed.code_checker.check.assert_called_once_with(tab, 'untitled',
+                                                  'import this\n', None)
+
+
+def test_live_check_code_tab_closed():
+    """
+    If the edited tab has been closed, its code isn't checked.
+    """
+    view = mock.MagicMock()
+    view.widgets = []
+    ed = mu.logic.Editor(view)
+    ed.code_checker = mock.MagicMock()
+    ed.live_check_tab = mock.MagicMock()
+    ed.live_check_code()
+    assert ed.code_checker.check.call_count == 0
+    ed.live_check_tab = None
+    ed.live_check_code()
+    assert ed.code_checker.check.call_count == 0
+
+
+def test_on_code_checked_live():
+    """
+    The results of checking code as you type update the tab's annotations
+    without confirming there are no problems.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = False
+    view.widgets = [tab, ]
+    flake = {2: [{'line_no': 2, 'message': 'a message', }], }
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed.on_code_checked(tab, flake, {})
+    tab.update_annotations.assert_called_once_with({'error': flake,
+                                                    'style': {}})
+    # Not the results of checking on request, so not toggled off by Check.
+    assert tab.has_annotations is False
+    ed.on_code_checked(tab, {}, {})
+    assert tab.has_annotations is False
+    assert ed.show_status_message.call_count == 0
+    assert tab.annotate_code.call_count == 0
+
+
+def test_on_code_checked():
+    """
+    The results of checking code correctly result in something the UI layer
+    can parse.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = True
+    view.widgets = [tab, ]
     flake = {2: {'line_no': 2, 'message': 'a message', }, }
     pep8 = {2: [{'line_no': 2, 'message': 'another message', }],
             3: [{'line_no': 3, 'message': 'yet another message', }]}
-    mock_mode = mock.MagicMock()
-    mock_mode.builtins = None
-    with mock.patch('mu.logic.check_flake', return_value=flake), \
-            mock.patch('mu.logic.check_pycodestyle', return_value=pep8):
-        ed = mu.logic.Editor(view)
-        ed.modes = {'python': mock_mode, }
-        ed.check_code()
-        assert tab.has_annotations is True
-        view.reset_annotations.assert_called_once_with()
-        view.annotate_code.assert_has_calls([mock.call(flake, 'error'),
-                                             mock.call(pep8, 'style')],
-                                            any_order=True)
+    ed = mu.logic.Editor(view)
+    ed.confirm_check = True
+    ed.on_code_checked(tab, flake, pep8)
+    assert tab.has_annotations is True
+    tab.annotate_code.assert_has_calls([mock.call(flake, 'error'),
+                                        mock.call(pep8, 'style')],
+                                       any_order=True)
+    tab.show_annotations.assert_called_once_with()
 
 
-def test_check_code_no_problems():
+def test_on_code_checked_no_problems():
     """
     If no problems are found in the code, ensure a status message is shown to
     the user to confirm the fact. See #337
     """
     view = mock.MagicMock()
     tab = mock.MagicMock()
+    tab.has_annotations = True
+    view.widgets = [tab, ]
+    ed = mu.logic.Editor(view)
+    ed.confirm_check = True
+    ed.show_status_message = mock.MagicMock()
+    ed.on_code_checked(tab, {}, {})
+    assert tab.has_annotations is False
+    assert ed.show_status_message.call_count == 1
+
+
+def test_on_code_checked_tab_closed():
+    """
+    If the tab was closed while its code was being checked, the results are
+    ignored.
+    """
+    view = mock.MagicMock()
+    view.widgets = []
+    tab = mock.MagicMock()
+    tab.has_annotations = True
+    ed = mu.logic.Editor(view)
+    ed.on_code_checked(tab, {}, {1: [{'line_no': 1, 'message': 'x', }]})
+    assert tab.annotate_code.call_count == 0
+
+
+def test_on_code_checked_toggled_off():
+    """
+    If the annotations were toggled off while the code was being checked, the
+    results are ignored.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
     tab.has_annotations = False
-    tab.path = 'foo.py'
-    tab.text.return_value = 'import this\n'
-    view.current_tab = tab
-    flake = {}
-    pep8 = {}
-    mock_mode = mock.MagicMock()
-    mock_mode.builtins = None
-    with mock.patch('mu.logic.check_flake', return_value=flake), \
-            mock.patch('mu.logic.check_pycodestyle', return_value=pep8):
-        ed = mu.logic.Editor(view)
-        ed.show_status_message = mock.MagicMock()
-        ed.modes = {'python': mock_mode, }
-        ed.check_code()
-        assert ed.show_status_message.call_count == 1
+    view.widgets = [tab, ]
+    ed = mu.logic.Editor(view)
+    ed.confirm_check = True
+    ed.show_status_message = mock.MagicMock()
+    ed.on_code_checked(tab, {}, {})
+    assert tab.show_annotations.call_count == 0
+    assert ed.show_status_message.call_count == 0
 
 
 def test_check_code_off():
@@ -1500,9 +2411,33 @@ def test_check_code_off():
     tab.has_annotations = True
     view.current_tab = tab
     ed = mu.logic.Editor(view)
+    ed.code_checker = mock.MagicMock()
     ed.check_code()
     assert tab.has_annotations is False
     view.reset_annotations.assert_called_once_with()
+    ed.code_checker.cancel.assert_called_once_with(tab)
+
+
+def test_check_code_after_live_check():
+    """
+    If the annotations on show are the results of checking as you type,
+    Check checks the code again (and confirms the results) rather than
+    toggling them off.
+    """
+    view = mock.MagicMock()
+    tab = mock.MagicMock()
+    tab.has_annotations = False
+    view.current_tab = tab
+    view.widgets = [tab, ]
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock(), }
+    ed.code_checker = mock.MagicMock()
+    ed.on_code_checked(tab, {2: [{'line_no': 2, 'message': 'x', }]}, {})
+    ed.check_code()
+    assert tab.has_annotations is True
+    assert ed.confirm_check is True
+    assert ed.code_checker.check.call_count == 1
+    assert ed.code_checker.cancel.call_count == 0
 
 
 def test_check_code_no_tab():
@@ -1523,7 +2458,7 @@ def test_show_help():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
+    with mock.patch('webbrowser.open_new', return_value=None) as wb, \
             mock.patch('mu.logic.locale.getdefaultlocale',
                        return_value=('en_GB', 'UTF-8')):
         ed.show_help()
@@ -1540,7 +2475,7 @@ def test_show_help_exploding_getdefaultlocale():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.webbrowser.open_new', return_value=None) as wb, \
+    with mock.patch('webbrowser.open_new', return_value=None) as wb, \
             mock.patch('mu.logic.locale.getdefaultlocale',
                        side_effect=TypeError('Boom!')):
         ed.show_help()
@@ -1630,8 +2565,9 @@ def test_quit_modified_ok():
 
 def test_quit_save_tabs_with_paths():
     """
-    When saving the session, ensure those tabs with associated paths are
-    logged in the session file.
+    When saving the session, ensure those tabs with associated paths
+    (including those whose files are yet to be loaded) are logged in the
+    session file, in the order of the tabs.
     """
     view = mock.MagicMock()
     view.modified = True
@@ -1639,6 +2575,12 @@ def test_quit_save_tabs_with_paths():
     w1 = mock.MagicMock()
     w1.path = 'foo.py'
     view.widgets = [w1, ]
+    placeholder1 = mock.MagicMock()
+    placeholder1.path = 'bar.py'
+    placeholder2 = mock.MagicMock()
+    placeholder2.path = 'baz.py'
+    view.placeholders = [placeholder1, placeholder2]
+    view.all_tabs = [placeholder1, w1, placeholder2]
     ed = mu.logic.Editor(view)
     mock_mode = mock.MagicMock()
     mock_mode.workspace_dir.return_value = 'foo/bar'
@@ -1663,7 +2605,9 @@ def test_quit_save_tabs_with_paths():
     recovered = ''.join([i[0][0] for i
                         in mock_open.return_value.write.call_args_list])
     session = json.loads(recovered)
-    assert os.path.abspath('foo.py') in session['paths']
+    assert session['paths'] == [os.path.abspath('bar.py'),
+                                os.path.abspath('foo.py'),
+                                os.path.abspath('baz.py')]
 
 
 def test_quit_save_theme():
@@ -1745,11 +2689,14 @@ def test_quit_save_envars():
                         in mock_open.return_value.write.call_args_list])
     session = json.loads(recovered)
     assert session['envars'] == [['name1', 'value1'], ['name2', 'value2'], ]
+    assert session['warm_pool'] == 0
+    assert session['debug_recording'] is False
+    assert session['live_check'] is True
 
 
 def test_quit_calls_sys_exit():
     """
-    Ensure that sys.exit(0) is called.
+    Ensure that outstanding autosaves are written and sys.exit(0) is called.
     """
     view = mock.MagicMock()
     view.modified = True
@@ -1758,6 +2705,7 @@ def test_quit_calls_sys_exit():
     w1.path = 'foo.py'
     view.widgets = [w1, ]
     ed = mu.logic.Editor(view)
+    ed.saver = mock.MagicMock()
     ed.theme = 'night'
     ed.modes = {
         'python': mock.MagicMock(),
@@ -1772,9 +2720,39 @@ def test_quit_calls_sys_exit():
     with mock.patch('sys.exit', return_value=None) as ex, \
             mock.patch('builtins.open', mock_open):
         ed.quit(mock_event)
+    ed.saver.stop.assert_called_once_with()
+    # Any pre-warmed interpreters are shut down.
+    ed.modes['python'].set_warm_pool.assert_called_once_with(0)
     ex.assert_called_once_with(0)
 
 
+def test_show_admin_warm_pool():
+    """
+    Ensure a change to the number of pre-warmed interpreters in the admin
+    dialog is applied to the current mode.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.modes = {'python': mock.MagicMock()}
+    view.show_admin.return_value = {
+        'envars': '',
+        'warm_pool': 2,
+        'minify': False,
+        'microbit_runtime': '',
+        'debug_recording': False,
+        'live_check': True,
+    }
+    with mock.patch('builtins.open', mock.mock_open()):
+        ed.show_admin(None)
+    assert view.show_admin.call_args[0][1]['warm_pool'] == 0
+    assert ed.warm_pool == 2
+    ed.modes['python'].set_warm_pool.assert_called_once_with(2)
+    ed.modes['python'].set_warm_pool.reset_mock()
+    with mock.patch('builtins.open', mock.mock_open()):
+        ed.show_admin(None)
+    assert ed.modes['python'].set_warm_pool.call_count == 0
+
+
 def test_show_admin():
     """
     Ensure the expected admin dialog is displayed to the end user.
@@ -1786,8 +2764,11 @@ def test_show_admin():
     ed.microbit_runtime = '/foo/bar'
     settings = {
         'envars': 'name=value',
+        'warm_pool': 0,
         'minify': True,
-        'microbit_runtime': '/foo/bar'
+        'microbit_runtime': '/foo/bar',
+        'debug_recording': False,
+        'live_check': True,
     }
     view.show_admin.return_value = settings
     mock_open = mock.mock_open()
@@ -1801,6 +2782,31 @@ def test_show_admin():
         assert ed.envars == [['name', 'value']]
         assert ed.minify is True
         assert ed.microbit_runtime == '/foo/bar'
+        assert ed.debug_recording is False
+        assert ed.live_check is True
+
+
+def test_show_admin_debug_latency():
+    """
+    Ensure the latency of the recent steps in the debugger is shown in the
+    admin dialog.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    debugger = mock.MagicMock()
+    ed.modes = {'debugger': debugger}
+    view.show_admin.return_value = {
+        'envars': '',
+        'warm_pool': 0,
+        'minify': False,
+        'microbit_runtime': '',
+        'debug_recording': False,
+        'live_check': True,
+    }
+    with mock.patch('builtins.open', mock.mock_open()):
+        ed.show_admin(None)
+    settings = view.show_admin.call_args[0][1]
+    assert settings['debug_latency'] is debugger.latency
 
 
 def test_show_admin_missing_microbit_runtime():
@@ -1815,8 +2821,11 @@ def test_show_admin_missing_microbit_runtime():
     ed.microbit_runtime = '/foo/bar'
     settings = {
         'envars': 'name=value',
+        'warm_pool': 0,
         'minify': True,
-        'microbit_runtime': '/foo/bar'
+        'microbit_runtime': '/foo/bar',
+        'debug_recording': False,
+        'live_check': True,
     }
     view.show_admin.return_value = settings
     mock_open = mock.mock_open()
@@ -1835,19 +2844,20 @@ def test_show_admin_missing_microbit_runtime():
 
 def test_select_mode():
     """
-    It's possible to select and update to a new mode.
+    It's possible to select and update to a new mode. The mode selector is
+    given the descriptors of the modes, so they're not instantiated.
     """
     view = mock.MagicMock()
     view.select_mode.return_value = 'foo'
     mode = mock.MagicMock()
     mode.is_debugger = False
     ed = mu.logic.Editor(view)
-    ed.modes = {
+    ed.modes = mocked_modes({
         'python': mode,
-    }
+    })
     ed.change_mode = mock.MagicMock()
     ed.select_mode(None)
-    assert view.select_mode.call_count == 1
+    view.select_mode.assert_called_once_with(ed.modes.descriptors, 'python')
     ed.change_mode.assert_called_once_with('foo')
 
 
@@ -1908,9 +2918,11 @@ def test_change_mode():
     old_mode.remove_repl.assert_called_once_with()
     old_mode.remove_fs.assert_called_once_with()
     old_mode.remove_plotter.assert_called_once_with()
+    old_mode.set_warm_pool.assert_called_once_with(0)
     # Check the new mode is set up correctly.
     assert ed.mode == 'python'
     view.change_mode.assert_called_once_with(mode)
+    mode.set_warm_pool.assert_called_once_with(ed.warm_pool)
     assert mock_button_bar.connect.call_count == 11
     view.status_bar.set_mode.assert_called_once_with('python')
     view.set_timer.assert_called_once_with(5, ed.autosave)
@@ -1955,6 +2967,7 @@ def test_change_mode_reset_breakpoints():
     mock_tab = mock.MagicMock()
     mock_tab.breakpoint_handles = set([1, 2, 3, ])
     view.widgets = [mock_tab, ]
+    view.placeholders = []
     ed = mu.logic.Editor(view)
     mode = mock.MagicMock()
     mode.has_debugger = False
@@ -1968,24 +2981,82 @@ def test_change_mode_reset_breakpoints():
     ed.change_mode('microbit')
     assert ed.mode == 'microbit'
     assert mock_tab.breakpoint_handles == set()
+    assert mock_tab.breakpoint_options == {}
     mock_tab.reset_annotations.assert_called_once_with()
 
 
 def test_autosave():
     """
-    Ensure the autosave callback does the expected things to the tabs.
+    Ensure the autosave callback saves the text of the modified tabs in the
+    background.
     """
     view = mock.MagicMock()
     view.modified = True
     mock_tab = mock.MagicMock()
     mock_tab.path = 'foo'
+    mock_tab.text = mock.MagicMock(return_value='bar')
+    mock_tab.newline = '\n'
     mock_tab.isModified.return_value = True
-    view.widgets = [mock_tab, ]
+    unmodified_tab = mock.MagicMock()
+    unmodified_tab.path = 'baz'
+    unmodified_tab.isModified.return_value = False
+    view.widgets = [mock_tab, unmodified_tab]
+    view.placeholders = []
     ed = mu.logic.Editor(view)
-    with mock.patch('mu.logic.save_and_encode') as mock_save:
-        ed.autosave()
-    assert mock_save.call_count == 1
-    mock_tab.setModified.assert_called_once_with(False)
+    ed.saver = mock.MagicMock()
+    ed.autosave()
+    ed.saver.save.assert_called_once_with('foo', 'bar', '\n')
+    # The tab is only unmodified once the text is saved.
+    assert mock_tab.setModified.call_count == 0
+
+
+def test_on_saved():
+    """
+    Once autosaved, the tabs for the path whose text hasn't changed since are
+    no longer modified.
+    """
+    view = mock.MagicMock()
+    saved_tab = mock.MagicMock()
+    saved_tab.path = 'foo'
+    saved_tab.text = mock.MagicMock(return_value='bar')
+    changed_tab = mock.MagicMock()
+    changed_tab.path = 'foo'
+    changed_tab.text = mock.MagicMock(return_value='bar and more')
+    view.widgets = [saved_tab, changed_tab]
+    ed = mu.logic.Editor(view)
+    ed.show_status_message = mock.MagicMock()
+    ed.on_saved('foo', 'bar')
+    saved_tab.setModified.assert_called_once_with(False)
+    assert changed_tab.setModified.call_count == 0
+    ed.show_status_message.assert_called_once_with('Saved file: foo')
+
+
+def test_on_save_failed():
+    """
+    Errors autosaving are reported to the user.
+    """
+    view = mock.MagicMock()
+    ed = mu.logic.Editor(view)
+    ed.on_save_failed('foo', OSError('Boom'))
+    assert view.show_message.call_count == 1
+    assert 'disk problem' in view.show_message.call_args[0][0]
+    error = UnicodeEncodeError(mu.logic.ENCODING, '', 0, 0, 'Boom')
+    ed.on_save_failed('foo', error)
+    assert 'encoding problem' in view.show_message.call_args[0][0]
+
+
+def test_save_tab_to_file_cancels_autosave():
+    """
+    Saving a tab discards any outstanding autosave of its path, so it can't
+    overwrite the text saved.
+    """
+    text, path, newline = "foo", "foo.py", "\n"
+    ed = mocked_editor(text=text, path=path, newline=newline)
+    ed.saver = mock.MagicMock()
+    with mock.patch("mu.logic.save_and_encode") as mock_save:
+        ed.save()
+    ed.saver.cancel.assert_called_once_with(path)
+    mock_save.assert_called_once_with(text, path, newline)
 
 
 def test_check_usb():
@@ -1999,9 +3070,9 @@ def test_check_usb():
     mode_mb = mock.MagicMock()
     mode_mb.name = 'BBC micro:bit'
     mode_mb.find_device.return_value = ('/dev/ttyUSB0', '12345')
-    ed.modes = {
+    ed.modes = mocked_modes({
         'microbit': mode_mb,
-    }
+    })
     ed.show_status_message = mock.MagicMock()
     ed.check_usb()
     expected = 'Detected new BBC micro:bit device.'
@@ -2021,9 +3092,9 @@ def test_check_usb_change_mode_cancel():
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
     mode_cp.find_device.return_value = ('/dev/ttyUSB1', '12345')
-    ed.modes = {
+    ed.modes = mocked_modes({
         'circuitplayground': mode_cp,
-    }
+    })
     ed.show_status_message = mock.MagicMock()
     ed.check_usb()
     expected = 'Detected new CircuitPlayground device.'
@@ -2045,10 +3116,10 @@ def test_check_usb_already_in_mode():
     mode_mb.find_device.return_value = ('/dev/ttyUSB0', '12345')
     mode_cp = mock.MagicMock()
     mode_cp.find_device.return_value = (None, None)
-    ed.modes = {
+    ed.modes = mocked_modes({
         'microbit': mode_mb,
         'circuitplayground': mode_cp
-    }
+    })
     ed.mode = 'microbit'
     ed.show_status_message = mock.MagicMock()
     ed.check_usb()
@@ -2070,10 +3141,10 @@ def test_check_usb_multiple_devices():
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
     mode_cp.find_device.return_value = ('/dev/ttyUSB1', '54321')
-    ed.modes = {
+    ed.modes = mocked_modes({
         'microbit': mode_mb,
         'circuitplayground': mode_cp
-    }
+    })
     ed.show_status_message = mock.MagicMock()
     ed.check_usb()
     expected_mb = mock.call('Detected new BBC micro:bit device.')
@@ -2096,9 +3167,9 @@ def test_check_usb_when_selecting_mode_is_silent():
     mode_cp = mock.MagicMock()
     mode_cp.name = 'CircuitPlayground'
     mode_cp.find_device.return_value = ('/dev/ttyUSB1', '12345')
-    ed.modes = {
+    ed.modes = mocked_modes({
         'circuitplayground': mode_cp,
-    }
+    })
     ed.show_status_message = mock.MagicMock()
     ed.selecting_mode = True
     ed.check_usb()
@@ -2115,7 +3186,7 @@ def test_check_usb_remove_disconnected_devices():
     """
     view = mock.MagicMock()
     ed = mu.logic.Editor(view)
-    ed.modes = {}
+    ed.modes = mocked_modes({})
     ed.show_status_message = mock.MagicMock()
     ed.connected_devices = {('microbit', '/dev/ttyACM1')}
     ed.check_usb()
@@ -2238,6 +3309,109 @@ def test_debug_toggle_breakpoint_off_invalid_breakpoint_line():
     view.current_tab.markerDelete.assert_called_once_with(10, -1)
 
 
+def test_debug_toggle_breakpoint_shift_edits_options():
+    """
+    Shift-clicking the margin edits the breakpoint's options instead of
+    toggling it.
+    """
+    view = mock.MagicMock()
+    view.current_tab.text.return_value = 'print("Hello")'
+    ed = mu.logic.Editor(view)
+    mock_mode = mock.MagicMock()
+    mock_mode.has_debugger = True
+    mock_mode.is_debugger = False
+    ed.modes = {
+        'python': mock_mode,
+    }
+    ed.mode = 'python'
+    ed.edit_breakpoint = mock.MagicMock()
+    ed.debug_toggle_breakpoint(1, 10, Qt.ShiftModifier)
+    ed.edit_breakpoint.assert_called_once_with(10, view.current_tab)
+    assert view.current_tab.markerAdd.call_count == 0
+
+
+def test_edit_breakpoint_cancelled():
+    """
+    Nothing changes if the user cancels editing the breakpoint's options.
+    """
+    view = mock.MagicMock()
+    view.show_breakpoint_options.return_value = None
+    tab = mock.MagicMock()
+    tab.breakpoint_handle.return_value = None
+    tab.breakpoint_options = {}
+    ed = mu.logic.Editor(view)
+    ed.mode = 'python'
+    ed.edit_breakpoint(10, tab)
+    view.show_breakpoint_options.assert_called_once_with(None, None, None)
+    assert tab.markerAdd.call_count == 0
+    assert tab.breakpoint_options == {}
+
+
+def test_edit_breakpoint_new():
+    """
+    If there's no breakpoint on the line (and the debugger isn't running),
+    one is added and the tab remembers its options.
+    """
+    view = mock.MagicMock()
+    view.show_breakpoint_options.return_value = ('x', 2, None)
+    tab = mock.MagicMock()
+    tab.breakpoint_handle.side_effect = [None, None, 999]
+    tab.breakpoint_handles = set()
+    tab.breakpoint_options = {}
+    tab.markerAdd.return_value = 999
+    ed = mu.logic.Editor(view)
+    ed.mode = 'python'
+    ed.edit_breakpoint(10, tab)
+    tab.markerAdd.assert_called_once_with(10, tab.BREAKPOINT_MARKER)
+    assert 999 in tab.breakpoint_handles
+    assert tab.breakpoint_options == {
+        999: {'condition': 'x', 'hit_count': 2, 'log_message': None},
+    }
+
+
+def test_edit_breakpoint_existing():
+    """
+    The existing options of the breakpoint on the line are shown to the user
+    and replaced with the new options.
+    """
+    view = mock.MagicMock()
+    view.show_breakpoint_options.return_value = (None, None, 'x is {x}')
+    tab = mock.MagicMock()
+    tab.breakpoint_handle.return_value = 999
+    tab.breakpoint_options = {
+        999: {'condition': 'x', 'hit_count': 2, 'log_message': None},
+    }
+    ed = mu.logic.Editor(view)
+    ed.mode = 'python'
+    ed.edit_breakpoint(10, tab)
+    view.show_breakpoint_options.assert_called_once_with('x', 2, None)
+    assert tab.markerAdd.call_count == 0
+    assert tab.breakpoint_options == {
+        999: {'condition': None, 'hit_count': None, 'log_message': 'x is {x}'},
+    }
+
+
+def test_edit_breakpoint_while_debugging():
+    """
+    If the debugger is running, its breakpoint's options are set too.
+    """
+    view = mock.MagicMock()
+    view.show_breakpoint_options.return_value = ('x', None, None)
+    tab = mock.MagicMock()
+    tab.breakpoint_handle.return_value = 999
+    tab.breakpoint_options = {}
+    ed = mu.logic.Editor(view)
+    mock_debugger = mock.MagicMock()
+    ed.modes = {
+        'debugger': mock_debugger,
+    }
+    ed.mode = 'debugger'
+    ed.edit_breakpoint(10, tab)
+    mock_debugger.set_breakpoint_options.assert_called_once_with(
+        10, tab, 'x', None, None)
+    assert tab.breakpoint_options[999]['condition'] == 'x'
+
+
 def test_rename_tab_no_tab_id():
     """
     If no tab id is supplied (i.e. this method was triggered by the shortcut
@@ -2308,6 +3482,8 @@ def test_rename_tab_avoid_duplicating_other_tab_name():
     mock_other_tab = mock.MagicMock()
     mock_other_tab.path = 'foo.py'
     view.widgets = [mock_other_tab, ]
+    view.placeholders = []
+    view.all_tabs = [mock_other_tab, ]
     mock_tab = mock.MagicMock()
     mock_tab.path = 'old.py'
     view.tabs.widget.return_value = mock_tab
@@ -2584,6 +3760,8 @@ def test_handle_open_file():
     """
     class Dummy(QObject):
         open_file = pyqtSignal(str)
+        text_changed = pyqtSignal(object)
+        placeholder_focused = pyqtSignal(object)
     view = Dummy()
     edit = mu.logic.Editor(view)
     m = mock.MagicMock()
@@ -2592,6 +3770,23 @@ def test_handle_open_file():
     m.assert_called_once_with('/test/path.py')
 
 
+def test_handle_text_changed():
+    """
+    Ensure the editor's on_text_changed event handler fires with the edited
+    tab when the view's text_changed signal is emitted.
+    """
+    class Dummy(QObject):
+        open_file = pyqtSignal(str)
+        text_changed = pyqtSignal(object)
+        placeholder_focused = pyqtSignal(object)
+    view = Dummy()
+    edit = mu.logic.Editor(view)
+    edit.live_check_timer = mock.MagicMock()
+    tab = mock.MagicMock()
+    view.text_changed.emit(tab)
+    assert edit.live_check_tab == tab
+
+
 def test_load_cli():
     """
     Ensure loading paths specified from the command line works as expected.
@@ -2611,15 +3806,13 @@ def test_load_cli():
 
 def test_abspath():
     """
-    Ensure a set of unique absolute paths is returned, given a list of
-    arbitrary paths.
+    Ensure a list of unique absolute paths is returned, in the order given,
+    given a list of arbitrary paths.
     """
     ed = mu.logic.Editor(mock.MagicMock())
-    paths = ['foo', 'bar', 'bar']
+    paths = ['foo', 'bar', 'foo', 'bar']
     result = ed._abspath(paths)
-    assert len(result) == 2
-    assert os.path.abspath('foo') in result
-    assert os.path.abspath('bar') in result
+    assert result == [os.path.abspath('foo'), os.path.abspath('bar')]
 
 
 def test_abspath_fail():
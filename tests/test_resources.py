@@ -2,6 +2,7 @@
 """
 Tests for the resources sub-module.
 """
+import os
 import mu.resources
 from unittest import mock
 from PyQt5.QtGui import QIcon, QPixmap
@@ -17,6 +18,30 @@ def test_path():
         r.assert_called_once_with(mu.resources.__name__, 'images/foo')
 
 
+def test_resource_filename():
+    """
+    Ensure the filename of a resource is in the referenced package's
+    directory.
+    """
+    directory = os.path.dirname(os.path.abspath(mu.resources.__file__))
+    result = mu.resources.resource_filename(mu.resources.__name__,
+                                            'css/day.css')
+    assert result == os.path.join(directory, 'css', 'day.css')
+    assert os.path.isfile(result)
+
+
+def test_resource_string():
+    """
+    Ensure the content of a resource is returned as bytes.
+    """
+    result = mu.resources.resource_string(mu.resources.__name__,
+                                          'css/day.css')
+    filename = os.path.join(os.path.dirname(mu.resources.__file__), 'css',
+                            'day.css')
+    with open(filename, 'rb') as f:
+        assert result == f.read()
+
+
 def test_load_icon():
     """
     Check the load_icon function returns the expected QIcon object.
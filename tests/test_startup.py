@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for the profiling of Mu's start-up.
+"""
+import builtins
+import sys
+import threading
+from unittest import mock
+import mu.startup
+
+
+def test_ImportTimer_start_stop():
+    """
+    Ensure the built-in __import__ function is only replaced while the timer
+    is started.
+    """
+    original = builtins.__import__
+    timer = mu.startup.ImportTimer()
+    timer.start()
+    try:
+        assert builtins.__import__ == timer.timed_import
+    finally:
+        timer.stop()
+    assert builtins.__import__ is original
+    timer.stop()  # Stopping twice is harmless.
+    assert builtins.__import__ is original
+
+
+def test_ImportTimer_timed_import():
+    """
+    Ensure imports which import modules are timed, including the time taken
+    by the modules they import.
+    """
+    timer = mu.startup.ImportTimer()
+    timer.thread = threading.get_ident()
+
+    def fake_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if name == 'foo':
+            timer.timed_import('bar')
+        sys.modules[name] = mock.MagicMock()
+        return sys.modules[name]
+
+    timer.original_import = fake_import
+    with mock.patch.dict('sys.modules'), \
+            mock.patch('mu.startup.time.perf_counter',
+                       side_effect=[1.0, 1.5, 2.0, 4.0]):
+        sys.modules.pop('foo', None)
+        sys.modules.pop('bar', None)
+        timer.timed_import('foo')
+    assert timer.timings == {'foo': (3.0, 2.5), 'bar': (0.5, 0.5)}
+
+
+def test_ImportTimer_timed_import_already_imported():
+    """
+    Ensure modules already imported are not timed.
+    """
+    timer = mu.startup.ImportTimer()
+    timer.thread = threading.get_ident()
+    timer.original_import = mock.MagicMock()
+    timer.timed_import('sys')
+    timer.original_import.assert_called_once_with('sys', None, None, (), 0)
+    assert timer.timings == {}
+
+
+def test_ImportTimer_timed_import_other_thread():
+    """
+    Ensure imports on other threads are not timed.
+    """
+    timer = mu.startup.ImportTimer()
+    timer.thread = -1
+    timer.original_import = mock.MagicMock()
+    with mock.patch.dict('sys.modules'):
+        sys.modules.pop('foo', None)
+        timer.timed_import('foo')
+    timer.original_import.assert_called_once_with('foo', None, None, (), 0)
+    assert timer.timings == {}
+
+
+def test_ImportTimer_module_name():
+    """
+    Ensure relative imports are named by their absolute name.
+    """
+    timer = mu.startup.ImportTimer()
+    assert timer.module_name('foo', None, 0) == 'foo'
+    globals = {'__package__': 'mu.modes'}
+    assert timer.module_name('python3', globals, 1) == 'mu.modes.python3'
+    assert timer.module_name('', globals, 1) == 'mu.modes'
+    assert timer.module_name('foo', {}, 1) == 'foo'
+
+
+def test_StartupProfile_mark():
+    """
+    Ensure the duration of each phase is recorded and its end is logged.
+    """
+    with mock.patch('mu.startup.time.perf_counter', return_value=1.0):
+        profile = mu.startup.StartupProfile()
+    with mock.patch('mu.startup.time.perf_counter', side_effect=[1.5, 3.0]), \
+            mock.patch('mu.startup.logger.info') as info:
+        profile.mark('foo')
+        profile.mark('bar')
+    assert profile.phases == [('foo', 0.5), ('bar', 1.5)]
+    info.assert_called_with('Start-up phase "bar" finished after 2000 ms.')
+
+
+def test_StartupProfile_report():
+    """
+    Ensure the phases and the slowest imports are reported when profiling,
+    and the import timer is stopped.
+    """
+    profile = mu.startup.StartupProfile()
+    profile.phases = [('imports', 0.5)]
+    profile.last = profile.started + 0.5
+    profile.imports = mock.MagicMock()
+    profile.imports.timings = {'foo': (0.25, 0.125), 'bar': (0.5, 0.5)}
+    with mock.patch('builtins.print') as mock_print, \
+            mock.patch('mu.startup.logger.info') as info:
+        profile.report()
+    profile.imports.stop.assert_called_once_with()
+    report = mock_print.call_args[0][0]
+    info.assert_called_once_with(report)
+    lines = report.splitlines()
+    assert '    500.0  imports' in lines
+    assert '    500.0  total' in lines
+    assert lines.index('    500.0      500.0  bar') < \
+        lines.index('    250.0      125.0  foo')
+
+
+def test_StartupProfile_report_not_enabled():
+    """
+    Nothing is reported unless start-up is being profiled.
+    """
+    profile = mu.startup.StartupProfile()
+    assert profile.enabled is False
+    with mock.patch('builtins.print') as mock_print:
+        profile.report()
+    assert mock_print.call_count == 0
+
+
+def test_StartupProfile_start():
+    """
+    Ensure starting the profile starts timing imports.
+    """
+    profile = mu.startup.StartupProfile()
+    with mock.patch('mu.startup.ImportTimer') as timer:
+        profile.start()
+    assert profile.enabled is True
+    timer.return_value.start.assert_called_once_with()
+
+
+def test_StartupScheduler_start():
+    """
+    Once the window is ready, the first paint is recorded and the deferred
+    tasks are started (only once).
+    """
+    profile = mock.MagicMock()
+    scheduler = mu.startup.StartupScheduler(profile)
+    with mock.patch('PyQt5.QtCore.QTimer.singleShot') as single_shot:
+        scheduler.start()
+        scheduler.start()
+    profile.mark.assert_called_once_with('first paint')
+    single_shot.assert_called_once_with(0, scheduler.run_next)
+
+
+def test_StartupScheduler_run_next():
+    """
+    Ensure deferred tasks are run in order, one at a time, with the end of
+    each recorded, and start-up is reported once they're all done.
+    """
+    profile = mock.MagicMock()
+    scheduler = mu.startup.StartupScheduler(profile)
+    foo = mock.MagicMock()
+    bar = mock.MagicMock()
+    scheduler.defer('foo', foo)
+    scheduler.defer('bar', bar)
+    scheduler.run_later = mock.MagicMock()
+    scheduler.run_next()
+    foo.assert_called_once_with()
+    assert bar.call_count == 0
+    profile.mark.assert_called_once_with('foo')
+    scheduler.run_later.assert_called_once_with()
+    scheduler.run_next()
+    bar.assert_called_once_with()
+    profile.mark.assert_called_with('bar')
+    assert profile.report.call_count == 0
+    scheduler.run_next()
+    profile.report.assert_called_once_with()
+    assert scheduler.run_later.call_count == 2
+
+
+def test_StartupScheduler_run_next_failure():
+    """
+    If a deferred task fails, the problem is logged and the next task is
+    still run.
+    """
+    profile = mock.MagicMock()
+    scheduler = mu.startup.StartupScheduler(profile)
+    foo = mock.MagicMock(side_effect=OSError('Read-only file system'))
+    bar = mock.MagicMock()
+    scheduler.defer('foo', foo)
+    scheduler.defer('bar', bar)
+    scheduler.run_later = mock.MagicMock()
+    with mock.patch('mu.startup.logger.exception') as mock_log:
+        scheduler.run_next()
+    mock_log.assert_called_once_with('Start-up task "foo" failed.')
+    profile.mark.assert_called_once_with('foo')
+    scheduler.run_later.assert_called_once_with()
+    scheduler.run_next()
+    bar.assert_called_once_with()
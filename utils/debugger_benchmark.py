@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Measures the throughput of the debugger's wire protocol for large stack
+messages (as sent by the debug runner when the user's code holds lots of
+data) over a real localhost connection.
+
+Usage: python utils/debugger_benchmark.py [size in MB ...]
+"""
+import os
+import socket
+import sys
+import time
+from threading import Thread
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from mu.debugger.utils import (encode_message, MessageBuffer,  # NOQA
+                               RECV_SIZE)
+
+
+REPEATS = 5
+
+
+def make_stack(size):
+    """
+    Return a stack of about size bytes of JSON, including characters that
+    were troublesome for the old ETX terminated protocol.
+    """
+    value = 'x' * 1000 + '\x03'
+    count = size // (len(value) + 20)
+    local_vars = {'var{}'.format(i): value for i in range(count)}
+    return [(1, {'filename': 'script.py', 'locals': local_vars})]
+
+
+def receive(connection, expected, results):
+    """
+    Receive messages until the expected number have arrived.
+    """
+    message_buffer = MessageBuffer()
+    count = 0
+    while count < expected:
+        count += len(message_buffer.feed(connection.recv(RECV_SIZE)))
+    results.append(time.perf_counter())
+
+
+def measure(stack, compress_threshold):
+    """
+    Return the time taken to encode, send, receive and decode the stack
+    REPEATS times.
+    """
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('localhost', 0))
+    server.listen(1)
+    sender = socket.create_connection(server.getsockname())
+    receiver, addr = server.accept()
+    results = []
+    thread = Thread(target=receive, args=(receiver, REPEATS, results))
+    thread.start()
+    start = time.perf_counter()
+    for i in range(REPEATS):
+        sender.sendall(encode_message('stack', {'stack': stack},
+                                      compress_threshold))
+    thread.join()
+    for s in (sender, receiver, server):
+        s.close()
+    return results[0] - start
+
+
+if __name__ == '__main__':
+    sizes = [float(arg) for arg in sys.argv[1:]] or [1, 4, 16]
+    for size in sizes:
+        stack = make_stack(int(size * 1024 * 1024))
+        for label, threshold in (('plain', None), ('compressed', 0)):
+            duration = measure(stack, threshold)
+            print('{:>6.1f} MB {:>10}: {:8.1f} ms per message, '
+                  '{:8.1f} MB/s'.format(size, label,
+                                        duration * 1000 / REPEATS,
+                                        size * REPEATS / duration))
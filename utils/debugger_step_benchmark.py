@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Measures the latency of each step in the debugger, from the program stopping
+to the client having decoded its stack, by driving the debug runner (without
+Mu's user interface) through synthetic programs with deep stacks and large
+local variables.
+
+The stages are those reported by the runner (see Debugger.output_stack) and
+the client (see Debugger.on_timings), apart from those that need Mu's user
+interface.
+
+Usage: python utils/debugger_step_benchmark.py [steps]
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+from mu.debugger.utils import (encode_message, MessageBuffer,  # NOQA
+                               read_port_handshake, RECV_SIZE)
+
+
+STAGES = ['stack', 'encode', 'send', 'transfer', 'decode', 'total']
+
+
+LOOP = """
+    total = 0
+    for i in range(1000000):
+        total += i  # Step here.
+    return total
+"""
+
+
+DEEP_STACK = """
+def recurse(depth):
+    values = list(range(depth))
+    label = 'frame ' + str(depth)
+    if depth:
+        return recurse(depth - 1)
+""" + LOOP + """
+
+recurse({size})
+"""
+
+
+LARGE_LOCALS = """
+def large():
+    numbers = list(range({size}))
+    table = {{i: str(i) for i in range({size})}}
+    text = 'x' * {size}
+    nested = [[i] * 10 for i in range({size} // 10)]
+""" + LOOP + """
+
+large()
+"""
+
+
+MANY_LOCALS = """
+def many():
+{assignments}
+""" + LOOP + """
+
+many()
+"""
+
+
+def programs():
+    """
+    Return a list of (description, source) of the synthetic programs.
+    """
+    result = []
+    for depth in (10, 100, 500):
+        result.append(('{} frames'.format(depth),
+                       DEEP_STACK.format(size=depth)))
+    for size in (10000, 1000000):
+        result.append(('large locals ({})'.format(size),
+                       LARGE_LOCALS.format(size=size)))
+    for count in (100, 1000):
+        assignments = '\n'.join('    var{0} = [{0}] * 10'.format(i)
+                                for i in range(count))
+        result.append(('{} locals'.format(count),
+                       MANY_LOCALS.format(assignments=assignments)))
+    return result
+
+
+class Client:
+    """
+    A headless client for the debug runner, timing the messages it receives.
+    """
+
+    def __init__(self, filename):
+        env = dict(os.environ, PYTHONPATH=ROOT)
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, 'mu', 'mu-debug.py'),
+             filename], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            universal_newlines=True, env=env)
+        port = read_port_handshake(self.process.stdout.readline())
+        self.socket = socket.create_connection(('localhost', port))
+        self.message_buffer = MessageBuffer()
+        self.messages = []
+
+    def send(self, event, **data):
+        self.socket.sendall(encode_message(event, data))
+
+    def receive(self, event):
+        """
+        Return the data of the next message for the event, with the time it
+        was received and how long it took to decode.
+        """
+        while True:
+            while self.messages:
+                message, received = self.messages.pop(0)
+                start = time.perf_counter()
+                name, data = json.loads(message)
+                decode = time.perf_counter() - start
+                if name == event:
+                    return data, received, decode
+            chunk = self.socket.recv(RECV_SIZE)
+            if not chunk:
+                raise ConnectionError('The debug runner has gone.')
+            received = time.time()
+            self.messages.extend((message, received) for message in
+                                 self.message_buffer.feed(chunk))
+
+    def step(self, command):
+        """
+        Send the command and return the latency of each stage of the step.
+        """
+        self.send(command)
+        data, received, decode = self.receive('stack')
+        decoded = time.time()
+        timings = self.receive('timings')[0]
+        return {
+            'stack': timings['stack'],
+            'encode': timings['encode'],
+            'send': timings['send'],
+            'transfer': max(received - timings['sent'], 0),
+            'decode': decode,
+            'total': max(decoded - timings['stopped'], 0),
+        }
+
+    def close(self):
+        self.socket.close()
+        self.process.kill()
+        self.process.wait()
+
+
+def measure(source, steps):
+    """
+    Return the latency of each stage of the given number of steps through the
+    loop at the end of the program.
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'program.py')
+        with open(filename, 'w') as f:
+            f.write(source)
+        line = source.splitlines().index('        total += i  # Step here.')
+        client = Client(filename)
+        try:
+            client.receive('bootstrap')
+            client.receive('stack')  # Before the program starts.
+            client.send('break', filename=os.path.normcase(filename),
+                        line=line + 1)
+            results = [client.step('continue')]
+            for i in range(steps):
+                results.append(client.step('next'))
+        finally:
+            client.close()
+    return results
+
+
+if __name__ == '__main__':
+    steps = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    print('{:>22} '.format('ms per step (mean)') +
+          ' '.join('{:>9}'.format(stage) for stage in STAGES))
+    for description, source in programs():
+        results = measure(source, steps)
+        print('{:>22} '.format(description) +
+              ' '.join('{:>9.2f}'.format(
+                  sum(result[stage] for result in results) * 1000 /
+                  len(results)) for stage in STAGES))
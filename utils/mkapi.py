@@ -1,23 +1,77 @@
 #!/usr/bin/env python3
 """
-Takes a JSON representation of an API and emits elements to be inserted into a
-Python list such that they conform to Scintilla's API description DSL.
+Creates the compact API definition stores (mu/modes/api/*.json) used by Mu's
+auto-suggest and call tips. Each store is a JSON list of entries which
+conform to Scintilla's API description DSL. The entries are stored
+untranslated, since Mu only translates them when a call tip is shown.
+
+A store is made from either a JSON representation of an API (a list of
+objects with a name, args and description) or a Python module containing a
+list of _() wrapped entries (as Mu used to have).
+
+Usage:
+
+    python mkapi.py python_api.json ../mu/modes/api/python3.json
+
+The --messages option emits the entries of the referenced stores as _()
+calls, so the entries can be extracted for translation by pygettext:
+
+    python mkapi.py --messages ../mu/modes/api/*.json > api_messages.py
 """
+import ast
 import sys
 import json
 
 
-if __name__ == '__main__':
-    f = sys.argv[1]
-    with open(f) as api_file:
-        api = json.load(api_file)
+def from_json(api):
+    """
+    Return the entries for the API represented by the referenced list of
+    objects with a name, args and description.
+    """
     # Sort the JSON objects so diffing code is easier to do.
     sorted_api = sorted(api, key=lambda k: k['name'])
-    # Emit a representation of the API information in the format parsed by
-    # the Scintilla.
+    entries = []
     for i in sorted_api:
         name = i['name']
         args = ', '.join(i['args']) if i['args'] else ''
-        description = i['description'].replace('\u2013', '--')
-        content = repr('{}({}) \n{}'.format(name, args, description))
-        print('    _({}),'.format(content))
+        description = i['description'].replace('–', '--')
+        entries.append('{}({}) \n{}'.format(name, args, description))
+    return entries
+
+
+def from_module(source):
+    """
+    Return the entries wrapped in _() in the referenced Python source code.
+    """
+    entries = []
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Call) and \
+                getattr(node.func, 'id', None) == '_':
+            entries.append(ast.literal_eval(node.args[0]))
+    return entries
+
+
+def dumps(entries):
+    """
+    Return the store of the referenced entries, with an entry per line so
+    diffing stores is easier to do.
+    """
+    return '[\n{}\n]\n'.format(',\n'.join(json.dumps(entry)
+                                          for entry in entries))
+
+
+if __name__ == '__main__':
+    if sys.argv[1] == '--messages':
+        for filename in sys.argv[2:]:
+            with open(filename, encoding='utf-8') as store:
+                for entry in json.load(store):
+                    print('_({})'.format(repr(entry)))
+        sys.exit(0)
+    source, destination = sys.argv[1:3]
+    with open(source, encoding='utf-8') as api_file:
+        if source.endswith('.py'):
+            entries = from_module(api_file.read())
+        else:
+            entries = from_json(json.load(api_file))
+    with open(destination, 'w', encoding='utf-8') as store:
+        store.write(dumps(entries))